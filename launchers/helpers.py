@@ -332,6 +332,12 @@ def entry_point(appname, debug=False):
         if debug:
             set_commandline_args()
 
+        from pychron.globals import globalv
+        if globalv.profile_startup:
+            # time the imports of the application and its plugins
+            from pychron.envisage.startup_profiler import startup_profiler
+            startup_profiler.install()
+
         # import app klass and pass to launch function
         if check_dependencies(debug):
             mod = __import__('pychron.applications.{}'.format(appname), fromlist=[klass])
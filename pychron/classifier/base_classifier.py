@@ -16,61 +16,185 @@
 
 # ============= enthought library imports =======================
 # ============= standard library imports ========================
+import copy
 import os
+from threading import Lock
 
-from numpy import vstack, hstack, array
-from sklearn.externals import joblib
-from sklearn.neighbors import KNeighborsClassifier
+from numpy import asarray, empty, arange, zeros
 
 # ============= local library imports  ==========================
 from pychron.paths import paths
 
+_models = {}
+_models_lock = Lock()
+
+
+def load_model(p):
+    """
+        load a persisted classifier once per process. returns (classifier, x, y) or None.
+        the cached model is reloaded if the file is modified
+    """
+    try:
+        mtime = os.path.getmtime(p)
+    except OSError:
+        return
+
+    with _models_lock:
+        cached = _models.get(p)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    from sklearn.externals import joblib
+
+    obj = joblib.load(p)
+    if isinstance(obj, dict):
+        model = obj['clf'], obj.get('x'), obj.get('y')
+    else:
+        # classifiers dumped before the training data was persisted with them
+        x = getattr(obj, '_fit_X', None)
+        y = getattr(obj, '_y', None)
+        if y is not None:
+            y = obj.classes_[y]
+        model = obj, x, y
+
+    with _models_lock:
+        _models[p] = (mtime, model)
+    return model
+
+
+def clear_models():
+    with _models_lock:
+        _models.clear()
+
 
 class BaseClassifier(object):
+    """
+        the training samples are kept in a preallocated feature matrix that grows geometrically so adding
+        training data is amortized O(1) per sample. classifiers with ``partial_fit`` are trained
+        incrementally with only the new samples
+    """
     _clf = None
+    _x = None
+    _y = None
+    _n = 0
+    _shared = False
+
+    klasses = None
 
     def fit(self, x, y):
         raise NotImplementedError
 
-    def predict(self):
-        raise NotImplementedError
+    def predict(self, x):
+        """
+            classify one sample. returns (klass, probability)
+        """
+        ks, ps = self.predict_many(x)
+        if ks is None:
+            return None, 0
+        return int(ks[0]), float(ps[0])
+
+    def predict_many(self, x):
+        """
+            classify a 2d array [n_samples, n_features] in one call.
+            returns (klasses, probabilities) arrays or (None, None) if there is no trained classifier
+        """
+        if self._clf is None:
+            self.load()
+
+        clf = self._clf
+        if clf is None:
+            return None, None
+
+        x = asarray(x, dtype=float)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+
+        if not len(x):
+            return empty(0, dtype=int), zeros(0)
+
+        proba = clf.predict_proba(x)
+        idx = proba.argmax(axis=1)
+        return clf.classes_[idx].astype(int), proba[arange(len(x)), idx]
 
     def add_training_data(self, samples, klasses):
-        self.load()
-        if not self._clf:
+        samples = asarray(samples, dtype=float)
+        if samples.ndim == 1:
+            samples = samples.reshape(1, -1)
+        klasses = asarray(klasses)
+
+        if self._clf is None:
+            self.load()
+
+        if self._clf is None:
             self._clf = self.classifier_factory()
-            x = array(samples[:1])
-            y = array(klasses[:1])
-            samples = samples[1:]
-            klasses = klasses[1:]
+        elif self._shared:
+            # do not modify the classifier cached for the process
+            self._clf = copy.deepcopy(self._clf)
+            self._shared = False
+
+        self._append(samples, klasses)
+        if hasattr(self._clf, 'partial_fit'):
+            classes = self.klasses
+            if classes is None:
+                classes = sorted(set(self._y[:self._n]))
+            self._clf.partial_fit(samples, klasses, classes=classes)
         else:
-            x = self._clf._fit_X
-            y = self._clf._y
+            x, y = self.training_data
+            self.fit(x, y)
 
-        for sample, klass in zip(samples, klasses):
-            x = vstack((x, sample))
-            y = hstack((y, [klass]))
-
-        self.fit(x, y)
+    @property
+    def training_data(self):
+        n = self._n
+        if self._x is None:
+            return None, None
+        return self._x[:n], self._y[:n]
 
     def classifier_factory(self, klass=None, *args, **kw):
         if klass is None:
+            from sklearn.neighbors import KNeighborsClassifier
             klass = KNeighborsClassifier
 
         return klass(*args, **kw)
 
     def load(self):
-        p = self.persistence_path
-        if os.path.isfile(p):
-            self._clf = joblib.load(p)
+        model = load_model(self.persistence_path)
+        if model:
+            self._clf, x, y = model
+            self._shared = True
+            self._x, self._y, self._n = None, None, 0
+            if x is not None and y is not None:
+                self._append(asarray(x, dtype=float), asarray(y))
 
     def dump(self):
-        joblib.dump(self._clf, self.persistence_path)
+        from sklearn.externals import joblib
+
+        x, y = self.training_data
+        joblib.dump({'clf': self._clf, 'x': x, 'y': y}, self.persistence_path)
+        with _models_lock:
+            _models.pop(self.persistence_path, None)
 
     @property
     def persistence_path(self):
         return os.path.join(paths.hidden_dir, self._persistence_name)
-# ============= EOF =============================================
-
 
+    # private
+    def _append(self, samples, klasses):
+        n, m = self._n, len(samples)
+        x = self._x
+        if x is None:
+            cap = max(64, m)
+            self._x = empty((cap, samples.shape[1]))
+            self._y = empty(cap, dtype=klasses.dtype)
+        elif n + m > len(x):
+            cap = max(2 * len(x), n + m)
+            nx = empty((cap, x.shape[1]))
+            ny = empty(cap, dtype=self._y.dtype)
+            nx[:n] = x[:n]
+            ny[:n] = self._y[:n]
+            self._x, self._y = nx, ny
+
+        self._x[n:n + m] = samples
+        self._y[n:n + m] = klasses
+        self._n = n + m
 
+# ============= EOF =============================================
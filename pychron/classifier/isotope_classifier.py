@@ -18,19 +18,32 @@
 # ============= standard library imports ========================
 from __future__ import absolute_import
 from __future__ import print_function
-from numpy import ones, vstack, zeros, hstack
+from numpy import ones, vstack, zeros, hstack, empty
 from numpy.random import random
 
 # ============= local library imports  ==========================
 from pychron.classifier.base_classifier import BaseClassifier
 
 
+NFEATURES = 7
+
+
 def make_sample(iso):
     # print 'make sample {} {} {}'.format(iso.mass, iso.n, iso.intercept_percent_error)
     return iso.mass, iso.n, iso.value, iso.intercept_percent_error, iso.get_slope(), iso.standard_fit_error(), \
            iso.noutliers()
 
 
+def make_samples(isos):
+    """
+        return the feature matrix [n_isotopes, NFEATURES] for ``isos``
+    """
+    x = empty((len(isos), NFEATURES))
+    for i, iso in enumerate(isos):
+        x[i] = make_sample(iso)
+    return x
+
+
 class IsotopeClassifier(BaseClassifier):
     """
     klasses:
@@ -39,17 +52,40 @@ class IsotopeClassifier(BaseClassifier):
     """
     _clf = None
     _persistence_name = 'clf.isotope.p'
+    klasses = (0, 1)
 
     def classifier_factory(self, klass=None, *args, **kw):
         kw['n_neighbors'] = 3
         return super(IsotopeClassifier, self).classifier_factory(klass=klass, *args, **kw)
 
     def predict_isotope(self, iso):
-        return self.predict(make_sample(iso))
+        return self.predict_isotopes((iso,))[0]
+
+    def predict_isotopes(self, isos):
+        """
+            classify ``isos`` in one call. returns a list of (klass, probability)
+        """
+        isos = list(isos)
+        ks, ps = self.predict_many(make_samples(isos))
+        if ks is None:
+            return [(None, 0)] * len(isos)
+        return [(int(k), float(p)) for k, p in zip(ks, ps)]
+
+    def predict_analyses(self, analyses):
+        """
+            classify all the isotopes of ``analyses`` in one call.
+            returns a list with a dictionary of isotope key: (klass, probability) for each analysis
+        """
+        keys = [(i, k, iso) for i, ai in enumerate(analyses) for k, iso in ai.isotopes.items()]
+        results = self.predict_isotopes([iso for _, _, iso in keys])
+
+        ret = [{} for _ in analyses]
+        for (i, k, _), r in zip(keys, results):
+            ret[i][k] = r
+        return ret
 
     def add_isotopes(self, isos, klasses):
-        samples = [make_sample(iso) for iso in isos]
-        self.add_training_data(samples, klasses)
+        self.add_training_data(make_samples(isos), klasses)
 
     def fit(self, x, y):
         """
@@ -65,19 +101,6 @@ class IsotopeClassifier(BaseClassifier):
 
         self._clf.fit(x, y)
 
-    def predict(self, x):
-        if self._clf is None:
-            self.load()
-
-        klass = None
-        prob = 0
-        print(x)
-        if self._clf:
-            klass = int(self._clf.predict(x)[0])
-            prob = self._clf.predict_proba(x)[0][klass]
-
-        return klass, prob
-
 
 if __name__ == '__main__':
     ic = IsotopeClassifier()
@@ -0,0 +1,123 @@
+import unittest
+
+from numpy import array, zeros
+
+from pychron.classifier.base_classifier import BaseClassifier
+from pychron.classifier.isotope_classifier import IsotopeClassifier
+
+
+class CentroidClassifier(object):
+    """
+        minimal incremental classifier with the sklearn interface used by BaseClassifier
+    """
+
+    def __init__(self):
+        self.sums = {}
+        self.counts = {}
+        self.nfit = 0
+
+    def partial_fit(self, x, y, classes=None):
+        self.nfit += len(x)
+        self.classes_ = array(classes)
+        for xi, yi in zip(x, y):
+            self.sums[yi] = self.sums.get(yi, 0) + xi
+            self.counts[yi] = self.counts.get(yi, 0) + 1
+
+    def predict_proba(self, x):
+        ds = zeros((len(x), len(self.classes_)))
+        for j, k in enumerate(self.classes_):
+            c = self.sums[k] / self.counts[k]
+            ds[:, j] = 1 / (1 + ((x - c) ** 2).sum(axis=1))
+        return ds / ds.sum(axis=1)[:, None]
+
+
+class Classifier(BaseClassifier):
+    klasses = (0, 1)
+    _persistence_name = 'clf.test.p'
+
+    def classifier_factory(self, klass=None, *args, **kw):
+        return CentroidClassifier()
+
+    def load(self):
+        pass
+
+
+class BaseClassifierTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clf = Classifier()
+        self.clf.add_training_data([[0, 0], [0, 1]], [0, 0])
+        self.clf.add_training_data([[10, 10], [10, 11]], [1, 1])
+
+    def test_training_data(self):
+        x, y = self.clf.training_data
+        self.assertEqual(x.shape, (4, 2))
+        self.assertEqual(list(y), [0, 0, 1, 1])
+
+    def test_grow(self):
+        for i in range(100):
+            self.clf.add_training_data([i, i], [i % 2])
+
+        x, y = self.clf.training_data
+        self.assertEqual(len(x), 104)
+        self.assertEqual(list(x[-1]), [99, 99])
+
+    def test_incremental(self):
+        # only the new samples are passed to partial_fit
+        self.assertEqual(self.clf._clf.nfit, 4)
+
+    def test_predict_many(self):
+        ks, ps = self.clf.predict_many([[0, 0.5], [10, 10.5], [1, 0]])
+        self.assertEqual(list(ks), [0, 1, 0])
+        self.assertTrue(all(p > 0.5 for p in ps))
+
+    def test_predict(self):
+        k, p = self.clf.predict([10, 9])
+        self.assertEqual(k, 1)
+
+    def test_untrained(self):
+        self.assertEqual(Classifier().predict([0, 0]), (None, 0))
+
+
+class MockIsotope:
+    def __init__(self, err):
+        self.mass = 40
+        self.n = 100
+        self.value = 10
+        self.intercept_percent_error = err
+
+    def get_slope(self):
+        return 0
+
+    def standard_fit_error(self):
+        return 0
+
+    def noutliers(self):
+        return 0
+
+
+class MockAnalysis:
+    def __init__(self, *errs):
+        self.isotopes = {'Ar{}'.format(36 + i): MockIsotope(e) for i, e in enumerate(errs)}
+
+
+class MockIsotopeClassifier(IsotopeClassifier):
+    def classifier_factory(self, klass=None, *args, **kw):
+        return CentroidClassifier()
+
+    def load(self):
+        pass
+
+
+class IsotopeClassifierTestCase(unittest.TestCase):
+    def test_predict_analyses(self):
+        clf = MockIsotopeClassifier()
+        clf.add_isotopes([MockIsotope(50), MockIsotope(0.1)], [0, 1])
+
+        ans = [MockAnalysis(0.2, 40), MockAnalysis(60)]
+        ret = clf.predict_analyses(ans)
+        self.assertEqual([r[0] for r in ret[0].values()], [1, 0])
+        self.assertEqual(ret[1]['Ar36'][0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
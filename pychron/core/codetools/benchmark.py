@@ -0,0 +1,263 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    time registered benchmarks with fixed seeds and write the results as json so runs of different releases can
+    be compared.
+
+    a benchmark is a function of one argument. ``setup`` is called with the shared fixture before every timed
+    call and its return value is passed to the benchmark. the time spent in ``setup`` is not counted
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import traceback
+from datetime import datetime
+from fnmatch import fnmatch
+
+# ============= local library imports  ==========================
+
+RESULTS_VERSION = 1
+
+BENCHMARKS = []
+
+
+class Benchmark(object):
+    def __init__(self, name, func, group='', setup=None, number=1):
+        self.name = name
+        self.func = func
+        self.group = group
+        self.setup = setup
+        self.number = number
+
+
+class Comparison(object):
+    __slots__ = ('name', 'baseline', 'current', 'ratio', 'regressed')
+
+    def __init__(self, name, baseline, current, ratio, regressed):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+        self.ratio = ratio
+        self.regressed = regressed
+
+
+def benchmark(name=None, group='', setup=None, number=1):
+    """
+        register the decorated function as a benchmark
+    """
+
+    def dec(func):
+        BENCHMARKS.append(Benchmark(name or func.__name__, func, group, setup, number))
+        return func
+
+    return dec
+
+
+def seed_all(seed):
+    random.seed(seed)
+    try:
+        import numpy
+        numpy.random.seed(seed)
+    except ImportError:
+        pass
+
+
+def environment():
+    env = {'python': platform.python_version(),
+           'implementation': platform.python_implementation(),
+           'platform': platform.platform(),
+           'machine': platform.machine(),
+           'processor': platform.processor(),
+           'argv': sys.argv}
+
+    for name in ('pychron', 'numpy', 'scipy', 'uncertainties'):
+        try:
+            mod = __import__(name)
+            env[name] = getattr(mod, '__version__', '')
+        except ImportError:
+            env[name] = None
+    return env
+
+
+class BenchmarkRunner(object):
+    def __init__(self, benchmarks=None, repeat=5, warmup=1, seed=0, fixture=None, pattern=None,
+                 clock=time.perf_counter, log=None):
+        if benchmarks is None:
+            benchmarks = BENCHMARKS
+
+        if pattern:
+            benchmarks = [b for b in benchmarks if fnmatch(b.name, pattern) or fnmatch(b.group, pattern)]
+
+        self.benchmarks = benchmarks
+        self.repeat = repeat
+        self.warmup = warmup
+        self.seed = seed
+        self.fixture = fixture
+        self.clock = clock
+        self.log = log
+
+    def run(self):
+        """
+            run the benchmarks and return the results document
+        """
+        results = {}
+        for b in self.benchmarks:
+            self._log('running {}'.format(b.name))
+            r = self.run_benchmark(b)
+            results[b.name] = r
+            if r['error']:
+                self._log('{} failed. {}'.format(b.name, r['error']))
+            else:
+                self._log('{} median={:0.5f}s min={:0.5f}s'.format(b.name, r['median'], r['min']))
+
+        return {'version': RESULTS_VERSION,
+                'created': datetime.now().isoformat(),
+                'environment': environment(),
+                'config': {'repeat': self.repeat, 'warmup': self.warmup, 'seed': self.seed,
+                           'fixture': getattr(self.fixture, 'config', None)},
+                'results': results}
+
+    def run_benchmark(self, b):
+        r = {'group': b.group, 'number': b.number, 'times': [], 'error': None}
+        try:
+            for i in range(self.warmup):
+                self._call(b)
+
+            ts = [self._call(b) / b.number for i in range(self.repeat)]
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                raise
+            r['error'] = '{}: {}'.format(type(e).__name__, e)
+            r['traceback'] = traceback.format_exc()
+            return r
+
+        r['times'] = ts
+        r['min'] = min(ts)
+        r['max'] = max(ts)
+        r['mean'] = statistics.mean(ts)
+        r['median'] = statistics.median(ts)
+        r['stdev'] = statistics.stdev(ts) if len(ts) > 1 else 0
+        return r
+
+    # private
+    def _call(self, b):
+        # every call sees the same random state
+        seed_all(self.seed)
+        state = b.setup(self.fixture) if b.setup else self.fixture
+
+        func = b.func
+        st = self.clock()
+        for i in range(b.number):
+            func(state)
+        return self.clock() - st
+
+    def _log(self, msg):
+        if self.log:
+            self.log(msg)
+
+
+def dump_results(results, path):
+    root = os.path.dirname(path)
+    if root and not os.path.isdir(root):
+        os.makedirs(root)
+
+    tmp = '{}.tmp'.format(path)
+    with open(tmp, 'w') as wfile:
+        json.dump(results, wfile, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def load_results(path):
+    with open(path, 'r') as rfile:
+        obj = json.load(rfile)
+
+    if obj.get('version') != RESULTS_VERSION:
+        raise ValueError('unsupported benchmark results version {}'.format(obj.get('version')))
+    return obj
+
+
+def compare(baseline, current, threshold=0.1, stat='median'):
+    """
+        compare two results documents. a benchmark regressed if ``stat`` grew by more than ``threshold``
+        (a fraction of the baseline). benchmarks that failed or are missing from either run are not compared
+    """
+    bs = baseline['results']
+    cs = current['results']
+
+    ret = []
+    for name in sorted(set(bs) & set(cs)):
+        b, c = bs[name], cs[name]
+        if b['error'] or c['error']:
+            continue
+
+        bv, cv = b[stat], c[stat]
+        ratio = cv / bv if bv else float('inf') if cv else 1
+        ret.append(Comparison(name, bv, cv, ratio, ratio > 1 + threshold))
+    return ret
+
+
+def format_comparison(comparisons):
+    lines = ['{:<40s}{:>12s}{:>12s}{:>9s}'.format('Benchmark', 'baseline', 'current', 'ratio')]
+    for c in comparisons:
+        lines.append('{:<40s}{:>12.5f}{:>12.5f}{:>9.2f}{}'.format(c.name, c.baseline, c.current, c.ratio,
+                                                                 ' REGRESSION' if c.regressed else ''))
+    return '\n'.join(lines)
+
+
+def main(argv=None, fixture_factory=None):
+    """
+        command line entry point. returns 1 if a benchmark regressed compared to ``--baseline``
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run pychron benchmarks')
+    parser.add_argument('-o', '--output', help='write the results to this json file')
+    parser.add_argument('-b', '--baseline', help='compare with the results in this json file')
+    parser.add_argument('-k', '--pattern', help='only run benchmarks whose name or group match this glob')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-w', '--warmup', type=int, default=1)
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='fractional slowdown reported as a regression')
+    args = parser.parse_args(argv)
+
+    fixture = fixture_factory(args.seed) if fixture_factory else None
+    try:
+        runner = BenchmarkRunner(repeat=args.repeat, warmup=args.warmup, seed=args.seed, fixture=fixture,
+                                 pattern=args.pattern, log=print)
+        results = runner.run()
+    finally:
+        if hasattr(fixture, 'cleanup'):
+            fixture.cleanup()
+
+    if args.output:
+        dump_results(results, args.output)
+
+    if args.baseline:
+        cs = compare(load_results(args.baseline), results, args.threshold)
+        print(format_comparison(cs))
+        if any(c.regressed for c in cs):
+            return 1
+    return 0
+
+# ============= EOF =============================================
@@ -0,0 +1,260 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    nested timed sections (spans) and counters.
+
+    ``with spans.span('measurement'):`` times a section. spans opened inside it on the same thread are its children
+    and their path is e.g. ``run/measurement/collect``. a span started with ``trace=<name>`` tags itself and its
+    children so the spans of one automated run can be collected even when runs overlap. finished spans are kept
+    in a ring buffer.
+
+    when the recorder is disabled ``span`` returns a shared do nothing context and ``count`` returns immediately
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+# ============= local library imports  ==========================
+
+
+class Span(object):
+    __slots__ = ('name', 'path', 'trace', 'thread', 'start', 'duration', 'depth', 'attrs')
+
+    def __init__(self, name, path, trace, thread, start, depth, attrs):
+        self.name = name
+        self.path = path
+        self.trace = trace
+        self.thread = thread
+        self.start = start
+        self.duration = 0
+        self.depth = depth
+        self.attrs = attrs
+
+    def to_dict(self):
+        return {'name': self.name, 'path': self.path, 'trace': self.trace, 'thread': self.thread,
+                'start': self.start, 'duration': self.duration, 'depth': self.depth, 'attrs': self.attrs}
+
+
+class _NullSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _SpanContext(object):
+    __slots__ = ('recorder', 'name', 'trace', 'attrs', 'span')
+
+    def __init__(self, recorder, name, trace, attrs):
+        self.recorder = recorder
+        self.name = name
+        self.trace = trace
+        self.attrs = attrs
+        self.span = None
+
+    def __enter__(self):
+        self.span = s = self.recorder._open(self.name, self.trace, self.attrs)
+        return s
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.recorder._close(self.span, exc_type)
+
+
+class SpanRecorder(object):
+    def __init__(self, capacity=50000, enabled=True, clock=time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self._buffer = deque(maxlen=capacity)
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def span(self, name, trace=None, **attrs):
+        """
+            return a context manager that times ``name``
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return _SpanContext(self, name, trace, attrs)
+
+    def traced(self, name=None):
+        """
+            decorator. time every call of the decorated function
+        """
+
+        def dec(func):
+            sname = name or func.__name__
+
+            @wraps(func)
+            def wrapper(*args, **kw):
+                if not self.enabled:
+                    return func(*args, **kw)
+
+                with _SpanContext(self, sname, None, {}):
+                    return func(*args, **kw)
+
+            return wrapper
+
+        return dec
+
+    def count(self, name, n=1, trace=None):
+        if not self.enabled:
+            return
+
+        if trace is None:
+            trace = self.current_trace()
+
+        with self._lock:
+            for key in ((None, name), (trace, name)) if trace else ((None, name),):
+                self._counters[key] = self._counters.get(key, 0) + n
+
+    def current_trace(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack:
+            return stack[-1].trace
+
+    def records(self, trace=None):
+        """
+            finished spans in the order they finished
+        """
+        with self._lock:
+            return [s for s in self._buffer if trace is None or s.trace == trace]
+
+    def counters(self, trace=None):
+        with self._lock:
+            return {name: v for (t, name), v in self._counters.items() if t == trace}
+
+    def breakdown(self, trace=None):
+        """
+            aggregate the spans of ``trace`` by path.
+            returns {'trace', 'spans': [{'path', 'n', 'total', 'mean', 'max'},...], 'counters'}
+        """
+        agg = {}
+        for s in self.records(trace):
+            a = agg.get(s.path)
+            if a is None:
+                a = agg[s.path] = {'path': s.path, 'n': 0, 'total': 0, 'max': 0}
+                starts = s.start
+            else:
+                starts = min(a['start'], s.start)
+
+            a['n'] += 1
+            a['total'] += s.duration
+            a['max'] = max(a['max'], s.duration)
+            a['start'] = starts
+
+        def key(a):
+            # children follow their parent, siblings in the order they started
+            ps = a['path'].split('/')
+            return [(agg[p]['start'] if p in agg else -1, ps[i])
+                    for i, p in enumerate('/'.join(ps[:j + 1]) for j in range(len(ps)))]
+
+        rows = sorted(agg.values(), key=key)
+        for a in rows:
+            a['mean'] = a['total'] / a['n']
+        for a in rows:
+            a.pop('start')
+        return {'trace': trace, 'spans': rows, 'counters': self.counters(trace)}
+
+    def finish_trace(self, trace):
+        """
+            return the breakdown of ``trace`` and forget its counters
+        """
+        bd = self.breakdown(trace)
+        with self._lock:
+            for key in [k for k in self._counters if k[0] == trace]:
+                self._counters.pop(key)
+        return bd
+
+    def clear(self):
+        with self._lock:
+            self._buffer.clear()
+            self._counters.clear()
+
+    # private
+    def _get_stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _open(self, name, trace, attrs):
+        stack = self._get_stack()
+        if stack:
+            parent = stack[-1]
+            path = '{}/{}'.format(parent.path, name)
+            if trace is None:
+                trace = parent.trace
+        else:
+            path = name
+
+        s = Span(name, path, trace, threading.current_thread().name, self.clock(), len(stack), attrs)
+        stack.append(s)
+        return s
+
+    def _close(self, s, exc_type):
+        s.duration = self.clock() - s.start
+        if exc_type is not None:
+            s.attrs['error'] = exc_type.__name__
+
+        stack = self._get_stack()
+        # tolerate spans closed out of order
+        if stack and stack[-1] is s:
+            stack.pop()
+        elif s in stack:
+            stack.remove(s)
+
+        with self._lock:
+            self._buffer.append(s)
+
+
+def format_breakdown(bd, nmax=30):
+    lines = ['{:<45s}{:>6s}{:>10s}{:>10s}{:>10s}'.format('Span', 'n', 'total', 'mean', 'max')]
+    for r in bd['spans'][:nmax]:
+        depth = r['path'].count('/')
+        name = '{}{}'.format('  ' * depth, r['path'].split('/')[-1])
+        lines.append('{:<45s}{:>6d}{:>10.3f}{:>10.3f}{:>10.3f}'.format(name, r['n'], r['total'], r['mean'],
+                                                                        r['max']))
+
+    cs = bd.get('counters')
+    if cs:
+        lines.append('')
+        lines.extend('{:<45s}{:>6}'.format(k, v) for k, v in sorted(cs.items()))
+    return '\n'.join(lines)
+
+
+def dump_breakdown(bd, path):
+    root = os.path.dirname(path)
+    if root and not os.path.isdir(root):
+        os.makedirs(root)
+
+    with open(path, 'w') as wfile:
+        json.dump(bd, wfile, indent=1)
+
+
+spans = SpanRecorder()
+
+# ============= EOF =============================================
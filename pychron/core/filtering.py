@@ -16,42 +16,153 @@
 
 # ============= enthought library imports =======================
 from __future__ import absolute_import
-import re
 
-from numpy import ma
+import ast
+import operator
+from functools import lru_cache
+
+from numpy import ma, asarray, where, logical_not, errstate, broadcast_to, flatnonzero
 
 
 # ============= standard library imports ========================
 # ============= local library imports  ==========================
 
+COMPARISONS = {ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+               ast.Eq: operator.eq, ast.NotEq: operator.ne}
+BINARY_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+                    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+                    ast.Pow: operator.pow}
+UNARY_OPERATORS = {ast.USub: operator.neg, ast.UAdd: operator.pos, ast.Not: logical_not}
+
+
+def truth(v):
+    return asarray(v).astype(bool)
+
+
+class Predicate(object):
+    """
+        a filter predicate compiled into a tree of functions of {name: array}. ``and``/``or`` keep python's
+        semantics, ``a and b`` is b where a is true otherwise a
+    """
+
+    def __init__(self, text, func, names):
+        self.text = text
+        self.names = names
+        self._func = func
+
+    def evaluate(self, ctx, n):
+        """
+            return a bool array of length n
+        """
+        with errstate(all='ignore'):
+            v = self._func(ctx)
+        return broadcast_to(truth(v), (n,))
+
+
+@lru_cache(maxsize=256)
+def compile_predicate(predicate_str):
+    """
+        compile ``predicate_str`` once. raises ValueError if it is anything other than comparisons, arithmetic and
+        and/or/not of names and numbers
+    """
+    try:
+        tree = ast.parse(predicate_str.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError('invalid predicate "{}". {}'.format(predicate_str, e))
+
+    names = set()
+    func = _compile_node(tree.body, names)
+    return Predicate(predicate_str, func, names)
+
+
+def _number(node):
+    """
+        the value of a number or True/False node otherwise None. python < 3.8 parses them as Num and NameConstant
+    """
+    kind = type(node).__name__
+    if kind == 'Num':
+        v = node.n
+    elif kind in ('Constant', 'NameConstant'):
+        v = node.value
+    else:
+        return
+
+    if isinstance(v, (int, float)):
+        return v
+
+
+def _compile_node(node, names):
+    value = _number(node)
+    if value is not None:
+        return lambda ctx: value
+
+    elif isinstance(node, ast.Name):
+        name = node.id
+        names.add(name)
+        return lambda ctx: ctx[name]
+
+    elif isinstance(node, ast.BoolOp):
+        fs = [_compile_node(v, names) for v in node.values]
+        if isinstance(node.op, ast.And):
+            def func(ctx):
+                r = fs[0](ctx)
+                for f in fs[1:]:
+                    r = where(truth(r), f(ctx), r)
+                return r
+        else:
+            def func(ctx):
+                r = fs[0](ctx)
+                for f in fs[1:]:
+                    r = where(truth(r), r, f(ctx))
+                return r
+        return func
+
+    elif isinstance(node, ast.Compare):
+        fs = [_compile_node(v, names) for v in [node.left] + node.comparators]
+        try:
+            ops = [COMPARISONS[type(o)] for o in node.ops]
+        except KeyError:
+            raise ValueError('invalid comparison in predicate')
+
+        def func(ctx):
+            vs = [f(ctx) for f in fs]
+            r = True
+            for op, a, b in zip(ops, vs, vs[1:]):
+                r = r & truth(op(a, b))
+            return r
+        return func
+
+    elif isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        op = BINARY_OPERATORS[type(node.op)]
+        left, right = _compile_node(node.left, names), _compile_node(node.right, names)
+        return lambda ctx: op(left(ctx), right(ctx))
+
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        op = UNARY_OPERATORS[type(node.op)]
+        operand = _compile_node(node.operand, names)
+        return lambda ctx: op(operand(ctx))
+
+    raise ValueError('"{}" not allowed in predicate'.format(type(node).__name__))
+
 
 def filter_items(items, predicate_str, return_indices=True):
     omits = []
     if predicate_str:
-        match = re.search(r'(?P<name>[A-Za-z])', predicate_str)
-        if match:
-            variable_name = match.group('name')
-            omits = [(eval(predicate_str, {variable_name: yi}), i) for i, yi in enumerate(items)]
-            omits = [idx for ti, idx in omits if ti]
+        p = compile_predicate(predicate_str)
+        if p.names:
+            vs = asarray(items, dtype=float)
+            omits = flatnonzero(p.evaluate({n: vs for n in p.names}, vs.shape[0])).tolist()
             if not return_indices:
                 omits = [items[i] for i in omits]
 
     return omits
 
 
-regex = re.compile(r'error|percent_error|(?! and| or)[A-Za-z]+')
-
-
 def validate_filter_predicate(predicate):
-    attr = regex.findall(predicate)
-    ctx = {}
-    for ai in attr:
-        ctx[ai] = 1
-
     try:
-        eval(predicate, ctx)
+        compile_predicate(predicate)
         return True
-    except BaseException:
+    except ValueError:
         pass
 
 
@@ -65,21 +176,25 @@ def filter_ufloats(items, predicate_str, return_indices=True):
     :param return_indices:
     :return: a list of omitted indices if return_indices is True or a list of omitted items
     """
-    attrs = regex.findall(predicate_str)
-
-    def make_ctx(v, e):
-        ctx = {}
-        for ai in attrs:
-            if ai == 'error':
-                ctx[ai] = e
-            elif ai == 'percent_error':
-                ctx[ai] = e / v * 100 if v else 0
-            else:
-                ctx[ai] = v
-        return ctx
-
-    omits = [(i, eval(predicate_str, make_ctx(*uf))) for i, uf in enumerate(items)]
-    omits = [idx for idx, ti in omits if ti]
+    p = compile_predicate(predicate_str)
+
+    n = len(items)
+    if not n:
+        return []
+
+    vs, es = asarray(items, dtype=float).reshape(n, 2).T
+
+    ctx = {}
+    for ai in p.names:
+        if ai == 'error':
+            ctx[ai] = es
+        elif ai == 'percent_error':
+            with errstate(all='ignore'):
+                ctx[ai] = where(vs != 0, es / vs * 100, 0)
+        else:
+            ctx[ai] = vs
+
+    omits = flatnonzero(p.evaluate(ctx, n)).tolist()
     if not return_indices:
         omits = [items[i] for i in omits]
 
@@ -46,6 +46,108 @@ def fuzzyfinder(user_input, collection, attr=None):
     return [x for _, _, x in suggestions]
 
 
+def trigrams(txt, pad=True):
+    """
+        the set of lowercase three character substrings of ``txt``. padding with two leading and one trailing
+        space gives the start and the end of ``txt`` trigrams of their own
+    """
+    txt = str(txt).lower()
+    if pad:
+        txt = '  {} '.format(txt)
+    return {txt[i:i + 3] for i in range(len(txt) - 2)}
+
+
+def similarity(a, b):
+    """
+        fraction of shared trigrams of two trigram sets
+    """
+    n = len(a | b)
+    return len(a & b) / float(n) if n else 0
+
+
+class FuzzyIndex(object):
+    """
+        index of a collection for ``fuzzyfinder`` style searches.
+
+        ``find`` gives the same items as ``fuzzyfinder`` in the same order. each character is mapped to a bitmask
+        of the items containing it so only the items containing every letter and digit of the input are matched
+        against the regex.
+
+        ``rank`` orders the matches by the length and start of the match and the length of the item and appends
+        items with similar trigrams so a misspelled input still finds something
+    """
+
+    def __init__(self, collection, attr=None):
+        self.attr = attr
+        self.items = list(collection)
+        self.texts = texts = [str(getattr(item, attr) if attr else item) for item in self.items]
+
+        masks = {}
+        grams = {}
+        for i, txt in enumerate(texts):
+            bit = 1 << i
+            for c in set(txt.lower()) | set(txt.casefold()):
+                masks[c] = masks.get(c, 0) | bit
+            for g in trigrams(txt):
+                grams.setdefault(g, []).append(i)
+
+        self._masks = masks
+        self._grams = grams
+
+    def find(self, user_input):
+        return [self.items[i] for _, _, i in self._find(user_input)]
+
+    def rank(self, user_input, limit=None, threshold=0.3):
+        texts = self.texts
+        hits = sorted(self._find(user_input), key=lambda h: (h[0], h[1], len(texts[h[2]]), h[2]))
+        idxs = [i for _, _, i in hits]
+
+        if user_input and (limit is None or len(idxs) < limit):
+            ts = trigrams(user_input)
+            candidates = set()
+            for g in ts:
+                candidates.update(self._grams.get(g, ()))
+
+            found = set(idxs)
+            typos = []
+            for i in candidates:
+                if i not in found:
+                    s = similarity(ts, trigrams(texts[i]))
+                    if s >= threshold:
+                        typos.append((-s, i))
+
+            idxs.extend(i for _, i in sorted(typos))
+
+        if limit is not None:
+            idxs = idxs[:limit]
+        return [self.items[i] for i in idxs]
+
+    def _find(self, user_input):
+        pattern = '.*'.join(user_input)
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            return []
+
+        # letters and digits are always literals in the pattern
+        mask = (1 << len(self.items)) - 1
+        for c in set(user_input.lower()):
+            if ord(c) < 128 and c.isalnum():
+                mask &= self._masks.get(c, 0)
+                if not mask:
+                    return []
+
+        ret = []
+        while mask:
+            low = mask & -mask
+            i = low.bit_length() - 1
+            mask ^= low
+
+            match = regex.search(self.texts[i])
+            if match:
+                ret.append((len(match.group()), match.start(), i))
+        return ret
+
 
 if __name__ == '__main__':
     collection = ['django_migrations.py',
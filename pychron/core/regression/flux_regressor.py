@@ -15,7 +15,7 @@
 # ===============================================================================
 
 # ============= standard library imports ========================
-from numpy import asarray, column_stack, ones_like, array, average
+from numpy import asarray, column_stack, ones_like, zeros, where, errstate, sqrt
 # ============= local library imports  ==========================
 from statsmodels.regression.linear_model import WLS, OLS
 # ============= enthought library imports =======================
@@ -35,37 +35,35 @@ class BracketingFluxRegressor(BaseRegressor):
         return self._predict(pts, return_error=True)
 
     def _predict(self, pts, return_error=False):
-        def pred(x, y):
-            """
-            get points with same y value
-            :param p:
-            :return:
-            """
-            tol = 0.001
-
-            # idx = (i for i, p in enumerate(self.clean_xs) if ((x - p[0]) ** 2 + (y - p[1]) ** 2) ** 0.5 < tol)
-            # idx = (i for i, p in enumerate(self.clean_xs) if )
-            idx = [abs(y - p[1]) < tol for p in self.clean_xs]
-            v = 0
-            if idx:
-                vs = self.clean_ys[idx]
-
-                if self.use_weighted_fit:
-                    es = self.clean_yserr[idx]
-                    ws = es ** -2
-                    if return_error:
-                        v = ws.sum()
-                    else:
-                        v = average(vs, weights=ws)
+        """
+            average the monitors with the same y value as each point. 0 if there are none
+        """
+        tol = 0.001
+
+        pts = asarray(pts, dtype=float).reshape(-1, 2)
+        xs = asarray(self.clean_xs, dtype=float).reshape(-1, 2)
+        vs = asarray(self.clean_ys, dtype=float)
+
+        # (npts, nmonitors) mask of the monitors bracketing each point
+        m = abs(pts[:, 1, None] - xs[None, :, 1]) < tol
+        n = m.sum(1)
+        nz = n > 0
+        with errstate(divide='ignore', invalid='ignore'):
+            if self.use_weighted_fit:
+                ws = m * asarray(self.clean_yserr, dtype=float) ** -2
+                sw = ws.sum(1)
+                if return_error:
+                    v = sw
                 else:
-                    if return_error:
-                        v = vs.std()
-                    else:
-                        v = vs.mean()
-            return v
+                    v = ws.dot(vs) / sw
+            else:
+                mean = m.dot(vs) / n
+                if return_error:
+                    v = sqrt((m * (vs[None, :] - mean[:, None]) ** 2).sum(1) / n)
+                else:
+                    v = mean
 
-        ret = [pred(*pt) for pt in pts]
-        return ret
+        return list(where(nz, v, 0))
 
     def get_exog(self, x):
         return x
@@ -86,14 +84,20 @@ class MatchingFluxRegressor(BaseRegressor):
         return self._predict(pts, self.clean_yserr)
 
     def _predict(self, pts, ret):
-        def matching(xx, yy):
-            for i, pt in enumerate(self.clean_xs):
-                if ((xx - pt[0]) ** 2 + (yy - pt[1]) ** 2) ** 0.5 < 0.0001:
-                    return ret[i]
-            else:
-                return 0
-
-        return array([matching(x, y) for x, y in pts])
+        """
+            the value of the monitor at each point. 0 if there is none
+        """
+        pts = asarray(pts, dtype=float).reshape(-1, 2)
+        xs = asarray(self.clean_xs, dtype=float).reshape(-1, 2)
+        ret = asarray(ret)
+        if not xs.shape[0]:
+            return zeros(pts.shape[0])
+
+        d = ((pts[:, None, :] - xs[None, :, :]) ** 2).sum(2) ** 0.5
+        m = d < 0.0001
+
+        # the first matching monitor
+        return where(m.any(1), ret[m.argmax(1)], 0)
 
     def get_exog(self, x):
         return x
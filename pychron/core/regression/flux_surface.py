@@ -0,0 +1,213 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    fit every flux surface model of an irradiation level at once.
+
+    the Plane columns (x, y, 1) are the first three columns of the Bowl design matrix so one QR decomposition
+    of the Bowl design matrix solves both models when they are weighted the same way. the leave-one-out
+    residuals come from the diagonal of the hat matrix, e/(1-h), instead of refitting without each monitor.
+
+    coefficients, var/covar and predicted errors are the same as ``PlaneFluxRegressor`` and
+    ``BowlFluxRegressor``. like ``BowlFluxRegressor`` the Bowl is not weighted unless ``weighted_bowl`` is set
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from collections import OrderedDict
+
+from numpy import asarray, column_stack, ones_like, ones, absolute, diag, finfo, linalg, sqrt, errstate, nan, \
+    where, isnan
+
+# ============= local library imports  ==========================
+from pychron.core.stats.core import calculate_mswd
+from pychron.pychron_constants import PLANE, BOWL, SEM, MSEM, SD
+
+# number of leading design matrix columns used by each model
+NCOLUMNS = OrderedDict(((PLANE, 3), (BOWL, 8)))
+
+# the regressors' coefficient order as design matrix columns
+COEFFICIENT_ORDER = {PLANE: (0, 1, 2),
+                     BOWL: (3, 4, 5, 6, 7, 0, 1, 2)}
+
+
+def design_matrix(pts):
+    """
+        x, y, 1, x**2, y**2, x**2*y, y**2*x, x*y for each (x, y) in ``pts``
+    """
+    x, y = asarray(pts, dtype=float).T
+    return column_stack((x, y, ones_like(x), x ** 2, y ** 2, x ** 2 * y, y ** 2 * x, x * y))
+
+
+class FluxSurfaceFit(object):
+    """
+        the fit of one model. ``resid`` and ``loo_resid`` are in units of J
+    """
+
+    def __init__(self, kind, params, var_covar, resid, hat, mswd):
+        self.kind = kind
+        self.params = params
+        self.var_covar = var_covar
+        self.resid = resid
+        self.hat = hat
+        self.mswd = mswd
+
+        n, p = resid.shape[0], params.shape[0]
+        self.n = n
+        self.sef = sqrt((resid ** 2).sum() / (n - p)) if n > p else 0
+
+        with errstate(divide='ignore', invalid='ignore'):
+            loo = resid / (1 - hat)
+        # a monitor the model passes through regardless of its value has no leave-one-out residual
+        self.loo_resid = where(1 - hat < 1e-10, nan, loo)
+
+    @property
+    def coefficients(self):
+        return self.params[list(COEFFICIENT_ORDER[self.kind])]
+
+    @property
+    def press(self):
+        """
+            prediction sum of squares
+        """
+        loo = self.loo_resid
+        return (loo[~isnan(loo)] ** 2).sum()
+
+    @property
+    def loo_rms(self):
+        loo = self.loo_resid
+        loo = loo[~isnan(loo)]
+        return sqrt((loo ** 2).mean()) if loo.shape[0] else nan
+
+    def predict(self, pts, X=None):
+        if X is None:
+            X = design_matrix(pts)
+        return X[:, :self.params.shape[0]].dot(self.params)
+
+    def predict_error(self, pts, error_calc=SEM, X=None):
+        if X is None:
+            X = design_matrix(pts)
+
+        X = X[:, :self.params.shape[0]]
+        v = (X.dot(self.var_covar) * X).sum(1)
+
+        sef = self.sef
+        if error_calc == SEM:
+            return sef * sqrt(v)
+        elif error_calc == MSEM:
+            m = self.mswd ** 0.5 if self.mswd > 1 else 1
+            return sef * sqrt(v) * m
+        elif error_calc == SD:
+            return sqrt(sef ** 2 + sef ** 2 * v)
+        else:
+            raise ValueError('invalid error_calc "{}"'.format(error_calc))
+
+
+class FluxSurface(object):
+    """
+        xy: monitor positions, [(x1, y1), (x2, y2), ...]
+        j, jerr: the monitor J's
+
+        use_weighted_fit weights each monitor of the Plane by 1/jerr**2. the Bowl is weighted too only if
+        ``weighted_bowl`` is set
+    """
+
+    def __init__(self, xy, j, jerr=None, use_weighted_fit=False, kinds=(PLANE, BOWL), weighted_bowl=False):
+        self.xy = asarray(xy, dtype=float)
+        self.j = asarray(j, dtype=float)
+        self.jerr = None if jerr is None else asarray(jerr, dtype=float)
+        self.use_weighted_fit = use_weighted_fit
+        self.weighted_bowl = weighted_bowl
+        self.kinds = kinds
+        self.fits = OrderedDict()
+
+    def is_weighted(self, kind):
+        return self.use_weighted_fit and (kind != BOWL or self.weighted_bowl)
+
+    def fit(self):
+        j, jerr = self.j, self.jerr
+        X = design_matrix(self.xy)
+        n = j.shape[0]
+
+        fits = OrderedDict()
+        if n >= 2:
+            weighted = [k for k in self.kinds if self.is_weighted(k)]
+            unweighted = [k for k in self.kinds if not self.is_weighted(k)]
+            if weighted:
+                if jerr is None or not jerr.all():
+                    raise ValueError('weighted fit requires non-zero J errors')
+                fits.update(self._fit(X, 1 / jerr, weighted))
+            if unweighted:
+                fits.update(self._fit(X, ones(n), unweighted))
+
+        self.fits = OrderedDict((k, fits[k]) for k in self.kinds if k in fits)
+        return self
+
+    def predict(self, pts, error_calc=SEM, kinds=None):
+        """
+            return {kind: (j, jerr)} at ``pts`` for each fitted model
+        """
+        X = design_matrix(pts)
+        if kinds is None:
+            kinds = self.fits.keys()
+
+        return OrderedDict((k, (self.fits[k].predict(pts, X=X),
+                                self.fits[k].predict_error(pts, error_calc, X=X))) for k in kinds if k in self.fits)
+
+    def compare(self):
+        """
+            (kind, loo_rms, press, sef) of each model, smallest leave-one-out error first
+        """
+        rows = [(f.kind, f.loo_rms, f.press, f.sef) for f in self.fits.values()]
+        return sorted(rows, key=lambda r: (isnan(r[1]), r[1]))
+
+    # private
+    def _fit(self, X, sw, kinds):
+        """
+            fit ``kinds`` with the monitors weighted by ``sw``**2 from one QR decomposition
+        """
+        j, jerr = self.j, self.jerr
+        n = j.shape[0]
+
+        # only the columns of the largest model
+        X = X[:, :max(NCOLUMNS[k] for k in kinds)]
+        wX = X * sw[:, None]
+        wy = j * sw
+        q, r = linalg.qr(wX)
+
+        d = absolute(diag(r))
+        fits = {}
+        for kind in kinds:
+            p = NCOLUMNS[kind]
+            dp = d[:p]
+            if n >= p and dp.min() > dp.max() * max(n, p) * finfo(float).eps:
+                qp = q[:, :p]
+                ri = linalg.inv(r[:p, :p])
+                params = ri.dot(qp.T.dot(wy))
+                var_covar = ri.dot(ri.T)
+                hat = (qp ** 2).sum(1)
+            else:
+                # fewer monitors than coefficients or monitors on a conic. minimum norm solution like statsmodels
+                pi = linalg.pinv(wX[:, :p])
+                params = pi.dot(wy)
+                var_covar = pi.dot(pi.T)
+                hat = (wX[:, :p] * pi.T).sum(1)
+
+            resid = j - X[:, :p].dot(params)
+            mswd = calculate_mswd(j, jerr, k=p) if jerr is not None and jerr.all() else 0
+            fits[kind] = FluxSurfaceFit(kind, params, var_covar, resid, hat, mswd)
+        return fits
+
+# ============= EOF =============================================
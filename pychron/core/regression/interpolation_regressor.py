@@ -15,7 +15,7 @@
 # ===============================================================================
 
 # ============= standard library imports ========================
-from numpy import where, polyval, polyfit
+from numpy import where, polyval, polyfit, asarray, arange, zeros, minimum, maximum, searchsorted, append
 # ============= enthought library imports =======================
 from traits.api import Str
 
@@ -38,11 +38,26 @@ class InterpolationRegressor(BaseRegressor):
         return self._predict(xs, 'error')
 
     def _predict(self, xs, attr):
-        kind = self.kind.replace(' ', '_')
-        func = getattr(self, '{}_predictors'.format(kind))
         if not hasattr(xs, '__iter__'):
             xs = (xs,)
 
+        ts = asarray(xs, dtype=float)
+        n = len(self.xs)
+        if self.kind.startswith('bracketing'):
+            if not n:
+                # no references. let the per point predictors raise
+                return self._predict_points(ts, attr)
+        elif not (self._check_integrity(self.xs, self.ys) and self._check_integrity(self.ys, self.yserr)):
+            return []
+
+        kind = self.kind.replace(' ', '_')
+        func = getattr(self, '_batch_{}'.format(kind))
+        return list(func(ts, attr))
+
+    def _predict_points(self, xs, attr):
+        kind = self.kind.replace(' ', '_')
+        func = getattr(self, '{}_predictors'.format(kind))
+
         exc = self.get_excluded()
         xs = (func(xi, exc, attr) for xi in xs)
 
@@ -50,6 +65,98 @@ class InterpolationRegressor(BaseRegressor):
         # if preceding and no value found use the first following value e.g index 0
         return [xi for xi in xs if xi is not None]
 
+    # batch predictors
+    # these give the same values as the per point predictors but find the neighbors of all the points
+    # with one searchsorted call. xs does not need to be sorted.
+    def _batch_preceding(self, ts, attr):
+        idx = self._last_index(ts, 'right')
+        idx[idx < 0] = 0
+        return self._batch_values(attr)[self._previous_included()[idx]]
+
+    def _batch_succeeding(self, ts, attr):
+        xs = asarray(self.xs)
+        n = len(xs)
+        idx = searchsorted(maximum.accumulate(xs), ts, 'left')
+        idx[idx == n] = n - 1
+
+        # an index of n raises an IndexError like the per point predictor
+        return self._batch_values(attr)[minimum(self._next_included()[idx], n)]
+
+    def _batch_bracketing_average(self, ts, attr):
+        pb, ab, _, _ = self._batch_bracketing(ts, attr)
+        if attr == 'value':
+            return (pb + ab) / 2.0
+        else:
+            return ((pb ** 2 + ab ** 2) ** 0.5) / 2.0
+
+    def _batch_bracketing_interpolate(self, ts, attr):
+        pb, ab, x0, x1 = self._batch_bracketing(ts, attr)
+        vs = self._batch_values(attr)
+
+        inside = (ts < x1) & (ts > x0)
+        # avoid dividing by zero outside of the bracket
+        f = (ts - x0) / where(inside, x1 - x0, 1)
+        if attr == 'error':
+            v = (((1 - f) * pb) ** 2 + (f * ab) ** 2) ** 0.5
+        else:
+            v = pb + f * (ab - pb)
+
+        v = where(ts <= x0, vs[0], v)
+        return where(ts >= x1, vs[-1], v)
+
+    def _batch_bracketing(self, ts, attr):
+        xs = asarray(self.xs)
+        vs = self._batch_values(attr)
+        n = len(xs)
+
+        ti = self._last_index(ts, 'left')
+        li = self._previous_included()[ti]
+
+        hi = ti + 1
+        nc = self.n
+        hi = where(hi < nc, minimum(self._next_included()[hi], nc), hi)
+
+        # no reference before the point or no reference after it. use the first reference
+        invalid = (ti < 0) | (hi >= n)
+        li[invalid] = 0
+        hi[invalid] = 0
+
+        return vs[li], vs[hi], xs[li], xs[hi]
+
+    def _batch_values(self, attr):
+        return asarray(self.ys if attr == 'value' else self.yserr)
+
+    def _last_index(self, ts, side):
+        """
+            index of the last x <= t (side='right') or x < t (side='left') for each t. -1 if there is none.
+            searches the running minimum from the end so xs does not need to be sorted
+        """
+        xs = asarray(self.xs)
+        return searchsorted(minimum.accumulate(xs[::-1])[::-1], ts, side) - 1
+
+    def _excluded_mask(self):
+        n = len(self.xs)
+        mask = zeros(n, dtype=bool)
+        exc = [i for i in self.get_excluded() if 0 <= i < n]
+        mask[exc] = True
+        return mask
+
+    def _previous_included(self):
+        """
+            for each index the closest included index at or before it, or 0
+        """
+        mask = self._excluded_mask()
+        return maximum.accumulate(where(mask, 0, arange(len(mask))))
+
+    def _next_included(self):
+        """
+            for each index the closest included index at or after it, or n. has n+1 entries
+        """
+        mask = self._excluded_mask()
+        n = len(mask)
+        idx = where(mask, n, arange(n))
+        return append(minimum.accumulate(idx[::-1])[::-1], n)
+
     def succeeding_predictors(self, *args, **kw):
         return self._adjacent_predictors('after', *args, **kw)
 
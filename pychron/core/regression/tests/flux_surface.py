@@ -0,0 +1,149 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+from unittest import TestCase
+
+from numpy import linspace, array, cos, sin, pi, delete, column_stack, allclose, isnan
+from numpy.random import RandomState
+
+# ============= local library imports  ==========================
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor, BowlFluxRegressor, MatchingFluxRegressor, \
+    BracketingFluxRegressor
+from pychron.core.regression.flux_surface import FluxSurface
+from pychron.pychron_constants import PLANE, BOWL, SEM, MSEM, SD
+
+KLASSES = {PLANE: PlaneFluxRegressor, BOWL: BowlFluxRegressor}
+
+
+class WeightedBowlFluxRegressor(PlaneFluxRegressor):
+    _get_X = BowlFluxRegressor._get_X
+
+
+def ring(n, r, offset=0):
+    t = linspace(0, 2 * pi, n, endpoint=False) + offset
+    return column_stack((r * cos(t), r * sin(t)))
+
+
+class FluxSurfaceTestCase(TestCase):
+    def setUp(self):
+        rs = RandomState(11)
+        # monitors on two rings like a tray
+        self.xy = xy = array(list(ring(8, 1.5)) + list(ring(6, 3, 0.2)))
+        x, y = xy.T
+        self.j = 0.01 + 1e-4 * x - 2e-4 * y + 3e-5 * x ** 2 + rs.normal(0, 5e-6, len(x))
+        self.jerr = rs.uniform(2e-6, 8e-6, len(x))
+        self.pts = rs.uniform(-3, 3, (50, 2))
+
+    def _regressor(self, kind, xy, j, jerr, weighted):
+        reg = KLASSES[kind](xs=xy, ys=j, yserr=jerr, use_weighted_fit=weighted)
+        reg.calculate()
+        return reg
+
+    def test_regressors(self):
+        for weighted in (False, True):
+            surface = FluxSurface(self.xy, self.j, self.jerr, use_weighted_fit=weighted).fit()
+            for kind in (PLANE, BOWL):
+                reg = self._regressor(kind, self.xy, self.j, self.jerr, weighted)
+                fit = surface.fits[kind]
+
+                self.assertTrue(allclose(fit.coefficients, reg.coefficients, rtol=1e-6, atol=1e-14))
+                self.assertTrue(allclose(fit.predict(self.pts), reg.predict(self.pts), rtol=1e-9))
+                for ec in (SEM, MSEM, SD):
+                    self.assertTrue(allclose(fit.predict_error(self.pts, ec),
+                                             reg.predict_error(self.pts, error_calc=ec), rtol=1e-6))
+
+    def test_weighted_bowl(self):
+        # the bowl is not weighted by default
+        reg = self._regressor(BOWL, self.xy, self.j, self.jerr, False)
+        wreg = self._regressor(BOWL, self.xy, self.j, self.jerr, True)
+        self.assertTrue(allclose(wreg.coefficients, reg.coefficients, rtol=1e-9, atol=1e-14))
+
+        surface = FluxSurface(self.xy, self.j, self.jerr, use_weighted_fit=True, weighted_bowl=True).fit()
+        self.assertEqual(list(surface.fits.keys()), [PLANE, BOWL])
+
+        reg = WeightedBowlFluxRegressor(xs=self.xy, ys=self.j, yserr=self.jerr, use_weighted_fit=True)
+        reg.calculate()
+        fit = surface.fits[BOWL]
+        self.assertTrue(allclose(fit.coefficients, reg.coefficients, rtol=1e-6, atol=1e-14))
+        for ec in (SEM, MSEM, SD):
+            self.assertTrue(allclose(fit.predict_error(self.pts, ec), reg.predict_error(self.pts, error_calc=ec),
+                                     rtol=1e-6))
+
+        reg = self._regressor(PLANE, self.xy, self.j, self.jerr, True)
+        self.assertTrue(allclose(surface.fits[PLANE].coefficients, reg.coefficients, rtol=1e-6, atol=1e-14))
+
+    def test_leave_one_out(self):
+        for weighted in (False, True):
+            surface = FluxSurface(self.xy, self.j, self.jerr, use_weighted_fit=weighted).fit()
+            for kind in (PLANE, BOWL):
+                fit = surface.fits[kind]
+                for i in range(len(self.j)):
+                    reg = self._regressor(kind, delete(self.xy, i, 0), delete(self.j, i), delete(self.jerr, i),
+                                          weighted)
+                    loo = self.j[i] - reg.predict(self.xy[i:i + 1])[0]
+                    self.assertAlmostEqual(fit.loo_resid[i] / loo, 1, 6)
+
+        # the noise is small compared to the curvature so the bowl predicts the left out monitors better
+        rows = FluxSurface(self.xy, self.j).fit().compare()
+        self.assertEqual([r[0] for r in rows], [BOWL, PLANE])
+
+    def test_predict(self):
+        surface = FluxSurface(self.xy, self.j, self.jerr).fit()
+        ps = surface.predict(self.pts, error_calc=SD)
+        self.assertEqual(list(ps.keys()), [PLANE, BOWL])
+        for kind, (j, je) in ps.items():
+            fit = surface.fits[kind]
+            self.assertTrue(allclose(j, fit.predict(self.pts)))
+            self.assertTrue(allclose(je, fit.predict_error(self.pts, SD)))
+
+    def test_degenerate(self):
+        # one ring. x**2+y**2 is constant so the bowl is rank deficient
+        xy = ring(10, 2)
+        j = self.j[:10]
+        surface = FluxSurface(xy, j).fit()
+        reg = self._regressor(BOWL, xy, j, self.jerr[:10], False)
+        self.assertTrue(allclose(surface.fits[BOWL].predict(self.pts), reg.predict(self.pts), rtol=1e-6))
+
+        # fewer monitors than bowl coefficients
+        surface = FluxSurface(self.xy[:5], self.j[:5]).fit()
+        reg = self._regressor(BOWL, self.xy[:5], self.j[:5], self.jerr[:5], False)
+        self.assertTrue(allclose(surface.fits[BOWL].predict(self.pts), reg.predict(self.pts), rtol=1e-6))
+        self.assertTrue(isnan(surface.fits[BOWL].loo_rms))
+
+    def test_matching(self):
+        reg = MatchingFluxRegressor(xs=self.xy, ys=self.j, yserr=self.jerr)
+        pts = array([self.xy[3], (10, 10), self.xy[0]])
+        self.assertEqual(list(reg.predict(pts)), [self.j[3], 0, self.j[0]])
+        self.assertEqual(list(reg.predict_error(pts)), [self.jerr[3], 0, self.jerr[0]])
+
+    def test_bracketing(self):
+        xy = array([(-1, 0), (1, 0), (0, 1)])
+        j = array([1., 2., 3.])
+        e = array([0.1, 0.2, 0.1])
+        pts = [(0, 0), (0, 1), (0, 5)]
+
+        reg = BracketingFluxRegressor(xs=xy, ys=j, yserr=e)
+        self.assertTrue(allclose(reg.predict(pts), [1.5, 3, 0]))
+        self.assertTrue(allclose(reg.predict_error(pts), [0.5, 0, 0]))
+
+        reg.use_weighted_fit = True
+        self.assertTrue(allclose(reg.predict(pts), [(100 + 2 * 25) / 125., 3, 0]))
+        self.assertTrue(allclose(reg.predict_error(pts), [125, 100, 0]))
+
+# ============= EOF =============================================
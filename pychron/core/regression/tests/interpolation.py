@@ -0,0 +1,83 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+from unittest import TestCase
+
+from numpy import linspace, array
+from numpy.random import RandomState
+
+# ============= local library imports  ==========================
+from pychron.core.regression.interpolation_regressor import InterpolationRegressor
+
+KINDS = ('preceding', 'succeeding', 'bracketing average', 'bracketing interpolate')
+
+
+class InterpolationRegressorTestCase(TestCase):
+    def setUp(self):
+        rs = RandomState(7)
+        self.xs = linspace(0, 100, 25)
+        self.ys = rs.uniform(1, 2, 25)
+        self.es = rs.uniform(0.01, 0.1, 25)
+        # points outside, on and between the references
+        self.ts = list(linspace(-10, 110, 97)) + list(self.xs)
+
+    def _assert_same(self, reg):
+        for attr in ('value', 'error'):
+            batch = reg._predict(self.ts, attr)
+            points = reg._predict_points(self.ts, attr)
+            self.assertEqual(len(batch), len(points))
+            for a, b in zip(batch, points):
+                self.assertAlmostEqual(a, b, 10)
+
+    def test_kinds(self):
+        for kind in KINDS:
+            self._assert_same(InterpolationRegressor(xs=self.xs, ys=self.ys, yserr=self.es, kind=kind))
+
+    def test_excluded(self):
+        # includes the first and last references
+        for kind in ('preceding', 'bracketing average', 'bracketing interpolate'):
+            reg = InterpolationRegressor(xs=self.xs, ys=self.ys, yserr=self.es, kind=kind)
+            reg.user_excluded = [0, 1, 5, 6, 7, 12, 24]
+            self._assert_same(reg)
+
+        reg = InterpolationRegressor(xs=self.xs, ys=self.ys, yserr=self.es, kind='succeeding')
+        reg.user_excluded = [0, 1, 5, 6, 7, 12]
+        self._assert_same(reg)
+
+    def test_unsorted(self):
+        rs = RandomState(3)
+        idx = rs.permutation(25)
+        for kind in KINDS:
+            reg = InterpolationRegressor(xs=self.xs[idx], ys=self.ys[idx], yserr=self.es[idx], kind=kind)
+            reg.user_excluded = [2, 9]
+            self._assert_same(reg)
+
+    def test_scalar(self):
+        reg = InterpolationRegressor(xs=self.xs, ys=self.ys, yserr=self.es, kind='bracketing interpolate')
+        self.assertEqual(len(reg.predict(50.0)), 1)
+        self.assertAlmostEqual(reg.predict(50.0)[0], reg.bracketing_interpolate_predictors(50.0, [], 'value'))
+
+    def test_single_reference(self):
+        reg = InterpolationRegressor(xs=array([1.]), ys=array([2.]), yserr=array([0.1]), kind='preceding')
+        self.assertEqual(reg.predict([0, 1, 2]), [])
+
+        reg = InterpolationRegressor(xs=array([1.]), ys=array([2.]), yserr=array([0.1]), kind='bracketing average')
+        self._assert_same(reg)
+
+# ============= EOF =============================================
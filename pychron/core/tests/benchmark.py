@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.core.codetools.benchmark import Benchmark, BenchmarkRunner, compare, dump_results, load_results, \
+    format_comparison
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        return self.t
+
+
+class BenchmarkRunnerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.clock = FakeClock()
+        self.setups = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _setup(self, fixture):
+        self.setups += 1
+        # setup time is not counted
+        self.clock.t += 100
+        return fixture
+
+    def _slow(self, fixture):
+        self.clock.t += fixture
+
+    def _fail(self, fixture):
+        raise ImportError('No module named foo')
+
+    def _runner(self, **kw):
+        bs = [Benchmark('slow', self._slow, group='a', setup=self._setup, number=2),
+              Benchmark('fail', self._fail, group='b')]
+        return BenchmarkRunner(bs, repeat=3, warmup=1, fixture=0.5, clock=self.clock, **kw)
+
+    def test_run(self):
+        results = self._runner().run()
+        r = results['results']['slow']
+        self.assertEqual(self.setups, 4)
+        self.assertListEqual(r['times'], [0.5, 0.5, 0.5])
+        self.assertEqual(r['median'], 0.5)
+        self.assertEqual(r['stdev'], 0)
+        self.assertIsNone(r['error'])
+
+        f = results['results']['fail']
+        self.assertTrue(f['error'].startswith('ImportError'))
+        self.assertListEqual(f['times'], [])
+        self.assertEqual(results['config']['seed'], 0)
+
+    def test_pattern(self):
+        runner = self._runner(pattern='b')
+        self.assertListEqual([b.name for b in runner.benchmarks], ['fail'])
+
+    def test_seed(self):
+        import random
+
+        vs = []
+        b = Benchmark('rand', lambda f: vs.append(random.random()))
+        BenchmarkRunner([b], repeat=2, warmup=1, seed=1).run()
+        self.assertEqual(len(set(vs)), 1)
+
+    def test_compare(self):
+        p = os.path.join(self.root, 'results', 'base.json')
+        base = self._runner().run()
+        dump_results(base, p)
+        base = load_results(p)
+
+        current = self._runner().run()
+        current['results']['slow']['median'] = 0.6
+        cs = compare(base, current, threshold=0.1)
+        self.assertEqual(len(cs), 1)
+        c = cs[0]
+        self.assertEqual(c.name, 'slow')
+        self.assertAlmostEqual(c.ratio, 1.2)
+        self.assertTrue(c.regressed)
+        self.assertIn('REGRESSION', format_comparison(cs))
+
+        self.assertFalse(compare(base, current, threshold=0.25)[0].regressed)
+
+
+if __name__ == '__main__':
+    unittest.main()
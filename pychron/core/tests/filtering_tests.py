@@ -1,7 +1,13 @@
 from __future__ import absolute_import
-from numpy import ma
+from numpy import ma, array
+from numpy.random import RandomState
 
-from pychron.core.filtering import filter_items, filter_ufloats, sigma_filter
+from pychron.core.filtering import filter_items, filter_ufloats, sigma_filter, validate_filter_predicate
+from pychron.dvc.benchmark.filtering import eval_filter_ufloats
+
+PREDICATES = ('x>10', 'x>10 or error>1', 'age>10 and percent_error<5', '10<x<=20', 'not x>10',
+              'x>10 and not (error>1 or percent_error>20)', 'x - error > 12', 'x**2/4 >= 50 or error*2 == 1',
+              '(x or error) > 5', 'x % 3 == 0', '-x < -15', 'percent_error != percent_error', 'True', '1 > 2')
 
 __author__ = 'ross'
 
@@ -37,6 +43,34 @@ class FilteringTestCase(unittest.TestCase):
         o = filter_ufloats([(1, 1), (10, 1), (20, 11)], 'age>10 or percent_error>50')
         self.assertListEqual(o, [0, 2])
 
+    def test_eval_equivalence(self):
+        rs = RandomState(3)
+        vs = rs.randint(-5, 30, 300).astype(float)
+        es = rs.randint(0, 4, 300).astype(float)
+        items = list(zip(vs, es))
+        for p in PREDICATES:
+            self.assertListEqual(filter_ufloats(items, p), eval_filter_ufloats(items, p), p)
+            self.assertListEqual(filter_ufloats(array(items), p), eval_filter_ufloats(items, p), p)
+
+    def test_ufloats_items(self):
+        o = filter_ufloats([(1, 1), (10, 11), (20, 1)], 'x>10 or error>10', return_indices=False)
+        self.assertListEqual(o, [(10, 11), (20, 1)])
+
+    def test_empty(self):
+        self.assertListEqual(filter_ufloats([], 'x>10'), [])
+        self.assertListEqual(filter_items([1, 2], ''), [])
+
+    def test_validate(self):
+        for p in PREDICATES:
+            self.assertTrue(validate_filter_predicate(p), p)
+
+        for p in ('x>', "__import__('os').getcwd()", 'x.real>1', 'open("a")', '(lambda: 1)()', "x=='a'",
+                  '[x][0]>1', 'x if error else 1'):
+            self.assertFalse(validate_filter_predicate(p), p)
+
+        with self.assertRaises(ValueError):
+            filter_ufloats([(1, 1)], 'x.__class__')
+
     def test_sigma_filter_masked(self):
         x = ma.array([1, 1, 1, 1, 1, 10], mask=False)
         x.mask[5] = True
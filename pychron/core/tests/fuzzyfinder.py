@@ -0,0 +1,43 @@
+import random
+import string
+import unittest
+
+from pychron.core.fuzzyfinder import fuzzyfinder, FuzzyIndex
+
+
+class Item(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class FuzzyIndexTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rs = random.Random(0)
+        chars = string.ascii_letters + string.digits + '-_. '
+        cls.collection = [''.join(rs.choice(chars) for _ in range(rs.randint(3, 14))) for _ in range(2000)]
+        cls.index = FuzzyIndex(cls.collection)
+
+    def test_same_hits(self):
+        rs = random.Random(1)
+        for ui in ['', 'ab', 'FC-2', 'a.', '.*', '(', '\\', 'Zz9'] + \
+                [''.join(rs.choice(string.ascii_letters + '-.') for _ in range(rs.randint(1, 4)))
+                 for _ in range(200)]:
+            self.assertEqual(self.index.find(ui), fuzzyfinder(ui, self.collection), ui)
+
+    def test_attr(self):
+        items = [Item(n) for n in ('sanidine', 'biotite', 'FC-2', 'fish canyon')]
+        index = FuzzyIndex(items, 'name')
+        self.assertEqual(index.find('fc'), fuzzyfinder('fc', items, 'name'))
+        self.assertEqual([i.name for i in index.find('fc')], ['FC-2', 'fish canyon'])
+
+    def test_rank(self):
+        index = FuzzyIndex(['plagioclase', 'sanidine-2', 'sanidine', 'biotite'])
+        self.assertEqual(index.rank('sanid'), ['sanidine', 'sanidine-2'])
+        # typo
+        self.assertEqual(index.rank('sanadine'), ['sanidine', 'sanidine-2'])
+        self.assertEqual(index.rank('biotite', limit=1), ['biotite'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from pychron.core.codetools.spans import SpanRecorder, NULL_SPAN, dump_breakdown, format_breakdown
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        return self.t
+
+
+class SpanRecorderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.recorder = SpanRecorder(capacity=100, clock=self.clock)
+
+    def _run(self, trace='12345-01'):
+        r, c = self.recorder, self.clock
+        with r.span('extraction', trace=trace):
+            c.t += 10
+        with r.span('measurement', trace=trace):
+            for i in range(3):
+                with r.span('iteration'):
+                    with r.span('get_data'):
+                        c.t += 1
+                    c.t += 1
+                r.count('counts')
+
+    def test_nesting(self):
+        self._run()
+        paths = [s.path for s in self.recorder.records()]
+        self.assertEqual(paths[:2], ['extraction', 'measurement/iteration/get_data'])
+        self.assertEqual(paths[-1], 'measurement')
+        self.assertTrue(all(s.trace == '12345-01' for s in self.recorder.records()))
+
+    def test_breakdown(self):
+        self._run()
+        self._run(trace='12345-02')
+
+        bd = self.recorder.breakdown('12345-01')
+        rows = {r['path']: r for r in bd['spans']}
+        self.assertListEqual([r['path'] for r in bd['spans']],
+                             ['extraction', 'measurement', 'measurement/iteration',
+                              'measurement/iteration/get_data'])
+        self.assertEqual(rows['extraction']['total'], 10)
+        self.assertEqual(rows['measurement']['total'], 6)
+        self.assertEqual(rows['measurement/iteration']['n'], 3)
+        self.assertEqual(rows['measurement/iteration']['mean'], 2)
+        self.assertEqual(bd['counters'], {'counts': 3})
+        self.assertIn('get_data', format_breakdown(bd))
+
+        self.recorder.finish_trace('12345-01')
+        self.assertEqual(self.recorder.counters('12345-01'), {})
+        self.assertEqual(self.recorder.counters(), {'counts': 6})
+        self.assertEqual(self.recorder.counters('12345-02'), {'counts': 3})
+
+    def test_threads(self):
+        r = self.recorder
+        with r.span('measurement', trace='a'):
+            trace = r.current_trace()
+
+            def func():
+                self.assertIsNone(r.current_trace())
+                with r.span('write', trace=trace):
+                    pass
+
+            t = threading.Thread(target=func)
+            t.start()
+            t.join()
+
+        w = r.records('a')[0]
+        self.assertEqual(w.path, 'write')
+        self.assertEqual(w.depth, 0)
+
+    def test_exception(self):
+        r = self.recorder
+        with self.assertRaises(ValueError):
+            with r.span('save'):
+                raise ValueError
+        s = r.records()[0]
+        self.assertEqual(s.attrs['error'], 'ValueError')
+        self.assertIsNone(r.current_trace())
+
+    def test_disabled(self):
+        r = self.recorder
+        r.enabled = False
+        self.assertIs(r.span('foo'), NULL_SPAN)
+
+        @r.traced()
+        def foo():
+            return 1
+
+        self.assertEqual(foo(), 1)
+        r.count('counts')
+        self.assertEqual(r.records(), [])
+        self.assertEqual(r.counters(), {})
+
+        r.enabled = True
+        foo()
+        self.assertEqual(r.records()[0].name, 'foo')
+
+    def test_ring_buffer(self):
+        r = SpanRecorder(capacity=5, clock=self.clock)
+        for i in range(10):
+            with r.span('s', idx=i):
+                pass
+        self.assertListEqual([s.attrs['idx'] for s in r.records()], [5, 6, 7, 8, 9])
+
+    def test_dump(self):
+        root = tempfile.mkdtemp()
+        try:
+            self._run()
+            p = os.path.join(root, 'logs', '12345-01.timing.json')
+            dump_breakdown(self.recorder.breakdown('12345-01'), p)
+            self.assertTrue(os.path.isfile(p))
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -173,6 +173,19 @@ class DashboardClient(Subscriber):
         if config:
             self._load_configuration(config)
 
+    def get_history(self, tag, start=None, end=None, max_points=2000):
+        """
+            return the recorded samples of the process value ``tag`` between ``start`` and ``end``.
+            the server returns rollups (t, min, mean, max, n) if there are more than ``max_points`` samples
+        """
+        start, end = ['none' if a is None else a for a in (start, end)]
+        resp = self.request('history {} {} {} {}'.format(tag, start, end, max_points), timeout=5)
+        if resp:
+            try:
+                return pickle.loads(resp)
+            except (pickle.PickleError, ImportError):
+                self.warning('Could not load history for {}'.format(tag))
+
     def set_error_flag(self, new):
         self.error_flag = new
 
@@ -19,8 +19,8 @@
 from traits.api import Str, Bool, List, Instance, Event
 from traitsui.api import View, ListEditor, InstanceEditor, UItem, VGroup, HGroup, VSplit
 # ============= standard library imports ========================
+import os
 import random
-import struct
 import time
 
 import yaml
@@ -28,15 +28,18 @@ from traits.api import Str, Bool, List, Instance, Event
 from traitsui.api import View, ListEditor, InstanceEditor, UItem, VGroup, HGroup, VSplit
 
 # ============= local library imports  ==========================
-from pychron.core.helpers.filetools import unique_path2
 from pychron.dashboard.conditional import DashboardConditional
 from pychron.dashboard.process_value import ProcessValue
+from pychron.dashboard.timeseries_store import TimeSeriesStore
 from pychron.globals import globalv
-from pychron.graph.stream_graph import StreamStackedGraph
+from pychron.graph.stream_graph import StreamStackedGraph, time_generator
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.loggable import Loggable
 from pychron.paths import paths
 
+SCAN_WIDTH = 24 * 60 * 60
+HISTORY_POINTS = 2000
+
 
 class DashboardDevice(Loggable):
     name = Str
@@ -49,6 +52,7 @@ class DashboardDevice(Loggable):
     conditional_event = Event
 
     graph = Instance(StreamStackedGraph)
+    store = Instance(TimeSeriesStore)
 
     @property
     def value_keys(self):
@@ -73,8 +77,12 @@ class DashboardDevice(Loggable):
 
             g.new_series(plotid=i)
             g.set_y_title(vi.display_name, plotid=i)
-            g.set_scan_width(24 * 60 * 60, plotid=i)
-            g.set_data_limits(24 * 60 * 60, plotid=i)
+            g.set_scan_width(SCAN_WIDTH, plotid=i)
+            g.set_data_limits(SCAN_WIDTH, plotid=i)
+
+            # continue the live samples from the end of the recorded history
+            start = self._load_history(vi) if vi.record else 0
+            g.time_generators.append(time_generator(start))
 
     def trigger(self):
         """
@@ -93,6 +101,16 @@ class DashboardDevice(Loggable):
             elif dt > value.period:
                 self._trigger(value)
 
+    def trigger_value(self, value, force=False):
+        """
+            read ``value`` from the hardware device. used by the poll scheduler
+        """
+        if force:
+            self.debug('Force trigger. timeout={}'.format(value.timeout))
+            self._trigger(value, force=True)
+        else:
+            self._trigger(value)
+
     def _trigger(self, value, **kw):
         try:
             self.debug('triggering value device={} value={} func={}'.format(self.hardware_device.name,
@@ -173,14 +191,12 @@ class DashboardDevice(Loggable):
             self._check_conditional(pv, new)
 
     def _record(self, pv, v):
-        path = pv.path
-        if not path:
-            path, _ = unique_path2(paths.device_scan_dir, pv.name)
-            pv.path = path
-            self.info('Saving {} to {}'.format(pv.name, path))
+        store = self.store
+        if not pv.path:
+            pv.path = store.get_path(pv.name)
+            self.info('Saving {} to {}'.format(pv.name, pv.path))
 
-        with open(path, 'a') as wfile:
-            wfile.write('{},{}\n'.format(time.time(), v))
+        store.append(pv.name, v, pv.last_time)
 
     def _check_conditional(self, pv, new):
         conds = pv.conditionals
@@ -207,29 +223,37 @@ class DashboardDevice(Loggable):
             d.append(dd)
         return yaml.dump(d)
 
-    def get_scan_fmt(self):
-        n = len(self.values) * 2
-        fmt = '>{}'.format('f' * n)
-        return fmt
-
-    def append_scan_blob(self, blob=None, fmt=None):
-        new_args = [a for v in self.values
-                    for a in (v.last_time, v.last_value)]
-
-        if blob:
-            step = 4 * fmt.count('f')
-            args = zip(*[struct.unpack(fmt, blob[i:i + step]) for i in range(0, len(blob), step)])
-            ns = []
-            for blobv, lastv in zip(args, new_args):
-                blobv = list(blobv)
-                blobv.append(lastv)
-                ns.append(blobv)
-            blob = ''.join([struct.pack(fmt, *v) for v in zip(*ns)])
-        else:
-            fmt = '>{}'.format('f' * len(new_args))
-            blob = struct.pack(fmt, *new_args)
+    def get_history(self, name, start=None, end=None, resolution=None, max_points=None):
+        """
+            return the recorded samples of value ``name``. see ``TimeSeriesStore.query``
+        """
+        return self.store.query(name, start, end, resolution=resolution, max_points=max_points)
+
+    def _load_history(self, pv):
+        """
+            plot the recorded samples of the last scan width so the graph does not start empty after a restart.
+            return the elapsed time of the plot
+        """
+        now = time.time()
+        try:
+            arr = self.get_history(pv.name, now - SCAN_WIDTH, now, max_points=HISTORY_POINTS)
+        except BaseException as e:
+            self.debug('failed loading history for {}. {}'.format(pv.name, e))
+            return 0
+
+        if arr is None or not arr.shape[0]:
+            return 0
+
+        vs = arr['v'] if 'v' in arr.dtype.names else arr['mean']
+        t0 = arr['t'][0]
+        g = self.graph
+        for t, v in zip(arr['t'], vs):
+            g.record(v, x=t - t0, plotid=pv.plotid)
+
+        return now - t0
 
-        return blob
+    def _store_default(self):
+        return TimeSeriesStore(os.path.join(paths.device_scan_dir, self.name))
 
     def traits_view(self):
         hgrp = HGroup(UItem('use'), UItem('name', style='readonly'))
@@ -0,0 +1,205 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import heapq
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from threading import RLock, Event
+
+# ============= local library imports  ==========================
+
+ON_CHANGE = 'on_change'
+
+logger = logging.getLogger('DeadlineScheduler')
+
+
+class ReadStats(object):
+    def __init__(self):
+        self.nreads = 0
+        self.ntimeouts = 0
+        self.nskipped = 0
+        self.last_duration = 0
+        self.max_duration = 0
+        self.total_duration = 0
+        self.last_lateness = 0
+        self.max_lateness = 0
+
+    def add_read(self, duration):
+        self.nreads += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+    def add_lateness(self, lateness):
+        self.last_lateness = lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+
+    def to_dict(self):
+        return {'nreads': self.nreads,
+                'ntimeouts': self.ntimeouts,
+                'nskipped': self.nskipped,
+                'last_duration': self.last_duration,
+                'max_duration': self.max_duration,
+                'mean_duration': self.total_duration / self.nreads if self.nreads else 0,
+                'last_lateness': self.last_lateness,
+                'max_lateness': self.max_lateness}
+
+
+class _Entry(object):
+    def __init__(self, device, value):
+        self.device = device
+        self.value = value
+        self.stats = ReadStats()
+
+
+class DeadlineScheduler(object):
+    """
+        poll dashboard process values from a priority queue of due times.
+
+        reads are run on a bounded thread pool. a device has at most one read in flight, so a slow or hung
+        device only delays its own values. values that come due while their device is busy are parked
+        and dispatched as soon as the device's read returns.
+
+        ``on_change`` values are only read when nothing was pushed for ``timeout`` seconds
+    """
+
+    def __init__(self, max_workers=4, read_timeout=10, min_period=1, clock=time.time):
+        self.read_timeout = read_timeout
+        self.min_period = min_period
+        self.clock = clock
+
+        self._heap = []
+        self._seq = count()
+        self._entries = []
+        self._busy = {}
+        self._parked = {}
+        self._lock = RLock()
+        self._wake = Event()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def add(self, device, value, now=None):
+        if now is None:
+            now = self.clock()
+
+        e = _Entry(device, value)
+        self._entries.append(e)
+        with self._lock:
+            self._push(now, e)
+        return e
+
+    def run(self, is_alive):
+        while is_alive():
+            timeout = self.step()
+            self._wake.wait(min(max(timeout, 0.01), 1))
+            self._wake.clear()
+
+    def step(self, now=None):
+        """
+            dispatch every read that is due. return the number of seconds until the next read is due
+        """
+        if now is None:
+            now = self.clock()
+
+        with self._lock:
+            self._check_timeouts(now)
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                due, _, e = heapq.heappop(heap)
+                self._dispatch(e, due, now)
+
+            if heap:
+                return heap[0][0] - now
+            return self.min_period
+
+    def stats(self):
+        return {e.value.tag: e.stats.to_dict() for e in self._entries}
+
+    def shutdown(self, wait=False):
+        self._wake.set()
+        self._pool.shutdown(wait=wait)
+
+    # private
+    def _push(self, due, e):
+        heapq.heappush(self._heap, (due, next(self._seq), e))
+
+    def _dispatch(self, e, due, now):
+        value, device = e.value, e.device
+        period = value.period
+
+        if not (device.use and value.enabled):
+            self._push(now + self._get_period(period, value), e)
+            return
+
+        force = False
+        if period == ON_CHANGE:
+            if not value.timeout:
+                self._push(now + self.min_period * 60, e)
+                return
+
+            force_due = value.last_time + value.timeout
+            if now < force_due:
+                self._push(force_due, e)
+                return
+            force = True
+
+        if device in self._busy:
+            e.stats.nskipped += 1
+            self._parked.setdefault(device, []).append((due, e))
+            return
+
+        e.stats.add_lateness(now - due)
+        self._busy[device] = (e, now, False)
+        fut = self._pool.submit(device.trigger_value, value, force=force)
+        fut.add_done_callback(lambda f, e=e, st=now: self._done(e, st))
+
+        if period != ON_CHANGE:
+            nt = due + period
+            if nt <= now:
+                nt = now + period
+            self._push(nt, e)
+
+    def _done(self, e, st):
+        now = self.clock()
+        e.stats.add_read(now - st)
+        with self._lock:
+            self._busy.pop(e.device, None)
+            for due, pe in self._parked.pop(e.device, []):
+                self._push(due, pe)
+
+        if e.value.period == ON_CHANGE:
+            with self._lock:
+                self._push(now + e.value.timeout, e)
+
+        self._wake.set()
+
+    def _check_timeouts(self, now):
+        for device, (e, st, flagged) in list(self._busy.items()):
+            if not flagged and now - st > self.read_timeout:
+                e.stats.ntimeouts += 1
+                self._busy[device] = (e, st, True)
+                logger.warning('read {} timed out after {:0.1f}s. '
+                               'other values of this device are waiting'.format(e.value.tag, now - st))
+
+    def _get_period(self, period, value):
+        if period == ON_CHANGE:
+            return max(self.min_period, value.timeout or 0)
+        return max(self.min_period, period)
+
+# ============= EOF =============================================
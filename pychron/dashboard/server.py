@@ -16,15 +16,15 @@
 
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Instance, on_trait_change, List, Button, Bool
+from traits.api import Instance, on_trait_change, List, Button, Bool, Int, Float
 # ============= standard library imports ========================
 from threading import Thread
 import os
 import pickle
-import time
 # ============= local library imports  ==========================
 from pychron.dashboard.constants import CRITICAL, NOERROR, WARNING
 from pychron.dashboard.device import DashboardDevice
+from pychron.dashboard.poll_scheduler import DeadlineScheduler
 from pychron.globals import globalv
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.core.helpers.filetools import add_extension
@@ -73,8 +73,12 @@ class DashboardServer(Loggable):
     emailer = Instance('pychron.social.emailer.Emailer')
     labspy_client = Instance('pychron.labspy.client.LabspyClient')
 
+    poll_workers = Int(4)
+    read_timeout = Float(10)
+
     use_db = False
     _alive = False
+    _scheduler = None
 
     def bind_preferences(self):
         bind_preference(self.notifier, 'enabled', 'pychron.dashboard.server.notifier_enabled')
@@ -95,7 +99,7 @@ class DashboardServer(Loggable):
             self.labspy_client.start()
 
     def deactivate(self):
-        pass
+        self._alive = False
 
     # def deactivate(self):
     # if self.use_db:
@@ -122,9 +126,19 @@ class DashboardServer(Loggable):
             # self.url = '{}:{}'.format(host, port)
             # add a config request handler
             self.notifier.add_request_handler('config', self._handle_config)
+            self.notifier.add_request_handler('history', self._handle_history)
+
+    def get_poll_stats(self):
+        """
+            return a dictionary of tag: read statistics (duration, lateness, timeouts) for each process value
+        """
+        if self._scheduler:
+            return self._scheduler.stats()
+        return {}
 
     def start_poll(self):
         self.info('starting dashboard poll')
+        self._load_poll_config()
         self._alive = True
         t = Thread(name='poll',
                    target=self._poll)
@@ -246,34 +260,55 @@ class DashboardServer(Loggable):
 
         return pickle.dumps(config)
 
-    def _poll(self):
-        if any((v.period == 'on_change' for dev in self.devices for v in dev.values)):
-            mperiod = 1
-        else:
-            mperiod = min((v.period for dev in self.devices for v in dev.values))
-
-        self.debug('min period {}'.format(mperiod))
-        while self._alive:
-            sst = time.time()
-            # self.debug('============= poll iteration start ============')
-            for dev in self.devices:
-                if not dev.use:
-                    continue
+    def _load_poll_config(self):
+        parser = get_parser()
+        for attr, tag, cast in (('poll_workers', 'poll_workers', int),
+                                ('read_timeout', 'read_timeout', float)):
+            elem = parser.get_elements(tag)
+            if elem:
+                try:
+                    setattr(self, attr, cast(elem[0].text.strip()))
+                except (IndexError, ValueError, AttributeError):
+                    pass
+
+    def _handle_history(self, args):
+        """
+            called by subscribers requesting the recorded history of a process value.
+            args is "<tag> <start> <end> <max_points>". use "none" for an open bound
 
-                dev.trigger()
+            return a pickled numpy array. see ``TimeSeriesStore.query``
+        """
+        try:
+            tag, start, end, max_points = args.rsplit(' ', 3)
+            start, end = [None if a == 'none' else float(a) for a in (start, end)]
+            max_points = int(max_points)
+        except ValueError:
+            self.debug('invalid history request "{}"'.format(args))
+            return pickle.dumps(None)
 
-            st = time.time()
-            pp = mperiod - (st - sst)
-            if pp >= 3:
-                self.debug('sleeping for {}'.format(pp))
+        for dev in self.devices:
+            pv = next((pv for pv in dev.values if pv.tag == tag), None)
+            if pv is not None:
+                return pickle.dumps(dev.get_history(pv.name, start, end, max_points=max_points))
 
-            while self._alive:
-                if time.time() - st >= pp:
-                    break
-                time.sleep(0.1)
+        return pickle.dumps(None)
 
-            # dur = time.time() - sst
-            # self.debug('============= poll iteration finished dur={:0.1f}============'.format(dur))
+    def _poll(self):
+        self.debug('poll workers={} read timeout={}'.format(self.poll_workers, self.read_timeout))
+        sched = DeadlineScheduler(max_workers=self.poll_workers,
+                                  read_timeout=self.read_timeout)
+        for dev in self.devices:
+            for v in dev.values:
+                sched.add(dev, v)
+
+        self._scheduler = sched
+        try:
+            sched.run(lambda: self._alive)
+        finally:
+            sched.shutdown()
+            for tag, st in sched.stats().items():
+                self.debug('{} reads={nreads} timeouts={ntimeouts} mean_duration={mean_duration:0.3f} '
+                           'max_lateness={max_lateness:0.3f}'.format(tag, **st))
 
     # def _set_error_flag(self, obj, msg):
     # self.notifier.send_message('error {}'.format(msg))
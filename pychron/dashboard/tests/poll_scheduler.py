@@ -0,0 +1,120 @@
+import time
+import unittest
+from threading import Event
+
+from pychron.dashboard.poll_scheduler import DeadlineScheduler
+
+
+class MockValue:
+    def __init__(self, tag, period, timeout=0):
+        self.tag = tag
+        self.period = period
+        self.timeout = timeout
+        self.enabled = True
+        self.last_time = 0
+
+
+class MockDevice:
+    def __init__(self, release=None):
+        self.use = True
+        self.reads = []
+        self.release = release
+
+    def trigger_value(self, value, force=False):
+        if self.release is not None:
+            self.release.wait(5)
+        self.reads.append((value.tag, force))
+
+
+class DeadlineSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.sched = DeadlineScheduler(max_workers=2, read_timeout=5, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.sched.shutdown()
+
+    def _step(self, now, *devices):
+        self.now = now
+        ret = self.sched.step()
+        self._wait(*devices)
+        return ret
+
+    def _wait(self, *devices):
+        st = time.time()
+        while any(d in self.sched._busy for d in devices) and time.time() - st < 5:
+            time.sleep(0.001)
+
+    def test_periods(self):
+        fast, slow = MockDevice(), MockDevice()
+        self.sched.add(fast, MockValue('pressure', 1), now=0)
+        self.sched.add(slow, MockValue('temperature', 60), now=0)
+
+        self._step(0, fast, slow)
+        for i in range(1, 4):
+            self._step(i, fast, slow)
+
+        self.assertEqual(len(fast.reads), 4)
+        self.assertEqual(len(slow.reads), 1)
+
+    def test_next_due(self):
+        dev = MockDevice()
+        self.sched.add(dev, MockValue('a', 5), now=0)
+        self._step(0, dev)
+        self.assertEqual(self._step(2, dev), 3)
+
+    def test_slow_device_isolated(self):
+        release = Event()
+        hung, fast = MockDevice(release), MockDevice()
+        self.sched.add(hung, MockValue('gauge1', 1), now=0)
+        self.sched.add(hung, MockValue('gauge2', 1), now=0)
+        self.sched.add(fast, MockValue('pressure', 1), now=0)
+
+        for i in range(10):
+            self._step(i, fast)
+
+        self.assertEqual(len(fast.reads), 10)
+        self.assertEqual(hung.reads, [])
+
+        st = self.sched.stats()
+        self.assertEqual(st['gauge1']['ntimeouts'], 1)
+        self.assertGreater(st['gauge2']['nskipped'], 0)
+        self.assertEqual(st['pressure']['max_lateness'], 0)
+
+        release.set()
+        self._wait(hung)
+        self._step(10, hung)
+        self._wait(hung)
+        self.assertIn('gauge2', [t for t, _ in hung.reads])
+        self.assertGreater(self.sched.stats()['gauge2']['max_lateness'], 0)
+
+    def test_on_change(self):
+        dev = MockDevice()
+        v = MockValue('a', 'on_change', timeout=10)
+        self.sched.add(dev, v, now=0)
+
+        # value pushed recently by the device. no read required
+        v.last_time = 5
+        self._step(0, dev)
+        self.assertEqual(dev.reads, [])
+        self._step(14, dev)
+        self.assertEqual(dev.reads, [])
+
+        self._step(16, dev)
+        self.assertEqual(dev.reads, [('a', True)])
+
+    def test_disabled(self):
+        dev = MockDevice()
+        v = MockValue('a', 1)
+        v.enabled = False
+        self.sched.add(dev, v, now=0)
+        self._step(0, dev)
+        self.assertEqual(dev.reads, [])
+
+        v.enabled = True
+        self._step(1, dev)
+        self.assertEqual(dev.reads, [('a', False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
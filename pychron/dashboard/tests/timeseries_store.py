@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.dashboard.timeseries_store import TimeSeriesStore, summarize
+
+
+class TimeSeriesStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = TimeSeriesStore(self.root, resolutions=(10, 100), chunk_size=16)
+        for i in range(250):
+            self.store.append('pressure', i, t=i)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.root)
+
+    def test_raw_range(self):
+        arr = self.store.query('pressure', 95, 104)
+        self.assertEqual(list(arr['t']), list(range(95, 105)))
+        self.assertEqual(list(arr['v']), list(range(95, 105)))
+
+    def test_all(self):
+        self.assertEqual(len(self.store.query('pressure')), 250)
+
+    def test_rollup(self):
+        arr = self.store.query('pressure', resolution=10)
+        self.assertEqual(len(arr), 25)
+        r = arr[3]
+        self.assertEqual(r['t'], 30)
+        self.assertEqual(r['min'], 30)
+        self.assertEqual(r['max'], 39)
+        self.assertEqual(r['mean'], 34.5)
+        self.assertEqual(r['n'], 10)
+
+    def test_open_bucket(self):
+        arr = self.store.query('pressure', resolution=100)
+        self.assertEqual(list(arr['t']), [0, 100, 200])
+        self.assertEqual(arr[-1]['n'], 50)
+
+    def test_max_points(self):
+        self.assertTrue('v' in self.store.query('pressure', max_points=500).dtype.names)
+        arr = self.store.query('pressure', max_points=100)
+        self.assertEqual(len(arr), 25)
+        arr = self.store.query('pressure', max_points=5)
+        self.assertEqual(len(arr), 3)
+
+    def test_summarize(self):
+        raw = summarize(self.store.query('pressure'))
+        rolled = summarize(self.store.query('pressure', resolution=100))
+        self.assertEqual(raw, (0, 124.5, 249, 250))
+        self.assertEqual(rolled, raw)
+
+    def test_invalid_resolution(self):
+        self.assertRaises(ValueError, self.store.query, 'pressure', resolution=5)
+
+    def test_reopen(self):
+        self.store.close()
+        store = TimeSeriesStore(self.root, resolutions=(10, 100), chunk_size=16)
+        for i in range(250, 260):
+            store.append('pressure', i, t=i)
+
+        self.assertEqual(len(store.query('pressure')), 260)
+        arr = store.query('pressure', resolution=10)
+        self.assertEqual(list(arr['n']), [10] * 26)
+        arr = store.query('pressure', resolution=100)
+        self.assertEqual(arr[-1]['n'], 60)
+        store.close()
+
+    def test_interrupted_rollup(self):
+        self.store.close()
+        shutil.rmtree(os.path.join(self.store.get_path('pressure'), 'r10'))
+
+        store = TimeSeriesStore(self.root, resolutions=(10, 100), chunk_size=16)
+        store.append('pressure', 250, t=250)
+        arr = store.query('pressure', resolution=10)
+        self.assertEqual(len(arr), 26)
+        self.assertEqual(arr[3]['mean'], 34.5)
+        store.close()
+
+    def test_reader(self):
+        reader = TimeSeriesStore(self.root, resolutions=(10, 100), chunk_size=16)
+        self.assertEqual(len(reader.query('pressure')), 250)
+        self.store.append('pressure', 250, t=250)
+        self.assertEqual(len(reader.query('pressure')), 251)
+        self.assertEqual(reader.query('pressure', resolution=100)[-1]['n'], 51)
+        reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,397 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    append-only time-series store for dashboard process values.
+
+    each device has a directory with one subdirectory per process value::
+
+        <root>/<value>/raw/00000000.bin
+        <root>/<value>/r60/00000000.bin
+        <root>/<value>/r600/00000000.bin
+        <root>/<value>/r3600/00000000.bin
+
+    samples are written as fixed size little-endian records to chunk files of ``chunk_size`` records. every
+    sample also updates min/mean/max/n rollups at each resolution. reads memory map the chunks and use
+    ``searchsorted`` to slice the requested time range, so a query only touches the chunks it needs
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import re
+import time
+from bisect import bisect_right
+from threading import Lock
+
+from numpy import dtype, memmap, array, concatenate, empty, floor, frombuffer, inf, unique, minimum, \
+    maximum, add
+
+# ============= local library imports  ==========================
+
+RAW_DTYPE = dtype([('t', '<f8'), ('v', '<f8')])
+ROLLUP_DTYPE = dtype([('t', '<f8'), ('min', '<f8'), ('mean', '<f8'), ('max', '<f8'), ('n', '<i8')])
+
+RESOLUTIONS = (60, 600, 3600)
+CHUNK_SIZE = 65536
+
+
+def series_name(name):
+    return re.sub(r'[^\w\-.]', '_', name)
+
+
+class _Chunks(object):
+    """
+        a directory of fixed size chunk files holding records of ``dtype`` sorted by time
+    """
+
+    def __init__(self, root, dt, chunk_size):
+        self.root = root
+        self.dtype = dt
+        self.chunk_size = chunk_size
+
+        self._paths = []
+        self._starts = []
+        self._maps = {}
+        self._wfile = None
+        self._nlast = 0
+
+        if not os.path.isdir(root):
+            os.makedirs(root)
+        self._load()
+
+    def append(self, rows):
+        i = 0
+        n = len(rows)
+        while i < n:
+            if not self._paths or self._nlast >= self.chunk_size:
+                self._new_chunk(rows[i]['t'])
+            elif self._wfile is None:
+                self._open_last()
+
+            j = min(n, i + self.chunk_size - self._nlast)
+            self._wfile.write(rows[i:j].tobytes())
+            self._nlast += j - i
+            i = j
+
+        self._wfile.flush()
+
+    def read(self, start, end):
+        self._load()
+        starts = self._starts
+        if not starts:
+            return empty(0, dtype=self.dtype)
+
+        i0 = max(0, bisect_right(starts, start) - 1)
+        i1 = bisect_right(starts, end)
+        parts = []
+        for i in range(i0, i1):
+            arr = self._map(i)
+            ts = arr['t']
+            lo = ts.searchsorted(start, 'left')
+            hi = ts.searchsorted(end, 'right')
+            if hi > lo:
+                parts.append(arr[lo:hi])
+
+        if not parts:
+            return empty(0, dtype=self.dtype)
+        return concatenate(parts)
+
+    def count(self, start, end):
+        self._load()
+        starts = self._starts
+        n = 0
+        for i in range(max(0, bisect_right(starts, start) - 1), bisect_right(starts, end)):
+            ts = self._map(i)['t']
+            n += ts.searchsorted(end, 'right') - ts.searchsorted(start, 'left')
+        return n
+
+    def first(self):
+        if self._starts:
+            return self._starts[0]
+
+    def last(self):
+        if self._paths:
+            arr = self._map(len(self._paths) - 1)
+            if len(arr):
+                return arr[-1]
+
+    def close(self):
+        if self._wfile:
+            self._wfile.close()
+            self._wfile = None
+        self._maps = {}
+
+    # private
+    def _load(self):
+        ps = sorted(p for p in os.listdir(self.root) if p.endswith('.bin'))
+        if len(ps) == len(self._paths):
+            return
+
+        for p in ps[len(self._paths):]:
+            p = os.path.join(self.root, p)
+            with open(p, 'rb') as rfile:
+                buf = rfile.read(8)
+            if len(buf) < 8:
+                break
+            self._paths.append(p)
+            self._starts.append(float(frombuffer(buf, '<f8')[0]))
+
+        if self._paths:
+            self._nlast = os.path.getsize(self._paths[-1]) // self.dtype.itemsize
+
+    def _open_last(self):
+        p = self._paths[-1]
+        self._wfile = open(p, 'ab')
+        # drop a partial record left by an interrupted write
+        self._wfile.truncate(self._nlast * self.dtype.itemsize)
+
+    def _new_chunk(self, t):
+        if self._wfile:
+            self._wfile.close()
+
+        p = os.path.join(self.root, '{:08d}.bin'.format(len(self._paths)))
+        self._paths.append(p)
+        self._starts.append(float(t))
+        self._wfile = open(p, 'ab')
+        self._nlast = 0
+
+    def _map(self, i):
+        p = self._paths[i]
+        last = i == len(self._paths) - 1
+        if not last and p in self._maps:
+            return self._maps[p]
+
+        if self._wfile and last:
+            self._wfile.flush()
+
+        n = os.path.getsize(p) // self.dtype.itemsize
+        if not n:
+            return empty(0, dtype=self.dtype)
+
+        arr = memmap(p, dtype=self.dtype, mode='r', shape=(n,))
+        if not last:
+            self._maps[p] = arr
+        return arr
+
+
+def rollup(rows, resolution):
+    """
+        return the min/mean/max/n of the raw ``rows`` in buckets of ``resolution`` seconds
+    """
+    if not len(rows):
+        return empty(0, dtype=ROLLUP_DTYPE)
+
+    vs = rows['v']
+    bts = floor(rows['t'] / resolution) * resolution
+    bs, idx, ns = unique(bts, return_index=True, return_counts=True)
+
+    out = empty(len(bs), dtype=ROLLUP_DTYPE)
+    out['t'] = bs
+    out['min'] = minimum.reduceat(vs, idx)
+    out['max'] = maximum.reduceat(vs, idx)
+    out['mean'] = add.reduceat(vs, idx) / ns
+    out['n'] = ns
+    return out
+
+
+def summarize(arr):
+    """
+        return (min, mean, max, n) of a raw or rollup array returned by ``TimeSeriesStore.query``
+    """
+    if not len(arr):
+        return
+
+    if 'v' in arr.dtype.names:
+        vs = arr['v']
+        return vs.min(), vs.mean(), vs.max(), len(vs)
+
+    ns = arr['n']
+    n = ns.sum()
+    return arr['min'].min(), (arr['mean'] * ns).sum() / n, arr['max'].max(), n
+
+
+class _Bucket(object):
+    def __init__(self, t):
+        self.t = t
+        self.min = inf
+        self.max = -inf
+        self.total = 0
+        self.n = 0
+
+    def add(self, v):
+        self.min = min(self.min, v)
+        self.max = max(self.max, v)
+        self.total += v
+        self.n += 1
+
+    def to_rows(self):
+        return array([(self.t, self.min, self.total / self.n, self.max, self.n)], dtype=ROLLUP_DTYPE)
+
+
+class _Series(object):
+    def __init__(self, root, resolutions, chunk_size):
+        self.root = root
+        self.resolutions = resolutions
+        self.raw = _Chunks(os.path.join(root, 'raw'), RAW_DTYPE, chunk_size)
+        self.rollups = {r: _Chunks(os.path.join(root, 'r{}'.format(r)), ROLLUP_DTYPE, chunk_size)
+                        for r in resolutions}
+        self._buckets = None
+        self._last_t = -inf
+
+    def append(self, t, v):
+        if self._buckets is None:
+            self._open()
+
+        # keep the series sorted if the clock steps backwards
+        t = max(t, self._last_t)
+        self._last_t = t
+
+        self.raw.append(array([(t, v)], dtype=RAW_DTYPE))
+        for r in self.resolutions:
+            bt = floor(t / r) * r
+            b = self._buckets.get(r)
+            if b is None or b.t != bt:
+                if b is not None:
+                    self.rollups[r].append(b.to_rows())
+                self._buckets[r] = b = _Bucket(bt)
+            b.add(v)
+
+    def query(self, start, end, resolution):
+        if not resolution:
+            return self.raw.read(start, end)
+
+        # the bucket in progress is only written when it closes. compute it from the raw samples
+        arr = self.rollups[resolution].read(start, end)
+        pending = self._pending(resolution)
+        pending = pending[(pending['t'] >= start) & (pending['t'] <= end)]
+        if len(pending):
+            arr = concatenate((arr, pending))
+        return arr
+
+    def count(self, start, end):
+        return self.raw.count(start, end)
+
+    def span(self):
+        first = self.raw.first()
+        if first is not None:
+            return first, self.raw.last()['t']
+
+    def close(self):
+        self.raw.close()
+        for r in self.rollups.values():
+            r.close()
+
+    # private
+    def _pending(self, r):
+        last = self.rollups[r].last()
+        since = last['t'] + r if last is not None else -inf
+        return rollup(self.raw.read(since, inf), r)
+
+    def _open(self):
+        """
+            prepare for writing. rollups that were never written, e.g. after an interrupted write, are written
+            and the bucket in progress is restored
+        """
+        last = self.raw.last()
+        if last is not None:
+            self._last_t = last['t']
+
+        self._buckets = {}
+        for r in self.resolutions:
+            pending = self._pending(r)
+            if len(pending):
+                if len(pending) > 1:
+                    self.rollups[r].append(pending[:-1])
+
+                t, vmin, vmean, vmax, n = pending[-1]
+                b = _Bucket(t)
+                b.min, b.max, b.total, b.n = vmin, vmax, vmean * n, n
+                self._buckets[r] = b
+
+
+class TimeSeriesStore(object):
+    def __init__(self, root, resolutions=RESOLUTIONS, chunk_size=CHUNK_SIZE):
+        self.root = root
+        self.resolutions = tuple(sorted(resolutions))
+        self.chunk_size = chunk_size
+
+        self._series = {}
+        self._lock = Lock()
+
+    def append(self, name, v, t=None):
+        if t is None:
+            t = time.time()
+
+        with self._lock:
+            self._get_series(name).append(float(t), float(v))
+
+    def query(self, name, start=None, end=None, resolution=None, max_points=None):
+        """
+            return the samples of ``name`` between ``start`` and ``end``.
+
+            ``resolution`` of 0 or None returns the raw samples (fields t, v). otherwise it is one of
+            ``resolutions`` and the rollups (fields t, min, mean, max, n) are returned. if ``max_points`` is
+            given and ``resolution`` is None the finest resolution with at most ``max_points`` points is used
+        """
+        if start is None:
+            start = -inf
+        if end is None:
+            end = inf
+
+        with self._lock:
+            s = self._get_series(name)
+            if resolution is None and max_points:
+                resolution = self._get_resolution(s, start, end, max_points)
+            elif resolution and resolution not in self.resolutions:
+                raise ValueError('invalid resolution {}. available={}'.format(resolution, self.resolutions))
+
+            return s.query(start, end, resolution)
+
+    def get_path(self, name):
+        return os.path.join(self.root, series_name(name))
+
+    def names(self):
+        if os.path.isdir(self.root):
+            return sorted(os.listdir(self.root))
+        return []
+
+    def close(self):
+        with self._lock:
+            for s in self._series.values():
+                s.close()
+            self._series = {}
+
+    # private
+    def _get_series(self, name):
+        s = self._series.get(name)
+        if s is None:
+            s = _Series(self.get_path(name), self.resolutions, self.chunk_size)
+            self._series[name] = s
+        return s
+
+    def _get_resolution(self, s, start, end, max_points):
+        if s.count(start, end) <= max_points:
+            return 0
+
+        span = s.span()
+        start = max(start, span[0])
+        end = min(end, span[1])
+        for r in self.resolutions:
+            if (end - start) / r <= max_points:
+                return r
+        return self.resolutions[-1]
+
+# ============= EOF =============================================
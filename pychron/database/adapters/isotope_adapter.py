@@ -1480,6 +1480,30 @@ class IsotopeAdapter(DatabaseAdapter):
 
             return self._query_all(q, verbose_query=False)
 
+    def get_analysis_keys_page(self, after=None, limit=200, low=None, high=None, mass_spectrometers=None):
+        """
+            return up to ``limit`` (id, uuid, identifier, aliquot, step) tuples with id > ``after`` ordered by id.
+            only the key columns are loaded so a whole database can be paged through cheaply
+        """
+        with self.session_ctx() as sess:
+            q = sess.query(meas_AnalysisTable.id, meas_AnalysisTable.uuid, gen_LabTable.identifier,
+                           meas_AnalysisTable.aliquot, meas_AnalysisTable.step)
+            q = q.join(gen_LabTable)
+            if mass_spectrometers:
+                q = q.join(meas_MeasurementTable).join(gen_MassSpectrometerTable)
+                q = in_func(q, gen_MassSpectrometerTable.name, mass_spectrometers)
+
+            if after is not None:
+                q = q.filter(meas_AnalysisTable.id > after)
+            if low:
+                q = q.filter(meas_AnalysisTable.analysis_timestamp >= low)
+            if high:
+                q = q.filter(meas_AnalysisTable.analysis_timestamp <= high)
+
+            q = q.order_by(meas_AnalysisTable.id.asc())
+            q = q.limit(limit)
+            return [tuple(r) for r in self._query_all(q, verbose_query=False)]
+
     # ===========================================================================
     # getters single
     # ===========================================================================
@@ -0,0 +1,37 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    reference implementations the filtering benchmarks and tests compare against
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+# ============= local library imports  ==========================
+
+
+def eval_filter_ufloats(items, predicate_str):
+    """
+        one eval per item like releases before predicates were compiled
+    """
+    omits = []
+    for i, (v, e) in enumerate(items):
+        ctx = {'error': e, 'percent_error': e / v * 100 if v else 0}
+        ctx.update({k: v for k in ('x', 'age')})
+        if eval(predicate_str, ctx):
+            omits.append(i)
+    return omits
+
+# ============= EOF =============================================
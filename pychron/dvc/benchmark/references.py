@@ -0,0 +1,126 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    benchmark ``DVCDatabase.find_references`` against a SQLite database with thousands of reference windows.
+
+    usage::
+
+        python -m pychron.dvc.benchmark.references -o refs.json
+
+    ``find_references.binned`` queries each window in turn like releases before the interval join
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+from numpy.random import RandomState
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.benchmark import benchmark, main
+from pychron.core.helpers.datetime_tools import bin_datetimes
+
+ANALYSIS_TYPES = ('unknown', 'blank_unknown', 'air', 'cocktail')
+REFERENCE_TYPES = ['blank_unknown', 'air']
+MASS_SPECTROMETERS = ('jan', 'obama')
+
+
+class ReferenceDatabase(object):
+    """
+        ``nanalyses`` analyses spread over a year and ``nunknowns`` unknown run times. with ``hours=1``
+        most unknowns get a window of their own
+    """
+
+    def __init__(self, root=None, seed=0, nanalyses=50000, nunknowns=3000, hours=1):
+        self._tmp = root is None
+        if root is None:
+            root = tempfile.mkdtemp(prefix='pychron_bench')
+
+        self.root = root
+        self.seed = seed
+        self.nanalyses = nanalyses
+        self.nunknowns = nunknowns
+        self.hours = hours
+        self.times = []
+        self.db = None
+
+    @property
+    def config(self):
+        return {'nanalyses': self.nanalyses, 'nunknowns': self.nunknowns, 'hours': self.hours,
+                'nwindows': len(list(bin_datetimes(self.times, timedelta(hours=self.hours)))),
+                'seed': self.seed}
+
+    def build(self):
+        from pychron.dvc.dvc_database import DVCDatabase
+        from pychron.dvc.dvc_orm import Base, AnalysisTbl, AnalysisChangeTbl, MassSpectrometerTbl
+
+        self.db = db = DVCDatabase(kind='sqlite', path=os.path.join(self.root, 'references.sqlite'))
+        db.connect()
+
+        rs = RandomState(self.seed)
+        start = datetime(2020, 1, 1)
+        minutes = 365 * 24 * 60
+
+        def timestamp():
+            return start + timedelta(minutes=float(rs.uniform(0, minutes)))
+
+        ans, changes = [], []
+        for i in range(self.nanalyses):
+            ans.append({'id': i + 1, 'timestamp': timestamp(), 'uuid': '{:032x}'.format(i),
+                        'analysis_type': ANALYSIS_TYPES[i % len(ANALYSIS_TYPES)],
+                        'mass_spectrometer': MASS_SPECTROMETERS[i % 3 == 0],
+                        'extract_device': 'Fusions CO2'})
+            changes.append({'analysisID': i + 1, 'tag': 'invalid' if i % 50 == 0 else 'ok'})
+
+        with db.session_ctx(use_parent_session=False) as sess:
+            Base.metadata.create_all(sess.bind)
+            sess.execute(MassSpectrometerTbl.__table__.insert(), [{'name': n} for n in MASS_SPECTROMETERS])
+            sess.execute(AnalysisTbl.__table__.insert(), ans)
+            sess.execute(AnalysisChangeTbl.__table__.insert(), changes)
+            sess.commit()
+
+        self.times = sorted(timestamp() for i in range(self.nunknowns))
+        return self
+
+    def cleanup(self):
+        if self._tmp and os.path.isdir(self.root):
+            shutil.rmtree(self.root, ignore_errors=True)
+
+
+@benchmark('find_references.join', group='database')
+def bench_find_references(fixture):
+    fixture.db.find_references(fixture.times, REFERENCE_TYPES, hours=fixture.hours, mass_spectrometers=['jan'])
+
+
+@benchmark('find_references.binned', group='database')
+def bench_find_references_binned(fixture):
+    db = fixture.db
+    ctimes = list(bin_datetimes(fixture.times, timedelta(hours=fixture.hours)))
+    with db.session_ctx():
+        db._find_references_binned(ctimes, REFERENCE_TYPES, mass_spectrometers=['jan'])
+
+
+def make_fixture(seed):
+    return ReferenceDatabase(seed=seed).build()
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(fixture_factory=make_fixture))
+
+# ============= EOF =============================================
@@ -0,0 +1,228 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    benchmarks of the data reduction paths run against a ``SyntheticDVC``.
+
+    usage::
+
+        python -m pychron.dvc.benchmark.suites -o bench-19.6.json
+        python -m pychron.dvc.benchmark.suites -o bench-dev.json -b bench-19.6.json
+
+    the second run exits with 1 if a benchmark is more than 10% slower than in the baseline
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+from itertools import groupby
+from operator import attrgetter
+
+# ============= local library imports  ==========================
+from pychron.core.codetools.benchmark import benchmark, main
+from pychron.core.filtering import filter_ufloats
+from pychron.dvc.benchmark.filtering import eval_filter_ufloats
+from pychron.dvc.benchmark.synthetic import SyntheticDVC, REPOSITORY
+from pychron.paths import paths
+
+FILTER_PREDICATE = 'age>10 and not (error>1 or percent_error>20)'
+NFILTER = 100000
+
+
+def make_dvc():
+    from pychron.dvc.dvc import DVC
+    from pychron.dvc.meta_repo import MetaRepo
+
+    return DVC(bind=False, meta_repo=MetaRepo(path=paths.meta_root))
+
+
+def get_analyses(fixture):
+    """
+        analyses made once and shared by the benchmarks that do not modify them
+    """
+    ans = fixture.cache.get('analyses')
+    if ans is None:
+        ans = fixture.cache['analyses'] = make_dvc().make_analyses(fixture.records, use_progress=False)
+    return ans
+
+
+def get_loaded_analyses(fixture):
+    ans = fixture.cache.get('loaded_analyses')
+    if ans is None:
+        ans = get_analyses(fixture)
+        for a in ans:
+            a.load_raw_data()
+        fixture.cache['loaded_analyses'] = ans
+    return ans
+
+
+def group_analyses(fixture, klass):
+    ans = sorted(get_analyses(fixture), key=attrgetter('group_id'))
+    return [klass(analyses=list(gs)) for _, gs in groupby(ans, key=attrgetter('group_id'))]
+
+
+# setup
+def setup_make_analyses(fixture):
+    return make_dvc(), fixture.records
+
+
+def setup_load_raw_data(fixture):
+    from pychron.dvc.dvc_analysis import DVCAnalysis
+
+    return [DVCAnalysis(r.uuid, r.record_id, REPOSITORY) for r in fixture.records]
+
+
+def setup_groups(fixture):
+    from pychron.processing.analyses.analysis_group import AnalysisGroup
+
+    return group_analyses(fixture, AnalysisGroup)
+
+
+def setup_step_heat_groups(fixture):
+    from pychron.processing.analyses.analysis_group import StepHeatAnalysisGroup
+
+    return group_analyses(fixture, StepHeatAnalysisGroup)
+
+
+def setup_ideogram(fixture):
+    from pychron.options.ideogram import IdeogramOptions
+    from pychron.pipeline.plot.models.ideogram_model import IdeogramModel
+
+    opt = IdeogramOptions()
+    opt.add_aux_plot('Ideogram', 0)
+    opt.add_aux_plot('Analysis Number', 1)
+    return IdeogramModel(plot_options=opt, analyses=get_analyses(fixture))
+
+
+def setup_spectrum(fixture):
+    from pychron.options.spectrum import SpectrumOptions
+    from pychron.pipeline.plot.models.spectrum_model import SpectrumModel
+
+    opt = SpectrumOptions()
+    opt.add_aux_plot('Age Spectrum', 0)
+    return SpectrumModel(plot_options=opt, analyses=get_analyses(fixture))
+
+
+def setup_filter(fixture):
+    from numpy import column_stack
+    from numpy.random import RandomState
+
+    rs = RandomState(fixture.seed)
+    return column_stack((rs.uniform(0, 30, NFILTER), rs.uniform(0, 3, NFILTER)))
+
+
+def setup_table(fixture):
+    from pychron.pipeline.tables.xlsx_table_options import XLSXAnalysisTableWriterOptions
+    from pychron.pipeline.tables.xlsx_table_writer import XLSXAnalysisTableWriter
+    from pychron.processing.analyses.analysis_group import InterpretedAgeGroup
+    from pychron.pychron_constants import PLATEAU, MSEM, WEIGHTED_MEAN
+
+    gs = []
+    for g in group_analyses(fixture, InterpretedAgeGroup):
+        g.set_preferred_age(PLATEAU, MSEM)
+        g.set_preferred_kind('kca', WEIGHTED_MEAN, MSEM)
+        gs.append(g)
+
+    options = XLSXAnalysisTableWriterOptions()
+    path = os.path.join(fixture.root, 'tables', 'bench.xlsx')
+    return XLSXAnalysisTableWriter(), {'unknowns': gs, 'machine_unknowns': gs}, path, options
+
+
+# benchmarks
+@benchmark('dvc.make_analyses', group='dvc', setup=setup_make_analyses)
+def bench_make_analyses(state):
+    dvc, records = state
+    dvc.make_analyses(records, use_progress=False)
+
+
+@benchmark('dvc_analysis.load_raw_data', group='dvc', setup=setup_load_raw_data)
+def bench_load_raw_data(ans):
+    for a in ans:
+        a.load_raw_data()
+
+
+@benchmark('analysis.calculate_age', group='processing', setup=get_analyses)
+def bench_calculate_age(ans):
+    for a in ans:
+        a.calculate_age(force=True)
+
+
+@benchmark('analysis.isotope_fits', group='processing', setup=get_loaded_analyses)
+def bench_isotope_fits(ans):
+    # regress the raw data with the saved fits
+    for a in ans:
+        for iso in a.itervalues():
+            iso.regressor
+            iso.baseline.regressor
+
+
+@benchmark('analysis_group.statistics', group='processing', setup=setup_groups)
+def bench_group_statistics(gs):
+    for g in gs:
+        g.weighted_age
+        g.arith_age
+        g.mswd
+        g.age_span
+        g.get_mswd_tuple()
+
+
+@benchmark('analysis_group.plateau', group='processing', setup=setup_step_heat_groups)
+def bench_plateau(gs):
+    for g in gs:
+        g.plateau_age
+        g.integrated_age
+
+
+@benchmark('analysis_group.isochron', group='processing', setup=setup_groups)
+def bench_isochron(gs):
+    for g in gs:
+        g.isochron_age
+
+
+@benchmark('figure.ideogram', group='figure', setup=setup_ideogram)
+def bench_ideogram(model):
+    model.refresh(force=True)
+
+
+@benchmark('figure.spectrum', group='figure', setup=setup_spectrum)
+def bench_spectrum(model):
+    model.refresh(force=True)
+
+
+@benchmark('table.xlsx', group='table', setup=setup_table)
+def bench_table(state):
+    writer, groups, path, options = state
+    writer.write(groups, path, options)
+
+
+@benchmark('filter_ufloats.compiled', group='filtering', setup=setup_filter)
+def bench_filter_ufloats(items):
+    filter_ufloats(items, FILTER_PREDICATE)
+
+
+@benchmark('filter_ufloats.eval', group='filtering', setup=setup_filter)
+def bench_filter_ufloats_eval(items):
+    # evaluate the predicate once per item like releases before predicates were compiled
+    eval_filter_ufloats(items, FILTER_PREDICATE)
+
+
+def make_fixture(seed):
+    return SyntheticDVC(seed=seed).build()
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(fixture_factory=make_fixture))
+
+# ============= EOF =============================================
@@ -0,0 +1,254 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    write a reproducible DVC data set (MetaData repository and one analysis repository) for benchmarking.
+
+    every sample is a step heat of ``nsteps`` analyses with the same age so plateaus and isochrons are defined.
+    signals decay linearly with noise and are packed into ``.data`` blobs like the ones written by the
+    persister
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+from numpy import exp, linspace
+from numpy.random import RandomState
+
+# ============= local library imports  ==========================
+from pychron.core.helpers.binpack import encode_blob, pack
+from pychron.dvc import dvc_dump, analysis_path, repository_path
+from pychron.dvc.meta_repo import dump_chronology
+from pychron.paths import paths
+
+LAMBDA_K = 5.543e-10
+ATM4036 = 295.5
+
+IRRADIATION = 'NM-BENCH'
+LEVEL = 'A'
+PRODUCTION = 'TRIGA'
+REPOSITORY = 'Benchmark'
+MASS_SPECTROMETER = 'jan'
+
+# isotope, detector, mass
+ISOTOPES = (('Ar40', 'H1', 39.9624),
+            ('Ar39', 'AX', 38.964),
+            ('Ar38', 'L1', 37.9627),
+            ('Ar37', 'L2', 36.9668),
+            ('Ar36', 'CDD', 35.9675))
+
+PRODUCTION_RATIOS = {'K4039': (0.0005, 0.00005),
+                     'K3839': (0.0128, 0.0002),
+                     'K3739': (0.00019, 0.00001),
+                     'Ca3937': (0.00069, 0.000001),
+                     'Ca3837': (0.0000293, 0.0000004),
+                     'Ca3637': (0.00027, 0.0000003),
+                     'Cl3638': (250, 2),
+                     'Ca_K': (1.96, 0),
+                     'Cl_K': (0.25, 0)}
+
+
+class SyntheticRecord(object):
+    """
+        the attributes of a database analysis record used by ``DVC.make_analyses``
+    """
+    analysis_type = 'unknown'
+    load_name = 'bench'
+    load_holder = '221-hole'
+    irradiation = IRRADIATION
+    irradiation_level = LEVEL
+    repository_identifier = REPOSITORY
+
+    def __init__(self, uuid, record_id, identifier, position, sample, age, group_id=0):
+        self.uuid = uuid
+        self.group_id = group_id
+        self.record_id = record_id
+        self.identifier = identifier
+        self.irradiation_position = position
+        self.sample = sample
+        self.age = age
+
+
+class SyntheticDVC(object):
+    def __init__(self, root=None, seed=0, nsamples=10, nsteps=10, ncounts=200, ages=(28.201, 1.185),
+                 j=0.0025):
+        self._tmp = root is None
+        if root is None:
+            root = tempfile.mkdtemp(prefix='pychron_bench')
+
+        self.root = root
+        self.seed = seed
+        self.nsamples = nsamples
+        self.nsteps = nsteps
+        self.ncounts = ncounts
+        self.ages = ages
+        self.j = j
+        self.records = []
+        # objects shared by benchmarks e.g. the loaded analyses
+        self.cache = {}
+
+        self._rs = RandomState(seed)
+
+    @property
+    def config(self):
+        return {'nsamples': self.nsamples, 'nsteps': self.nsteps, 'ncounts': self.ncounts,
+                'ages': list(self.ages), 'j': self.j, 'seed': self.seed}
+
+    @property
+    def nanalyses(self):
+        return len(self.records)
+
+    def build(self):
+        """
+            point ``paths`` at ``root`` and write the repositories
+        """
+        paths.build(self.root)
+        for p in (paths.dvc_dir, paths.repository_dataset_dir, paths.meta_root):
+            if not os.path.isdir(p):
+                os.makedirs(p)
+
+        self._make_meta()
+        self._make_repository()
+
+        for p in (paths.meta_root, repository_path(REPOSITORY)):
+            self._git_init(p)
+        return self
+
+    def cleanup(self):
+        if self._tmp and os.path.isdir(self.root):
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    # private
+    def _make_meta(self):
+        root = os.path.join(paths.meta_root, IRRADIATION)
+        os.makedirs(os.path.join(root, 'productions'))
+        os.makedirs(os.path.join(paths.meta_root, 'spectrometers'))
+
+        dvc_dump({iso: mass for iso, _, mass in ISOTOPES}, os.path.join(paths.meta_root, 'molecular_weights.json'))
+
+        end = datetime(2020, 1, 1, 12)
+        start = end - timedelta(hours=10)
+        fmt = '%Y-%m-%d %H:%M:%S'
+        dump_chronology(os.path.join(root, 'chronology.txt'), [(1.0, start.strftime(fmt), end.strftime(fmt))])
+
+        dvc_dump(PRODUCTION_RATIOS, os.path.join(root, 'productions', '{}.json'.format(PRODUCTION)))
+        dvc_dump({LEVEL: PRODUCTION, 'note': ''}, os.path.join(root, 'productions.json'))
+
+        rs = self._rs
+        positions = []
+        for i in range(self.nsamples):
+            je = self.j * 0.001
+            positions.append({'position': i + 1,
+                              'identifier': str(66000 + i),
+                              'j': self.j * (1 + rs.normal(0, 0.001)), 'j_err': je,
+                              'mean_j': self.j, 'mean_j_err': je,
+                              'position_jerr': je,
+                              'decay_constants': {},
+                              'options': {},
+                              'analyses': []})
+        dvc_dump({'z': 0, 'positions': positions}, os.path.join(root, '{}.json'.format(LEVEL)))
+
+    def _make_repository(self):
+        os.makedirs(repository_path(REPOSITORY))
+
+        rs = self._rs
+        ts = datetime(2020, 2, 1)
+        for i in range(self.nsamples):
+            identifier = str(66000 + i)
+            age = self.ages[i % len(self.ages)]
+            for step in range(self.nsteps):
+                rid = '{}-01{}'.format(identifier, chr(65 + step))
+                u = str(uuid.UUID(int=int(rs.randint(0, 2 ** 31)) << 64 | i << 16 | step, version=4))
+                r = SyntheticRecord(u, rid, identifier, i + 1, 'bench-{:03d}'.format(i), age, group_id=i)
+
+                ts += timedelta(minutes=45)
+                self._write_analysis(r, step, ts)
+                self.records.append(r)
+
+    def _write_analysis(self, r, step, ts):
+        rs = self._rs
+        key = (r.uuid, r.record_id)
+
+        def path(modifier=None):
+            return analysis_path(key, REPOSITORY, modifier=modifier, mode='w')
+
+        # 40Ar*/39ArK for this age plus an atmospheric component
+        k39 = rs.uniform(2, 20)
+        f = (exp(LAMBDA_K * r.age * 1e6) - 1) / self.j
+        a36 = k39 * rs.uniform(0.0005, 0.005)
+        intercepts = {'Ar40': k39 * f + a36 * ATM4036,
+                      'Ar39': k39,
+                      'Ar38': k39 * 0.0128 + a36 * 0.19,
+                      'Ar37': k39 * rs.uniform(0.1, 0.5),
+                      'Ar36': a36}
+
+        isotopes = {iso: {'name': iso, 'detector': det, 'serial_id': '', 'units': 'fA'} for iso, det, _ in ISOTOPES}
+        meta = {'analysis_type': 'unknown', 'uuid': r.uuid, 'identifier': r.identifier,
+                'aliquot': 1, 'increment': step,
+                'mass_spectrometer': MASS_SPECTROMETER,
+                'repository_identifier': REPOSITORY,
+                'sample': r.sample, 'material': 'sanidine', 'project': 'bench',
+                'irradiation': r.irradiation, 'irradiation_level': r.irradiation_level,
+                'irradiation_position': r.irradiation_position,
+                'timestamp': ts.strftime('%Y-%m-%dT%H:%M:%S'),
+                'isotopes': isotopes,
+                'detectors': {det: {'deflection': 0, 'gain': 1} for _, det, _ in ISOTOPES}}
+        dvc_dump(meta, path())
+
+        dvc_dump({'extract_device': 'Bench', 'extract_value': 1 + step * 0.5, 'extract_units': 'W',
+                  'extract_duration': 30, 'cleanup_duration': 60, 'weight': 0,
+                  'load_name': r.load_name, 'load_holder': r.load_holder},
+                 path('extraction'))
+
+        xs = linspace(5, 5 + self.ncounts * 1.049, self.ncounts)
+        signals, baselines = [], []
+        ints, bs, blanks, ics = {}, {}, {}, {}
+        for iso, det, _ in ISOTOPES:
+            v = intercepts[iso]
+            ys = v * (1 - 0.0005 * xs) + rs.normal(0, 0.001 + v * 0.002, self.ncounts)
+            signals.append({'isotope': iso, 'detector': det, 'blob': encode_blob(pack('>ff', zip(xs, ys)))})
+
+            bys = rs.normal(0, 0.002, 30)
+            bxs = linspace(0, 30, 30)
+            baselines.append({'detector': det, 'blob': encode_blob(pack('>ff', zip(bxs, bys)))})
+
+            ints[iso] = {'fit': 'linear', 'error_type': 'SEM', 'value': v, 'error': v * 0.001,
+                         'filter_outliers_dict': {'filter_outliers': True, 'iterations': 1, 'std_devs': 2}}
+            bs[det] = {'fit': 'average', 'error_type': 'SEM', 'value': float(bys.mean()), 'error': 0.0005}
+            blanks[iso] = {'fit': 'previous', 'error_type': 'SEM', 'value': v * 0.001, 'error': v * 0.0001,
+                           'references': [{'record_id': 'bu-FD-o', 'uuid': '', 'exclude': False}]}
+            ics[det] = {'fit': 'default', 'value': 1.0, 'error': 0.001, 'references': []}
+
+        dvc_dump({'commit': '', 'encoding': 'base64', 'format': '>ff',
+                  'signals': signals, 'baselines': baselines, 'sniffs': []}, path('.data'))
+        dvc_dump(ints, path('intercepts'))
+        dvc_dump(bs, path('baselines'))
+        dvc_dump(blanks, path('blanks'))
+        dvc_dump(ics, path('icfactors'))
+
+    def _git_init(self, root):
+        # make_analyses reads the active branch of each repository
+        from git import Repo
+
+        repo = Repo.init(root)
+        repo.git.add(A=True)
+        repo.index.commit('synthetic benchmark data')
+
+# ============= EOF =============================================
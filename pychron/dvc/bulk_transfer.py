@@ -0,0 +1,182 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# ============= local library imports  ==========================
+
+logger = logging.getLogger('BulkTransfer')
+
+
+class TransferCheckpoint(object):
+    """
+        json file with the key of the last source record that was transferred and the running totals.
+        written atomically after every page
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.last_key = None
+        self.counts = {}
+        self.failed = []
+
+    def load(self):
+        if self.path and os.path.isfile(self.path):
+            with open(self.path, 'r') as rfile:
+                d = json.load(rfile)
+            self.last_key = d.get('last_key')
+            self.counts = d.get('counts', {})
+            self.failed = d.get('failed', [])
+
+    def save(self):
+        if not self.path:
+            return
+
+        tmp = '{}.tmp'.format(self.path)
+        with open(tmp, 'w') as wfile:
+            json.dump({'last_key': self.last_key,
+                       'counts': self.counts,
+                       'failed': self.failed,
+                       'timestamp': time.time()}, wfile, indent=2)
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        if self.path and os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+class BulkTransfer(object):
+    """
+        stream records from a source database in pages and transfer the ones missing from the destination.
+
+        ``fetch_page(after, limit)`` returns up to ``limit`` source records whose ``key`` is greater than
+        ``after`` (None for the first page) ordered by ``key``.
+
+        ``identity(record)`` is compared against ``existing``, the identities already in the destination.
+        these are prefetched once instead of querying the destination for every record.
+
+        ``build(record)`` runs on a pool of ``workers`` threads and returns the object to persist or None to
+        skip the record. it must only use thread safe resources e.g. a connection per thread.
+
+        ``persist(batch)`` runs on the calling thread with up to ``batch_size`` (record, built) pairs in source
+        order. it should insert the batch with as few commits as possible, commit once per repository and return
+        the (record, error) pairs it could not save.
+
+        the key of the last transferred page is saved to the checkpoint so an interrupted transfer resumes
+        with the next page. if ``persist`` raises the transfer stops and the page is transferred again on resume.
+        records saved before the interruption are skipped as they are in ``existing``
+    """
+
+    def __init__(self, fetch_page, build, persist, key, identity=None, existing=None,
+                 checkpoint_path=None, workers=4, page_size=200, batch_size=50):
+        self.fetch_page = fetch_page
+        self.build = build
+        self.persist = persist
+        self.key = key
+        self.identity = identity
+        self.existing = set(existing or ())
+        self.workers = workers
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.checkpoint = TransferCheckpoint(checkpoint_path)
+
+    def run(self, max_pages=None):
+        """
+            transfer until the source is exhausted or ``max_pages`` pages were transferred.
+            returns the counts: transferred, skipped, failed, pages
+        """
+        cp = self.checkpoint
+        cp.load()
+
+        counts = cp.counts
+        for k in ('transferred', 'skipped', 'failed', 'pages'):
+            counts.setdefault(k, 0)
+
+        if cp.last_key is not None:
+            logger.info('resuming transfer after {}. {}'.format(cp.last_key, counts))
+
+        after = cp.last_key
+        npages = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while max_pages is None or npages < max_pages:
+                st = time.time()
+                page = self.fetch_page(after, self.page_size)
+                if not page:
+                    break
+
+                todo = [r for r in page if not self._exists(r)]
+                counts['skipped'] += len(page) - len(todo)
+
+                built = list(pool.map(self._build, todo))
+                batch = []
+                for record, (obj, err) in zip(todo, built):
+                    if err is not None:
+                        self._fail(record, err)
+                    elif obj is None:
+                        counts['skipped'] += 1
+                    else:
+                        batch.append((record, obj))
+
+                for i in range(0, len(batch), self.batch_size):
+                    chunk = batch[i:i + self.batch_size]
+                    failed = self.persist(chunk) or []
+                    for record, err in failed:
+                        self._fail(record, err)
+
+                    bad = {id(r) for r, _ in failed}
+                    saved = [r for r, _ in chunk if id(r) not in bad]
+                    counts['transferred'] += len(saved)
+                    if self.identity:
+                        self.existing.update(self.identity(r) for r in saved)
+
+                after = self.key(page[-1])
+                npages += 1
+                counts['pages'] += 1
+                cp.last_key = self._json_key(page[-1])
+                cp.save()
+                logger.debug('page {} n={} built={} time={:0.2f}'.format(counts['pages'], len(page), len(batch),
+                                                                         time.time() - st))
+
+        return counts
+
+    # private
+    def _exists(self, record):
+        return self.identity is not None and self.identity(record) in self.existing
+
+    def _fail(self, record, err):
+        self.checkpoint.counts['failed'] += 1
+        self.checkpoint.failed.append([self._json_key(record), str(err)])
+
+    def _build(self, record):
+        try:
+            return self.build(record), None
+        except BaseException as e:
+            logger.warning('failed building {}. {}'.format(self.key(record), e))
+            return None, str(e)
+
+    def _json_key(self, record):
+        k = self.key(record)
+        if isinstance(k, tuple):
+            k = list(k)
+        return k
+
+# ============= EOF =============================================
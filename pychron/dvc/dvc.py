@@ -15,6 +15,7 @@
 # ===============================================================================
 
 import os
+import re
 import shutil
 import time
 from datetime import datetime
@@ -35,8 +36,9 @@ from pychron.core.progress import progress_loader, progress_iterator, open_progr
 from pychron.dvc import dvc_dump, dvc_load, analysis_path, repository_path, AnalysisNotAnvailableError, PATH_MODIFIERS
 from pychron.dvc.cache import DVCCache
 from pychron.dvc.defaults import TRIGA, HOLDER_24_SPOKES, LASER221, LASER65
-from pychron.dvc.dvc_analysis import DVCAnalysis
+from pychron.dvc.dvc_analysis import DVCAnalysis, QuickDVCAnalysis
 from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.dvc_orm import IrradiationPositionTbl
 from pychron.dvc.func import find_interpreted_age_path, GitSessionCTX, push_repositories, make_interpreted_age_dict
 from pychron.dvc.meta_repo import MetaRepo, get_frozen_flux, get_frozen_productions
 from pychron.dvc.tasks.dvc_preferences import DVCConnectionItem
@@ -79,6 +81,8 @@ class DVC(Loggable):
     use_cache = Bool
     max_cache_size = Int
     _cache = None
+    _search_index = None
+    _search_index_url = None
 
     def __init__(self, bind=True, *args, **kw):
         super(DVC, self).__init__(*args, **kw)
@@ -147,31 +151,52 @@ class DVC(Loggable):
         else:
             self.meta_repo.push()
 
-    def load_analysis_backend(self, ln, isotope_group):
+    def get_analysis_backend(self, ln, private_session=False):
+        """
+            return the flux, production and chronology for identifier ``ln``
+
+            use ``private_session=True`` off the executor thread. the lookup then queries its own session
+            instead of swapping ``db.session``, which is shared with the current run
+        """
         db = self.db
-        with db.session_ctx():
-            ip = db.get_identifier(ln)
-            dblevel = ip.level
-            irrad = dblevel.irradiation.name
-            level = dblevel.name
-            pos = ip.position
-
-            fd = self.meta_repo.get_flux(irrad, level, pos)
-            prodname, prod = self.meta_repo.get_production(irrad, level)
-            cs = self.meta_repo.get_chronology(irrad)
-
-            x = datetime.now()
-            now = time.mktime(x.timetuple())
-            if fd['lambda_k']:
-                isotope_group.arar_constants.lambda_k = fd['lambda_k']
-
-            isotope_group.trait_set(j=fd['j'],
-                                    # lambda_k=lambda_k,
-                                    production_ratios=prod.to_dict(RATIO_KEYS),
-                                    interference_corrections=prod.to_dict(INTERFERENCE_KEYS),
-                                    chron_segments=cs.get_chron_segments(x),
-                                    irradiation_time=cs.irradiation_time,
-                                    timestamp=now)
+        if private_session:
+            sess = db.session_factory()
+            try:
+                ip = sess.query(IrradiationPositionTbl).filter(IrradiationPositionTbl.identifier == ln).one()
+                irrad, level, pos = ip.level.irradiation.name, ip.level.name, ip.position
+            finally:
+                sess.close()
+        else:
+            with db.session_ctx():
+                ip = db.get_identifier(ln)
+                irrad, level, pos = ip.level.irradiation.name, ip.level.name, ip.position
+
+        fd = self.meta_repo.get_flux(irrad, level, pos)
+        prodname, prod = self.meta_repo.get_production(irrad, level)
+        cs = self.meta_repo.get_chronology(irrad)
+        return fd, prod, cs
+
+    def load_analysis_backend(self, ln, isotope_group, backend=None):
+        """
+            backend: optional result of ``get_analysis_backend``
+        """
+        if backend is None:
+            backend = self.get_analysis_backend(ln)
+
+        fd, prod, cs = backend
+
+        x = datetime.now()
+        now = time.mktime(x.timetuple())
+        if fd['lambda_k']:
+            isotope_group.arar_constants.lambda_k = fd['lambda_k']
+
+        isotope_group.trait_set(j=fd['j'],
+                                # lambda_k=lambda_k,
+                                production_ratios=prod.to_dict(RATIO_KEYS),
+                                interference_corrections=prod.to_dict(INTERFERENCE_KEYS),
+                                chron_segments=cs.get_chron_segments(x),
+                                irradiation_time=cs.irradiation_time,
+                                timestamp=now)
         return True
 
     def repository_db_sync(self, reponame, dry_run=False):
@@ -721,6 +746,91 @@ class DVC(Loggable):
 
         return ret
 
+    def make_quick_analyses(self, records, calculate_f_only=False, use_progress=True):
+        """
+            make ``QuickDVCAnalysis`` objects from the database records and their stored intensities.
+            the intensities of all the records are selected together and only the chronology, production and
+            flux of each irradiation level are read from the MetaData repository.
+
+            records without stored intensities are made with ``make_analyses``
+        """
+        if not records:
+            return []
+
+        st = time.time()
+        made = [r for r in records if isinstance(r, DVCAnalysis)]
+        records = [r for r in records if not isinstance(r, DVCAnalysis)]
+        intensities = self.db.get_analysis_intensities([r.id for r in records])
+
+        meta_repo = self.meta_repo
+        chronos = {}
+        productions = {}
+        fluxes = {}
+
+        synced = {}
+
+        def sync_repository(name):
+            # pull or clone each repository once, when the first of its analyses is loaded in full
+            if name not in synced:
+                try:
+                    synced[name] = self.sync_repo(name, use_progress=False)
+                except BaseException as e:
+                    self.warning('failed syncing repository {}. {}'.format(name, e))
+                    synced[name] = False
+            return synced[name]
+
+        ret, full = list(made), []
+        for r in records:
+            rows = intensities.get(r.id)
+            if not rows or r.repository_identifier is None:
+                full.append(r)
+                continue
+
+            a = QuickDVCAnalysis(r, rows)
+            a.group_id = r.group_id
+            a.sync_repository = sync_repository
+
+            irrad = a.irradiation
+            if irrad and irrad != 'NoIrradiation':
+                level = a.irradiation_level
+                if irrad not in chronos:
+                    chronos[irrad] = meta_repo.get_chronology(irrad)
+
+                key = (irrad, level)
+                if key not in productions:
+                    productions[key] = meta_repo.get_production(irrad, level)
+                    fluxes[key] = meta_repo.get_flux_positions(irrad, level)
+
+                chronology = chronos[irrad]
+                if chronology:
+                    a.set_chronology(chronology)
+
+                a.set_production(*productions[key])
+
+                fd = meta_repo.get_flux_from_positions(a.irradiation_position, fluxes[key])
+                a.j = fd.get('j', ufloat(0, 0))
+                a.position_jerr = fd.get('position_jerr', 0)
+                lk = fd.get('lambda_k')
+                if lk:
+                    a.arar_constants.lambda_k = lk
+
+            if calculate_f_only:
+                a.calculate_f()
+            else:
+                a.calculate_age()
+            ret.append(a)
+
+        et = time.time() - st
+        n = len(ret) - len(made)
+        if n:
+            self.debug('Make quick analysis time, total: {}, n: {}, average: {}'.format(et, n, et / float(n)))
+
+        if full:
+            self.debug('{} analyses without stored intensities'.format(len(full)))
+            ret.extend(self.make_analyses(full, calculate_f_only=calculate_f_only, use_progress=use_progress))
+
+        return ret
+
     # repositories
     def find_changes(self, names, remote, branch):
         gs = self.application.get_services(IGitHost)
@@ -954,6 +1064,29 @@ class DVC(Loggable):
         irrads = self.db.get_irradiations()
         return [i.name for i in irrads]
 
+    def get_search_index(self, update=False):
+        """
+            the local search index of the current database. ``update`` brings it up to date with the database
+        """
+        url = self.db.datasource_url
+        if self._search_index is None or self._search_index_url != url:
+            from pychron.dvc.search_index import SearchIndex
+
+            if self._search_index is not None:
+                self._search_index.close()
+
+            name = '{}.sqlite'.format(re.sub(r'[^\w.-]+', '_', url))
+            self._search_index = SearchIndex(os.path.join(paths.hidden_path('search_index'), name))
+            self._search_index_url = url
+            update = True
+
+        if update:
+            st = time.time()
+            n = self._search_index.update(self.db)
+            self.debug('updated search index. {} changes in {:0.3f}s'.format(n, time.time() - st))
+
+        return self._search_index
+
     # add
     def add_interpreted_ages(self, rid, iass):
         ps = []
@@ -19,6 +19,7 @@
 import datetime
 import os
 import time
+from functools import wraps
 from operator import itemgetter
 
 from uncertainties import ufloat, std_dev, nominal_value
@@ -28,7 +29,8 @@ from pychron.core.helpers.datetime_tools import make_timef
 from pychron.core.helpers.filetools import add_extension
 from pychron.core.helpers.iterfuncs import partition
 from pychron.core.helpers.strtools import to_csv_str
-from pychron.dvc import dvc_dump, dvc_load, analysis_path, make_ref_list, get_spec_sha, get_masses, repository_path
+from pychron.dvc import dvc_dump, dvc_load, analysis_path, make_ref_list, get_spec_sha, get_masses, repository_path, \
+    AnalysisNotAnvailableError
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.identifier import make_aliquot_step, make_step
 from pychron.processing.analyses.analysis import Analysis
@@ -67,33 +69,10 @@ class DVCAnalysis(Analysis):
     def __init__(self, uuid, record_id, repository_identifier, *args, **kw):
         super(DVCAnalysis, self).__init__(*args, **kw)
         self.record_id = record_id
-        path = analysis_path((uuid, record_id), repository_identifier)
         self.repository_identifier = repository_identifier
         self.rundate = datetime.datetime.now()
 
-        root = os.path.dirname(path)
-        bname = os.path.basename(path)
-        head, ext = os.path.splitext(bname)
-
-        ep = os.path.join(root, 'extraction', '{}.extr{}'.format(head, ext))
-        if os.path.isfile(ep):
-            jd = dvc_load(ep)
-
-            self.load_extraction(jd)
-
-        else:
-            self.warning('Invalid analysis. RunID="{}". No extraction file {}'.format(record_id, ep))
-
-        if os.path.isfile(path):
-            jd = dvc_load(path)
-            self.load_spectrometer_parameters(jd.get('spec_sha'))
-            self.load_environmentals(jd.get('environmental'))
-
-            self.load_meta(jd)
-        else:
-            self.warning('Invalid analysis. RunID="{}". No meta file {}'.format(record_id, path))
-
-        self.load_paths()
+        self._load_files(uuid, record_id, repository_identifier)
 
     @property
     def irradiation_position_position(self):
@@ -476,6 +455,32 @@ class DVCAnalysis(Analysis):
         return self._analysis_path(modifier=modifier)
 
     # private
+    def _load_files(self, uuid, record_id, repository_identifier):
+        path = analysis_path((uuid, record_id), repository_identifier)
+        root = os.path.dirname(path)
+        bname = os.path.basename(path)
+        head, ext = os.path.splitext(bname)
+
+        ep = os.path.join(root, 'extraction', '{}.extr{}'.format(head, ext))
+        if os.path.isfile(ep):
+            jd = dvc_load(ep)
+
+            self.load_extraction(jd)
+
+        else:
+            self.warning('Invalid analysis. RunID="{}". No extraction file {}'.format(record_id, ep))
+
+        if os.path.isfile(path):
+            jd = dvc_load(path)
+            self.load_spectrometer_parameters(jd.get('spec_sha'))
+            self.load_environmentals(jd.get('environmental'))
+
+            self.load_meta(jd)
+        else:
+            self.warning('Invalid analysis. RunID="{}". No meta file {}'.format(record_id, path))
+
+        self.load_paths()
+
     def _load_peakcenter(self, jd):
 
         refdet = jd.get('reference_detector')
@@ -646,4 +651,127 @@ class DVCAnalysis(Analysis):
     @property
     def tag_path(self):
         return self._analysis_path(modifier='tags')
+
+
+def full_load(func):
+    """
+        decorator. read the repository files of a ``QuickDVCAnalysis`` before calling ``func``
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kw):
+        self.load_full()
+        return func(self, *args, **kw)
+
+    return wrapper
+
+
+class QuickDVCAnalysis(DVCAnalysis):
+    """
+        an analysis made from its database record and the rows of AnalysisIntensitiesTbl without reading the
+        repository.
+
+        the intensities table stores the intercepts, baselines and blanks but not the ic factors, so the ic factors
+        are 1 until ``load_full`` reads the repository files. ``load_full`` is called before the raw data is loaded.
+        pipeline nodes that edit analyses call ``load_full`` before the analyses are edited.
+
+        ``sync_repository`` is called with the repository identifier to pull or clone the repository before its
+        files are read
+    """
+    quick = True
+    sync_repository = None
+
+    def __init__(self, record, intensities, *args, **kw):
+        super(DVCAnalysis, self).__init__(*args, **kw)
+        self.uuid = record.uuid
+        self.record_id = record.record_id
+        self.repository_identifier = record.repository_identifier
+
+        self.identifier = record.identifier
+        self.aliquot = record.aliquot
+        self.increment = record.increment
+        if self.increment is not None:
+            self.step = make_step(self.increment)
+        self.aliquot_step_str = make_aliquot_step(self.aliquot, self.step)
+
+        self.analysis_type = record.analysis_type or 'unknown'
+        if self.analysis_type.lower() == 'sample':
+            self.analysis_type = 'unknown'
+
+        for attr in ('mass_spectrometer', 'extract_device', 'extract_value', 'extract_units', 'weight', 'comment',
+                     'sample', 'material', 'project', 'principal_investigator', 'load_name', 'load_holder'):
+            v = getattr(record, attr, None)
+            if v is not None:
+                setattr(self, attr, v)
+
+        self.cleanup_duration = record.cleanup or 0
+        self.extract_duration = record.duration or 0
+        self.measurement_script_name = record.measurementName or NULL_STR
+        self.extraction_script_name = record.extractionName or NULL_STR
+        if not self.extract_units:
+            self.extract_units = 'W'
+
+        self.rundate = record.timestamp
+        self.timestamp = self.timestampf = make_timef(self.rundate)
+
+        ip = record.irradiation_position
+        if ip is not None and ip.level is not None:
+            self.irradiation = record.irradiation
+            self.irradiation_level = record.irradiation_level
+            self.irradiation_position = record.irradiation_position_position
+
+        self.set_tag(record.tag)
+        self._set_intensities(intensities)
+
+    def load_full(self):
+        """
+            replace the database values with the ones in the repository. raises AnalysisNotAnvailableError if the
+            repository does not have the analysis
+        """
+        if self.quick:
+            repo = self.repository_identifier
+            if self.sync_repository is not None:
+                self.sync_repository(repo)
+
+            if not analysis_path((self.uuid, self.record_id), repo):
+                raise AnalysisNotAnvailableError(repository_path(repo), self.record_id)
+
+            self.quick = False
+            self._load_files(self.uuid, self.record_id, repo)
+            self.calculate_age(force=True)
+
+    load_raw_data = full_load(DVCAnalysis.load_raw_data)
+    get_extraction_data = full_load(DVCAnalysis.get_extraction_data)
+
+    # private
+    def _set_intensities(self, intensities):
+        cb = False if any(self.analysis_type.startswith(at) for at in NO_BLANK_CORRECT) else True
+        masses = get_masses()
+
+        isos = {}
+        for (name, det, v, e, n, fit, error_type,
+             bv, be, bn, bfit, blank_v, blank_e) in intensities:
+            key = name
+            if key in isos and isos[key].detector != det:
+                key = '{}{}'.format(name, det)
+
+            iso = Isotope(name, det)
+            iso.correct_for_blank = cb
+            iso.mass = masses.get(name, 0)
+
+            iso.value, iso.error = v or 0, e or 0
+            iso.n = n
+            iso.fit = fit
+            iso.error_type = error_type or 'SEM'
+
+            bs = iso.baseline
+            bs.value, bs.error = bv or 0, be or 0
+            bs.n = bn
+            bs.fit = bfit
+
+            iso.blank.value, iso.blank.error = blank_v or 0, blank_e or 0
+            isos[key] = iso
+
+        self.isotopes = isos
+
 # ============= EOF ============================================
@@ -17,7 +17,9 @@
 from datetime import timedelta, datetime
 
 import six
-from sqlalchemy import not_, func, distinct, or_, select, and_, join
+from sqlalchemy import not_, func, distinct, or_, select, and_, join, Table, MetaData, Column, Integer, DATETIME
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.sql.functions import count
 from sqlalchemy.util import OrderedSet
@@ -157,6 +159,35 @@ def extract_devices_query(analysis_types, extract_devices, q):
     return q
 
 
+def irradiation_position_options(opt=None):
+    """
+        load the level, irradiation, sample, material, project and principal investigator of IrradiationPositionTbl
+        or of ``opt``, a loader option for IrradiationPositionTbl. the positions of the level and sample and the
+        levels of the irradiation are not loaded
+    """
+    if opt is None:
+        lopt = joinedload(IrradiationPositionTbl.level)
+        sopt = joinedload(IrradiationPositionTbl.sample)
+    else:
+        lopt = opt.joinedload(IrradiationPositionTbl.level)
+        sopt = opt.joinedload(IrradiationPositionTbl.sample)
+    return [lopt.lazyload(LevelTbl.positions),
+            lopt.joinedload(LevelTbl.irradiation).lazyload(IrradiationTbl.levels),
+            sopt.lazyload(SampleTbl.positions),
+            sopt.joinedload(SampleTbl.material),
+            sopt.joinedload(SampleTbl.project).joinedload(ProjectTbl.principal_investigator)]
+
+
+def analysis_load_options():
+    """
+        loader options for AnalysisTbl queries whose results are bound (``AnalysisTbl.bind``) and used after the
+        session is closed. everything ``bind`` and the analysis tables read is loaded with the analyses
+    """
+    opts = irradiation_position_options(joinedload(AnalysisTbl.irradiation_position))
+    opts.append(selectinload(AnalysisTbl.measured_positions).joinedload(MeasuredPositionTbl.load))
+    return opts
+
+
 class DVCDatabase(DatabaseAdapter):
     """
     mysql2sqlite
@@ -349,6 +380,7 @@ class DVCDatabase(DatabaseAdapter):
             if exclude_invalid:
                 q = exclude_invalid_analyses(q)
 
+            q = q.options(*analysis_load_options())
             records = self._query_all(q, verbose_query=True)
             return records
 
@@ -356,29 +388,84 @@ class DVCDatabase(DatabaseAdapter):
                         extract_devices=None,
                         mass_spectrometers=None,
                         exclude_invalid=True):
+        """
+            find the analyses of ``atypes`` within ``hours`` of ``times``.
 
-        with self.session_ctx():
+            the binned time windows are written to a temporary table and joined against AnalysisTbl so all the
+            windows are searched and the references deduplicated by one query
+        """
+        with self.session_ctx() as sess:
             delta = timedelta(hours=hours)
-            refs = OrderedSet()
-            ex = None
 
             times = [ti if isinstance(ti, datetime) else ti.rundate for ti in times]
             ctimes = list(bin_datetimes(times, delta))
             self.debug('find references ntimes={} compresstimes={}'.format(len(times), len(ctimes)))
 
-            for low, high in ctimes:
-                rs = self.get_analyses_by_date_range(low, high,
-                                                     extract_devices=extract_devices,
-                                                     mass_spectrometers=mass_spectrometers,
-                                                     analysis_types=atypes,
-                                                     exclude=ex,
-                                                     exclude_uuids=exclude,
-                                                     exclude_invalid=exclude_invalid,
-                                                     verbose=True)
-                refs.update(rs)
-                ex = [r.id for r in refs]
+            kw = dict(extract_devices=extract_devices,
+                      mass_spectrometers=mass_spectrometers,
+                      exclude_uuids=exclude,
+                      exclude_invalid=exclude_invalid)
+            try:
+                return self._find_references_join(sess, ctimes, atypes, **kw)
+            except SQLAlchemyError as e:
+                self.warning('find references by interval join failed. querying each window. {}'.format(e))
+                sess.rollback()
+                return self._find_references_binned(ctimes, atypes, **kw)
+
+    def _find_references_join(self, sess, ctimes, atypes, extract_devices=None, mass_spectrometers=None,
+                              exclude_uuids=None, exclude_invalid=True):
+        windows = Table('tmp_reference_windows', MetaData(),
+                        Column('idx', Integer, primary_key=True),
+                        Column('low', DATETIME),
+                        Column('high', DATETIME),
+                        prefixes=['TEMPORARY'])
+
+        conn = sess.connection()
+        # sqlite rolls back the drop below with the rest of the session transaction
+        windows.drop(conn, checkfirst=True)
+        windows.create(conn)
+        try:
+            conn.execute(windows.insert(), [{'idx': i, 'low': low, 'high': high}
+                                            for i, (low, high) in enumerate(ctimes)])
+
+            # the first window an analysis falls in. orders the references like querying the windows in turn
+            sq = sess.query(AnalysisTbl.id.label('aid'), func.min(windows.c.idx).label('window'))
+            sq = sq.join(windows, and_(AnalysisTbl.timestamp >= windows.c.low,
+                                       AnalysisTbl.timestamp <= windows.c.high))
+            if exclude_invalid:
+                sq = sq.join(AnalysisChangeTbl, AnalysisChangeTbl.analysisID == AnalysisTbl.id)
+                sq = exclude_invalid_analyses(sq)
+            if mass_spectrometers:
+                sq = in_func(sq, AnalysisTbl.mass_spectrometer, mass_spectrometers)
+            if atypes:
+                sq = analysis_type_filter(sq, atypes)
+            sq = extract_devices_query(atypes, extract_devices, sq)
+            if exclude_uuids:
+                sq = sq.filter(not_(AnalysisTbl.uuid.in_(exclude_uuids)))
+
+            sq = sq.group_by(AnalysisTbl.id).subquery()
+
+            q = sess.query(AnalysisTbl).join(sq, AnalysisTbl.id == sq.c.aid)
+            q = q.order_by(sq.c.window, AnalysisTbl.timestamp.asc())
+            q = q.options(*analysis_load_options())
 
-            return refs
+            self.debug(compile_query(q))
+            return OrderedSet(q.all())
+        finally:
+            windows.drop(conn)
+
+    def _find_references_binned(self, ctimes, atypes, **kw):
+        refs = OrderedSet()
+        ex = None
+        for low, high in ctimes:
+            rs = self.get_analyses_by_date_range(low, high,
+                                                 analysis_types=atypes,
+                                                 exclude=ex,
+                                                 verbose=True, **kw)
+            refs.update(rs)
+            ex = [r.id for r in refs]
+
+        return refs
 
     def get_blanks(self, ms=None, limit=100):
         with self.session_ctx() as sess:
@@ -544,6 +631,33 @@ class DVCDatabase(DatabaseAdapter):
 
             self._add_item(result)
 
+    def get_analysis_intensities(self, ids, chunk=500):
+        """
+            return {analysisID: [(isotope, detector, value, error, n, fit, fit_error_type,
+                                  baseline_value, baseline_error, baseline_n, baseline_fit, blank_value,
+                                  blank_error),...]}
+
+            for the AnalysisTbl ids ``ids``. the rows are selected as plain columns, ``chunk`` ids per query
+        """
+        cols = (AnalysisIntensitiesTbl.analysisID,
+                AnalysisIntensitiesTbl.isotope, AnalysisIntensitiesTbl.detector,
+                AnalysisIntensitiesTbl.value, AnalysisIntensitiesTbl.error, AnalysisIntensitiesTbl.n,
+                AnalysisIntensitiesTbl.fit, AnalysisIntensitiesTbl.fit_error_type,
+                AnalysisIntensitiesTbl.baseline_value, AnalysisIntensitiesTbl.baseline_error,
+                AnalysisIntensitiesTbl.baseline_n, AnalysisIntensitiesTbl.baseline_fit,
+                AnalysisIntensitiesTbl.blank_value, AnalysisIntensitiesTbl.blank_error)
+
+        ids = list(ids)
+        ret = {}
+        with self.session_ctx() as sess:
+            for i in range(0, len(ids), chunk):
+                q = sess.query(*cols)
+                q = q.filter(AnalysisIntensitiesTbl.analysisID.in_(ids[i:i + chunk]))
+                q = q.order_by(AnalysisIntensitiesTbl.id.asc())
+                for row in self._query_all(q, verbose_query=False):
+                    ret.setdefault(row[0], []).append(tuple(row[1:]))
+        return ret
+
     def get_search_attributes(self):
         with self.session_ctx() as sess:
             s1 = sess.query(distinct(AnalysisIntensitiesTbl.isotope))
@@ -964,13 +1078,25 @@ class DVCDatabase(DatabaseAdapter):
                 return
 
     def get_labnumbers_startswith(self, partial_id, mass_spectrometers=None, filter_non_run=True,
-                                  verbose_query=True, **kw):
+                                  verbose_query=True, identifiers=None, after_id=None, **kw):
+        """
+            return the IrradiationPositionTbls with an identifier containing ``partial_id``. ``identifiers``, the
+            matching identifiers e.g. from the search index, replaces the LIKE filter. the positions with an id
+            greater than ``after_id``, e.g. added since the search index was updated, are still matched with LIKE
+        """
         with self.session_ctx() as sess:
             q = sess.query(IrradiationPositionTbl)
             if mass_spectrometers or filter_non_run:
                 q = q.join(AnalysisTbl)
 
-            q = q.filter(IrradiationPositionTbl.identifier.like('%{}%'.format(partial_id)))
+            like = IrradiationPositionTbl.identifier.like('%{}%'.format(partial_id))
+            if identifiers is not None:
+                f = IrradiationPositionTbl.identifier.in_(identifiers)
+                if after_id is not None:
+                    f = or_(f, and_(IrradiationPositionTbl.id > after_id, like))
+                q = q.filter(f)
+            else:
+                q = q.filter(like)
             if mass_spectrometers:
                 q = q.filter(AnalysisTbl.mass_spectrometer.in_(mass_spectrometers))
             if filter_non_run:
@@ -999,8 +1125,20 @@ class DVCDatabase(DatabaseAdapter):
             q = sess.query(AnalysisTbl)
             q = q.filter(AnalysisTbl.uuid.in_(uuids))
             q = q.order_by(AnalysisTbl.uuid.asc())
+            q = q.options(*analysis_load_options())
             return self._query_all(q, verbose_query=verbose_query)
 
+    def get_analysis_runid_keys(self):
+        """
+            return a set of (identifier, aliquot, increment) of every analysis. increment is -1 for analyses
+            without a step
+        """
+        with self.session_ctx() as sess:
+            q = sess.query(IrradiationPositionTbl.identifier, AnalysisTbl.aliquot, AnalysisTbl.increment)
+            q = q.select_from(AnalysisTbl).join(IrradiationPositionTbl)
+            return {(idn, aliquot, -1 if inc is None else inc)
+                    for idn, aliquot, inc in self._query_all(q, verbose_query=False)}
+
     def get_analysis_runid(self, idn, aliquot, step=None):
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl)
@@ -1112,6 +1250,7 @@ class DVCDatabase(DatabaseAdapter):
                 q = q.limit(limit)
 
             tc = q.count()
+            q = q.options(*analysis_load_options())
             return self._query_all(q, verbose_query=verbose_query), tc
 
     def get_repository_date_range(self, names):
@@ -1198,6 +1337,7 @@ class DVCDatabase(DatabaseAdapter):
             if limit:
                 q = q.limit(limit)
 
+            q = q.options(*analysis_load_options())
             return self._query_all(q, verbose_query=verbose)
 
     def get_project_labnumbers(self, project_names, filter_non_run,
@@ -1256,7 +1396,12 @@ class DVCDatabase(DatabaseAdapter):
                        high_post=None,
                        low_post=None,
                        loads=None,
-                       filter_non_run=False):
+                       filter_non_run=False,
+                       projection=False):
+        """
+            return the matching IrradiationPositionTbls. if ``projection`` return rows of the columns used by
+            ``LabnumberRecordView`` instead
+        """
 
         self.debug('------- Get Labnumbers {}-------'.format(id(self)))
         self.debug('------- samples: {}'.format(samples))
@@ -1365,10 +1510,37 @@ class DVCDatabase(DatabaseAdapter):
                 res = self._query_all(q, verbose_query=False)
                 if res:
                     ids = [r[0] for r in res]
-                    q = sess.query(IrradiationPositionTbl)
+                    if projection:
+                        q = self._labnumber_projection(sess)
+                    else:
+                        q = sess.query(IrradiationPositionTbl)
+                        q = q.options(*irradiation_position_options())
                     q = q.filter(IrradiationPositionTbl.id.in_(ids))
+                    q = q.order_by(IrradiationPositionTbl.id)
                     return self._query_all(q, verbose_query=False)
 
+    def _labnumber_projection(self, sess):
+        q = sess.query(IrradiationPositionTbl.identifier,
+                       IrradiationPositionTbl.position,
+                       IrradiationPositionTbl.packet,
+                       LevelTbl.name.label('level'),
+                       IrradiationTbl.name.label('irradiation'),
+                       SampleTbl.name.label('sample'),
+                       SampleTbl.lat,
+                       SampleTbl.elevation,
+                       SampleTbl.lithology,
+                       SampleTbl.location,
+                       SampleTbl.igsn,
+                       MaterialTbl.name.label('material'),
+                       ProjectTbl.name.label('project'))
+
+        q = q.outerjoin(LevelTbl, LevelTbl.id == IrradiationPositionTbl.levelID)
+        q = q.outerjoin(IrradiationTbl, IrradiationTbl.id == LevelTbl.irradiationID)
+        q = q.outerjoin(SampleTbl, SampleTbl.id == IrradiationPositionTbl.sampleID)
+        q = q.outerjoin(MaterialTbl, MaterialTbl.id == SampleTbl.materialID)
+        q = q.outerjoin(ProjectTbl, ProjectTbl.id == SampleTbl.projectID)
+        return q
+
     def get_analysis_groups(self, project_ids, **kw):
         ret = []
         if project_ids:
@@ -1908,6 +2080,7 @@ class DVCDatabase(DatabaseAdapter):
             q = q.filter(SampleTbl.name == sample)
             q = q.filter(AnalysisChangeTbl.tag != 'invalid')
 
+            q = q.options(*analysis_load_options())
             return self._query_all(q, verbose_query=True)
 
     def delete_tag(self, name):
@@ -110,7 +110,7 @@ class AnalysisTbl(Base, IDMixin):
 
     weight = Column(Float)
     comment = stringcolumn(200)
-    repository_associations = relationship('RepositoryAssociationTbl', backref='analysis', lazy='joined')
+    repository_associations = relationship('RepositoryAssociationTbl', backref='analysis', lazy='selectin')
     group_sets = relationship('AnalysisGroupSetTbl', backref='analysis')
 
     change = relationship('AnalysisChangeTbl', uselist=False, backref='analysis', lazy='joined')
@@ -341,7 +341,7 @@ class SampleTbl(Base, NameMixin):
     create_date = deferred(Column(DateTime, default=func.now()))
     update_date = deferred(Column(DateTime, onupdate=func.now(), default=func.now()))
 
-    positions = relationship('IrradiationPositionTbl', backref='sample', lazy='joined')
+    positions = relationship('IrradiationPositionTbl', backref='sample', lazy='selectin')
 
 
 # class ProductionTbl(Base, NameMixin):
@@ -354,7 +354,7 @@ class LevelTbl(Base, NameMixin):
     holder = stringcolumn(45)
     z = Column(Float)
 
-    positions = relationship('IrradiationPositionTbl', backref='level', lazy='joined')
+    positions = relationship('IrradiationPositionTbl', backref='level', lazy='selectin')
 
     note = Column(TEXT)
 
@@ -374,7 +374,7 @@ class LevelTbl(Base, NameMixin):
 
 
 class IrradiationTbl(Base, NameMixin):
-    levels = relationship('LevelTbl', backref='irradiation', lazy='joined')
+    levels = relationship('LevelTbl', backref='irradiation', lazy='selectin')
     create_date = Column(TIMESTAMP, default=func.now())
 
 
@@ -17,16 +17,18 @@
 import hashlib
 import os
 import shutil
+import time
 from datetime import datetime
 
 import yaml
 from apptools.preferences.preference_binding import bind_preference
 from git.exc import GitCommandError
 # ============= enthought library imports =======================
-from traits.api import Instance, Bool, Str
+from traits.api import Instance, Bool, Str, Float
 from uncertainties import std_dev, nominal_value
 from yaml import YAMLError
 
+from pychron.core.codetools.spans import spans
 from pychron.core.helpers.binpack import encode_blob, pack
 from pychron.dvc import dvc_dump, analysis_path, repository_path, NPATH_MODIFIERS
 from pychron.experiment.automated_run.persistence import BasePersister
@@ -63,6 +65,9 @@ class DVCPersister(BasePersister):
     save_log_enabled = Bool(False)
     arar_mapping = None
 
+    # seconds spent committing and pushing the last analysis
+    publish_duration = Float
+
     def __init__(self, bind=True, *args, **kw):
         super(DVCPersister, self).__init__(*args, **kw)
         if bind:
@@ -197,6 +202,7 @@ class DVCPersister(BasePersister):
         """
         self.info('================= post measurement save started =================')
         ret = True
+        self.publish_duration = 0
 
         ar = self.active_repository
 
@@ -220,21 +226,24 @@ class DVCPersister(BasePersister):
         # will modify repository to NoRepo if repository_identifier does not exist
         self._check_repository_identifier()
 
-        self._save_analysis(timestamp)
+        with spans.span('save_analysis'):
+            self._save_analysis(timestamp)
 
-        # save monitor
-        self._save_monitor()
+            # save monitor
+            self._save_monitor()
 
-        # save peak center
-        self._save_peak_center(self.per_spec.peak_center)
+            # save peak center
+            self._save_peak_center(self.per_spec.peak_center)
 
         # stage files
         dvc = self.dvc
 
         if self.stage_files:
             if commit:
+                st = time.time()
                 try:
-                    ar.smart_pull(accept_their=True)
+                    with spans.span('git.pull'):
+                        ar.smart_pull(accept_their=True)
 
                     paths = [spec_path, ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
 
@@ -245,7 +254,9 @@ class DVCPersister(BasePersister):
                             self.debug('not at valid file {}'.format(p))
 
                     # commit files
-                    ar.commit('<{}>'.format(commit_tag))
+                    with spans.span('git.commit'):
+                        ar.commit('<{}>'.format(commit_tag))
+                    spans.count('git.commits')
 
                     # commit default data reduction
                     add = False
@@ -260,7 +271,9 @@ class DVCPersister(BasePersister):
                         add = True
 
                     if add:
-                        ar.commit('<ISOEVO> default collection fits')
+                        with spans.span('git.commit'):
+                            ar.commit('<ISOEVO> default collection fits')
+                        spans.count('git.commits')
 
                     for pp, tag, msg in (('blanks', 'BLANKS',
                                           'preceding {}'.format(self.per_spec.previous_blank_runid)),
@@ -268,19 +281,25 @@ class DVCPersister(BasePersister):
                         p = self._make_path(pp)
                         if os.path.isfile(p):
                             ar.add(p, commit=False)
-                            ar.commit('<{}> {}'.format(tag, msg))
+                            with spans.span('git.commit'):
+                                ar.commit('<{}> {}'.format(tag, msg))
+                            spans.count('git.commits')
                     if push:
                         # push changes
-                        dvc.push_repository(ar)
+                        with spans.span('git.push'):
+                            dvc.push_repository(ar)
 
                     # update meta
-                    dvc.meta_pull(accept_our=True)
+                    with spans.span('meta.pull'):
+                        dvc.meta_pull(accept_our=True)
 
-                    dvc.meta_commit('repo updated for analysis {}'.format(self.per_spec.run_spec.runid))
+                    with spans.span('meta.commit'):
+                        dvc.meta_commit('repo updated for analysis {}'.format(self.per_spec.run_spec.runid))
 
                     if push:
                         # push commit
-                        dvc.meta_push()
+                        with spans.span('meta.push'):
+                            dvc.meta_push()
                 except GitCommandError as e:
                     self.warning(e)
                     if self.confirmation_dialog('NON FATAL\n\n'
@@ -289,8 +308,9 @@ class DVCPersister(BasePersister):
                                                 timeout_ret=False,
                                                 timeout=30):
                         ret = False
+                self.publish_duration = time.time() - st
 
-        with dvc.session_ctx():
+        with spans.span('save_analysis_db'), dvc.session_ctx():
             self._save_analysis_db(timestamp)
         self.info('================= post measurement save finished =================')
         return ret
@@ -445,9 +465,14 @@ class DVCPersister(BasePersister):
         source = {'emission': per_spec.emission,
                   'trap': per_spec.trap}
 
-        clf = None
+        klasses = {}
         if self.use_isotope_classifier:
             clf = self.application.get_service('pychron.classifier.isotope_classifier.IsotopeClassifier')
+            if clf is not None:
+                # classify all isotopes in one call
+                keys = list(per_spec.isotope_group.keys())
+                isotopes = [per_spec.isotope_group[k] for k in keys]
+                klasses = dict(zip(keys, clf.predict_isotopes(isotopes)))
 
         for key, iso in per_spec.isotope_group.items():
             sblob = encode_blob(iso.pack(endianness, as_hex=False))
@@ -462,8 +487,8 @@ class DVCPersister(BasePersister):
             isod = {'detector': iso.detector, 'name': iso.name,
                     'serial_id': detector.serial_id if detector else '00000'}
 
-            if clf is not None:
-                klass, prob = clf.predict_isotope(iso)
+            if key in klasses:
+                klass, prob = klasses[key]
                 isod.update(classification=klass,
                             classification_probability=prob)
 
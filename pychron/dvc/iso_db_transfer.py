@@ -23,6 +23,8 @@ import os
 import time
 from datetime import timedelta
 from itertools import groupby
+from operator import itemgetter
+from threading import Lock, local
 
 from numpy import array_split
 from six.moves import filter
@@ -33,6 +35,7 @@ from pychron.core.utils import alpha_to_int
 from pychron.database.isotope_database_manager import IsotopeDatabaseManager
 from pychron.database.records.isotope_record import IsotopeRecordView
 from pychron.dvc import dvc_dump
+from pychron.dvc.bulk_transfer import BulkTransfer
 from pychron.dvc.dvc import DVC
 from pychron.dvc.dvc_persister import DVCPersister, format_repository_identifier
 from pychron.dvc.pychrondata_transfer_helpers import get_irradiation_timestamps, get_project_timestamps, \
@@ -57,6 +60,21 @@ def create_github_repo(name):
         org.create_repo(name, usr, pwd)
 
 
+def map_identifier(idn):
+    if idn == '4359':
+        idn = 'c-01-j'
+    elif idn == '4358':
+        idn = 'c-01-o'
+    return idn
+
+
+def runid_key(idn, aliquot, step):
+    """
+        (identifier, aliquot, increment) as returned by ``DVCDatabase.get_analysis_runid_keys``
+    """
+    return idn, int(aliquot), alpha_to_int(step) if step else -1
+
+
 class IsoDBTransfer(Loggable):
     """
     transfer analyses from an isotope_db database to a dvc database
@@ -67,6 +85,11 @@ class IsoDBTransfer(Loggable):
 
     quiet = False
 
+    _src_conn = None
+    _local = None
+    _build_lock = None
+    _repos = None
+
     def init(self):
         conn = dict(host=os.environ.get('ARGONSERVER_HOST'),
                     username='jross',  # os.environ.get('ARGONSERVER_DB_USER'),
@@ -116,6 +139,7 @@ class IsoDBTransfer(Loggable):
         src = proc.db
         src.connect()
         self.processor = proc
+        self._src_conn = conn
 
     def copy_productions(self):
         src = self.processor.db
@@ -374,7 +398,136 @@ class IsoDBTransfer(Loggable):
                             traceback.print_exc()
                             self.warning('failed transfering {}. {}'.format(a, e))
 
+    def bulk_export(self, repository_identifier, creator, low=None, high=None, mass_spectrometers=None,
+                    monitor_mapping=None, create_repo=False, workers=4, page_size=200, batch_size=50,
+                    checkpoint_path=None, max_pages=None):
+        """
+            transfer every analysis in the source database that is not in the destination database. use ``low``,
+            ``high`` and ``mass_spectrometers`` to limit the transfer.
+
+            ``repository_identifier`` is a repository name or a callable that takes a source analysis and
+            returns its repository name.
+
+            the progress is saved to ``checkpoint_path`` so calling bulk_export again after an interruption
+            resumes where the transfer stopped
+        """
+        src = self.processor.db
+        dest = self.dvc.db
+
+        if checkpoint_path is None:
+            name = repository_identifier if isinstance(repository_identifier, str) else 'bulk'
+            checkpoint_path = os.path.join(paths.dvc_dir, 'transfer.{}.json'.format(name))
+
+        with dest.session_ctx():
+            existing = dest.get_analysis_runid_keys()
+        self.debug('bulk export. {} analyses in destination. checkpoint={}'.format(len(existing), checkpoint_path))
+
+        def fetch_page(after, limit):
+            with src.session_ctx():
+                rows = src.get_analysis_keys_page(after, limit, low=low, high=high,
+                                                  mass_spectrometers=mass_spectrometers)
+            return [(aid, uuid, map_identifier(idn), aliquot, step or None) for aid, uuid, idn, aliquot, step in rows]
+
+        def persist(batch):
+            return self._persist_batch(batch, repository_identifier, creator, create_repo, monitor_mapping)
+
+        self._local = local()
+        self._build_lock = Lock()
+        self._repos = {}
+
+        bt = BulkTransfer(fetch_page, self._build_analysis, persist,
+                          key=itemgetter(0),
+                          identity=lambda r: runid_key(*r[2:]),
+                          existing=existing,
+                          checkpoint_path=checkpoint_path,
+                          workers=workers,
+                          page_size=page_size,
+                          batch_size=batch_size)
+        counts = bt.run(max_pages=max_pages)
+        self.debug('bulk export finished. {}'.format(counts))
+        return counts
+
     # private
+    def _build_analysis(self, rec):
+        """
+            unpack a source analysis. runs on a BulkTransfer worker thread
+        """
+        proc = self._get_thread_processor()
+        iv = IsotopeRecordView()
+        iv.uuid = rec[1]
+
+        if proc is self.processor:
+            with self._build_lock:
+                with proc.db.session_ctx():
+                    return proc.make_analysis(iv, unpack=True, use_cache=False, use_progress=False)
+
+        with proc.db.session_ctx():
+            return proc.make_analysis(iv, unpack=True, use_cache=False, use_progress=False)
+
+    def _get_thread_processor(self):
+        """
+            sessions can not be shared between threads. each worker gets its own connection to the source
+            database. without connection parameters the workers take turns using ``processor``
+        """
+        if self._src_conn is None:
+            return self.processor
+
+        proc = getattr(self._local, 'processor', None)
+        if proc is None:
+            proc = IsotopeDatabaseManager(bind=False, connect=False)
+            proc.db.trait_set(**self._src_conn)
+            proc.db.connect()
+            self._local.processor = proc
+        return proc
+
+    def _persist_batch(self, batch, repository_identifier, creator, create_repo, monitor_mapping):
+        src = self.processor.db
+        dest = self.dvc.db
+
+        failed = []
+        saved = {}
+        autocommit = dest.autocommit
+        with src.session_ctx():
+            with dest.session_ctx() as sess:
+                # add rows without committing each one. _save_analysis commits once per analysis
+                dest.autocommit = True
+                try:
+                    for rec, an in batch:
+                        aid, uuid, idn, aliquot, step = rec
+                        try:
+                            dban = src.get_analysis_uuid(uuid)
+                            exp = repository_identifier
+                            if callable(exp):
+                                exp = exp(dban)
+
+                            repo = self._get_bulk_repository(dest, exp, creator, create_repo)
+                            self.persister.active_repository = repo
+                            self.dvc.current_repository = repo
+
+                            self._save_analysis(dest, dban, an, idn, aliquot, step, exp, monitor_mapping)
+                            saved.setdefault(exp, []).append(make_runid(idn, aliquot, step))
+                        except BaseException as e:
+                            self.debug_exception()
+                            self.warning('failed transfering {}. {}'.format(make_runid(idn, aliquot, step), e))
+                            sess.rollback()
+                            failed.append((rec, e))
+                finally:
+                    dest.autocommit = autocommit
+
+        for exp, runids in saved.items():
+            repo = self._repos[exp]
+            repo.add_unstaged(add_all=True)
+            repo.commit('<Database Transfer> {} analyses {} - {}'.format(len(runids), runids[0], runids[-1]))
+
+        return failed
+
+    def _get_bulk_repository(self, dest, repository_identifier, creator, create_repo):
+        repo = self._repos.get(repository_identifier)
+        if repo is None:
+            repo = self._add_repository(dest, repository_identifier, creator, create_repo)
+            self._repos[repository_identifier] = repo
+        return repo
+
     def _get_project_timestamps(self, project, mass_spectrometer, tol_hrs=6):
         src = self.processor.db
         return get_project_timestamps(src, project, mass_spectrometer, tol_hrs)
@@ -593,10 +746,7 @@ class IsoDBTransfer(Loggable):
             except IndexError:
                 step = None
 
-        if idn == '4359':
-            idn = 'c-01-j'
-        elif idn == '4358':
-            idn = 'c-01-o'
+        idn = map_identifier(idn)
 
         # check if analysis already exists. skip if it does
         if dest.get_analysis_runid(idn, aliquot, step):
@@ -615,6 +765,9 @@ class IsoDBTransfer(Loggable):
         #     self.warning('exception: {}'.format(e))
         #     return
 
+        return self._save_analysis(dest, dban, an, idn, aliquot, step, exp, monitor_mapping)
+
+    def _save_analysis(self, dest, dban, an, idn, aliquot, step, exp, monitor_mapping=None):
         self._transfer_meta(dest, dban, monitor_mapping)
         # return
 
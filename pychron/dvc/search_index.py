@@ -0,0 +1,258 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    local SQLite trigram index of the names in a DVC database.
+
+    the index holds one entry per sample, project, material, irradiation, principal investigator and labnumber
+    and the trigrams of each entry. ``search`` answers exact, prefix and substring searches with the same hits as
+    the database LIKE queries and ranks near misses for ``comp=None``.
+
+    ``update`` selects the (id, name) columns of each table and rewrites only the entries that were added,
+    renamed or deleted since the last update
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import sqlite3
+from collections import Counter
+from math import ceil
+
+# ============= local library imports  ==========================
+from pychron.core.fuzzyfinder import trigrams, similarity
+
+KINDS = ('sample', 'project', 'material', 'irradiation', 'principal_investigator', 'labnumber')
+
+# trigrams of more entries than this are not used to find near misses
+MAX_POSTINGS = 2000
+
+SCHEMA = ('CREATE TABLE IF NOT EXISTS entries (kind TEXT, source_id INTEGER, name TEXT, lname TEXT, '
+          'PRIMARY KEY (kind, source_id))',
+          'CREATE INDEX IF NOT EXISTS entries_lname ON entries (lname)',
+          'CREATE TABLE IF NOT EXISTS grams (gram TEXT, kind TEXT, source_id INTEGER)',
+          'CREATE INDEX IF NOT EXISTS grams_gram ON grams (gram)',
+          'CREATE INDEX IF NOT EXISTS grams_entry ON grams (kind, source_id)',
+          'CREATE TABLE IF NOT EXISTS gram_counts (gram TEXT PRIMARY KEY, n INTEGER)')
+
+
+def source_columns(kind):
+    from pychron.dvc.dvc_orm import SampleTbl, ProjectTbl, MaterialTbl, IrradiationTbl, \
+        PrincipalInvestigatorTbl, IrradiationPositionTbl
+
+    if kind == 'labnumber':
+        return IrradiationPositionTbl.id, IrradiationPositionTbl.identifier
+    elif kind == 'principal_investigator':
+        return PrincipalInvestigatorTbl.id, PrincipalInvestigatorTbl.last_name, PrincipalInvestigatorTbl.first_initial
+
+    table = {'sample': SampleTbl, 'project': ProjectTbl, 'material': MaterialTbl,
+             'irradiation': IrradiationTbl}[kind]
+    return table.id, table.name
+
+
+class SearchIndex(object):
+    def __init__(self, path=':memory:'):
+        self.path = path
+        if path != ':memory:':
+            root = os.path.dirname(path)
+            if root and not os.path.isdir(root):
+                os.makedirs(root)
+
+        self._conn = conn = sqlite3.connect(path, check_same_thread=False)
+        with conn:
+            for s in SCHEMA:
+                conn.execute(s)
+
+    def close(self):
+        self._conn.close()
+
+    def update(self, db, kinds=KINDS):
+        """
+            bring the index up to date with ``db``. returns the number of entries added, renamed or removed
+        """
+        n = 0
+        with db.session_ctx() as sess:
+            for kind in kinds:
+                rows = {}
+                for r in sess.query(*source_columns(kind)):
+                    if kind == 'principal_investigator':
+                        name = '{}, {}'.format(r[1], r[2]) if r[2] else r[1]
+                    else:
+                        name = r[1]
+                    if name:
+                        rows[r[0]] = name
+
+                n += self.set_entries(kind, rows)
+        return n
+
+    def set_entries(self, kind, rows):
+        """
+            make the entries of ``kind`` match ``rows``, a dict of {source_id: name}
+        """
+        conn = self._conn
+        existing = dict(conn.execute('SELECT source_id, name FROM entries WHERE kind=?', (kind,)))
+
+        removed = [(i, name) for i, name in existing.items() if i not in rows]
+        changed = [(i, name) for i, name in rows.items() if existing.get(i) != name]
+        stale = removed + [(i, existing[i]) for i, _ in changed if i in existing]
+
+        counts = Counter()
+        for _, name in stale:
+            counts.subtract(trigrams(name))
+        for _, name in changed:
+            counts.update(trigrams(name))
+
+        with conn:
+            keys = [(kind, i) for i, _ in stale]
+            conn.executemany('DELETE FROM entries WHERE kind=? AND source_id=?', keys)
+            conn.executemany('DELETE FROM grams WHERE kind=? AND source_id=?', keys)
+
+            conn.executemany('INSERT INTO entries VALUES (?,?,?,?)',
+                             [(kind, i, name, name.lower()) for i, name in changed])
+            conn.executemany('INSERT INTO grams VALUES (?,?,?)',
+                             [(g, kind, i) for i, name in changed for g in trigrams(name)])
+
+            counts = [(g, n) for g, n in counts.items() if n]
+            conn.executemany('INSERT OR IGNORE INTO gram_counts VALUES (?, 0)', [(g,) for g, _ in counts])
+            conn.executemany('UPDATE gram_counts SET n=n+? WHERE gram=?', [(n, g) for g, n in counts])
+
+        return len(removed) + len(changed)
+
+    def last_source_id(self, kind):
+        """
+            the largest indexed source id of ``kind``. rows added to the database since the last update have a
+            larger id
+        """
+        r = self._conn.execute('SELECT max(source_id) FROM entries WHERE kind=?', (kind,)).fetchone()
+        return r[0] or 0
+
+    def search(self, text, kinds=None, comp=None, limit=None):
+        """
+            return a list of (kind, name) matching ``text``. case is ignored
+
+            comp='=': equal to ``text``
+            comp='startswith': starting with ``text``
+            comp='contains': containing ``text``
+
+            comp=None: the exact matches then the prefix matches, the other matches and entries that share
+            trigrams with ``text``
+        """
+        text = text.lower()
+        if not text:
+            return []
+
+        if comp is None:
+            return self._rank(text, kinds, limit)
+
+        return [(k, n) for k, _, n in self._search(text, kinds, comp, limit)]
+
+    # private
+    def _search(self, text, kinds, comp, limit=None):
+        args = []
+        if comp == '=':
+            where = 'lname=?'
+            args.append(text)
+        elif comp == 'startswith':
+            # a range on the lname index. ordinary LIKE ignores indices
+            where = 'lname>=? AND lname<?'
+            args.extend((text, text + u'\U0010ffff'))
+        elif comp == 'contains':
+            where = 'instr(lname, ?)>0'
+            args.append(text)
+
+            # an entry containing text has every trigram of text. look only at the entries with the rarest one
+            g = self._rarest(trigrams(text, pad=False))
+            if g is not None:
+                where = '{} AND (kind, source_id) IN (SELECT kind, source_id FROM grams WHERE gram=?)'.format(where)
+                args.append(g)
+        else:
+            raise ValueError('invalid comp "{}"'.format(comp))
+
+        sql = 'SELECT kind, source_id, name FROM entries WHERE {}'.format(where)
+        if kinds:
+            sql = '{} AND kind IN ({})'.format(sql, ','.join('?' * len(kinds)))
+            args.extend(kinds)
+
+        sql = '{} ORDER BY lname, kind'.format(sql)
+        if limit:
+            sql = '{} LIMIT {:d}'.format(sql, limit)
+
+        return self._conn.execute(sql, args).fetchall()
+
+    def _rank(self, text, kinds, limit, threshold=0.3):
+        ret = []
+        seen = set()
+        for comp in ('=', 'startswith', 'contains'):
+            for kind, sid, name in self._search(text, kinds, comp):
+                if (kind, sid) not in seen:
+                    seen.add((kind, sid))
+                    ret.append((kind, name))
+
+            if limit and len(ret) >= limit:
+                return ret[:limit]
+
+        # an entry reaching the threshold shares at least m trigrams with text so it has one of the
+        # len(grams)-m+1 rarest. see MAX_POSTINGS
+        ts = trigrams(text)
+        grams = [g for _, g in self._counts(ts)]
+        m = int(ceil(threshold * len(ts)))
+        probe = grams[:max(0, len(grams) - m + 1)]
+        if not probe:
+            return ret[:limit] if limit else ret
+
+        sql = 'SELECT DISTINCT e.kind, e.source_id, e.name FROM grams AS g ' \
+              'JOIN entries AS e ON e.kind=g.kind AND e.source_id=g.source_id ' \
+              'WHERE g.gram IN ({})'.format(','.join('?' * len(probe)))
+        args = list(probe)
+        if kinds:
+            sql = '{} AND g.kind IN ({})'.format(sql, ','.join('?' * len(kinds)))
+            args.extend(kinds)
+
+        typos = []
+        for kind, sid, name in self._conn.execute(sql, args):
+            if (kind, sid) not in seen:
+                s = similarity(ts, trigrams(name))
+                if s >= threshold:
+                    typos.append((-s, name, kind))
+
+        ret.extend((kind, name) for _, name, kind in sorted(typos))
+        if limit:
+            ret = ret[:limit]
+        return ret
+
+    def _counts(self, grams):
+        """
+            (n, gram) of the indexed trigrams in ``grams`` with at most MAX_POSTINGS entries, rarest first
+        """
+        grams = list(grams)
+        if not grams:
+            return []
+
+        sql = 'SELECT n, gram FROM gram_counts WHERE gram IN ({}) AND n>0 AND n<=?'.format(','.join('?' * len(grams)))
+        return sorted(self._conn.execute(sql, grams + [MAX_POSTINGS]).fetchall())
+
+    def _rarest(self, grams):
+        """
+            the trigram in ``grams`` with the fewest entries. '' if one is not indexed, None if ``grams`` is empty
+        """
+        grams = list(grams)
+        if grams:
+            sql = 'SELECT n, gram FROM gram_counts WHERE gram IN ({}) AND n>0'.format(','.join('?' * len(grams)))
+            rows = self._conn.execute(sql, grams).fetchall()
+            if len(rows) < len(grams):
+                return ''
+            return min(rows)[1]
+
+# ============= EOF =============================================
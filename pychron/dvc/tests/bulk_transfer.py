@@ -0,0 +1,166 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from operator import itemgetter
+
+from pychron.dvc.bulk_transfer import BulkTransfer
+
+NRECORDS = 23
+
+
+class BulkTransferTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.src = sqlite3.connect(os.path.join(self.root, 'src.sqlite'), check_same_thread=False)
+        self.src.execute('CREATE TABLE analysis (id INTEGER PRIMARY KEY, identifier TEXT, aliquot INTEGER, '
+                         'repository TEXT, value REAL)')
+        self.src.executemany('INSERT INTO analysis VALUES (?,?,?,?,?)',
+                             [(i + 1, '{:05d}'.format(i // 5), i % 5, 'Repo{}'.format(i % 2), i)
+                              for i in range(NRECORDS)])
+        self.src.commit()
+
+        self.dest = sqlite3.connect(os.path.join(self.root, 'dest.sqlite'))
+        self.dest.execute('CREATE TABLE analysis (identifier TEXT, aliquot INTEGER, repository TEXT, value REAL, '
+                          'UNIQUE (identifier, aliquot))')
+        self.dest.commit()
+
+        self.checkpoint_path = os.path.join(self.root, 'transfer.json')
+        self.batches = []
+        self.commits = []
+        self.fail_persist = None
+        self.bad = set()
+
+    def tearDown(self):
+        self.src.close()
+        self.dest.close()
+        shutil.rmtree(self.root)
+
+    def _fetch_page(self, after, limit):
+        cur = self.src.execute('SELECT id, identifier, aliquot, repository FROM analysis WHERE id > ? '
+                               'ORDER BY id LIMIT ?', (after or 0, limit))
+        return cur.fetchall()
+
+    def _build(self, rec):
+        if rec[0] in self.bad:
+            raise ValueError('bad record {}'.format(rec[0]))
+        # each worker uses its own connection
+        conn = sqlite3.connect(os.path.join(self.root, 'src.sqlite'))
+        try:
+            v, = conn.execute('SELECT value FROM analysis WHERE id=?', (rec[0],)).fetchone()
+        finally:
+            conn.close()
+        return v * 2
+
+    def _persist(self, batch):
+        if self.fail_persist is not None and len(self.batches) == self.fail_persist:
+            raise IOError('database connection lost')
+
+        self.batches.append(len(batch))
+        failed = []
+        repos = set()
+        for rec, v in batch:
+            aid, idn, aliquot, repo = rec
+            try:
+                self.dest.execute('INSERT INTO analysis VALUES (?,?,?,?)', (idn, aliquot, repo, v))
+                repos.add(repo)
+            except sqlite3.IntegrityError as e:
+                failed.append((rec, e))
+        self.dest.commit()
+        self.commits.extend(sorted(repos))
+        return failed
+
+    def _existing(self):
+        return {(idn, aliquot) for idn, aliquot in self.dest.execute('SELECT identifier, aliquot FROM analysis')}
+
+    def _transfer(self, **kw):
+        return BulkTransfer(self._fetch_page, self._build, self._persist,
+                            key=itemgetter(0),
+                            identity=itemgetter(1, 2),
+                            existing=self._existing(),
+                            checkpoint_path=self.checkpoint_path,
+                            workers=3, page_size=10, batch_size=4, **kw)
+
+    def _ntransferred(self):
+        return self.dest.execute('SELECT COUNT(*) FROM analysis').fetchone()[0]
+
+    def test_transfer(self):
+        counts = self._transfer().run()
+        self.assertEqual(counts['transferred'], NRECORDS)
+        self.assertEqual(counts['pages'], 3)
+        self.assertEqual(self._ntransferred(), NRECORDS)
+        self.assertEqual(self.batches, [4, 4, 2, 4, 4, 2, 3])
+
+        v, = self.dest.execute('SELECT value FROM analysis WHERE identifier=? AND aliquot=?',
+                               ('00002', 1)).fetchone()
+        self.assertEqual(v, 22)
+
+    def test_commit_per_repository(self):
+        self._transfer().run()
+        self.assertEqual(self.commits[:2], ['Repo0', 'Repo1'])
+        self.assertEqual(len(self.commits), 2 * len(self.batches))
+
+    def test_skip_existing(self):
+        self.dest.executemany('INSERT INTO analysis VALUES (?,?,?,?)',
+                              [('00000', i, 'Repo0', 0) for i in range(5)])
+        self.dest.commit()
+
+        counts = self._transfer().run()
+        self.assertEqual(counts['skipped'], 5)
+        self.assertEqual(counts['transferred'], NRECORDS - 5)
+        self.assertEqual(self._ntransferred(), NRECORDS)
+
+    def test_failures(self):
+        self.bad = {3, 12}
+        # saved by another client after the existing runids were fetched
+        self.dest.execute('INSERT INTO analysis VALUES (?,?,?,?)', ('00003', 0, 'Repo1', 0))
+        self.dest.commit()
+
+        bt = self._transfer()
+        bt.existing = set()
+        counts = bt.run()
+        self.assertEqual(counts['failed'], 3)
+        self.assertEqual(counts['transferred'], NRECORDS - 3)
+
+        with open(self.checkpoint_path) as rfile:
+            cp = json.load(rfile)
+        self.assertEqual(sorted(k for k, e in cp['failed']), [3, 12, 16])
+
+    def test_resume(self):
+        self.fail_persist = 4
+        self.assertRaises(IOError, self._transfer().run)
+        # the first page was completed. the second page was interrupted after one batch
+        self.assertEqual(self._ntransferred(), 14)
+
+        with open(self.checkpoint_path) as rfile:
+            self.assertEqual(json.load(rfile)['last_key'], 10)
+
+        self.fail_persist = None
+        counts = self._transfer().run()
+        # the batch saved before the interruption is skipped
+        self.assertEqual(counts['transferred'], NRECORDS - 4)
+        self.assertEqual(counts['skipped'], 4)
+        self.assertEqual(counts['pages'], 3)
+        self.assertEqual(self._ntransferred(), NRECORDS)
+
+    def test_max_pages(self):
+        counts = self._transfer().run(max_pages=1)
+        self.assertEqual(counts['transferred'], 10)
+
+        counts = self._transfer().run(max_pages=1)
+        self.assertEqual(counts['transferred'], 20)
+        self.assertEqual(counts['pages'], 2)
+
+        counts = self._transfer().run()
+        self.assertEqual(counts['transferred'], NRECORDS)
+        self.assertEqual(self._ntransferred(), NRECORDS)
+
+        # nothing left to transfer
+        counts = self._transfer().run()
+        self.assertEqual(counts['pages'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+
+from pychron.core.helpers.datetime_tools import bin_datetimes
+from pychron.dvc.benchmark.references import ReferenceDatabase, REFERENCE_TYPES
+
+
+class FindReferencesTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        cls.fixture = ReferenceDatabase(root=cls.root, nanalyses=2000, nunknowns=200, hours=2).build()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fixture.db.close_session()
+        shutil.rmtree(cls.root)
+
+    def _ctimes(self):
+        return list(bin_datetimes(self.fixture.times, timedelta(hours=self.fixture.hours)))
+
+    def _binned(self, **kw):
+        db = self.fixture.db
+        with db.session_ctx():
+            return [r.id for r in db._find_references_binned(self._ctimes(), REFERENCE_TYPES, **kw)]
+
+    def _join(self, **kw):
+        db = self.fixture.db
+        with db.session_ctx() as sess:
+            return [r.id for r in db._find_references_join(sess, self._ctimes(), REFERENCE_TYPES, **kw)]
+
+    def test_same_references(self):
+        refs = self._join()
+        self.assertTrue(refs)
+        self.assertEqual(refs, self._binned())
+
+    def test_filters(self):
+        self.assertEqual(self._join(mass_spectrometers=['jan']), self._binned(mass_spectrometers=['jan']))
+        self.assertEqual(self._join(exclude_invalid=False), self._binned(exclude_invalid=False))
+
+    def test_exclude(self):
+        refs = self._join()
+        ex = ['{:032x}'.format(i - 1) for i in refs[:5]]
+        self.assertEqual(self._join(exclude_uuids=ex), refs[5:])
+
+    def test_find_references(self):
+        fixture = self.fixture
+        refs = fixture.db.find_references(fixture.times, REFERENCE_TYPES, hours=fixture.hours)
+        self.assertEqual([r.id for r in refs], self._join())
+
+    def test_repeated(self):
+        # the windows table is dropped and made again in the same session
+        db = self.fixture.db
+        with db.session_ctx() as sess:
+            a = db._find_references_join(sess, self._ctimes(), REFERENCE_TYPES)
+            b = db._find_references_join(sess, self._ctimes(), REFERENCE_TYPES)
+        self.assertEqual([r.id for r in a], [r.id for r in b])
+
+    def test_unique(self):
+        refs = self._join()
+        self.assertEqual(len(refs), len(set(refs)))
+
+if __name__ == '__main__':
+    unittest.main()
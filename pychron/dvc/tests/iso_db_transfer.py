@@ -0,0 +1,212 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from pychron.database.adapters.isotope_adapter import IsotopeAdapter
+from pychron.database.isotope_database_manager import IsotopeDatabaseManager
+from pychron.database.orms.isotope.gen import gen_LabTable, gen_MassSpectrometerTable
+from pychron.database.orms.isotope.meas import meas_AnalysisTable, meas_MeasurementTable
+from pychron.database.orms.isotope.util import Base as IsoBase
+from pychron.dvc.dvc import DVC
+from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.dvc_orm import Base as DVCBase, AnalysisTbl, IrradiationPositionTbl
+from pychron.dvc.dvc_persister import DVCPersister
+from pychron.dvc.iso_db_transfer import IsoDBTransfer, runid_key
+from pychron.git_archive.repo_manager import GitRepoManager
+
+# identifier, aliquot, step, mass spectrometer. 4359 is saved as c-01-j
+ANALYSES = [('1000', 1, None, 'jan'),
+            ('1000', 2, None, 'jan'),
+            ('1001', 1, 'A', 'jan'),
+            ('1001', 1, 'B', 'jan'),
+            ('1001', 1, 'C', 'obama'),
+            ('4359', 5, None, 'jan'),
+            ('1002', 1, None, 'obama'),
+            ('1002', 2, None, 'jan')]
+
+
+class Processor(IsotopeDatabaseManager):
+    def make_analysis(self, iv, **kw):
+        return iv.uuid
+
+
+class Repository(GitRepoManager):
+    def __init__(self, name, commits):
+        super(Repository, self).__init__()
+        self.name = name
+        self.commits = commits
+
+    def add_unstaged(self, *args, **kw):
+        pass
+
+    def commit(self, msg):
+        self.commits.append((self.name, msg))
+
+
+class IsoDBBulkExportTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+        self.src = src = IsotopeAdapter(kind='sqlite', path=os.path.join(self.root, 'isotope.sqlite'))
+        src.connect()
+        self.dest = dest = DVCDatabase(kind='sqlite', path=os.path.join(self.root, 'dvc.sqlite'))
+        dest.connect()
+
+        self._seed_source()
+        self._seed_destination()
+
+        proc = Processor(bind=False, connect=False)
+        proc.db = src
+        dvc = DVC(bind=False)
+        dvc.db = dest
+
+        self.xfer = xfer = IsoDBTransfer(processor=proc, dvc=dvc, persister=DVCPersister(bind=False))
+        xfer.quiet = True
+        xfer._add_repository = self._add_repository
+        xfer._save_analysis = self._save_analysis
+
+        self.checkpoint_path = os.path.join(self.root, 'transfer.json')
+        self.commits = []
+        self.saved = []
+        self.bad = set()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _seed_source(self):
+        t = datetime(2020, 1, 1)
+        with self.src.session_ctx(use_parent_session=False) as sess:
+            IsoBase.metadata.create_all(sess.bind)
+
+            def insert(table, rows):
+                sess.execute(table.__table__.insert(), rows)
+
+            specs = {'jan': 1, 'obama': 2}
+            labs = {}
+            for idn, aliquot, step, spec in ANALYSES:
+                labs.setdefault(idn, len(labs) + 1)
+
+            insert(gen_MassSpectrometerTable, [{'id': v, 'name': k} for k, v in specs.items()])
+            insert(gen_LabTable, [{'id': v, 'identifier': k} for k, v in labs.items()])
+            insert(meas_MeasurementTable, [{'id': i + 1, 'mass_spectrometer_id': specs[a[3]]}
+                                           for i, a in enumerate(ANALYSES)])
+            insert(meas_AnalysisTable, [{'id': i + 1, 'uuid': 'uuid{}'.format(i), 'lab_id': labs[idn],
+                                         'measurement_id': i + 1, 'aliquot': aliquot, 'step': step or '',
+                                         'analysis_timestamp': t + timedelta(hours=i)}
+                                        for i, (idn, aliquot, step, spec) in enumerate(ANALYSES)])
+            sess.commit()
+
+    def _seed_destination(self):
+        with self.dest.session_ctx(use_parent_session=False) as sess:
+            DVCBase.metadata.create_all(sess.bind)
+            for idn in ('1000', '1001', 'c-01-j', '1002'):
+                sess.add(IrradiationPositionTbl(identifier=idn))
+            sess.commit()
+
+            # 1000-01 was transferred before
+            ip = sess.query(IrradiationPositionTbl).filter(IrradiationPositionTbl.identifier == '1000').one()
+            sess.add(AnalysisTbl(irradiation_positionID=ip.id, aliquot=1, uuid='uuid0'))
+            sess.commit()
+
+    def _add_repository(self, dest, repository_identifier, creator, create_repo):
+        return Repository(repository_identifier, self.commits)
+
+    def _save_analysis(self, dest, dban, an, idn, aliquot, step, exp, monitor_mapping=None):
+        if an in self.bad:
+            raise ValueError('bad analysis {}'.format(an))
+
+        sess = dest.session
+        ip = sess.query(IrradiationPositionTbl).filter(IrradiationPositionTbl.identifier == idn).one()
+        sess.add(AnalysisTbl(irradiation_positionID=ip.id, aliquot=aliquot,
+                             increment=runid_key(idn, aliquot, step)[2] if step else None, uuid=an))
+        sess.commit()
+        self.saved.append((an, dban.uuid, exp))
+
+    def _export(self, repository_identifier='Repo', **kw):
+        kw.setdefault('page_size', 3)
+        kw.setdefault('batch_size', 2)
+        return self.xfer.bulk_export(repository_identifier, 'jross', workers=2,
+                                     checkpoint_path=self.checkpoint_path, **kw)
+
+    def test_keys_page(self):
+        src = self.src
+        rows = src.get_analysis_keys_page(limit=3)
+        self.assertEqual(rows, [(1, 'uuid0', '1000', 1, ''),
+                                (2, 'uuid1', '1000', 2, ''),
+                                (3, 'uuid2', '1001', 1, 'A')])
+
+        rows = src.get_analysis_keys_page(after=3, limit=10)
+        self.assertEqual([r[0] for r in rows], [4, 5, 6, 7, 8])
+
+        rows = src.get_analysis_keys_page(limit=10, mass_spectrometers=['obama'])
+        self.assertEqual([r[1] for r in rows], ['uuid4', 'uuid6'])
+
+        rows = src.get_analysis_keys_page(limit=10, low=datetime(2020, 1, 1, 2), high=datetime(2020, 1, 1, 4))
+        self.assertEqual([r[1] for r in rows], ['uuid2', 'uuid3', 'uuid4'])
+
+    def test_runid_keys(self):
+        self.assertEqual(self.dest.get_analysis_runid_keys(), {('1000', 1, -1)})
+        self.assertEqual(runid_key('1000', '1', None), ('1000', 1, -1))
+        self.assertEqual(runid_key('1001', 1, 'B'), ('1001', 1, 1))
+
+    def test_bulk_export(self):
+        counts = self._export()
+        self.assertEqual(counts['skipped'], 1)
+        self.assertEqual(counts['transferred'], len(ANALYSES) - 1)
+        self.assertEqual(counts['pages'], 3)
+
+        self.assertEqual([s[0] for s in self.saved], ['uuid{}'.format(i) for i in range(1, len(ANALYSES))])
+        # the source analysis is passed with the built analysis
+        self.assertTrue(all(an == uuid for an, uuid, exp in self.saved))
+
+        keys = self.dest.get_analysis_runid_keys()
+        self.assertEqual(len(keys), len(ANALYSES))
+        self.assertIn(('c-01-j', 5, -1), keys)
+        self.assertIn(('1001', 1, 2), keys)
+
+        # one commit per repository per batch
+        self.assertEqual(len(self.commits), 4)
+        self.assertEqual(self.commits[0], ('Repo', '<Database Transfer> 2 analyses 1000-02 - 1001-01A'))
+
+        # nothing left to transfer
+        counts = self._export()
+        self.assertEqual(counts['transferred'], len(ANALYSES) - 1)
+        self.assertEqual(len(self.saved), len(ANALYSES) - 1)
+
+    def test_repository_callable(self):
+        self._export(lambda dban: 'Repo{}'.format(dban.aliquot))
+        self.assertEqual(sorted({exp for an, uuid, exp in self.saved}), ['Repo1', 'Repo2', 'Repo5'])
+        self.assertEqual(sorted({name for name, msg in self.commits}), ['Repo1', 'Repo2', 'Repo5'])
+
+    def test_failed(self):
+        self.bad = {'uuid2', 'uuid6'}
+        counts = self._export()
+        self.assertEqual(counts['failed'], 2)
+        self.assertEqual(counts['transferred'], len(ANALYSES) - 3)
+
+        # the rows saved before a failure in the same batch are kept
+        keys = self.dest.get_analysis_runid_keys()
+        self.assertEqual(len(keys), len(ANALYSES) - 2)
+        self.assertNotIn(('1001', 1, 0), keys)
+
+        # a new transfer retries the failed analyses
+        self.bad = set()
+        os.remove(self.checkpoint_path)
+        counts = self._export()
+        self.assertEqual(counts['transferred'], 2)
+        self.assertEqual(len(self.dest.get_analysis_runid_keys()), len(ANALYSES))
+
+    def test_resume(self):
+        counts = self._export(max_pages=1)
+        self.assertEqual(counts['transferred'], 2)
+        self.assertEqual(counts['skipped'], 1)
+
+        counts = self._export()
+        self.assertEqual(counts['transferred'], len(ANALYSES) - 1)
+        self.assertEqual(len(self.saved), len(ANALYSES) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.dvc_orm import Base, AnalysisTbl, AnalysisChangeTbl, IrradiationTbl, LevelTbl, \
+    IrradiationPositionTbl, SampleTbl, MaterialTbl, ProjectTbl, PrincipalInvestigatorTbl, LoadTbl, \
+    MeasuredPositionTbl, RepositoryTbl, RepositoryAssociationTbl, MassSpectrometerTbl
+from pychron.envisage.browser.record_views import LabnumberRecordView
+
+NIRRADIATIONS = 2
+NLEVELS = 4
+NPOSITIONS = 25
+NSAMPLES = 20
+NANALYSES = 3
+
+
+def seed(db):
+    """
+        NIRRADIATIONS x NLEVELS x NPOSITIONS positions with NANALYSES analyses each
+    """
+    t = datetime(2020, 1, 1)
+    with db.session_ctx(use_parent_session=False) as sess:
+        Base.metadata.create_all(sess.bind)
+
+        def insert(table, rows):
+            sess.execute(table.__table__.insert(), rows)
+
+        insert(MassSpectrometerTbl, [{'name': 'jan'}])
+        insert(PrincipalInvestigatorTbl, [{'id': 1, 'last_name': 'Ross', 'first_initial': 'J'}])
+        insert(ProjectTbl, [{'id': i + 1, 'name': 'project{}'.format(i), 'principal_investigatorID': 1}
+                            for i in range(3)])
+        insert(MaterialTbl, [{'id': i + 1, 'name': m, 'grainsize': '1-2mm'}
+                             for i, m in enumerate(('sanidine', 'ash'))])
+        insert(SampleTbl, [{'id': i + 1, 'name': 'sample{}'.format(i), 'materialID': i % 2 + 1,
+                            'projectID': i % 3 + 1, 'lat': 34.1 + i,
+                            'lithology': 'tuff' if i % 2 else None} for i in range(NSAMPLES)])
+        insert(LoadTbl, [{'name': 'L1', 'holderName': '221-hole'}])
+        insert(RepositoryTbl, [{'name': 'Repo', 'principal_investigatorID': 1}])
+
+        levels, positions, ans, changes, mps, ras = [], [], [], [], [], []
+        insert(IrradiationTbl, [{'id': i + 1, 'name': 'NM-{}'.format(i)} for i in range(NIRRADIATIONS)])
+        for i in range(NIRRADIATIONS):
+            for j in range(NLEVELS):
+                lid = len(levels) + 1
+                levels.append({'id': lid, 'name': chr(65 + j), 'irradiationID': i + 1})
+                for k in range(NPOSITIONS):
+                    pid = len(positions) + 1
+                    positions.append({'id': pid, 'identifier': str(60000 + pid), 'position': k + 1,
+                                      'levelID': lid, 'sampleID': pid % NSAMPLES + 1, 'packet': 'p{}'.format(k)})
+                    for a in range(NANALYSES):
+                        aid = len(ans) + 1
+                        t += timedelta(minutes=30)
+                        ans.append({'id': aid, 'uuid': '{:032x}'.format(aid), 'timestamp': t, 'aliquot': a + 1,
+                                    'analysis_type': 'unknown', 'mass_spectrometer': 'jan',
+                                    'irradiation_positionID': pid})
+                        changes.append({'analysisID': aid, 'tag': 'ok'})
+                        mps.append({'analysisID': aid, 'position': k + 1, 'loadName': 'L1'})
+                        ras.append({'analysisID': aid, 'repository': 'Repo'})
+
+        insert(LevelTbl, levels)
+        insert(IrradiationPositionTbl, positions)
+        insert(AnalysisTbl, ans)
+        insert(AnalysisChangeTbl, changes)
+        insert(MeasuredPositionTbl, mps)
+        insert(RepositoryAssociationTbl, ras)
+        sess.commit()
+
+
+class ORMLoadingTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp()
+        cls.db = DVCDatabase(kind='sqlite', path=os.path.join(cls.root, 'orm.sqlite'))
+        cls.db.connect()
+        seed(cls.db)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root)
+
+    def setUp(self):
+        self.statements = []
+        self.engine = self.db.session_factory.kw['bind']
+        event.listen(self.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+
+    def _count(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _identifiers(self, n):
+        return [str(60000 + i + 1) for i in range(n)]
+
+    def _bind(self, n):
+        del self.statements[:]
+        ans, tc = self.db.get_labnumber_analyses(self._identifiers(n), limit=None)
+
+        # the session is closed. anything not loaded raises DetachedInstanceError
+        rows = []
+        for a in ans:
+            a.bind()
+            rows.append((a.record_id, a.irradiation_info, a.sample, a.material, a.project,
+                         a.principal_investigator, a.tag, a.repository_identifier, a.load_name, a.load_holder))
+        return rows, len(self.statements)
+
+    def test_bind_query_count(self):
+        rows, n = self._bind(5)
+        self.assertEqual(len(rows), 5 * NANALYSES)
+
+        rows, m = self._bind(100)
+        self.assertEqual(len(rows), 100 * NANALYSES)
+        self.assertEqual(n, m)
+        self.assertLessEqual(m, 4)
+
+        self.assertEqual(rows[0], ('60001-01', 'NM-0A 1', 'sample1', 'ash', 'project1', 'Ross, J', 'ok', 'Repo',
+                                   'L1', '221-hole'))
+
+    def test_bind_latency(self):
+        st = time.time()
+        rows, _ = self._bind(NIRRADIATIONS * NLEVELS * NPOSITIONS)
+        self.assertEqual(len(rows), NIRRADIATIONS * NLEVELS * NPOSITIONS * NANALYSES)
+        self.assertLess(time.time() - st, 5)
+
+    def test_labnumber_projection(self):
+        db = self.db
+        with db.session_ctx():
+            lns = db.get_labnumbers(mass_spectrometers=['jan'])
+            objs = [vars(LabnumberRecordView(li)) for li in lns]
+
+        del self.statements[:]
+        rows = db.get_labnumbers(mass_spectrometers=['jan'], projection=True)
+        self.assertEqual(len(self.statements), 2)
+        self.assertEqual([vars(LabnumberRecordView(r)) for r in rows], objs)
+
+    def test_irradiation_levels(self):
+        del self.statements[:]
+        with self.db.session_ctx() as sess:
+            irrad = sess.query(IrradiationTbl).filter(IrradiationTbl.name == 'NM-0').one()
+
+        # irradiation, levels and positions. no cartesian join
+        self.assertEqual(len(self.statements), 3)
+        self.assertEqual(len(irrad.levels), NLEVELS)
+        self.assertEqual(sum(len(l.positions) for l in irrad.levels), NLEVELS * NPOSITIONS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import os
+import unittest
+from datetime import datetime
+
+from uncertainties import nominal_value
+
+from pychron.dvc import dvc_load, analysis_path, AnalysisNotAnvailableError
+from pychron.dvc.benchmark.synthetic import SyntheticDVC, IRRADIATION, LEVEL, REPOSITORY, MASS_SPECTROMETER
+from pychron.dvc.dvc_orm import Base, AnalysisTbl, AnalysisChangeTbl, IrradiationTbl, LevelTbl, \
+    IrradiationPositionTbl, SampleTbl, RepositoryTbl, RepositoryAssociationTbl, MassSpectrometerTbl, \
+    PrincipalInvestigatorTbl
+from pychron.paths import paths
+
+
+def seed(db, records):
+    """
+        one AnalysisTbl row for each synthetic record
+    """
+    with db.session_ctx(use_parent_session=False) as sess:
+        Base.metadata.create_all(sess.bind)
+
+        def insert(table, rows):
+            sess.execute(table.__table__.insert(), rows)
+
+        insert(MassSpectrometerTbl, [{'name': MASS_SPECTROMETER}])
+        insert(PrincipalInvestigatorTbl, [{'id': 1, 'last_name': 'Ross', 'first_initial': 'J'}])
+        insert(RepositoryTbl, [{'name': REPOSITORY, 'principal_investigatorID': 1}])
+        insert(IrradiationTbl, [{'id': 1, 'name': IRRADIATION}])
+        insert(LevelTbl, [{'id': 1, 'name': LEVEL, 'irradiationID': 1}])
+
+        samples, positions, ans = {}, {}, []
+        for r in records:
+            if r.sample not in samples:
+                samples[r.sample] = len(samples) + 1
+            if r.identifier not in positions:
+                positions[r.identifier] = {'id': len(positions) + 1, 'identifier': r.identifier,
+                                           'position': r.irradiation_position, 'levelID': 1,
+                                           'sampleID': samples[r.sample]}
+
+            meta = dvc_load(analysis_path((r.uuid, r.record_id), REPOSITORY))
+            ans.append({'id': len(ans) + 1, 'uuid': r.uuid,
+                        'timestamp': datetime.strptime(meta['timestamp'], '%Y-%m-%dT%H:%M:%S'),
+                        'aliquot': meta['aliquot'], 'increment': meta['increment'],
+                        'analysis_type': 'unknown', 'mass_spectrometer': MASS_SPECTROMETER,
+                        'irradiation_positionID': positions[r.identifier]['id']})
+
+        insert(SampleTbl, [{'id': i, 'name': n} for n, i in samples.items()])
+        insert(IrradiationPositionTbl, list(positions.values()))
+        insert(AnalysisTbl, ans)
+        insert(AnalysisChangeTbl, [{'analysisID': a['id'], 'tag': 'ok'} for a in ans])
+        insert(RepositoryAssociationTbl, [{'analysisID': a['id'], 'repository': REPOSITORY} for a in ans])
+        sess.commit()
+
+
+class QuickAnalysisTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from pychron.dvc.dvc import DVC
+        from pychron.dvc.dvc_database import DVCDatabase
+        from pychron.dvc.meta_repo import MetaRepo
+
+        cls.synthetic = s = SyntheticDVC(nsamples=2, nsteps=3, ncounts=50).build()
+
+        db = DVCDatabase(kind='sqlite', path=os.path.join(s.root, 'quick.sqlite'))
+        db.connect()
+        seed(db, s.records)
+
+        cls.dvc = dvc = DVC(bind=False, db=db, meta_repo=MetaRepo(path=paths.meta_root))
+        cls.uuids = [r.uuid for r in s.records]
+        cls.full = {a.uuid: a for a in dvc.make_analyses(db.get_analyses_uuid(cls.uuids), use_progress=False)}
+
+        # store the intensities like the persister. the last analysis has none
+        with db.session_ctx():
+            for dban in db.get_analyses_uuid(cls.uuids[:-1]):
+                for iso in cls.full[dban.uuid].itervalues():
+                    db.add_analysis_result(dban, iso)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.synthetic.cleanup()
+
+    def _quick(self):
+        records = self.dvc.db.get_analyses_uuid(self.uuids)
+        return {a.uuid: a for a in self.dvc.make_quick_analyses(records, use_progress=False)}
+
+    def test_fallback(self):
+        ans = self._quick()
+        self.assertEqual(len(ans), len(self.uuids))
+        self.assertTrue(all(getattr(ans[u], 'quick', False) for u in self.uuids[:-1]))
+        self.assertFalse(getattr(ans[self.uuids[-1]], 'quick', False))
+
+    def test_intensities(self):
+        ans = self._quick()
+        for u in self.uuids[:-1]:
+            q, f = ans[u], self.full[u]
+            self.assertEqual(q.record_id, f.record_id)
+            self.assertEqual(sorted(q.isotopes), sorted(f.isotopes))
+            for k, fi in f.isotopes.items():
+                qi = q.isotopes[k]
+                self.assertEqual(qi.detector, fi.detector)
+                self.assertAlmostEqual(qi.value, fi.value)
+                self.assertAlmostEqual(qi.error, fi.error)
+                self.assertAlmostEqual(qi.baseline.value, fi.baseline.value)
+                self.assertAlmostEqual(qi.blank.value, fi.blank.value)
+                self.assertEqual(qi.fit, fi.fit)
+
+    def test_age(self):
+        ans = self._quick()
+        for u in self.uuids[:-1]:
+            q, f = ans[u], self.full[u]
+            self.assertEqual(q.irradiation_label, f.irradiation_label)
+            self.assertAlmostEqual(nominal_value(q.j), nominal_value(f.j))
+            self.assertAlmostEqual(q.age, f.age, places=6)
+
+    def test_load_full(self):
+        a = self._quick()[self.uuids[0]]
+        a.load_raw_data()
+        self.assertFalse(a.quick)
+        self.assertEqual(a.isotopes['Ar40'].xs.shape[0], self.synthetic.ncounts)
+        self.assertAlmostEqual(a.age, self.full[self.uuids[0]].age, places=6)
+
+    def test_missing_repository(self):
+        a = self._quick()[self.uuids[0]]
+        synced = []
+        a.sync_repository = synced.append
+        a.repository_identifier = 'NotCloned'
+
+        with self.assertRaises(AnalysisNotAnvailableError):
+            a.load_full()
+
+        # the repository is synced first. the analysis stays a quick analysis
+        self.assertEqual(synced, ['NotCloned'])
+        self.assertTrue(a.quick)
+        self.assertEqual(a.isotopes['Ar40'].xs.shape[0], 0)
+
+    def test_edit_after_load_full(self):
+        a = self._quick()[self.uuids[0]]
+        a.load_full()
+
+        # an edit made after the analysis was loaded is not replaced by the repository values
+        iso = a.isotopes['Ar40']
+        iso.set_uvalue((1.5, 0.1))
+        a.load_full()
+        self.assertEqual(iso.value, 1.5)
+        self.assertIs(a.isotopes['Ar40'], iso)
+
+        f = self.full[self.uuids[0]]
+        self.assertFalse(f.quick)
+        f.load_full()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.dvc_orm import Base, SampleTbl, ProjectTbl, MaterialTbl, IrradiationTbl, LevelTbl, \
+    IrradiationPositionTbl, PrincipalInvestigatorTbl
+from pychron.dvc.search_index import SearchIndex
+
+SAMPLES = ['FC-2', 'FC-3', 'fc-2b', 'Fish Canyon', 'GA1550', 'sanidine-12', 'bt-4', 'AC-2', 'TCR-2']
+
+
+def seed(db):
+    with db.session_ctx(use_parent_session=False) as sess:
+        Base.metadata.create_all(sess.bind)
+
+        def insert(table, rows):
+            sess.execute(table.__table__.insert(), rows)
+
+        insert(PrincipalInvestigatorTbl, [{'id': 1, 'last_name': 'Ross', 'first_initial': 'J'},
+                                          {'id': 2, 'last_name': 'Ferguson', 'first_initial': None}])
+        insert(ProjectTbl, [{'id': 1, 'name': 'Monitors', 'principal_investigatorID': 1},
+                            {'id': 2, 'name': 'Socorro', 'principal_investigatorID': 2}])
+        insert(MaterialTbl, [{'id': 1, 'name': 'sanidine'}, {'id': 2, 'name': 'biotite'}])
+        insert(SampleTbl, [{'id': i + 1, 'name': n, 'projectID': i % 2 + 1, 'materialID': i % 2 + 1}
+                           for i, n in enumerate(SAMPLES)])
+        insert(IrradiationTbl, [{'id': 1, 'name': 'NM-300'}, {'id': 2, 'name': 'NM-301'}])
+        insert(LevelTbl, [{'id': 1, 'name': 'A', 'irradiationID': 1}])
+        insert(IrradiationPositionTbl, [{'id': i + 1, 'identifier': str(61000 + i * 7), 'position': i + 1,
+                                         'levelID': 1, 'sampleID': i % len(SAMPLES) + 1} for i in range(300)])
+        sess.commit()
+
+
+class SearchIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.db = DVCDatabase(kind='sqlite', path=os.path.join(self.root, 'search.sqlite'))
+        self.db.connect()
+        seed(self.db)
+
+        self.index = SearchIndex(os.path.join(self.root, 'index', 'search_index.sqlite'))
+        self.index.update(self.db)
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.root)
+
+    def _like(self, table, pattern):
+        with self.db.session_ctx() as sess:
+            col = table.identifier if table is IrradiationPositionTbl else table.name
+            q = sess.query(col).filter(col.like(pattern))
+            return sorted(r[0] for r in q)
+
+    def test_same_hits(self):
+        index = self.index
+        for term in ('fc', 'FC-2', 'c-2', 'an', 'zz', 'fish c'):
+            self.assertEqual(sorted(n for _, n in index.search(term, kinds=('sample',), comp='contains')),
+                             self._like(SampleTbl, '%{}%'.format(term)), term)
+            self.assertEqual(sorted(n for _, n in index.search(term, kinds=('sample',), comp='startswith')),
+                             self._like(SampleTbl, '{}%'.format(term)), term)
+
+        for term in ('610', '7', '6100', '62', '999'):
+            self.assertEqual(sorted(n for _, n in index.search(term, kinds=('labnumber',), comp='contains')),
+                             self._like(IrradiationPositionTbl, '%{}%'.format(term)), term)
+
+        self.assertEqual(index.search('fc-2', comp='='), [('sample', 'FC-2')])
+        self.assertEqual(index.search('ferguson', kinds=('principal_investigator',), comp='='),
+                         [('principal_investigator', 'Ferguson')])
+        self.assertEqual(index.search('ross, j', comp='='), [('principal_investigator', 'Ross, J')])
+
+    def test_rank(self):
+        ret = self.index.search('fc-2')
+        self.assertEqual(ret[:2], [('sample', 'FC-2'), ('sample', 'fc-2b')])
+
+        # typos
+        self.assertEqual(self.index.search('sanadine', kinds=('material',)), [('material', 'sanidine')])
+        self.assertEqual(self.index.search('Fergusen')[0], ('principal_investigator', 'Ferguson'))
+        self.assertEqual(len(self.index.search('nm-30', limit=1)), 1)
+
+    def test_update(self):
+        self.assertEqual(self.index.update(self.db), 0)
+
+        with self.db.session_ctx() as sess:
+            s = sess.query(SampleTbl).filter(SampleTbl.name == 'bt-4').one()
+            s.name = 'biotite-4'
+            sess.query(IrradiationPositionTbl).filter(IrradiationPositionTbl.id == 1).delete()
+            sess.add(MaterialTbl(name='hornblende'))
+            sess.commit()
+
+        self.assertEqual(self.index.update(self.db), 3)
+        self.assertEqual(self.index.search('bt-4', comp='='), [])
+        self.assertEqual(self.index.search('biotite-4', comp='='), [('sample', 'biotite-4')])
+        self.assertEqual(self.index.search('61000', comp='='), [])
+        self.assertEqual(self.index.search('hornblende', comp='='), [('material', 'hornblende')])
+
+        # persistent
+        index = SearchIndex(self.index.path)
+        self.assertEqual(index.update(self.db), 0)
+        self.assertEqual(index.search('hornblende', comp='='), [('material', 'hornblende')])
+        index.close()
+
+    def test_new_positions(self):
+        self.assertEqual(self.index.last_source_id('labnumber'), 300)
+
+        with self.db.session_ctx() as sess:
+            sess.add(IrradiationPositionTbl(id=301, identifier='61009', position=301, levelID=1))
+            sess.commit()
+
+        # 61009 is in the database but not the index
+        idns = [n for _, n in self.index.search('6100', kinds=('labnumber',), comp='contains')]
+        self.assertEqual(idns, ['61000', '61007'])
+
+        after_id = self.index.last_source_id('labnumber')
+        ps = self.db.get_labnumbers_startswith('6100', filter_non_run=False, identifiers=idns, after_id=after_id)
+        self.assertEqual(sorted(p.identifier for p in ps), ['61000', '61007', '61009'])
+
+    def test_latency(self):
+        index = SearchIndex()
+        index.set_entries('sample', {i: 'sample-{:06d}'.format(i) for i in range(50000)})
+
+        for term in ('sample-0123', '012345', 'sampel-01234'):
+            st = time.time()
+            index.search(term, limit=20)
+            self.assertLess(time.time() - st, 0.25, term)
+        index.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,7 +26,7 @@ from traits.trait_types import BaseStr
 from traitsui.tabular_adapter import TabularAdapter
 
 from pychron.column_sorter_mixin import ColumnSorterMixin
-from pychron.core.fuzzyfinder import fuzzyfinder
+from pychron.core.fuzzyfinder import FuzzyIndex
 from pychron.core.progress import progress_loader
 from pychron.core.ui.table_configurer import SampleTableConfigurer
 from pychron.envisage.browser.adapters import LabnumberAdapter
@@ -36,6 +36,9 @@ from pychron.paths import paths
 from pychron.persistence_loggable import PersistenceLoggable
 from pychron.pychron_constants import DVC_PROTOCOL
 
+# identifier searches with more index hits than this use LIKE
+MAX_INDEX_IDENTIFIERS = 500
+
 
 class IdentifierStr(BaseStr):
     def validate(self, obj, name, value):
@@ -198,6 +201,7 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
 
     _suppress_post_update = False
     _suppress_load_labnumbers = False
+    _sample_index = None
 
     def reattach(self):
         pass
@@ -639,7 +643,19 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
         if self.mass_spectrometers_enabled:
             ms = self.mass_spectrometer_includes
 
-        return db.get_labnumbers_startswith(new, mass_spectrometers=ms)
+        idns, after_id = None, None
+        index = db.get_search_index()
+        if index:
+            idns = [n for _, n in index.search(new, kinds=('labnumber',), comp='contains',
+                                               limit=MAX_INDEX_IDENTIFIERS + 1)]
+            # LIKE is as fast as a long IN (...) list
+            if not idns or len(idns) > MAX_INDEX_IDENTIFIERS:
+                idns = None
+            else:
+                # the index may be behind the database
+                after_id = index.last_source_id('labnumber')
+
+        return db.get_labnumbers_startswith(new, mass_spectrometers=ms, identifiers=idns, after_id=after_id)
 
     def _identifier_change_hook(self, db, new, lns):
         pass
@@ -710,11 +726,20 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
         # names = [ni.name for ni in self.selected_projects]
         self._load_associated_labnumbers()
 
+    def _osamples_changed(self):
+        self._sample_index = None
+
+    def _osamples_items_changed(self):
+        self._sample_index = None
+
     def _sample_filter_changed(self, new):
         name = self._get_sample_filter_parameter()
         comp = self.sample_filter_comparator
         if comp == 'fuzzy':
-            self.samples = fuzzyfinder(new, self.osamples, name)
+            index = self._sample_index
+            if index is None or index.attr != name:
+                index = self._sample_index = FuzzyIndex(self.osamples, name)
+            self.samples = index.find(new)
         else:
             func = filter_func(new, name, comp)
             self.samples = [s for s in self.osamples if func(s)]
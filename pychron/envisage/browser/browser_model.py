@@ -95,6 +95,11 @@ class BrowserModel(BaseBrowserModel):
             if self.auto_load_database:
                 self.load_selectors()
 
+            try:
+                db.get_search_index(update=True)
+            except BaseException as e:
+                self.warning('failed updating search index. {}'.format(e))
+
             if self.load_selection_enabled:
                 self.load_browser_selection()
 
@@ -334,7 +339,8 @@ class BrowserModel(BaseBrowserModel):
                                      high_post=hp,
                                      low_post=lp,
                                      loads=ls,
-                                     filter_non_run=self.filter_non_run_samples)
+                                     filter_non_run=self.filter_non_run_samples,
+                                     projection=True)
         return lns
 
     def _identifier_change_hook(self, db, new, lns):
@@ -137,6 +137,10 @@ class LabnumberRecordView(RecordView):
     packet = ''
 
     def _create(self, dbrecord):
+        if hasattr(dbrecord, '_fields'):
+            self._create_from_row(dbrecord)
+            return
+
         self.labnumber = dbrecord.identifier or ''
 
         pos = dbrecord
@@ -185,6 +189,29 @@ class LabnumberRecordView(RecordView):
                 # for i in range(100):
                 #     time.sleep(0.001)
 
+    def _create_from_row(self, row):
+        """
+            row from ``DVCDatabase.get_labnumbers(projection=True)``
+        """
+        self.labnumber = row.identifier or ''
+        self.irradiation_pos = str(row.position)
+        self.packet = str(row.packet)
+        if row.level is not None:
+            self.irradiation_level = row.level
+        if row.irradiation is not None:
+            self.irradiation = row.irradiation
+
+        if row.material:
+            self.material = row.material
+        if row.project:
+            self.project = row.project
+
+        for attr, col in (('name', 'sample'), ('lat', 'lat'), ('elevation', 'elevation'),
+                          ('lithology', 'lithology'), ('location', 'location'), ('igsn', 'igsn')):
+            v = getattr(row, col)
+            if v is not None:
+                setattr(self, attr, v)
+
     # def _get_identifier(self):
     #     return self.labnumber
 
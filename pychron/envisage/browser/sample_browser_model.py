@@ -309,7 +309,8 @@ class SampleBrowserModel(BrowserModel):
                                         analysis_types=v.analysis_types,
                                         high_post=now,
                                         low_post=lp,
-                                        filter_non_run=self.filter_non_run_samples)
+                                        filter_non_run=self.filter_non_run_samples,
+                                        projection=True)
             if ls:
                 sams = self._load_sample_record_views(ls)
 
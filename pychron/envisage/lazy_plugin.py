@@ -0,0 +1,351 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    register a plugin's contributions from its manifest entry and import the plugin on first use.
+
+    ``describe_plugin`` records the tasks, task extensions, actions, preferences, preferences panes and service
+    offers of a started plugin. ``LazyPlugin`` contributes the same items with placeholder factories. the first
+    time a factory is called, or an attribute of a contributed class is needed, the real plugin is imported,
+    attached to the application and the matching item of the real plugin is used.
+
+    the menus, groups and actions made by schema additions are described too. building a menu or tool bar uses
+    placeholders made from that description and only performing a placeholder action imports the plugin
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import importlib
+import inspect
+from threading import RLock
+
+from envisage.extension_point import ExtensionPoint
+from envisage.plugin import Plugin
+from envisage.service_offer import ServiceOffer
+from envisage.ui.tasks.task_extension import TaskExtension
+from envisage.ui.tasks.task_factory import TaskFactory
+from pyface.action.api import Action, ActionItem, Group, MenuManager
+from pyface.image_resource import ImageResource
+from pyface.tasks.action.schema import SMenu, SGroup, SToolBar
+from pyface.tasks.action.schema_addition import SchemaAddition
+from pyface.tasks.action.task_action import TaskAction
+from traits.api import Dict, Any, List
+
+# ============= local library imports  ==========================
+from pychron.envisage.plugin_manifest import encode_value, decode_value, TUPLE_TAG
+from pychron.envisage.startup_profiler import startup_profiler
+from pychron.envisage.tasks.base_plugin import BasePlugin
+
+TASK_FACTORY_ATTRS = ('id', 'name', 'accelerator', 'image', 'include_view_menu', 'task_group')
+SCHEMA_ADDITION_ATTRS = ('id', 'path', 'before', 'after', 'absolute_position')
+# class attributes of actions used by the task extensions editor
+FACTORY_META_ATTRS = ('dname', 'ddescription', 'name', 'id')
+ACTION_ATTRS = ('id', 'name', 'description', 'tooltip', 'accelerator', 'style', 'checked', 'enabled', 'visible')
+MENU_ATTRS = ('id', 'name', 'separator')
+GROUP_ATTRS = ('id', 'separator')
+TOOLBAR_ATTRS = ('id', 'name', 'image_size', 'orientation', 'show_divider', 'show_tool_names')
+
+
+class NotLazy(Exception):
+    pass
+
+
+def protocol_name(protocol):
+    if isinstance(protocol, str):
+        return protocol
+    return '{}.{}'.format(protocol.__module__, protocol.__name__)
+
+
+def describe_plugin(plugin):
+    """
+        return a manifest entry for ``plugin`` or raise NotLazy if the plugin has to be imported at startup.
+
+        a plugin that starts or stops anything, checks its dependencies, manages hardware or has startup tests
+        is not lazy
+    """
+    klass = type(plugin)
+    if klass.start is not Plugin.start or klass.stop is not Plugin.stop:
+        raise NotLazy('{} overrides start/stop'.format(klass.__name__))
+
+    if klass.check is not BasePlugin.check:
+        raise NotLazy('{} checks its dependencies'.format(klass.__name__))
+
+    if any(name.startswith('test_') for name, _ in inspect.getmembers(klass, inspect.isfunction)):
+        raise NotLazy('{} has startup tests'.format(klass.__name__))
+
+    contributions = {}
+    for tname in plugin.trait_names(contributes_to=lambda x: x is not None):
+        eid = plugin.trait(tname).contributes_to
+        items = getattr(plugin, tname)
+        if not items:
+            continue
+
+        if eid == 'pychron.hardware.managers':
+            raise NotLazy('{} manages hardware'.format(klass.__name__))
+
+        encoded = [_encode(item, [tname, i]) for i, item in enumerate(items)]
+        contributions.setdefault(eid, []).extend(encoded)
+
+    return {'id': plugin.id,
+            'name': plugin.name,
+            'klass': klass.__name__,
+            'extension_points': [ep.id for ep in plugin.get_extension_points()],
+            'contributions': contributions}
+
+
+def _encode(item, path):
+    def hook(v, p=path):
+        if isinstance(v, TaskFactory):
+            attrs = {a: encode_value(getattr(v, a, None)) for a in TASK_FACTORY_ATTRS
+                     if getattr(v, a, None) is not None}
+            return {'kind': 'task_factory', 'path': p, 'attrs': attrs}
+        elif isinstance(v, TaskExtension):
+            return {'kind': 'task_extension', 'path': p,
+                    'task_id': v.task_id,
+                    'actions': [_encode(a, p + ['actions', i]) for i, a in enumerate(v.actions)],
+                    'ndock_panes': len(v.dock_pane_factories)}
+        elif isinstance(v, SchemaAddition):
+            attrs = {a: encode_value(getattr(v, a)) for a in SCHEMA_ADDITION_ATTRS}
+            return {'kind': 'schema_addition', 'path': p, 'attrs': attrs,
+                    'factory': _factory_meta(v.factory),
+                    'placeholder': describe_schema(v.factory())}
+        elif isinstance(v, ServiceOffer):
+            return {'kind': 'service_offer', 'path': p,
+                    'protocol': protocol_name(v.protocol),
+                    'properties': encode_value(v.properties)}
+        elif callable(v):
+            return {'kind': 'factory', 'path': p, 'meta': _factory_meta(v)}
+
+        raise NotLazy('cannot describe {}'.format(v))
+
+    if isinstance(item, (tuple, list)):
+        # e.g. available task extensions (id, task_id, name, [SchemaAddition,...])
+        seq = [_encode(vi, path + [i]) for i, vi in enumerate(item)]
+        return {TUPLE_TAG: seq} if isinstance(item, tuple) else seq
+
+    try:
+        return encode_value(item, hook)
+    except ValueError as e:
+        raise NotLazy(str(e))
+
+
+def _factory_meta(factory):
+    meta = {}
+    for a in FACTORY_META_ATTRS:
+        v = getattr(factory, a, None)
+        if isinstance(v, str):
+            meta[a] = v
+    return meta
+
+
+def describe_schema(item, index=None):
+    """
+        describe the action, menu, group or tool bar made by a schema addition's factory. raise NotLazy if a
+        placeholder cannot be made for it, e.g. a custom Group or a widget action
+    """
+    if index is None:
+        index = []
+
+    klass = type(item)
+    if isinstance(item, Action):
+        if item.style == 'widget':
+            raise NotLazy('{} is a widget action'.format(klass.__name__))
+
+        attrs = {a: getattr(item, a) for a in ACTION_ATTRS}
+        image = item.image
+        if image is not None:
+            if not isinstance(image, ImageResource) or not all(isinstance(si, str) for si in image.search_path):
+                raise NotLazy('cannot describe the image of {}'.format(klass.__name__))
+            attrs['image'] = {'name': image.name, 'search_path': list(image.search_path)}
+
+        return {'type': 'action', 'attrs': attrs, 'index': index}
+
+    if klass is SMenu and getattr(item, 'action', None) is None:
+        kind, names = 'menu', MENU_ATTRS
+    elif klass in (SGroup, Group):
+        kind, names = 'group', GROUP_ATTRS
+    elif klass is MenuManager:
+        kind, names = 'menu', ('id', 'name')
+    elif klass is SToolBar:
+        kind, names = 'toolbar', TOOLBAR_ATTRS
+    else:
+        raise NotLazy('cannot describe {}'.format(klass.__name__))
+
+    return {'type': kind,
+            'attrs': {a: encode_value(getattr(item, a)) for a in names},
+            'items': [describe_schema(c, index + [i]) for i, c in enumerate(_schema_children(item))]}
+
+
+def _schema_children(item):
+    if isinstance(item, (Group, MenuManager)):
+        return [c.action if isinstance(c, ActionItem) else c for c in item.items]
+    return item.items
+
+
+def make_placeholder(plugin, path, desc):
+    """
+        return the menu, group, tool bar or action described by ``describe_schema``. the actions are
+        ``LazyAction``s for the item of the factory at ``path`` of ``plugin``
+    """
+    kind = desc['type']
+    if kind == 'action':
+        attrs = dict(desc['attrs'])
+        image = attrs.pop('image', None)
+        if image:
+            attrs['image'] = ImageResource(name=image['name'], search_path=image['search_path'])
+        return LazyAction(lazy_plugin=plugin, factory_path=path, index=desc['index'], **attrs)
+
+    klass = {'menu': SMenu, 'group': SGroup, 'toolbar': SToolBar}[kind]
+    items = [make_placeholder(plugin, path, c) for c in desc['items']]
+    attrs = {k: decode_value(a) for k, a in desc['attrs'].items()}
+    return klass(*items, **attrs)
+
+
+class LazyAction(TaskAction):
+    """
+        placeholder for an action of a lazy plugin. performing it imports the plugin and performs the real action
+    """
+    lazy_plugin = Any
+    factory_path = List
+    index = List
+
+    _action = Any
+
+    def perform(self, event):
+        action = self._get_action()
+        if self.style in ('toggle', 'radio'):
+            action.checked = self.checked
+        if isinstance(action, TaskAction):
+            action.task = self.task
+        action.perform(event)
+
+    def destroy(self):
+        if self._action is not None:
+            self._action.destroy()
+        super(LazyAction, self).destroy()
+
+    def _get_action(self):
+        if self._action is None:
+            obj = self.lazy_plugin.resolve(self.factory_path)()
+            for i in self.index:
+                obj = _schema_children(obj)[i]
+            self._action = obj
+        return self._action
+
+
+class LazyFactory(object):
+    """
+        stands in for a factory of the real plugin. calling it or reading an attribute it was not described
+        with imports the real plugin. a factory with a ``placeholder`` description returns placeholders until
+        the plugin is imported
+    """
+
+    def __init__(self, plugin, path, meta=None, placeholder=None):
+        self._plugin = plugin
+        self._path = path
+        self._placeholder = placeholder
+        if meta:
+            self.__dict__.update(meta)
+
+    def resolve(self):
+        return self._plugin.resolve(self._path)
+
+    def __call__(self, *args, **kw):
+        if self._placeholder is not None and self._plugin.plugin is None and not args and not kw:
+            return make_placeholder(self._plugin, self._path, self._placeholder)
+        return self.resolve()(*args, **kw)
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+
+class LazyPlugin(BasePlugin):
+    """
+        proxy for a plugin described in the plugin manifest
+    """
+    entry = Dict
+    plugin = Any
+
+    _lock = Any
+    _extensions = Dict
+
+    def __init__(self, entry, *args, **kw):
+        super().__init__(entry=entry, id=entry['id'], name=entry['name'], *args, **kw)
+        self._lock = RLock()
+
+    def get_extension_points(self):
+        # declared here so other plugins can contribute to them before the real plugin is imported
+        return [ExtensionPoint(List, id=eid) for eid in self.entry.get('extension_points', [])]
+
+    def get_extensions(self, extension_point_id):
+        exts = self._extensions.get(extension_point_id)
+        if exts is None:
+            items = self.entry['contributions'].get(extension_point_id, [])
+            exts = decode_value(items, self._decode)
+            self._extensions[extension_point_id] = exts
+        return exts
+
+    def activate(self):
+        """
+            import the real plugin and attach it to the application
+        """
+        with self._lock:
+            if self.plugin is None:
+                package, klass = self.entry['package'], self.entry['klass']
+                self.debug('activating {}'.format(klass))
+                with startup_profiler.section(klass, 'activate'):
+                    mod = importlib.import_module(package)
+                    plugin = getattr(mod, klass)()
+                    plugin.application = self.application
+                    plugin.activator.start_plugin(plugin)
+                self.plugin = plugin
+
+        return self.plugin
+
+    def resolve(self, path):
+        obj = self.activate()
+        for p in path:
+            obj = obj[p] if isinstance(p, int) else getattr(obj, p)
+        return obj
+
+    def stop(self):
+        if self.plugin is not None:
+            self.plugin.activator.stop_plugin(self.plugin)
+
+    # private
+    def _decode(self, v):
+        kind, path = v['kind'], v['path']
+        if kind == 'task_factory':
+            attrs = {k: decode_value(a) for k, a in v['attrs'].items()}
+            return TaskFactory(factory=LazyFactory(self, path + ['factory']), **attrs)
+        elif kind == 'task_extension':
+            dps = [LazyFactory(self, path + ['dock_pane_factories', i]) for i in range(v['ndock_panes'])]
+            return TaskExtension(task_id=v['task_id'],
+                                 actions=[self._decode(a) for a in v['actions']],
+                                 dock_pane_factories=dps)
+        elif kind == 'schema_addition':
+            attrs = {k: decode_value(a) for k, a in v['attrs'].items()}
+            factory = LazyFactory(self, path + ['factory'], v['factory'], v.get('placeholder'))
+            return SchemaAddition(factory=factory, **attrs)
+        elif kind == 'service_offer':
+            return ServiceOffer(protocol=v['protocol'],
+                                factory=LazyFactory(self, path + ['factory']),
+                                properties=decode_value(v['properties']))
+        elif kind == 'factory':
+            return LazyFactory(self, path, v['meta'])
+
+# ============= EOF =============================================
@@ -0,0 +1,151 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import json
+import os
+
+# ============= local library imports  ==========================
+
+MANIFEST_VERSION = 2
+TUPLE_TAG = '__tuple__'
+
+PYCHRON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def module_path(package):
+    """
+        path of the source file of ``package`` without importing it
+    """
+    root = os.path.dirname(PYCHRON_ROOT)
+    p = os.path.join(root, *package.split('.'))
+    if os.path.isdir(p):
+        return os.path.join(p, '__init__.py')
+    return '{}.py'.format(p)
+
+
+def fingerprint(package, extra=None):
+    """
+        modification times of the python files next to the module of ``package`` and of the ``extra`` files.
+        a plugin's contributions are usually assembled from the modules in its own directory
+    """
+    root = os.path.dirname(module_path(package))
+    fs = []
+    if os.path.isdir(root):
+        fs = [os.path.join(root, f) for f in sorted(os.listdir(root)) if f.endswith('.py')]
+
+    if extra:
+        fs.extend(extra)
+
+    return {f: os.path.getmtime(f) if os.path.isfile(f) else None for f in fs}
+
+
+def encode_value(v, hook=None):
+    """
+        convert ``v`` to a json compatible value. tuples are tagged so ``decode_value`` restores them.
+        values that are not json types are passed to ``hook``. raise ValueError if they cannot be encoded
+    """
+    if v is None or isinstance(v, (bool, int, float, str)):
+        return v
+    elif isinstance(v, tuple):
+        return {TUPLE_TAG: [encode_value(vi, hook) for vi in v]}
+    elif isinstance(v, list):
+        return [encode_value(vi, hook) for vi in v]
+    elif isinstance(v, dict) and all(isinstance(k, str) for k in v):
+        return {k: encode_value(vi, hook) for k, vi in v.items()}
+    elif hook is not None:
+        return hook(v)
+
+    raise ValueError('cannot encode {}'.format(v))
+
+
+def decode_value(v, hook=None):
+    if isinstance(v, list):
+        return [decode_value(vi, hook) for vi in v]
+    elif isinstance(v, dict):
+        if TUPLE_TAG in v:
+            return tuple(decode_value(vi, hook) for vi in v[TUPLE_TAG])
+        elif hook is not None and 'kind' in v:
+            return hook(v)
+        return {k: decode_value(vi, hook) for k, vi in v.items()}
+    return v
+
+
+class PluginManifest(object):
+    """
+        lightweight description of plugins keyed by plugin class name.
+
+        an entry records the plugin's package, id, name and its contributions so the plugin can be registered
+        without importing it. an entry is only used while the source files it was made from are unchanged
+    """
+
+    def __init__(self, path, extra=None):
+        self.path = path
+        self.extra = extra or []
+        self.entries = {}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        self.entries = {}
+        if self.path and os.path.isfile(self.path):
+            try:
+                with open(self.path, 'r') as rfile:
+                    obj = json.load(rfile)
+            except (ValueError, OSError):
+                return
+
+            if obj.get('version') == MANIFEST_VERSION:
+                self.entries = obj.get('plugins', {})
+
+    def get(self, name):
+        """
+            return the entry for ``name`` if it is still valid
+        """
+        entry = self.entries.get(name)
+        if entry and entry.get('fingerprint') == self._fingerprint(entry['package']):
+            return entry
+
+    def set(self, name, package, entry):
+        entry = dict(entry, package=package, fingerprint=self._fingerprint(package))
+        self.entries[name] = entry
+        self._dirty = True
+        return entry
+
+    def remove(self, name):
+        if self.entries.pop(name, None) is not None:
+            self._dirty = True
+
+    def dump(self):
+        if not self._dirty or not self.path:
+            return
+
+        root = os.path.dirname(self.path)
+        if root and not os.path.isdir(root):
+            os.makedirs(root)
+
+        tmp = '{}.tmp'.format(self.path)
+        with open(tmp, 'w') as wfile:
+            json.dump({'version': MANIFEST_VERSION, 'plugins': self.entries}, wfile, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def _fingerprint(self, package):
+        # json keys are strings. normalize so a loaded fingerprint compares equal
+        return json.loads(json.dumps(fingerprint(package, self.extra)))
+
+# ============= EOF =============================================
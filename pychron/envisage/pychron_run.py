@@ -15,17 +15,23 @@
 # ===============================================================================
 # ============= enthought library imports =======================
 import logging
+from contextlib import ExitStack
 from operator import attrgetter
 
 from envisage.core_plugin import CorePlugin
+from envisage.plugin_activator import PluginActivator
 from pyface.message_dialog import warning
 
 from pychron.core.displays.gdisplays import gTraceDisplay
 from pychron.envisage.initialization.initialization_parser import InitializationParser
 from pychron.envisage.key_bindings import update_key_bindings
+from pychron.envisage.plugin_manifest import PluginManifest
+from pychron.envisage.startup_profiler import startup_profiler
 from pychron.envisage.tasks.base_plugin import BasePlugin
 from pychron.envisage.tasks.tasks_plugin import PychronTasksPlugin, myTasksPlugin
+from pychron.globals import globalv
 from pychron.logger.tasks.logger_plugin import LoggerPlugin
+from pychron.paths import paths
 from pychron.user.tasks.plugin import UsersPlugin
 
 logger = logging.getLogger()
@@ -107,6 +113,22 @@ PACKAGE_DICT = dict(
 )
 
 
+class TimingActivator(PluginActivator):
+    """
+        record the time each plugin takes to start
+    """
+
+    def start_plugin(self, plugin):
+        with startup_profiler.section(plugin.name, 'start'):
+            super(TimingActivator, self).start_plugin(plugin)
+
+
+def profile(name, stage):
+    if globalv.profile_startup:
+        return startup_profiler.section(name, stage)
+    return ExitStack()
+
+
 def get_module_name(klass):
     words = []
     wcnt = 0
@@ -147,20 +169,33 @@ def get_klass(package, name):
     return klass
 
 
-def get_plugin(pname):
+def get_plugin(pname, manifest=None):
+    """
+        if ``manifest`` has a valid entry for the plugin return a LazyPlugin. the plugin is imported when it is
+        first used
+    """
     klass = None
     if not pname.endswith('Plugin'):
         pname = '{}Plugin'.format(pname)
 
     if pname in PACKAGE_DICT:
         package = PACKAGE_DICT[pname]
-        klass = get_klass(package, pname)
+        if manifest is not None:
+            entry = manifest.get(pname)
+            if entry:
+                from pychron.envisage.lazy_plugin import LazyPlugin
+
+                return LazyPlugin(entry)
+
+        with profile(pname, 'import'):
+            klass = get_klass(package, pname)
     else:
         logger.warning('****** {} not a valid plugin name******'.format(pname),
                        extra={'threadName_': 'Launcher'})
 
     if klass is not None:
-        plugin = klass()
+        with profile(pname, 'create'):
+            plugin = klass()
         if isinstance(plugin, BasePlugin):
             check = plugin.check()
             if check is True:
@@ -175,7 +210,7 @@ def get_plugin(pname):
                            extra={'threadName_': 'Launcher'})
 
 
-def get_user_plugins():
+def get_user_plugins(manifest=None):
     """
     """
 
@@ -191,15 +226,15 @@ def get_user_plugins():
             plugint = ip.get_plugin(p, category='hardware')
             mode = ip.get_parameter(plugint, 'mode')
             if mode == 'client':
-                plugin = get_plugin('CoreClientLaserPlugin')
+                plugin = get_plugin('CoreClientLaserPlugin', manifest)
             else:
-                plugin = get_plugin('CoreLaserPlugin')
+                plugin = get_plugin('CoreLaserPlugin', manifest)
 
             if plugin and not core_added:
                 core_added = True
                 plugins.append(plugin)
 
-        plugin = get_plugin(p)
+        plugin = get_plugin(p, manifest)
         if plugin:
             plugins.append(plugin)
 
@@ -220,16 +255,66 @@ def app_factory(klass):
                UsersPlugin()]
 
     plugins += get_hardware_plugins()
-    plugins += get_user_plugins()
+
+    manifest = None
+    if globalv.lazy_plugins:
+        manifest = PluginManifest(paths.plugin_manifest, extra=[paths.task_extensions_file])
+
+    user_plugins = get_user_plugins(manifest)
+    plugins += user_plugins
+
+    if globalv.profile_startup:
+        for p in plugins:
+            p.activator = TimingActivator()
 
     app = klass(plugins=plugins)
 
     # set key bindings
     update_key_bindings(pychron_plugin.actions)
 
+    if manifest is not None or globalv.profile_startup:
+        def started():
+            if manifest is not None:
+                update_manifest(manifest, user_plugins)
+            if globalv.profile_startup:
+                startup_profiler.dump(paths.startup_profile)
+                logger.debug('startup profile written to {}'.format(paths.startup_profile))
+
+        app.on_trait_change(started, 'started')
+
     return app
 
 
+def update_manifest(manifest, plugins):
+    """
+        describe the plugins that were imported at startup so they can be lazy the next time
+    """
+    from pychron.envisage.lazy_plugin import LazyPlugin, NotLazy, describe_plugin
+
+    for plugin in plugins:
+        if isinstance(plugin, LazyPlugin):
+            continue
+
+        pname = type(plugin).__name__
+        package = PACKAGE_DICT.get(pname)
+        if package is None:
+            continue
+
+        try:
+            manifest.set(pname, package, describe_plugin(plugin))
+        except NotLazy as e:
+            logger.debug('{} is not lazy. {}'.format(pname, e))
+            manifest.remove(pname)
+        except BaseException as e:
+            logger.warning('failed describing {}. {}'.format(pname, e))
+            manifest.remove(pname)
+
+    try:
+        manifest.dump()
+    except OSError as e:
+        logger.warning('failed writing plugin manifest. {}'.format(e))
+
+
 def launch(klass):
     """
     """
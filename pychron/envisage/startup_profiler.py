@@ -0,0 +1,254 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    record where the application spends its time while starting.
+
+    module imports are timed by a meta path finder that wraps the ``exec_module`` of each loader. the time of a
+    module includes the modules it imports (cumulative) and excludes them (self) like ``python -X importtime``.
+
+    plugin stages (import, create, start, activate) are timed with ``section``. the modules imported during a
+    section are attributed to it so the report shows which plugin pulled in which heavy dependency
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+# ============= local library imports  ==========================
+
+
+class ModuleRecord(object):
+    __slots__ = ('name', 'cumulative', 'self_time', 'section', 'top')
+
+    def __init__(self, name, cumulative, self_time, section, top):
+        self.name = name
+        self.cumulative = cumulative
+        self.self_time = self_time
+        self.section = section
+        self.top = top
+
+
+class SectionRecord(object):
+    __slots__ = ('name', 'stage', 'duration', 'nmodules', 'import_time')
+
+    def __init__(self, name, stage, duration, nmodules, import_time):
+        self.name = name
+        self.stage = stage
+        self.duration = duration
+        self.nmodules = nmodules
+        self.import_time = import_time
+
+
+class _TimingFinder(object):
+    """
+        meta path finder that finds nothing itself. it asks the other finders for the spec and wraps the loader
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        # the other finders may import modules themselves
+        if getattr(self._local, 'busy', False):
+            return
+
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    self.profiler.wrap_loader(spec)
+                    return spec
+        finally:
+            self._local.busy = False
+
+
+class StartupProfiler(object):
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.modules = []
+        self.sections = []
+        self.installed = False
+
+        self._t0 = None
+        self._finder = None
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._section_stack = []
+
+    def install(self):
+        """
+            start timing module imports
+        """
+        with self._lock:
+            if not self.installed:
+                self._t0 = self.clock()
+                self._finder = _TimingFinder(self)
+                sys.meta_path.insert(0, self._finder)
+                self.installed = True
+
+    def uninstall(self):
+        with self._lock:
+            if self.installed:
+                try:
+                    sys.meta_path.remove(self._finder)
+                except ValueError:
+                    pass
+                self._finder = None
+                self.installed = False
+
+    @property
+    def elapsed(self):
+        if self._t0 is not None:
+            return self.clock() - self._t0
+        return 0
+
+    @contextmanager
+    def section(self, name, stage):
+        """
+            time a stage of a plugin e.g. import, create or start
+        """
+        with self._lock:
+            n = len(self.modules)
+            self._section_stack.append(name)
+
+        st = self.clock()
+        try:
+            yield
+        finally:
+            dur = self.clock() - st
+            with self._lock:
+                self._section_stack.pop()
+                ms = self.modules[n:]
+                # the cumulative time of the top level modules includes the nested imports
+                it = sum(m.cumulative for m in ms if m.top)
+                self.sections.append(SectionRecord(name, stage, dur, len(ms), it))
+
+    def wrap_loader(self, spec):
+        loader = spec.loader
+        # builtin and frozen importers are classes shared by all modules
+        if loader is None or isinstance(loader, type) or not hasattr(loader, 'exec_module'):
+            return
+
+        exec_module = loader.exec_module
+        name = spec.name
+
+        def timed_exec_module(module):
+            self._enter(name)
+            try:
+                return exec_module(module)
+            finally:
+                self._exit(name)
+                try:
+                    del loader.exec_module
+                except AttributeError:
+                    pass
+
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            pass
+
+    def module_times(self, section=None):
+        """
+            return {module name: (cumulative, self)} of the modules imported during ``section`` or all modules
+        """
+        return {m.name: (m.cumulative, m.self_time) for m in self.modules
+                if section is None or m.section == section}
+
+    def plugin_times(self):
+        """
+            return {plugin name: {stage: duration}}
+        """
+        ps = {}
+        for s in self.sections:
+            d = ps.setdefault(s.name, {})
+            d[s.stage] = d.get(s.stage, 0) + s.duration
+        return ps
+
+    def report(self, nmodules=40):
+        lines = ['Startup profile. elapsed={:0.3f}s'.format(self.elapsed), '']
+
+        stages = ('import', 'create', 'start', 'activate')
+        ps = self.plugin_times()
+        if ps:
+            lines.append('{:<35s}{:>10s}{:>10s}{:>10s}{:>10s}{:>10s}'.format('Plugin', *(stages + ('total',))))
+            rows = sorted(ps.items(), key=lambda x: sum(x[1].values()), reverse=True)
+            for name, d in rows:
+                ts = [d.get(s, 0) for s in stages]
+                lines.append('{:<35s}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}'.format(name, *(ts + [sum(ts)])))
+            lines.append('')
+
+        if self.modules:
+            lines.append('Slowest modules (self time)')
+            lines.append('{:>10s}{:>10s}  {:<25s}{}'.format('self', 'cumulative', 'section', 'module'))
+            ms = sorted(self.modules, key=lambda m: m.self_time, reverse=True)
+            for m in ms[:nmodules]:
+                lines.append('{:>10.4f}{:>10.4f}  {:<25s}{}'.format(m.self_time, m.cumulative,
+                                                                    m.section or '', m.name))
+            lines.append('')
+            lines.append('modules imported={} total={:0.3f}s'.format(len(self.modules),
+                                                                   sum(m.self_time for m in self.modules)))
+
+        return '\n'.join(lines)
+
+    def dump(self, path):
+        root = os.path.dirname(path)
+        if root and not os.path.isdir(root):
+            os.makedirs(root)
+
+        with open(path, 'w') as wfile:
+            wfile.write(self.report())
+
+    # private
+    def _get_stack(self):
+        # each thread imports independently
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name):
+        self._get_stack().append([name, self.clock(), 0])
+
+    def _exit(self, name):
+        now = self.clock()
+        stack = self._get_stack()
+        if not stack:
+            return
+
+        _, st, children = stack.pop()
+        cumulative = now - st
+        if stack:
+            stack[-1][2] += cumulative
+
+        with self._lock:
+            section = self._section_stack[-1] if self._section_stack else None
+            self.modules.append(ModuleRecord(name, cumulative, cumulative - children, section, not stack))
+
+
+startup_profiler = StartupProfiler()
+
+# ============= EOF =============================================
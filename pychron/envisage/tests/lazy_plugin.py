@@ -0,0 +1,93 @@
+import unittest
+
+from pyface.action.api import Group
+from pyface.tasks.action.schema import SMenu, SGroup
+from pyface.tasks.action.schema_addition import SchemaAddition
+from pyface.tasks.action.task_action import TaskAction
+
+from pychron.envisage.lazy_plugin import LazyAction, LazyFactory, NotLazy, describe_schema
+from pychron.envisage.plugin_manifest import encode_value, decode_value
+
+PERFORMED = []
+
+
+class OpenAction(TaskAction):
+    name = 'Open'
+    id = 'pychron.open'
+    accelerator = 'Ctrl+O'
+
+    def perform(self, event):
+        PERFORMED.append(self.id)
+
+
+class SaveAction(TaskAction):
+    name = 'Save'
+    id = 'pychron.save'
+
+    def perform(self, event):
+        PERFORMED.append(self.id)
+
+
+class CustomGroup(Group):
+    pass
+
+
+def file_menu():
+    return SMenu(SGroup(OpenAction(), SaveAction(), id='file.group'), id='file.menu', name='File')
+
+
+class MockPlugin(object):
+    """
+        stands in for a LazyPlugin. ``resolve`` counts how often the real plugin would be imported
+    """
+    plugin = None
+
+    def __init__(self, factories):
+        self.factories = factories
+        self.nresolved = 0
+
+    def resolve(self, path):
+        self.nresolved += 1
+        return self.factories[path[-2]]
+
+
+class LazyActionTestCase(unittest.TestCase):
+    def setUp(self):
+        del PERFORMED[:]
+
+    def _factory(self, addition):
+        desc = decode_value(encode_value(describe_schema(addition.factory())))
+        plugin = MockPlugin({'open': addition.factory, 'file': addition.factory})
+        return plugin, LazyFactory(plugin, ['additions', addition.id, 'factory'], placeholder=desc)
+
+    def test_action(self):
+        plugin, factory = self._factory(SchemaAddition(id='open', factory=OpenAction, path='MenuBar/file.menu'))
+        action = factory()
+        self.assertIsInstance(action, LazyAction)
+        self.assertEqual((action.id, action.name, action.accelerator), ('pychron.open', 'Open', 'Ctrl+O'))
+        self.assertEqual(plugin.nresolved, 0)
+
+        action.perform(None)
+        self.assertEqual(PERFORMED, ['pychron.open'])
+        self.assertEqual(plugin.nresolved, 1)
+
+    def test_menu(self):
+        plugin, factory = self._factory(SchemaAddition(id='file', factory=file_menu, path='MenuBar'))
+        menu = factory()
+        self.assertIsInstance(menu, SMenu)
+        self.assertEqual((menu.id, menu.name), ('file.menu', 'File'))
+
+        group = menu.items[0]
+        self.assertEqual(group.id, 'file.group')
+        self.assertEqual([a.name for a in group.items], ['Open', 'Save'])
+        self.assertEqual(plugin.nresolved, 0)
+
+        group.items[1].perform(None)
+        self.assertEqual(PERFORMED, ['pychron.save'])
+
+    def test_not_lazy(self):
+        self.assertRaises(NotLazy, describe_schema, CustomGroup(OpenAction()))
+
+
+if __name__ == '__main__':
+    unittest.main()
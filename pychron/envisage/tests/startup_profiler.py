@@ -0,0 +1,122 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+from pychron.envisage.plugin_manifest import PluginManifest, encode_value, decode_value, module_path
+from pychron.envisage.startup_profiler import StartupProfiler
+
+PKG = '_startup_profiler_pkg'
+
+
+class StartupProfilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        pkg = os.path.join(self.root, PKG)
+        os.mkdir(pkg)
+        for name, txt in (('__init__', ''),
+                          ('slow', 'import time\ntime.sleep(0.05)\nfrom {} import fast\n'.format(PKG)),
+                          ('fast', 'x = 1\n')):
+            with open(os.path.join(pkg, '{}.py'.format(name)), 'w') as wfile:
+                wfile.write(txt)
+
+        sys.path.insert(0, self.root)
+        self.profiler = StartupProfiler()
+        self.profiler.install()
+
+    def tearDown(self):
+        self.profiler.uninstall()
+        sys.path.remove(self.root)
+        for k in list(sys.modules):
+            if k.startswith(PKG):
+                sys.modules.pop(k)
+        shutil.rmtree(self.root)
+
+    def test_module_times(self):
+        with self.profiler.section('FooPlugin', 'import'):
+            __import__('{}.slow'.format(PKG))
+
+        mt = self.profiler.module_times()
+        cs, ss = mt['{}.slow'.format(PKG)]
+        cf, sf = mt['{}.fast'.format(PKG)]
+        self.assertGreaterEqual(cs, 0.05)
+        self.assertAlmostEqual(ss, cs - cf, 6)
+        self.assertAlmostEqual(cf, sf, 6)
+
+        self.assertIn('{}.fast'.format(PKG), self.profiler.module_times('FooPlugin'))
+        s = self.profiler.sections[0]
+        self.assertEqual(s.nmodules, 3)
+        self.assertGreaterEqual(s.duration, s.import_time)
+        self.assertGreaterEqual(s.import_time, cs)
+
+    def test_uninstall(self):
+        self.profiler.uninstall()
+        __import__('{}.fast'.format(PKG))
+        self.assertEqual(self.profiler.modules, [])
+
+    def test_report(self):
+        with self.profiler.section('FooPlugin', 'import'):
+            __import__('{}.slow'.format(PKG))
+        with self.profiler.section('FooPlugin', 'start'):
+            time.sleep(0.01)
+
+        ps = self.profiler.plugin_times()
+        self.assertGreaterEqual(ps['FooPlugin']['start'], 0.01)
+
+        p = os.path.join(self.root, 'logs', 'startup_profile.txt')
+        self.profiler.dump(p)
+        with open(p) as rfile:
+            txt = rfile.read()
+        self.assertIn('FooPlugin', txt)
+        self.assertIn('{}.slow'.format(PKG), txt)
+
+
+class PluginManifestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'plugin_manifest.json')
+        self.extra = os.path.join(self.root, 'task_extensions.yaml')
+        with open(self.extra, 'w') as wfile:
+            wfile.write('a')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_encode(self):
+        v = [('flux_constants', 'FLUX_CONSTANTS_DEFAULT', False), {'a': (1, [2.5, None])}]
+        self.assertEqual(decode_value(encode_value(v)), v)
+        self.assertRaises(ValueError, encode_value, object())
+
+    def test_module_path(self):
+        self.assertTrue(os.path.isfile(module_path('pychron.envisage.plugin_manifest')))
+        self.assertTrue(os.path.isfile(module_path('pychron.envisage')))
+
+    def test_roundtrip(self):
+        m = PluginManifest(self.path, extra=[self.extra])
+        m.set('FooPlugin', 'pychron.envisage.plugin_manifest', {'id': 'foo', 'contributions': {}})
+        m.dump()
+
+        m = PluginManifest(self.path, extra=[self.extra])
+        self.assertEqual(m.get('FooPlugin')['id'], 'foo')
+        self.assertIsNone(m.get('BarPlugin'))
+
+    def test_stale(self):
+        m = PluginManifest(self.path, extra=[self.extra])
+        m.set('FooPlugin', 'pychron.envisage.plugin_manifest', {'id': 'foo'})
+        m.dump()
+
+        st = os.path.getmtime(self.extra)
+        os.utime(self.extra, (st + 10, st + 10))
+        m = PluginManifest(self.path, extra=[self.extra])
+        self.assertIsNone(m.get('FooPlugin'))
+
+    def test_corrupt(self):
+        with open(self.path, 'w') as wfile:
+            wfile.write('{')
+        self.assertEqual(PluginManifest(self.path).entries, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
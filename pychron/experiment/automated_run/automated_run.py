@@ -30,6 +30,7 @@ from traits.api import Any, Str, List, Property, \
     Event, Instance, Bool, HasTraits, Float, Int, Long, Tuple, Dict
 from traits.trait_errors import TraitError
 
+from pychron.core.codetools.spans import spans
 from pychron.core.helpers.filetools import add_extension
 from pychron.core.helpers.filetools import get_path
 from pychron.core.helpers.iterfuncs import groupby_key
@@ -40,7 +41,7 @@ from pychron.experiment.automated_run.hop_util import parse_hops
 from pychron.experiment.automated_run.persistence_spec import PersistenceSpec
 from pychron.experiment.conditional.conditional import TruncationConditional, \
     ActionConditional, TerminationConditional, conditional_from_dict, CancelationConditional, conditionals_from_file, \
-    QueueModificationConditional
+    QueueModificationConditional, load_conditionals_yaml
 from pychron.experiment.utilities.conditionals import test_queue_conditionals_name, QUEUE, SYSTEM, RUN
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.identifier import convert_identifier
@@ -185,6 +186,8 @@ class AutomatedRun(Loggable):
     _alive = Bool(False)
     _truncate_signal = Bool
     _equilibration_done = False
+    _script_mtimes = None
+    _analysis_backend = None
     _integration_seconds = Float(1.1)
 
     min_ms_pumptime = Int(60)
@@ -594,6 +597,7 @@ class AutomatedRun(Loggable):
 
         return ret
 
+    @spans.traced('peak_center')
     def py_peak_center(self, detector=None, save=True, isotope=None,
                        directions='Increase', config_name='default',
                        check_intensity=None,
@@ -1348,6 +1352,29 @@ anaylsis_type={}
     def refresh_scripts(self):
         self._refresh_scripts()
 
+    def preload(self):
+        """
+            load the scripts, conditionals and analysis backend ahead of ``start``. used to prepare upcoming
+            runs on the look-ahead thread while the current run is measuring. the backend lookup uses a
+            private database session. ``start`` falls back to a normal load if the lookup fails
+        """
+        self._refresh_scripts()
+        self._preload_conditionals()
+        self._script_mtimes = self._get_script_mtimes()
+
+        if self.experiment_type == AR_AR:
+            ln = convert_identifier(self.spec.labnumber)
+            try:
+                self._analysis_backend = self.datahub.get_analysis_backend(ln)
+            except BaseException as e:
+                self.debug('failed preloading analysis backend: {}'.format(e))
+
+    def scripts_modified(self):
+        """
+            has a script file been saved since ``preload``
+        """
+        return self._get_script_mtimes() != self._script_mtimes
+
     def update_detector_isotope_pairing(self, detectors, isotopes):
         self.debug('update detector isotope pairing')
         self.debug('detectors={}'.format(detectors))
@@ -1394,16 +1421,8 @@ anaylsis_type={}
         # for testing only
         # self._get_environmentals()
 
-        if self.isotope_group is None:
-            # load arar_age object for age calculation
-            if self.experiment_type == AR_AR:
-                from pychron.processing.arar_age import ArArAge
-                klass = ArArAge
-            else:
-                from pychron.processing.isotope_group import IsotopeGroup
-                klass = IsotopeGroup
-
-            self.isotope_group = klass()
+        if not self._load_analysis_backend():
+            return
 
         es = self.extraction_script
         if es is not None:
@@ -1411,16 +1430,6 @@ anaylsis_type={}
             v = self._get_yaml_parameter(es, 'sensitivity_multiplier', default=1)
             self.isotope_group.sensitivity_multiplier = v
 
-        ln = self.spec.labnumber
-        ln = convert_identifier(ln)
-
-        self.debug('**************** Experiment Type: {}, {}'.format(self.experiment_type, AR_AR))
-        if self.experiment_type == AR_AR:
-            if not self.datahub.load_analysis_backend(ln, self.isotope_group):
-                self.debug('failed load analysis backend')
-                return
-            self.isotope_group.calculate_decay_factors()
-
         self.py_clear_conditionals()
         # setup default/queue conditionals
         # clear the conditionals for good measure.
@@ -1489,6 +1498,30 @@ anaylsis_type={}
 
         return True
 
+    def _load_analysis_backend(self):
+        if self.isotope_group is None:
+            # load arar_age object for age calculation
+            if self.experiment_type == AR_AR:
+                from pychron.processing.arar_age import ArArAge
+                klass = ArArAge
+            else:
+                from pychron.processing.isotope_group import IsotopeGroup
+                klass = IsotopeGroup
+
+            self.isotope_group = klass()
+
+        ln = self.spec.labnumber
+        ln = convert_identifier(ln)
+
+        self.debug('**************** Experiment Type: {}, {}'.format(self.experiment_type, AR_AR))
+        if self.experiment_type == AR_AR:
+            if not self.datahub.load_analysis_backend(ln, self.isotope_group, backend=self._analysis_backend):
+                self.debug('failed load analysis backend')
+                return
+            self.isotope_group.calculate_decay_factors()
+
+        return True
+
     def _set_filtering(self):
         self.debug('Set filtering')
 
@@ -1527,23 +1560,28 @@ anaylsis_type={}
         self.debug('persistence save...')
         if self.use_db_persistence:
             self.debug('persistence save - db')
-            getattr(self.persister, func)(*args, **kw)
+            with spans.span('db.{}'.format(func)):
+                getattr(self.persister, func)(*args, **kw)
         if self.use_dvc_persistence:
             self.debug('persistence save - dvc')
-            getattr(self.dvc_persister, func)(*args, **kw)
+            with spans.span('dvc.{}'.format(func)):
+                getattr(self.dvc_persister, func)(*args, **kw)
         if self.use_xls_persistence:
             self.debug('persistence save - xls')
-            getattr(self.xls_persister, func)(*args, **kw)
+            with spans.span('xls.{}'.format(func)):
+                getattr(self.xls_persister, func)(*args, **kw)
 
     def _persister_action(self, func, *args, **kw):
-        getattr(self.persister, func)(*args, **kw)
+        with spans.span('db.{}'.format(func)):
+            getattr(self.persister, func)(*args, **kw)
 
-        for i, p in enumerate((self.xls_persister, self.dvc_persister)):
+        for i, (kind, p) in enumerate((('xls', self.xls_persister), ('dvc', self.dvc_persister))):
             if p is None:
                 continue
 
             try:
-                getattr(p, func)(*args, **kw)
+                with spans.span('{}.{}'.format(kind, func)):
+                    getattr(p, func)(*args, **kw)
             except BaseException as e:
                 self.warning('{} persister action failed. {} func={}, excp={}'.format(i, p.__class__.__name__,
                                                                                       func, e))
@@ -1603,6 +1641,21 @@ anaylsis_type={}
             else:
                 self.warning('Invalid Conditionals file. {}'.format(p))
 
+    def _preload_conditionals(self):
+        ps = [get_path(paths.spectrometer_dir, '.*conditionals', ('.yaml', '.yml'))]
+
+        name = self.spec.queue_conditionals_name
+        if test_queue_conditionals_name(name):
+            ps.append(get_path(paths.queue_conditionals_dir, name, ('.yaml', '.yml')))
+
+        t = self.spec.conditionals
+        if t:
+            ps.append(os.path.join(paths.conditionals_dir, add_extension(t, '.yaml')))
+
+        for p in ps:
+            if p and os.path.isfile(p):
+                load_conditionals_yaml(p)
+
     def _add_conditionals_from_file(self, p, level=None):
         d = conditionals_from_file(p, level=level)
         for k, v in d.items():
@@ -1638,6 +1691,14 @@ anaylsis_type={}
         for name in SCRIPT_KEYS:
             setattr(self, '{}_script'.format(name), self._load_script(name))
 
+    def _get_script_mtimes(self):
+        mtimes = {}
+        for name in SCRIPT_KEYS:
+            script = getattr(self, '{}_script'.format(name))
+            if script is not None and os.path.isfile(script.filename):
+                mtimes[name] = os.path.getmtime(script.filename)
+        return mtimes
+
     def _get_default_fits_file(self):
         p = self._get_measurement_parameter('default_fits')
         if p:
@@ -1797,30 +1858,29 @@ anaylsis_type={}
             p = os.path.join(paths.conditionals_dir, add_extension(t, '.yaml'))
             if os.path.isfile(p):
                 self.debug('extract conditionals from file. {}'.format(p))
-                with open(p, 'r') as rfile:
-                    yd = yaml.load(rfile)
-                    failure = False
-                    for kind, items in yd.items():
+                yd = load_conditionals_yaml(p)
+                failure = False
+                for kind, items in yd.items():
+                    try:
+                        klass = klass_dict[kind]
+                    except KeyError:
+                        self.debug('Invalid conditional kind="{}"'.format(kind))
+                        continue
+
+                    for cd in items:
                         try:
-                            klass = klass_dict[kind]
-                        except KeyError:
-                            self.debug('Invalid conditional kind="{}"'.format(kind))
-                            continue
-
-                        for cd in items:
-                            try:
-                                # trim off s
-                                if kind.endswith('s'):
-                                    kind = kind[:-1]
-
-                                self._conditional_appender(kind, cd, klass, location=p)
-                            except BaseException as e:
-                                self.debug('Failed adding {}. excp="{}", cd={}'.format(kind, e, cd))
-                                failure = True
-
-                    if failure:
-                        if not self.confirmation_dialog('Failed to add Conditionals. Would you like to continue?'):
-                            self.cancel_run(do_post_equilibration=False)
+                            # trim off s
+                            if kind.endswith('s'):
+                                kind = kind[:-1]
+
+                            self._conditional_appender(kind, cd, klass, location=p)
+                        except BaseException as e:
+                            self.debug('Failed adding {}. excp="{}", cd={}'.format(kind, e, cd))
+                            failure = True
+
+                if failure:
+                    if not self.confirmation_dialog('Failed to add Conditionals. Would you like to continue?'):
+                        self.cancel_run(do_post_equilibration=False)
             else:
                 try:
                     c, start = t.split(',')
@@ -2266,7 +2326,8 @@ anaylsis_type={}
 
         # time.sleep(0.5)
         with self.persister.writer_ctx():
-            m.measure()
+            with spans.span(grpname, ncounts=ncounts):
+                m.measure()
 
         # mem_log('post measure')
         if m.terminated:
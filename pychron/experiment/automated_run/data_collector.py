@@ -22,6 +22,7 @@ from threading import Event, Thread
 from apptools.preferences.preference_binding import bind_preference
 from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance
 
+from pychron.core.codetools.spans import spans
 from pychron.envisage.consoleable import Consoleable
 from pychron.pychron_constants import AR_AR, SIGNAL, BASELINE, WHIFF, SNIFF
 
@@ -138,14 +139,17 @@ class DataCollector(Consoleable):
         self._queue = q = Queue()
         self._evt = Event()
         evt = self._evt
+        # the writer thread does not inherit the run's trace
+        trace = spans.current_trace()
 
         def writefunc():
             writer = self.data_writer
             while not q.empty() or not evt.wait(10):
                 dets = self.detectors
-                while not q.empty():
-                    x, keys, signals = q.get()
-                    writer(dets, x, keys, signals)
+                with spans.span('write', trace=trace):
+                    while not q.empty():
+                        x, keys, signals = q.get()
+                        writer(dets, x, keys, signals)
 
         # only write to file every 10 seconds and not on main thread
         t = Thread(target=writefunc)
@@ -155,22 +159,29 @@ class DataCollector(Consoleable):
         self.debug('measurement period (ms) = {}'.format(self.period_ms))
         period = self.period_ms * 0.001
         i = 1
+        span = spans.span
         # elapsed = 0
         while not evt.is_set():
-            result = self._check_iteration(i)
+            with span('check_iteration'):
+                result = self._check_iteration(i)
             if not result:
-                if not self._pre_trigger_hook():
-                    break
+                with span('trigger'):
+                    if not self._pre_trigger_hook():
+                        break
 
-                if self.trigger:
-                    self.trigger()
+                    if self.trigger:
+                        self.trigger()
 
-                evt.wait(period)
+                with span('wait'):
+                    evt.wait(period)
                 self.automated_run.plot_panel.counts = i
-                if not self._iter_hook(i):
-                    break
+                with span('iteration'):
+                    if not self._iter_hook(i):
+                        break
 
-                self._post_iter_hook(i)
+                with span('post_iteration'):
+                    self._post_iter_hook(i)
+                spans.count('counts')
                 i += 1
             else:
                 if result == 'cancel':
@@ -229,7 +240,8 @@ class DataCollector(Consoleable):
 
     def _iteration(self, i, detectors=None):
         try:
-            data = self._get_data(detectors)
+            with spans.span('get_data'):
+                data = self._get_data(detectors)
         except (AttributeError, TypeError, ValueError) as e:
             self.debug('failed getting data {}'.format(e))
             return
@@ -240,8 +252,10 @@ class DataCollector(Consoleable):
         k, s = data
         if k is not None and s is not None:
             x = self._get_time()
-            self._save_data(x, k, s)
-            self._plot_data(i, x, k, s)
+            with spans.span('save'):
+                self._save_data(x, k, s)
+            with spans.span('plot'):
+                self._plot_data(i, x, k, s)
 
         return True
 
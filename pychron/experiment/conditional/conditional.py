@@ -18,6 +18,8 @@
 
 import os
 import pprint
+from copy import deepcopy
+from threading import Lock
 
 import yaml
 from traits.api import Str, Either, Int, Callable, Bool, Float, Enum, List
@@ -47,9 +49,34 @@ def dictgetter(d, attrs, default=None):
         return default
 
 
+_yaml_cache = {}
+_yaml_cache_lock = Lock()
+
+
+def load_conditionals_yaml(p):
+    """
+        parse a conditionals file. the parsed file is cached until the file is modified
+    """
+    mtime = os.path.getmtime(p)
+    with _yaml_cache_lock:
+        try:
+            cmtime, yd = _yaml_cache[p]
+        except KeyError:
+            cmtime, yd = None, None
+
+    if cmtime != mtime:
+        with open(p, 'r') as rfile:
+            yd = yaml.load(rfile)
+
+        with _yaml_cache_lock:
+            _yaml_cache[p] = (mtime, yd)
+
+    return deepcopy(yd)
+
+
 def conditionals_from_file(p, name=None, level=SYSTEM, **kw):
-    with open(p, 'r') as rfile:
-        yd = yaml.load(rfile)
+    yd = load_conditionals_yaml(p)
+    if yd:
         cs = (('TruncationConditional', 'truncation', 'truncations'),
               ('ActionConditional', 'action', 'actions'),
               ('ActionConditional', 'action', 'post_run_actions'),
@@ -194,9 +194,13 @@ class Datahub(Loggable):
                                                                                        spec.step,
                                                                                        spec.increment))
 
-    def load_analysis_backend(self, ln, isotope_group):
+    def get_analysis_backend(self, ln):
         dvc = self.mainstore
-        return dvc.load_analysis_backend(ln, isotope_group)
+        return dvc.get_analysis_backend(ln, private_session=True)
+
+    def load_analysis_backend(self, ln, isotope_group, backend=None):
+        dvc = self.mainstore
+        return dvc.load_analysis_backend(ln, isotope_group, backend=backend)
 
     # def add_experiment(self, exp):
     #     db = self.mainstore.db
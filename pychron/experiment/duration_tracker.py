@@ -16,129 +16,181 @@
 
 # ============= standard library imports ========================
 import os
+import sqlite3
+import time
+from threading import Lock
 
+from numpy import percentile
 # ============= enthought library imports =======================
-from traits.api import Dict
+from traits.api import Dict, Int, Tuple
 
 # ============= local library imports  ==========================
-from pychron.core.helpers.strtools import to_csv_str
 from pychron.loggable import Loggable
 from pychron.paths import paths
 
+PHASES = ('start', 'extraction', 'measurement', 'post_measurement', 'save', 'publish')
 
-def write_txt_file(p, out):
-    with open(p, 'w') as wfile:
-        for line in out:
-            wfile.write('{}\n'.format(to_csv_str(line)))
+SCHEMA = '''CREATE TABLE IF NOT EXISTS durations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    script_hash TEXT NOT NULL,
+    runid TEXT,
+    timestamp REAL,
+    truncated INTEGER,
+    total REAL,
+    {});
+CREATE INDEX IF NOT EXISTS durations_script_hash_idx ON durations (script_hash, id);
+'''.format(',\n    '.join('{} REAL'.format(p) for p in PHASES))
 
+# newest first. sqlite 3.13 has no window functions so the last runs of each hash are picked in python
+RECENT_SQL = 'SELECT script_hash, total FROM durations WHERE total IS NOT NULL ORDER BY script_hash, id DESC'
 
 class AutomatedRunDurationTracker(Loggable):
+    """
+        append-only store of run durations.
+
+        every completed run adds one row to a SQLite table with its total duration and the duration of each
+        phase. the estimated duration of a script hash is the mean of its last ``naverage`` runs.
+        ``bands`` holds the ``band_percentiles`` of its last ``nband`` runs
+    """
+    naverage = Int(10)
+    nband = Int(50)
+    band_percentiles = Tuple((10, 90))
+
     _items = Dict
+    _bands = Dict
     _frequencies = Dict
+    _recent = Dict
+    _counts = Dict
 
     def __init__(self, *args, **kw):
         super(AutomatedRunDurationTracker, self).__init__(*args, **kw)
+        self._lock = Lock()
         self.load()
 
     def load(self):
-        items = {}
-        if os.path.isfile(paths.duration_tracker):
-            with open(paths.duration_tracker, 'r') as rfile:
-                for line in rfile:
-                    line = line.strip()
-                    if line:
-                        args = line.split(',')
-                        items[args[0]] = float(args[1])
-
-        self._items = items
-
-        # load frequencies
-        freq = {}
-        if os.path.isfile(paths.duration_tracker_frequencies):
-            with open(paths.duration_tracker_frequencies, 'r') as rfile:
-                for line in rfile:
-                    if line:
-                        h, total, truncated = line.split(',')
-
-                    freq[h] = float(truncated) / float(total)
-        self._frequencies = freq
-
-    def update(self, run, t):
+        recent, counts = {}, {}
+        p = paths.duration_tracker_db
+        if p and any(os.path.isfile(pp or '') for pp in (p, paths.duration_tracker,
+                                                          paths.duration_tracker_frequencies)):
+            n = max(self.naverage, self.nband)
+            with self._connect() as conn:
+                for h, v in conn.execute(RECENT_SQL):
+                    vs = recent.setdefault(h, [])
+                    if len(vs) < n:
+                        vs.append(v)
+
+                for h, truncated, total in conn.execute('SELECT script_hash, SUM(truncated), COUNT(truncated) '
+                                                        'FROM durations WHERE truncated IS NOT NULL '
+                                                        'GROUP BY script_hash'):
+                    counts[h] = [truncated, total]
+
+        self._recent = recent
+        self._counts = counts
+        self._items, self._bands, self._frequencies = {}, {}, {}
+        for h in recent:
+            self._update_durations(h)
+        for h in counts:
+            self._update_frequency(h)
+
+    def update(self, run, t, phases=None):
+        """
+            record a completed run. ``phases`` is an optional dictionary of phase: duration
+        """
         rh = run.spec.script_hash
         self.debug('update duration runid={}, duration={}, md5={}'.format(run.spec.runid, t, rh[:8]))
 
+        truncated = int(bool(run.spec.is_truncated()))
+        phases = phases or {}
+        cols = ['script_hash', 'runid', 'timestamp', 'truncated', 'total']
+        values = [rh, run.spec.runid, time.time(), truncated, t]
+        for k in PHASES:
+            if k in phases:
+                cols.append(k)
+                values.append(phases[k])
+
+        with self._connect() as conn:
+            conn.execute('INSERT INTO durations ({}) VALUES ({})'.format(','.join(cols),
+                                                                         ','.join('?' * len(cols))),
+                         values)
+
+        # only the cached values of this hash change
+        vs = self._recent.setdefault(rh, [])
+        vs.insert(0, t)
+        del vs[max(self.naverage, self.nband):]
+        self._update_durations(rh)
+
+        c = self._counts.setdefault(rh, [0, 0])
+        c[0] += truncated
+        c[1] += 1
+        self._update_frequency(rh)
+
+    def get_percentiles(self, h, qs, phase='total', n=None):
+        """
+            return the ``qs`` percentiles of ``phase`` for the last ``n`` runs of script hash ``h``
+        """
+        if phase != 'total' and phase not in PHASES:
+            raise ValueError('invalid phase {}'.format(phase))
+
+        if n is None:
+            n = self.nband
+
+        with self._connect() as conn:
+            vs = [r[0] for r in conn.execute('SELECT {0} FROM durations WHERE script_hash=? AND {0} IS NOT NULL '
+                                             'ORDER BY id DESC LIMIT ?'.format(phase), (h, n))]
+        if vs:
+            return list(percentile(vs, qs))
+
+    def get_band(self, h):
+        return self._bands.get(h)
+
+    # private
+    def _update_durations(self, h):
+        vs = self._recent[h]
+        if vs:
+            avg = vs[:self.naverage]
+            self._items[h] = sum(avg) / float(len(avg))
+            self._bands[h] = tuple(percentile(vs[:self.nband], self.band_percentiles))
+
+    def _update_frequency(self, h):
+        truncated, total = self._counts[h]
+        if total:
+            self._frequencies[h] = float(truncated) / total
+
+    def _connect(self):
+        return _Connection(paths.duration_tracker_db, self._lock, self._migrate)
+
+    def _migrate(self, conn):
+        """
+            import the durations and truncation frequencies from the old csv duration tracker
+        """
         p = paths.duration_tracker
-
-        out = []
-        exists = False
-
-        if os.path.isfile(p):
+        if p and os.path.isfile(p):
+            self.debug('importing durations from {}'.format(p))
+            rows = []
             with open(p, 'r') as rfile:
                 for line in rfile:
                     line = line.strip()
                     if line:
                         args = line.split(',')
+                        h, ds = args[0], args[2:] or args[1:2]
+                        rows.extend((h, float(d)) for d in ds)
 
-                        h, ct, ds = args[0], args[1], args[2:]
-                        # update the runs duration by taking running average of last 10
-                        if h == rh:
-                            exists = True
-
-                            ds = list(map(float, ds))
-                            ds.append(t)
-                            ds = ds[-10:]
-                            if len(ds):
-                                args = [h, sum(ds) / len(ds)]
-                                args.extend(ds)
-
-                        out.append(args)
-
-        if not exists:
-            self.debug('adding {} {} to durations'.format(run.spec.runid, rh[:8]))
-            out.append((rh, t))
+            conn.executemany('INSERT INTO durations (script_hash, total) VALUES (?,?)', rows)
 
-        write_txt_file(p, out)
-
-        # update frequencies
-        rh = run.spec.script_hash
-        out = []
-        exists = False
         p = paths.duration_tracker_frequencies
-
-        ist = run.spec.is_truncated()
-        if os.path.isfile(p):
+        if p and os.path.isfile(p):
+            # the csv only has the counts. one row per counted run, without a duration
+            self.debug('importing truncation frequencies from {}'.format(p))
+            rows = []
             with open(p, 'r') as rfile:
                 for line in rfile:
                     line = line.strip()
                     if line:
                         h, total, truncated = line.split(',')
-                        if h == rh:
-                            exists = True
-                            total = int(total) + 1
-                            if ist:
-                                truncated = int(truncated) + 1
+                        total, truncated = int(total), int(truncated)
+                        rows.extend((h, int(i < truncated)) for i in range(total))
 
-                        out.append((h, total, truncated))
-
-        if not exists:
-            self.debug('adding {} {} to frequencies'.format(run.spec.runid, rh[:8]))
-            out.append((rh, 1, 1 if ist else 0))
-
-        write_txt_file(p, out)
-        self.load()
-
-    # def probability_model(self, h, ht):
-    #     self.debug('using probability model')
-    #     prob = self._frequencies.get(h, 0)
-    #
-    #     self.debug('probability: {}'.format(prob))
-    #     # probability run is truncated
-    #     if random() < prob:
-    #         h = ht
-    #         self.debug('use truncated duration')
-    #     print self._items
-    #     dur = self._items[h]
-    #     return dur
+            conn.executemany('INSERT INTO durations (script_hash, truncated) VALUES (?,?)', rows)
 
     def __contains__(self, v):
         return v in self._items
@@ -146,4 +198,42 @@ class AutomatedRunDurationTracker(Loggable):
     def __getitem__(self, k):
         return self._items[k]
 
+
+class _Connection(object):
+    def __init__(self, path, lock, migrate):
+        self._path = path
+        self._lock = lock
+        self._migrate = migrate
+        self._conn = None
+
+    def __enter__(self):
+        self._lock.acquire()
+        try:
+            exists = os.path.isfile(self._path)
+            self._conn = conn = sqlite3.connect(self._path)
+            if not exists:
+                with conn:
+                    conn.executescript(SCHEMA)
+                    self._migrate(conn)
+        except BaseException:
+            self._close()
+            raise
+
+        return self._conn
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self._close()
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._lock.release()
+
 # ============= EOF =============================================
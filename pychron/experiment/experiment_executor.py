@@ -33,6 +33,7 @@ from uncertainties import nominal_value, std_dev
 
 from pychron.consumer_mixin import consumable
 from pychron.core.codetools.memory_usage import mem_available
+from pychron.core.codetools.spans import spans, dump_breakdown
 from pychron.core.helpers.filetools import add_extension, get_path, unique_path2
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.helpers.logger_setup import add_root_handler, remove_root_handler
@@ -49,6 +50,7 @@ from pychron.experiment.conflict_resolver import ConflictResolver
 from pychron.experiment.datahub import Datahub
 from pychron.experiment.experiment_scheduler import ExperimentScheduler
 from pychron.experiment.experiment_status import ExperimentStatus
+from pychron.experiment.run_preparer import RunPreparer
 from pychron.experiment.stats import StatsGroup
 from pychron.experiment.utilities.conditionals import test_queue_conditionals_name, SYSTEM, QUEUE, RUN, \
     CONDITIONAL_GROUP_TAGS
@@ -59,7 +61,8 @@ from pychron.experiment.utilities.repository_identifier import retroactive_repos
 from pychron.extraction_line.ipyscript_runner import IPyScriptRunner
 from pychron.globals import globalv
 from pychron.paths import paths
-from pychron.pychron_constants import DEFAULT_INTEGRATION_TIME, LINE_STR, AR_AR, DVC_PROTOCOL, DEFAULT_MONITOR_NAME
+from pychron.pychron_constants import DEFAULT_INTEGRATION_TIME, LINE_STR, AR_AR, DVC_PROTOCOL, DEFAULT_MONITOR_NAME, \
+    SCRIPT_KEYS
 from pychron.wait.wait_group import WaitGroup
 
 
@@ -168,6 +171,9 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
     ratio_change_detection_enabled = Bool(False)
 
+    use_run_lookahead = Bool(True)
+    run_lookahead_depth = Int(2)
+
     # dvc
     use_dvc_persistence = Bool(False)
     default_principal_investigator = Str
@@ -197,6 +203,9 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
     _cached_runs = List
     _active_repository_identifier = Str
 
+    _run_preparer = None
+    _prepared_repositories = None
+
     def __init__(self, *args, **kw):
         super(ExperimentExecutor, self).__init__(*args, **kw)
         self.wait_control_lock = Lock()
@@ -245,7 +254,9 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                  'use_db_persistence',
                  'experiment_type',
                  'laboratory',
-                 'ratio_change_detection_enabled')
+                 'ratio_change_detection_enabled',
+                 'use_run_lookahead',
+                 'run_lookahead_depth')
         self._preference_binder(prefid, attrs)
 
         # dvc
@@ -532,6 +543,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         self.debug('reset stats: {}'.format(self.stats))
         self.stats.reset()
         self.stats.start_timer()
+        spans.enabled = globalv.instrument_runs
 
         exp.start_timestamp = datetime.now()  # .strftime('%m-%d-%Y %H:%M:%S')
 
@@ -554,6 +566,11 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         is_first_flag = True
         is_first_analysis = True
         delay_after_previous_analysis = None
+        previous_run_end = None
+
+        self._prepared_repositories = set()
+        if self.use_run_lookahead:
+            self._run_preparer = RunPreparer(self._prepare_run, self.run_lookahead_depth)
         # from pympler import classtracker
         # tr = classtracker.ClassTracker()
         # from pychron.experiment.automated_run.automated_run import AutomatedRun
@@ -573,6 +590,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                     rgen, nruns = exp.new_runs_generator()
                     cnt = 0
                     self.queue_modified = False
+                    if self._run_preparer:
+                        self._run_preparer.invalidate()
 
                 try:
                     spec = next(rgen)
@@ -594,6 +613,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
                 self._aborted = False
                 self.ms_pumptime_start = None
+                delayed = 0
                 # overlapping = self.current_run and self.current_run.isAlive()
                 overlapping = self.measuring_run and self.measuring_run.is_alive()
                 if not overlapping:
@@ -602,7 +622,9 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                         # self._delay(exp.delay_between_analyses)
                         d = delay_after_previous_analysis
                         if d:
+                            st = time.time()
                             self._delay(d)
+                            delayed = time.time() - st
 
                         if not self.is_alive():
                             self.debug('User Cancel between runs')
@@ -618,6 +640,12 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                     self.debug('failed to make run')
                     break
 
+                if previous_run_end is not None:
+                    self.stats.update_dead_time(time.time() - previous_run_end - delayed)
+
+                # prepare the next runs while this run is executing
+                self._schedule_lookahead(exp, spec)
+
                 self.wait_group.active_control.page_name = run.runid
                 run.is_first = is_first_flag
 
@@ -641,10 +669,12 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                     self.debug('overlap finished. starting next run')
 
                     con.add_consumable((t, run))
+                    previous_run_end = None
                 else:
                     is_first_flag = True
                     last_runid = run.runid
                     self._join_run(spec, run)
+                    previous_run_end = time.time()
 
                 # self.tracker.stats.print_summary()
 
@@ -676,6 +706,11 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 # wait for overlapped runs to finish.
                 self._wait_for(lambda x: self.extracting_run or self.measuring_run)
 
+        if self._run_preparer:
+            self.debug('run lookahead stats={}'.format(self._run_preparer.stats()))
+            self._run_preparer.shutdown()
+            self._run_preparer = None
+
         if self._err_message:
             self.warning('automated runs did not complete successfully')
             self.warning('error: {}'.format(self._err_message))
@@ -787,6 +822,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         self.extracting_run = run
 
+        phases = {}
         for step in ('_start',
                      '_extraction',
                      '_measurement',
@@ -804,7 +840,11 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 break
 
             f = getattr(self, step)
-            if not f(run):
+            pst = time.time()
+            with spans.span(step[1:], trace=run.runid):
+                ok = f(run)
+            phases[step[1:]] = time.time() - pst
+            if not ok:
                 self.warning('{} did not complete successfully'.format(step[1:]))
                 if step != '_post_measurement':  # save data even if post measurement fails
                     run.spec.state = 'failed'
@@ -816,14 +856,21 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 run.spec.state = 'success'
 
         if run.spec.state in ('success', 'truncated', 'terminated'):
-            run.save()
+            pst = time.time()
+            with spans.span('save', trace=run.runid):
+                run.save()
+            publish = run.dvc_persister.publish_duration if run.dvc_persister else 0
+            phases['publish'] = publish
+            phases['save'] = time.time() - pst - publish
             self.run_completed = run
 
         remove_backup(run.uuid)
 
         # check to see if action should be taken
         if run.spec.state not in ('canceled', 'failed'):
-            if self._post_run_check(run):
+            with spans.span('post_run_check', trace=run.runid):
+                failed = self._post_run_check(run)
+            if failed:
                 self._err_message = 'Post Run Check Failed'
                 self.warning('post run check failed')
             else:
@@ -837,6 +884,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
             run.spec.uage = run.isotope_group.uage
             run.spec.k39 = run.isotope_group.get_computed_value('k39')
 
+        self._save_run_timing(run, p, t)
+
         if run.spec.state not in ('canceled', 'failed', 'aborted'):
             self._retroactive_repository_identifiers(run.spec)
 
@@ -848,7 +897,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         # mem_log('end run')
         self.stats.finish_run()
         if run.spec.state == 'success':
-            self.stats.update_run_duration(run, t)
+            self.stats.update_run_duration(run, t, phases)
             self.stats.recalculate_etf()
 
         # write rem and ex queues
@@ -865,6 +914,24 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         self._set_thread_name(self.experiment_queue.name)
         self.experiment_queue.refresh_table_needed = True
 
+    def _save_run_timing(self, run, log_path, duration):
+        """
+            save the timing breakdown of ``run`` next to its log file
+        """
+        bd = spans.finish_trace(run.runid)
+        if not bd['spans']:
+            return
+
+        bd['state'] = run.spec.state
+        bd['duration'] = duration
+        p = '{}.timing.json'.format(os.path.splitext(log_path)[0])
+        try:
+            dump_breakdown(bd, p)
+        except (OSError, TypeError, ValueError) as e:
+            self.warning('failed saving run timing. {}'.format(e))
+
+        self.stats.update_run_timing(bd)
+
     def _close_cv(self):
         self.debug('close cv {}'.format(self._cv_info))
         if self._cv_info:
@@ -1181,7 +1248,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
         if not self._set_run_aliquot(spec):
             return
 
-        run = None
+        run = self._get_prepared_run(spec)
 
         spec.load_name = exp.load_name
         spec.load_holder = exp.tray
@@ -1215,7 +1282,8 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         arun.set_preferences(self.application.preferences)
 
-        arun.refresh_scripts()
+        if run is None:
+            arun.refresh_scripts()
         for script in (arun.extraction_script,
                        arun.measurement_script,
                        arun.post_measurement_script,
@@ -1239,7 +1307,9 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
                 arun.dvc_persister = dvcp
 
                 repid = spec.repository_identifier
-                self.datahub.mainstore.add_repository(repid, self.default_principal_investigator, inform=False)
+                if repid not in self._prepared_repositories:
+                    self.datahub.mainstore.add_repository(repid, self.default_principal_investigator, inform=False)
+                    self._prepared_repositories.add(repid)
 
                 arun.dvc_persister.initialize(repid)
 
@@ -1258,6 +1328,59 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         return arun
 
+    def _schedule_lookahead(self, exp, spec):
+        preparer = self._run_preparer
+        if preparer is None:
+            return
+
+        runs = [ri for ri in exp.cleaned_automated_runs if ri.executable and not ri.skip]
+        try:
+            idx = runs.index(spec) + 1
+        except ValueError:
+            idx = 0
+
+        preparer.schedule(runs[idx:])
+
+    def _prepare_run(self, spec):
+        """
+            spec: AutomatedRunSpec
+            return AutomatedRun
+
+            called on the look-ahead thread. load the scripts, conditionals files and analysis backend.
+            repositories and aliquots stay on the executor thread because they depend on the runs saved
+            before this one
+        """
+        self.debug('preparing run {}'.format(spec.runid))
+        arun = spec.make_run(new_uuid=False)
+        arun.logger_name = 'AutomatedRun {}'.format(spec.runid)
+        for k in ('experiment_type', 'datahub', 'spectrometer_manager', 'extraction_line_manager',
+                  'ion_optics_manager'):
+            setattr(arun, k, getattr(self, k))
+
+        arun.preload()
+        return arun
+
+    def _get_prepared_run(self, spec):
+        preparer = self._run_preparer
+        if preparer is None:
+            return
+
+        def accept(run):
+            for k in SCRIPT_KEYS:
+                if getattr(run.script_info, '{}_script_name'.format(k)) != getattr(spec, '{}_script'.format(k)):
+                    self.debug('{} script changed since {} was prepared'.format(k, spec.runid))
+                    return False
+
+            if run.scripts_modified():
+                self.debug('scripts saved since {} was prepared'.format(spec.runid))
+                return False
+            return True
+
+        run = preparer.pop(spec, accept=accept)
+        if run is not None:
+            self.debug('using prepared run {}'.format(spec.runid))
+        return run
+
     def _set_run_aliquot(self, spec):
         """
             spec: AutomatedRunSpec
@@ -26,6 +26,7 @@ from traits.trait_types import Date
 from traitsui.api import View, Item, UItem
 
 from pychron.core.helpers.ctx_managers import no_update
+from pychron.core.helpers.filetools import add_extension
 from pychron.core.helpers.iterfuncs import groupby_key, partition
 from pychron.core.helpers.traitsui_shortcuts import okcancel_view
 from pychron.core.select_same import SelectSameMixin
@@ -35,7 +36,7 @@ from pychron.envisage.view_util import open_view
 from pychron.experiment.queue.base_queue import BaseExperimentQueue
 from pychron.experiment.queue.value_editor import ValueEditor
 from pychron.experiment.utilities.human_error_checker import HumanErrorChecker
-from pychron.experiment.utilities.identifier import make_runid
+from pychron.experiment.utilities.identifier import make_runid, convert_extract_device
 from pychron.experiment.utilities.uv_human_error_checker import UVHumanErrorChecker
 from pychron.paths import paths
 from pychron.pychron_constants import DVC_PROTOCOL
@@ -177,6 +178,54 @@ class ExperimentQueue(BaseExperimentQueue, SelectSameMixin):
         self.automated_runs = unks
         self.refresh_table_needed = True
 
+    def optimize_hole_order(self, velocity=None, acceleration=None):
+        """
+        reorder the selected runs, or all the unknowns if nothing is selected, to minimize the stage travel
+        between their holes.
+
+        if the laser of this queue is available and has this tray loaded the route starts at the current stage
+        position and uses the axes velocity and acceleration. otherwise ``velocity`` and ``acceleration``
+        are used. without a ``velocity`` the holes are ordered by distance.
+
+        runs of the same hole stay together and keep their order. the reordered runs take the rows of the
+        original runs so blanks, airs etc. stay where they are. runs without a single hole position are not moved
+        """
+        stage_manager = self._get_stage_manager()
+        if stage_manager is not None:
+            sm = stage_manager.stage_map
+        else:
+            sm = self._load_stage_map()
+
+        if sm is None:
+            self.warning_dialog('No stage map for tray "{}"'.format(self.tray))
+            return
+
+        aruns = self.automated_runs[:]
+        runs = self.selected
+        if not runs:
+            runs = [a for a in aruns if a.analysis_type == 'unknown' and not a.skip]
+
+        runs = [a for a in runs if sm.get_hole(a.position) is not None]
+        if len(runs) < 2:
+            return
+
+        groups = {}
+        for a in runs:
+            groups.setdefault(a.position, []).append(a)
+
+        if stage_manager is not None:
+            route = stage_manager.get_hole_route(list(groups))
+        else:
+            route = sm.get_route(list(groups), velocity=velocity, acceleration=acceleration)
+        self.debug('optimized hole order {}'.format(','.join(route)))
+
+        idxs = sorted(aruns.index(a) for a in runs)
+        for i, a in zip(idxs, (a for key in route for a in groups[key])):
+            aruns[i] = a
+
+        self.automated_runs = aruns
+        self.refresh_table_needed = True
+
     def group_extractions2(self):
         """
         group using ABC, ABC, ABC
@@ -465,6 +514,26 @@ class ExperimentQueue(BaseExperimentQueue, SelectSameMixin):
     def _load_actions(self):
         pass
 
+    def _get_stage_manager(self):
+        """
+            return the stage manager of this queue's laser if it has this queue's tray loaded
+        """
+        if self.application and self.extract_device and self.tray:
+            from pychron.lasers.laser_managers.ilaser_manager import ILaserManager
+
+            name = convert_extract_device(self.extract_device)
+            man = self.application.get_service(ILaserManager, 'name=="{}"'.format(name))
+            sm = getattr(man, 'stage_manager', None)
+            if sm is not None and sm.stage_map is not None and sm.stage_map_name == self.tray:
+                return sm
+
+    def _load_stage_map(self):
+        if self.tray:
+            p = os.path.join(paths.map_dir, add_extension(str(self.tray), '.txt'))
+            if os.path.isfile(p):
+                from pychron.stage.maps.laser_stage_map import LaserStageMap
+                return LaserStageMap(file_path=p)
+
     def _load_meta_hook(self, meta):
         bool_default = lambda x: bool(x) if x else False
         self._set_meta_param('auto_save_detector_ic', meta, bool_default)
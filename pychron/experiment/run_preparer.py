@@ -0,0 +1,118 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from threading import Lock
+
+
+# ============= local library imports  ==========================
+
+
+class RunPreparer(object):
+    """
+        prepare upcoming runs in the background while the current run is measuring.
+
+        ``prepare`` is called with a spec on a single worker thread and its return value is handed
+        back by ``pop``. prepared state is discarded by ``invalidate``, e.g. when the queue is modified.
+        a result produced by a preparation that was started before ``invalidate`` is never returned
+    """
+
+    def __init__(self, prepare, depth=2):
+        self.prepare = prepare
+        self.depth = depth
+
+        self.nprepared = 0
+        self.nhits = 0
+        self.nmisses = 0
+        self.ninvalidated = 0
+
+        self._futures = {}
+        self._generation = 0
+        self._lock = Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1)
+
+    def schedule(self, specs):
+        """
+            start preparing the first ``depth`` specs that are not already prepared or in progress
+        """
+        with self._lock:
+            for spec in specs[:self.depth]:
+                key = id(spec)
+                if key not in self._futures:
+                    self._futures[key] = (spec, self._generation,
+                                          self._pool.submit(self._prepare, spec, self._generation))
+
+    def pop(self, spec, timeout=None, accept=None):
+        """
+            return the prepared result for ``spec`` or None.
+
+            waits for a preparation that is in progress because finishing it is never slower than
+            starting over. a result rejected by ``accept`` counts as a miss
+        """
+        with self._lock:
+            item = self._futures.pop(id(spec), None)
+
+        if item is None or item[0] is not spec or item[1] != self._generation:
+            self.nmisses += 1
+            return
+
+        try:
+            result = item[2].result(timeout)
+        except (CancelledError, Exception):
+            result = None
+
+        if result is not None and accept is not None and not accept(result):
+            result = None
+
+        if result is None:
+            self.nmisses += 1
+        else:
+            self.nhits += 1
+        return result
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            for _, _, fut in self._futures.values():
+                fut.cancel()
+            self.ninvalidated += len(self._futures)
+            self._futures = {}
+
+    def shutdown(self):
+        self.invalidate()
+        self._pool.shutdown(wait=False)
+
+    def stats(self):
+        return {'prepared': self.nprepared,
+                'hits': self.nhits,
+                'misses': self.nmisses,
+                'invalidated': self.ninvalidated}
+
+    # private
+    def _prepare(self, spec, generation):
+        if generation != self._generation:
+            return
+
+        result = self.prepare(spec)
+        if generation != self._generation:
+            return
+
+        self.nprepared += 1
+        return result
+
+# ============= EOF =============================================
@@ -20,6 +20,7 @@ from datetime import datetime, timedelta
 
 from traits.api import Property, String, Float, Any, Int, List, Instance
 
+from pychron.core.codetools.spans import format_breakdown
 from pychron.core.helpers.timer import Timer
 from pychron.experiment.duration_tracker import AutomatedRunDurationTracker
 from pychron.loggable import Loggable
@@ -41,12 +42,15 @@ class ExperimentStats(Loggable):
     nruns = Int
     nruns_finished = Int
     etf = String
+    etf_band = String
     start_at = String
     end_at = String
     run_duration = String
     current_run_duration = String
     total_time = Property(depends_on='_total_time')
     _total_time = Float
+    _total_time_low = Float
+    _total_time_high = Float
 
     _timer = Any
 
@@ -62,6 +66,15 @@ class ExperimentStats(Loggable):
     duration_tracker = Instance(AutomatedRunDurationTracker, ())
     _run_start = 0
 
+    # time the spectrometer sits idle between runs, excluding the configured delays
+    last_dead_time = Float
+    total_dead_time = Float
+    ndead_times = Int
+    mean_dead_time = Property(depends_on='total_dead_time, ndead_times')
+
+    # timing breakdown of the last completed run
+    last_run_timing = String
+
     # experiment_queue = Any
 
     def calculate_duration(self, runs=None):
@@ -104,6 +117,10 @@ class ExperimentStats(Loggable):
             et = self._elapsed
             dt = tt - et
             self.info('Estimated total time= {:0.1f}, elapsed time= {:0.1f}, deviation= {:0.1f}'.format(tt, et, dt))
+            if self.ndead_times:
+                self.info('Between run dead time total= {:0.1f}, mean= {:0.1f}, n={}'.format(self.total_dead_time,
+                                                                                            self.mean_dead_time,
+                                                                                            self.ndead_times))
             self._timer.stop()
 
     def reset(self):
@@ -113,10 +130,27 @@ class ExperimentStats(Loggable):
         self._elapsed = 0
         self._run_elapsed = 0
         self._run_start = 0
+        self.last_dead_time = 0
+        self.total_dead_time = 0
+        self.ndead_times = 0
 
-    def update_run_duration(self, run, t):
+    def format_band(self, low, high, post=None, fmt='%H:%M %a'):
+        return '{} - {}'.format(self.format_duration(low, post=post, fmt=fmt),
+                                self.format_duration(high, post=post, fmt=fmt))
+
+    def update_run_duration(self, run, t, phases=None):
         a = self.duration_tracker
-        a.update(run, t)
+        a.update(run, t, phases)
+
+    def update_run_timing(self, breakdown):
+        self.last_run_timing = '{}\n{}'.format(breakdown['trace'], format_breakdown(breakdown))
+
+    def update_dead_time(self, dt):
+        dt = max(0, dt)
+        self.trait_set(last_dead_time=dt,
+                       total_dead_time=self.total_dead_time + dt,
+                       ndead_times=self.ndead_times + 1)
+        self.debug('between run dead time={:0.2f}s mean={:0.2f}s'.format(dt, self.mean_dead_time))
 
     def start_run(self, run):
         self._run_start = time.time()
@@ -174,6 +208,7 @@ class ExperimentStats(Loggable):
     def _calculate_duration(self, runs):
 
         dur = 0
+        low, high = 0, 0
         if runs:
             script_ctx = dict()
             warned = []
@@ -181,19 +216,27 @@ class ExperimentStats(Loggable):
 
             btw = 0
             run_dur = 0
+            run_low, run_high = 0, 0
             d = 0
+            tracker = self.duration_tracker
             for a in runs:
                 sh = a.script_hash
 
-                if sh in self.duration_tracker:
+                if sh in tracker:
                     # t = a.make_truncated_script_hash()
                     # if a.has_conditionals() and t in self.duration_tracker:
                     #     run_dur += self.duration_tracker.probability_model(sh, t)
                     # else:
                     #     run_dur += self.duration_tracker[sh]
-                    run_dur += self.duration_tracker[sh]
+                    rd = tracker[sh]
+                    lo, hi = tracker.get_band(sh) or (rd, rd)
                 else:
-                    run_dur += a.get_estimated_duration(script_ctx, warned, True)
+                    rd = a.get_estimated_duration(script_ctx, warned, True)
+                    lo, hi = rd, rd
+
+                run_dur += rd
+                run_low += lo
+                run_high += hi
                 d = a.get_delay_after(self.delay_between_analyses, self.delay_after_blank, self.delay_after_air)
                 btw += d
 
@@ -201,11 +244,20 @@ class ExperimentStats(Loggable):
             btw -= d
 
             dur = run_dur + self.delay_before_analyses + btw
+            low = run_low + self.delay_before_analyses + btw
+            high = run_high + self.delay_before_analyses + btw
             self.debug('nruns={} before={}, run_dur={}, btw={}'.format(ni, self.delay_before_analyses,
                                                                        run_dur, btw))
 
+        self._total_time_low = low
+        self._total_time_high = high
         return dur
 
+    def _get_mean_dead_time(self):
+        if self.ndead_times:
+            return self.total_dead_time / self.ndead_times
+        return 0
+
     def _get_run_elapsed(self):
         return str(timedelta(seconds=self._run_elapsed))
 
@@ -250,13 +302,16 @@ class StatsGroup(ExperimentStats):
             self.debug('total_time={}'.format(tt))
             self._total_time = tt
             self.etf = self.format_duration(tt)
+            self.etf_band = self.format_band(*self._get_band())
 
     def recalculate_etf(self):
         tt = sum([ei.stats.calculate_duration(ei.cleaned_automated_runs)
                   for ei in self.experiment_queues])
 
         self._total_time = tt + self._elapsed
-        self.etf = self.format_duration(tt, post=datetime.now())
+        now = datetime.now()
+        self.etf = self.format_duration(tt, post=now)
+        self.etf_band = self.format_band(*self._get_band(), post=now)
 
     def calculate_at(self, sel, at_times=True):
         """
@@ -300,6 +355,11 @@ class StatsGroup(ExperimentStats):
                 et += ei.stats.calculate_duration()
         return st, et
 
+    def _get_band(self):
+        low = sum([ei.stats._total_time_low for ei in self.experiment_queues])
+        high = sum([ei.stats._total_time_high for ei in self.experiment_queues])
+        return low, high
+
     @property
     def etf_iso(self):
         return self.format_duration(self._total_time, fmt='iso')
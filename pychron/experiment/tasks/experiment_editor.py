@@ -70,6 +70,9 @@ class ExperimentEditorHandler(TabularEditorHandler):
     def randomize_unknowns(self, info, obj):
         obj.randomize_unknowns()
 
+    def optimize_hole_order(self, info, obj):
+        obj.optimize_hole_order()
+
     def show_summary(self, info, obj):
         obj.show_summary()
 
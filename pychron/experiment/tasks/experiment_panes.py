@@ -341,6 +341,7 @@ class StatsPane(TraitsDockPane):
                                       UReadonly('elapsed')),
                                Readonly('remaining', label='Remaining'),
                                Readonly('etf', label='Est. finish'),
+                               Readonly('etf_band', label='Est. finish 10-90%'),
                                label='General')
         cur_grp = BorderVGroup(Readonly('current_run_duration', ),
                                Readonly('run_elapsed'),
@@ -349,7 +350,9 @@ class StatsPane(TraitsDockPane):
                                Readonly('end_at'),
                                Readonly('run_duration'),
                                label='Selection')
-        v = View(VGroup(gen_grp, cur_grp, sel_grp))
+        timing_grp = BorderVGroup(UReadonly('last_run_timing'),
+                                  label='Last Run Timing')
+        v = View(VGroup(gen_grp, cur_grp, sel_grp, timing_grp))
         return v
 
 
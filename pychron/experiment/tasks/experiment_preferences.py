@@ -65,6 +65,9 @@ class ExperimentPreferences(BasePreferencesHelper):
 
     min_ms_pumptime = Int
 
+    use_run_lookahead = Bool(True)
+    run_lookahead_depth = Int(2)
+
     use_memory_check = Bool
     memory_threshold = Property(PositiveInteger,
                                 depends_on='_memory_threshold')
@@ -220,6 +223,17 @@ class ExperimentPreferencesPane(PreferencesPane):
                             show_border=True,
                             label='Overlap')
 
+        lookahead_grp = Group(Item('use_run_lookahead',
+                                   label='Enabled',
+                                   tooltip='Load the scripts, conditionals and database records of the next runs '
+                                           'while the current run is measuring'),
+                              Item('run_lookahead_depth',
+                                   label='N. Runs',
+                                   enabled_when='use_run_lookahead',
+                                   tooltip='Number of runs to prepare ahead of the current run'),
+                              show_border=True,
+                              label='Look-ahead')
+
         persist_grp = Group(Item('use_xls_persistence', label='Save analyses to Excel workbook'),
                             Item('use_db_persistence', label='Save analyses to Database'),
                             Item('use_uuid_path_name', label='Use UUID Path Names'),
@@ -257,7 +271,7 @@ class ExperimentPreferencesPane(PreferencesPane):
                                           tooltip='update the isotope regression graph every N counts'),
                                      pc_grp,
                                      persist_grp,
-                                     monitor_grp, overlap_grp),
+                                     monitor_grp, overlap_grp, lookahead_grp),
                               label='Automated Run')
 
         return View(color_group,
@@ -31,8 +31,7 @@ class DurationTrackerTestCase(unittest.TestCase):
         self.dt = AutomatedRunDurationTracker()
 
     def tearDown(self):
-        os.remove(paths.duration_tracker)
-        os.remove(paths.duration_tracker_frequencies)
+        os.remove(paths.duration_tracker_db)
 
     def test_prob(self):
         run = MockRun('1000-01', 'a', 'a')
@@ -55,6 +54,54 @@ class DurationTrackerTestCase(unittest.TestCase):
         prob = self.dt._frequencies['a']
         self.assertEqual(prob, 3 / 4.)
 
+    def test_average(self):
+        run = MockRun('1000-01', 'a', 'a')
+        for i in range(12):
+            self.dt.update(run, i)
+
+        # mean of the last 10 durations
+        self.assertEqual(self.dt['a'], 6.5)
+        self.assertNotIn('b', self.dt)
+
+    def test_percentiles(self):
+        run = MockRun('1000-01', 'a', 'a')
+        for i in range(11):
+            self.dt.update(run, i * 10, {'measurement': i})
+
+        self.assertEqual(self.dt.get_band('a'), (10, 90))
+        self.assertEqual(self.dt.get_percentiles('a', [50], phase='measurement'), [5])
+
+    def test_migrate(self):
+        with open(paths.duration_tracker, 'w') as wfile:
+            wfile.write('a,15,10,20\n')
+            wfile.write('b,30\n')
+        with open(paths.duration_tracker_frequencies, 'w') as wfile:
+            wfile.write('a,4,1\n')
+            wfile.write('b,2,0\n')
+
+        try:
+            dt = AutomatedRunDurationTracker()
+            self.assertEqual(dt['a'], 15)
+            self.assertEqual(dt['b'], 30)
+            self.assertEqual(dt._frequencies, {'a': 0.25, 'b': 0})
+
+            dt.update(MockRun('1000-01', 'a', 'b'), 30)
+            self.assertEqual(dt['a'], 20)
+            self.assertEqual(dt._frequencies['a'], 2 / 5.)
+        finally:
+            os.remove(paths.duration_tracker)
+            os.remove(paths.duration_tracker_frequencies)
+
+    def test_cache(self):
+        # update changes the cached values without reloading. they match a fresh load
+        for i in range(60):
+            self.dt.update(MockRun('1000-01', 'ab'[i % 2], 'ab'[i % 3 == 0]), i, {'measurement': i})
+
+        dt = AutomatedRunDurationTracker()
+        for attr in ('_items', '_bands', '_frequencies', '_recent'):
+            self.assertEqual(getattr(self.dt, attr), getattr(dt, attr), attr)
+        self.assertEqual(self.dt['a'], sum(range(40, 60, 2)) / 10.)
+
     # def test_pm(self):
     #     run = MockRun('1000-01', 'a', 'a')
     #     self.dt.update(run, 10)
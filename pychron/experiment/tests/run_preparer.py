@@ -0,0 +1,93 @@
+import unittest
+from threading import Event
+
+from pychron.experiment.run_preparer import RunPreparer
+
+
+class MockSpec:
+    def __init__(self, runid):
+        self.runid = runid
+
+
+class RunPreparerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.prepared = []
+
+        def prepare(spec):
+            self.prepared.append(spec.runid)
+            return 'run {}'.format(spec.runid)
+
+        self.preparer = RunPreparer(prepare, depth=2)
+        self.specs = [MockSpec('1000-0{}'.format(i)) for i in range(4)]
+
+    def tearDown(self):
+        self.preparer.shutdown()
+
+    def test_depth(self):
+        self.preparer.schedule(self.specs)
+        self.assertEqual(self.preparer.pop(self.specs[0]), 'run 1000-00')
+        self.assertEqual(self.preparer.pop(self.specs[1]), 'run 1000-01')
+        self.assertIsNone(self.preparer.pop(self.specs[2]))
+        self.assertEqual(self.prepared, ['1000-00', '1000-01'])
+
+    def test_prepare_once(self):
+        self.preparer.schedule(self.specs)
+        self.preparer.schedule(self.specs)
+        self.preparer.pop(self.specs[0])
+        self.preparer.pop(self.specs[1])
+        self.assertEqual(self.prepared, ['1000-00', '1000-01'])
+
+    def test_stats(self):
+        self.preparer.schedule(self.specs)
+        self.preparer.pop(self.specs[0])
+        self.preparer.pop(self.specs[3])
+        st = self.preparer.stats()
+        self.assertEqual(st['hits'], 1)
+        self.assertEqual(st['misses'], 1)
+
+    def test_rejected(self):
+        self.preparer.schedule(self.specs)
+        self.assertIsNone(self.preparer.pop(self.specs[0], accept=lambda r: False))
+        self.assertEqual(self.preparer.pop(self.specs[1], accept=lambda r: True), 'run 1000-01')
+        st = self.preparer.stats()
+        self.assertEqual(st['hits'], 1)
+        self.assertEqual(st['misses'], 1)
+
+    def test_invalidate(self):
+        self.preparer.schedule(self.specs)
+        self.preparer.pop(self.specs[0])
+        self.preparer.invalidate()
+        self.assertIsNone(self.preparer.pop(self.specs[1]))
+
+    def test_invalidate_in_progress(self):
+        started, release = Event(), Event()
+
+        def prepare(spec):
+            started.set()
+            release.wait(5)
+            return spec.runid
+
+        preparer = RunPreparer(prepare, depth=1)
+        preparer.schedule(self.specs)
+        started.wait(5)
+        preparer.invalidate()
+        release.set()
+
+        # rescheduling after an invalidation prepares the spec again
+        preparer.schedule(self.specs)
+        self.assertEqual(preparer.pop(self.specs[0], timeout=5), '1000-00')
+        self.assertEqual(preparer.stats()['prepared'], 1)
+        preparer.shutdown()
+
+    def test_prepare_failure(self):
+        def prepare(spec):
+            raise ValueError(spec.runid)
+
+        preparer = RunPreparer(prepare)
+        preparer.schedule(self.specs)
+        self.assertIsNone(preparer.pop(self.specs[0]))
+        preparer.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,14 +17,18 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
-from traits.api import Bool
+from traits.api import Bool, Dict, Int
 
 # ============= standard library imports ========================
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 # ============= local library imports  ==========================
 from pychron.core.ui.preference_binding import bind_preference
 from pychron.experiment.utilities.identifier import get_analysis_type
 from pychron.loggable import Loggable
 from pychron.pychron_constants import LINE_STR, SCRIPT_NAMES, NULL_STR
+from pychron.pyscripts.error import PyscriptError, IntervalError
 
 
 class HumanErrorChecker(Loggable):
@@ -36,6 +40,10 @@ class HumanErrorChecker(Loggable):
     non_fatal_enabled = Bool
     spectrometer_manager = None
 
+    # name: error or None for each script tested by the last ``validate_scripts``
+    script_results = Dict
+    validation_workers = Int(4)
+
     def __init__(self, *args, **kw):
         super(HumanErrorChecker, self).__init__(*args, **kw)
 
@@ -85,6 +93,9 @@ class HumanErrorChecker(Loggable):
 
         self._script_context = {}
         self._warned = []
+        if test_scripts:
+            self.validate_scripts(runs, script_context=self._script_context, inform=inform)
+
         inform = inform and not test_all
         for i, ai in enumerate(runs):
             err = self._check_run(ai, inform, test_scripts)
@@ -101,6 +112,60 @@ class HumanErrorChecker(Loggable):
 
         return ret
 
+    def validate_scripts(self, runs, script_context=None, inform=True):
+        """
+            dry run each unique script used by ``runs`` once. the dry runs are done concurrently.
+
+            the loaded scripts are added to ``script_context`` as name: (script, ok), the format used by
+            ``AutomatedRunSpec.test_scripts``, so the scripts are not tested again for every run.
+            return a dictionary of script name: error for the invalid scripts
+        """
+        if script_context is None:
+            script_context = {}
+
+        st = time.time()
+        scripts = {}
+        for run in runs:
+            names = [getattr(run, si) for si in SCRIPT_NAMES]
+            if all(not n or n == NULL_STR or n in scripts or n in script_context for n in names):
+                continue
+
+            run.spectrometer_manager = self.spectrometer_manager
+            arun = run.make_run(new_uuid=False)
+            arun.refresh_scripts()
+            for si, name in zip(SCRIPT_NAMES, names):
+                script = getattr(arun, si)
+                if script is not None and name not in scripts and name not in script_context:
+                    scripts[name] = script
+            arun.spec = None
+
+        def test(script):
+            try:
+                script.test()
+            except (PyscriptError, IntervalError) as e:
+                return str(e)
+
+        names = list(scripts.keys())
+        with ThreadPoolExecutor(max_workers=max(1, self.validation_workers)) as pool:
+            errors = list(pool.map(test, [scripts[n] for n in names]))
+
+        results = {}
+        for name, err in zip(names, errors):
+            script_context[name] = scripts[name], err is None
+            results[name] = err
+            if err:
+                self.warning('script {} invalid. {}'.format(name, err))
+            else:
+                self.debug('script {} ok'.format(name))
+
+        self.script_results = results
+        self.info('validated {} scripts for {} runs in {:0.2f}s'.format(len(names), len(runs), time.time() - st))
+
+        invalid = {k: v for k, v in results.items() if v}
+        if invalid and inform:
+            self.warning_dialog('\n\n'.join(invalid.values()))
+        return invalid
+
     def report_errors(self, errdict):
 
         msg = '\n'.join(['{} {}'.format(k, v) for k, v in errdict.items()])
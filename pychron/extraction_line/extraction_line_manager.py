@@ -80,6 +80,7 @@ class ExtractionLineManager(Manager, Consoleable):
     valves_path = File
 
     use_hardware_update = Bool
+    use_adaptive_hardware_update = Bool
     hardware_update_period = Float
 
     file_listener = None
@@ -117,7 +118,7 @@ class ExtractionLineManager(Manager, Consoleable):
         prefid = 'pychron.extraction_line'
 
         attrs = ('canvas_path', 'canvas_config_path', 'valves_path',
-                 'use_hardware_update', 'hardware_update_period',
+                 'use_hardware_update', 'hardware_update_period', 'use_adaptive_hardware_update',
                  'check_master_owner', 'use_network')
 
         for attr in attrs:
@@ -369,6 +370,14 @@ class ExtractionLineManager(Manager, Consoleable):
             else:
                 return self.switch_manager.get_indicator_state_by_name(name)
 
+    def get_indicator_states(self, names):
+        if self.switch_manager is not None:
+            return self.switch_manager.get_indicator_states(names)
+
+    def get_hardware_states(self, names):
+        if self.switch_manager is not None:
+            return self.switch_manager.get_hardware_states(names)
+
     def get_valve_states(self):
         if self.switch_manager is not None:
             # only query valve states if not already doing a
@@ -524,7 +533,7 @@ class ExtractionLineManager(Manager, Consoleable):
 
     def _update(self):
         if self.use_hardware_update:
-            self.switch_manager.load_hardware_states()
+            self.switch_manager.load_hardware_states(scheduled=self.use_adaptive_hardware_update)
             do_after(self.hardware_update_period * 1000, self._update)
 
     def _deactivate_hook(self):
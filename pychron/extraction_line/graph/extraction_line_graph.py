@@ -19,6 +19,7 @@ from __future__ import absolute_import
 from __future__ import print_function
 from traits.api import HasTraits, Dict, Bool
 # ============= standard library imports ========================
+from collections import OrderedDict
 # ============= local library imports  ==========================
 
 from pychron.extraction_line.graph.nodes import ValveNode, RootNode, \
@@ -66,6 +67,12 @@ class ExtractionLineGraph(HasTraits):
     suppress_changes = False
     inherit_state = Bool
 
+    # traversal results are cached keyed on the valve-state bitmask
+    max_cache_size = 4096
+    _cache = None
+    _valve_bits = None
+    _state_key = 0
+
     def load(self, p):
 
         cp = CanvasParser(p)
@@ -150,6 +157,14 @@ class ExtractionLineGraph(HasTraits):
                 edge.name = '-'.join(ns)
 
         self.nodes = nodes
+        self._build_index()
+
+    @property
+    def state_key(self):
+        """
+            bitmask of the open valves
+        """
+        return self._state_key
 
     def set_default_states(self, canvas):
         for ni in self.nodes:
@@ -162,6 +177,15 @@ class ExtractionLineGraph(HasTraits):
             v_node = self.nodes[name]
             v_node.state = 'open' if state else 'closed'
 
+            if self._valve_bits is None:
+                self._build_index()
+
+            bit = self._valve_bits.get(name, 0)
+            if state:
+                self._state_key |= bit
+            else:
+                self._state_key &= ~bit
+
     def set_canvas_states(self, canvas, name):
         if not self.suppress_changes:
             if hasattr(canvas, 'scene'):
@@ -186,22 +210,29 @@ class ExtractionLineGraph(HasTraits):
                 # recursively split tree if node is closed
 
                 self._set_state(s_node, scene)
-                self._clear_visited()
 
-    def _set_state(self, n, scene=None):
+    def _set_state(self, n, scene=None, visited=None):
+        if visited is None:
+            visited = set()
 
         if n:
-            if n.state == 'closed' and not n.visited:
-                n.visited = True
-                # print 'splitting on {}'.format(n.name)
-                #print ','.join([x.name for x in split_graph(n)])
+            if n.state == 'closed' and n.name not in visited:
+                visited.add(n.name)
                 for ni in split_graph(n):
-                    self._set_state(ni, scene)
+                    self._set_state(ni, scene, visited)
             else:
                 state, term = self._find_max_state(n)
-                # print state, term, n.__class__.__name__, n.name
                 self.fill(scene, n, state, term)
-                self._clear_fvisited()
+
+    def get_component(self, name):
+        """
+            return the label of the connected component containing node ``name``.
+
+            nodes are connected through open nodes only. a closed valve is its own component
+        """
+        if not isinstance(name, str):
+            name = name.name
+        return self._cached('components', None, self._label_components).get(name)
 
     def calculate_volumes(self, node):
         if isinstance(node, str):
@@ -210,23 +241,26 @@ class ExtractionLineGraph(HasTraits):
 
             node = self.nodes[node]
 
+        return self._cached('volumes', node.name, lambda: self._calculate_volumes(node))
+
+    def _calculate_volumes(self, node):
         if node.state == 'closed':
             nodes = split_graph(node)
         else:
             nodes = (node, )
 
-        vs = [(ni.name, self._calculate_volume(ni)) for ni in nodes]
-        self._clear_fvisited()
-        return vs
+        # share visited between sides so a closed valve's volume is only counted once
+        visited = set()
+        return [(ni.name, self._calculate_volume(ni, visited)) for ni in nodes]
 
-    def _calculate_volume(self, node, k=0):
+    def _calculate_volume(self, node, visited, k=0):
         """
             use a Depth-first Traverse
             accumulate volume
         """
         debug = False
         vol = node.volume
-        node.f_visited = True
+        visited.add(node.name)
         if debug:
             print('=' * (k + 1), node.name, node.volume, vol)
 
@@ -240,15 +274,15 @@ class ExtractionLineGraph(HasTraits):
                 if debug:
                     print('-' * (k + i + 1), ei.name, ei.volume, vol)
 
-                if not n.f_visited:
-                    n.f_visited = True
+                if n.name not in visited:
+                    visited.add(n.name)
                     if n.state == 'closed':
                         vol += n.volume
                         if debug:
                             print('e' * (k + i + 1), n.name, n.volume, vol)
 
                     else:
-                        v = self._calculate_volume(n, k=k + 1)
+                        v = self._calculate_volume(n, visited, k=k + 1)
                         vol += v
                         if debug:
                             print('n' * (k + i + 1), n.name, v, vol)
@@ -256,6 +290,9 @@ class ExtractionLineGraph(HasTraits):
         return vol
 
     def _find_max_state(self, node):
+        return self._cached('max_state', node.name, lambda: self._calculate_max_state(node))
+
+    def _calculate_max_state(self, node):
         """
             use a Breadth-First Traverse
             acumulate the max state at each node
@@ -284,17 +321,37 @@ class ExtractionLineGraph(HasTraits):
             return m_state, term
 
     def fill(self, scene, root, state, term):
-        self._set_item_state(scene, root.name, state, term)
-        for ei in root.edges:
-            # n = ei.get_nodes(root)
-            for n in ei.get_nodes(root):
-                if n is None:
-                    continue
-                self._set_item_state(scene, ei.name, state, term)
+        # every open root in a component fills the same items
+        if root.state == 'closed':
+            key = root.name
+        else:
+            key = self.get_component(root)
 
-                if n.state != 'closed' and not n.f_visited:
-                    n.f_visited = True
-                    self.fill(scene, n, state, term)
+        for name in self._cached('fill', key, lambda: self._get_fill_items(root)):
+            self._set_item_state(scene, name, state, term)
+
+    def _get_fill_items(self, root):
+        """
+            use a Depth-first Traverse
+            return the names of the nodes and edges filled from root
+        """
+        items = [root.name]
+        visited = {root.name}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for ei in node.edges:
+                for n in ei.get_nodes(node):
+                    if n is None:
+                        continue
+
+                    items.append(ei.name)
+                    if n.state != 'closed' and n.name not in visited:
+                        visited.add(n.name)
+                        items.append(n.name)
+                        stack.append(n)
+
+        return list(OrderedDict.fromkeys(items))
 
     def _set_item_state(self, scene, name, state, term, color=None):
         if not isinstance(name, str):
@@ -326,13 +383,56 @@ class ExtractionLineGraph(HasTraits):
         else:
             obj.state = False
 
-    def _clear_visited(self):
-        for ni in self.nodes.values():
-            ni.visited = False
+    def _build_index(self):
+        self._valve_bits = {name: 1 << i for i, name in
+                            enumerate(sorted(k for k, v in self.nodes.items() if isinstance(v, ValveNode)))}
+
+        key = 0
+        for name, bit in self._valve_bits.items():
+            if self.nodes[name].state != 'closed':
+                key |= bit
+
+        self._state_key = key
+        self._cache = {}
+
+    def _cached(self, kind, name, func):
+        if self._cache is None:
+            self._build_index()
+
+        key = (self._state_key, kind, name)
+        try:
+            return self._cache[key]
+        except KeyError:
+            if len(self._cache) > self.max_cache_size:
+                self._cache.clear()
+
+            v = func()
+            self._cache[key] = v
+            return v
+
+    def _label_components(self):
+        """
+            label connected components using union-find. only open nodes connect
+        """
+        parent = {k: k for k in self.nodes}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for name, node in self.nodes.items():
+            if node.state == 'closed':
+                continue
+
+            for n in node:
+                if n is not None and n.state != 'closed' and n.name in parent:
+                    ra, rb = find(name), find(n.name)
+                    if ra != rb:
+                        parent[rb] = ra
 
-    def _clear_fvisited(self):
-        for ni in self.nodes.values():
-            ni.f_visited = False
+        return {k: find(k) for k in parent}
 
     def __getitem__(self, key):
         if not isinstance(key, str):
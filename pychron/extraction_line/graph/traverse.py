@@ -30,7 +30,6 @@ def bfs(G, s, value, attr='name'):
         if not u:
             continue
 
-        print(u.name, value, getattr(u, attr) == value)
         if getattr(u, attr) == value:
             return u
 
@@ -0,0 +1,80 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import time
+from threading import Lock
+
+
+# ============= local library imports  ==========================
+
+
+class AdaptivePollScheduler(object):
+    """
+        decide which switches need to be polled.
+
+        a switch that just changed is polled every ``min_period`` seconds. each poll without a change
+        multiplies its period by ``backoff`` up to ``max_period``
+    """
+
+    def __init__(self, min_period=1, max_period=30, backoff=2):
+        self.min_period = min_period
+        self.max_period = max_period
+        self.backoff = backoff
+
+        self._entries = {}
+        self._lock = Lock()
+
+    def due(self, keys, now=None):
+        """
+            return the subset of keys that should be polled now. unknown keys are always due
+        """
+        if now is None:
+            now = time.time()
+
+        entries = self._entries
+        return [k for k in keys if k not in entries or entries[k][0] <= now]
+
+    def update(self, key, changed, now=None):
+        if now is None:
+            now = time.time()
+
+        with self._lock:
+            if changed or key not in self._entries:
+                period = self.min_period
+            else:
+                period = min(self.max_period, self._entries[key][1] * self.backoff)
+
+            self._entries[key] = (now + period, period)
+
+    def reset(self, key=None):
+        """
+            poll ``key`` (or every switch if key is None) at the next opportunity
+        """
+        with self._lock:
+            if key is None:
+                self._entries = {}
+            else:
+                self._entries.pop(key, None)
+
+    def period(self, key):
+        try:
+            return self._entries[key][1]
+        except KeyError:
+            return self.min_period
+
+# ============= EOF =============================================
@@ -91,8 +91,7 @@ class StatusMonitor(Loggable):
         else:
             i = 0
             while 1:
-                time.sleep(self.update_period)
-                if self._stop_evt.is_set():
+                if self._stop_evt.wait(self.update_period):
                     break
 
                 if self._iter(i, vm):
@@ -116,19 +115,19 @@ class StatusMonitor(Loggable):
             if globalv.valve_debug:
                 self.debug('load valve states')
             vm.load_valve_states()
-            time.sleep(delay)
+            self._stop_evt.wait(delay)
 
         if self.lock_freq and not i % self.lock_freq:
             if globalv.valve_debug:
                 self.debug('load lock states')
             vm.load_valve_lock_states()
-            time.sleep(delay)
+            self._stop_evt.wait(delay)
 
         if self.owner_freq and not i % self.owner_freq:
             if globalv.valve_debug:
                 self.debug('load owners')
             vm.load_valve_owners()
-            time.sleep(delay)
+            self._stop_evt.wait(delay)
 
         if self.checksum_freq and not i % self.checksum_freq:
             if not vm.state_checksum:
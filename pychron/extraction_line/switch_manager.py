@@ -19,19 +19,22 @@ import binascii
 import os
 import pickle
 import time
+from concurrent.futures import ThreadPoolExecutor
 from operator import itemgetter
 from pickle import PickleError
 
 from six.moves import range
 from six.moves import zip
-from traits.api import Any, Dict, List, Bool, Event, Str
+from traits.api import Any, Dict, List, Bool, Event, Str, Instance
 
 from pychron.core.helpers.filetools import add_extension
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.helpers.strtools import to_bool
 from pychron.extraction_line.explanation.explanable_item import ExplanableValve
 from pychron.extraction_line.pipettes.tracking import PipetteTracker
+from pychron.extraction_line.poll_scheduler import AdaptivePollScheduler
 from pychron.globals import globalv
+from pychron.hardware.actuators import get_valve_name
 from pychron.hardware.core.checksum_helper import computeCRC
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.hardware.switch import Switch, ManualSwitch
@@ -69,6 +72,8 @@ class SwitchManager(Manager):
     actuators = List
 
     query_valve_state = Bool(True)
+    use_bulk_state_read = Bool(True)
+    poll_scheduler = Instance(AdaptivePollScheduler, ())
 
     use_explanation = True
 
@@ -251,6 +256,20 @@ class SwitchManager(Manager):
         self._prev_keys = keys
         return ','.join(states)
 
+    @add_checksum
+    def get_indicator_states(self, names):
+        """
+            return the indicator states of many switches. e.g. A1,B0
+        """
+        return self._get_states_word(names, self._get_indicator_state_by)
+
+    @add_checksum
+    def get_hardware_states(self, names):
+        """
+            return the channel states of many switches. e.g. A1,B0
+        """
+        return self._get_states_word(names, self._get_state_by)
+
     def get_valve_by_address(self, a):
         """
         """
@@ -423,27 +442,36 @@ class SwitchManager(Manager):
     def load_valve_owners(self):
         pass
 
-    def load_hardware_states(self, force=False, indicator=True, verbose=False):
-        self.debug('load hardware states')
-        update = False
-        states = []
-        for k, v in self.switches.items():
-            if v.query_state or force:
-                ostate = v.state
+    def load_hardware_states(self, force=False, indicator=True, verbose=False, scheduled=False):
+        """
+            query the hardware for the switch states.
 
-                if indicator:
-                    func = v.get_hardware_indicator_state
-                else:
-                    func = v.get_hardware_state
+            switches are grouped by actuator. each actuator reads all its states in one command
+            if it supports bulk reads, otherwise one switch at a time. actuators are queried concurrently.
 
-                s = func(verbose=verbose)
+            if ``scheduled`` only the switches due according to the poll scheduler are queried
+        """
+        self.debug('load hardware states')
+        switches = [(k, v) for k, v in self.switches.items() if v.query_state or force]
+        if scheduled and not force:
+            due = set(self.poll_scheduler.due([k for k, v in switches]))
+            switches = [(k, v) for k, v in switches if k in due]
 
-                if not isinstance(s, bool):
-                    s = None
+        ostates = {k: v.state for k, v in switches}
+        results = self._read_hardware_states(switches, indicator, verbose)
 
-                states.append((k, s, False))
-                if ostate != s:
-                    update = update or ostate != s
+        update = False
+        states = []
+        now = time.time()
+        for k, v in switches:
+            s = results.get(k)
+            if not isinstance(s, bool):
+                s = None
+
+            states.append((k, s, False))
+            changed = ostates[k] != s
+            update = update or changed
+            self.poll_scheduler.update(k, changed, now)
 
         if states:
             self.refresh_state = states
@@ -489,6 +517,65 @@ class SwitchManager(Manager):
                         self.debug('interlocked {}'.format(interlock))
                         return v
 
+    def _get_states_word(self, names, func):
+        """
+            switches with an unknown state are left out so clients query them individually
+        """
+        states = []
+        for n in names:
+            v = self.get_switch_by_name(n)
+            if v is not None:
+                s = func(v)
+                if s is not None:
+                    states.append('{}{}'.format(n, int(bool(s))))
+        return ','.join(states)
+
+    def _read_hardware_states(self, switches, indicator, verbose):
+        """
+            return a dict of switch name: state
+        """
+        groups = {}
+        for k, v in switches:
+            actuator = getattr(v, 'actuator', None)
+            groups.setdefault(id(actuator), (actuator, []))[1].append((k, v))
+
+        groups = list(groups.values())
+        results = {}
+        if len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                for r in executor.map(lambda g: self._read_actuator_states(g[0], g[1], indicator, verbose), groups):
+                    results.update(r)
+        else:
+            for actuator, group in groups:
+                results.update(self._read_actuator_states(actuator, group, indicator, verbose))
+
+        return results
+
+    def _read_actuator_states(self, actuator, switches, indicator, verbose):
+        bulk = None
+        if actuator is not None and self.use_bulk_state_read and len(switches) > 1:
+            func = actuator.get_indicator_states if indicator else actuator.get_channel_states
+            try:
+                bulk = func([v for k, v in switches], verbose=verbose)
+            except BaseException as e:
+                self.debug('bulk state read failed for {}. {}'.format(actuator.name, e))
+
+        results = {}
+        for k, v in switches:
+            s = None
+            if bulk is not None:
+                s = bulk.get(get_valve_name(v))
+
+            if isinstance(s, bool):
+                v.set_state(s)
+            else:
+                func = v.get_hardware_indicator_state if indicator else v.get_hardware_state
+                s = func(verbose=verbose)
+
+            results[k] = s
+
+        return results
+
     def _get_indicator_state_by(self, v, force=False):
         state = None
         if (self.query_valve_state and v.query_state) or force:
@@ -686,6 +773,7 @@ class SwitchManager(Manager):
             else:
                 act = getattr(v, action)
                 result, changed = act(mode='{}-{}'.format(self.mode, mode), force=force)
+                self.poll_scheduler.reset(v.display_name)
                 if isinstance(v, ManualSwitch):
                     self._save_manual_states()
         else:
@@ -75,6 +75,7 @@ class BaseExtractionLinePreferences(BasePreferencesHelper):
 class ExtractionLinePreferences(BaseExtractionLinePreferences):
     use_hardware_update = Bool
     hardware_update_period = Float
+    use_adaptive_hardware_update = Bool
     check_master_owner = Bool
 
 
@@ -110,6 +111,10 @@ class ExtractionLinePreferencesPane(PreferencesPane):
                               Item('use_hardware_update'),
                               Item('hardware_update_period',
                                    enabled_when='use_hardware_update'),
+                              Item('use_adaptive_hardware_update',
+                                   label='Adaptive',
+                                   tooltip='Poll valves that changed recently more often than idle valves',
+                                   enabled_when='use_hardware_update'),
                               show_border=True, label='Update'),
                        self._network_group(),
                        show_border=True,
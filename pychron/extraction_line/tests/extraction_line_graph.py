@@ -0,0 +1,131 @@
+import unittest
+
+from pychron.extraction_line.graph.extraction_line_graph import ExtractionLineGraph
+from pychron.extraction_line.graph.nodes import ValveNode, PumpNode, SpectrometerNode, LaserNode, Edge
+
+
+def connect(a, b, volume=1):
+    e = Edge(name='{}_{}'.format(a.name, b.name), volume=volume)
+    e.nodes.extend((a, b))
+    a.add_edge(e)
+    b.add_edge(e)
+
+
+class Scene(object):
+    def __init__(self):
+        self.items = {}
+
+    def get_item(self, name):
+        return self.items.get(name)
+
+
+class ExtractionLineGraphTestCase(unittest.TestCase):
+    """
+        laser - A - B - spectrometer
+                |
+                C - pump
+    """
+
+    def setUp(self):
+        g = ExtractionLineGraph()
+        laser = LaserNode(name='laser', volume=10)
+        spec = SpectrometerNode(name='spectrometer', volume=100)
+        pump = PumpNode(name='pump', volume=0)
+        a = ValveNode(name='A', volume=(10, 5))
+        b = ValveNode(name='B', volume=(10, 5))
+        c = ValveNode(name='C', volume=(10, 5))
+
+        connect(laser, a)
+        connect(a, b)
+        connect(b, spec)
+        connect(a, c)
+        connect(c, pump)
+
+        g.nodes = {n.name: n for n in (laser, spec, pump, a, b, c)}
+        self.graph = g
+
+    def test_state_key(self):
+        g = self.graph
+        self.assertEqual(g.state_key, 0)
+        g.set_valve_state('A', True)
+        k = g.state_key
+        self.assertNotEqual(k, 0)
+        g.set_valve_state('B', True)
+        g.set_valve_state('B', False)
+        self.assertEqual(g.state_key, k)
+
+    def test_components(self):
+        g = self.graph
+        self.assertNotEqual(g.get_component('laser'), g.get_component('spectrometer'))
+
+        g.set_valve_state('A', True)
+        g.set_valve_state('B', True)
+        self.assertEqual(g.get_component('laser'), g.get_component('spectrometer'))
+        self.assertNotEqual(g.get_component('laser'), g.get_component('pump'))
+
+    def test_max_state(self):
+        g = self.graph
+        g.set_valve_state('A', True)
+        self.assertEqual(g._find_max_state(g.nodes['laser']), ('laser', 'laser'))
+
+        g.set_valve_state('C', True)
+        self.assertEqual(g._find_max_state(g.nodes['laser']), ('pump', 'pump'))
+
+        g.set_valve_state('C', False)
+        self.assertEqual(g._find_max_state(g.nodes['laser']), ('laser', 'laser'))
+
+    def test_volumes(self):
+        g = self.graph
+        # closed valve. volumes on either side
+        vs = dict(g.calculate_volumes('B'))
+        self.assertEqual(vs['A'], 29)
+        # B was counted on the A side
+        self.assertEqual(vs['spectrometer'], 101)
+
+        g.set_valve_state('B', True)
+        vs = dict(g.calculate_volumes('B'))
+        self.assertEqual(vs['B'], 123)
+
+    def test_volumes_cached(self):
+        g = self.graph
+        g.set_valve_state('A', True)
+        v1 = g.calculate_volumes('A')
+        self.assertIs(g.calculate_volumes('A'), v1)
+
+        g.set_valve_state('A', False)
+        self.assertIsNot(g.calculate_volumes('A'), v1)
+
+    def test_fill_items(self):
+        g = self.graph
+        g.set_valve_state('A', True)
+        items = g._get_fill_items(g.nodes['laser'])
+        self.assertEqual(set(items), {'laser', 'A', 'laser_A', 'A_B', 'A_C'})
+
+    def test_set_canvas_states(self):
+        g = self.graph
+        scene = Scene()
+
+        class Item(object):
+            type_tag = ''
+            state = False
+            default_color = 'red'
+            active_color = None
+
+        for name in ('laser', 'spectrometer', 'laser_A', 'A_B', 'B_spectrometer'):
+            scene.items[name] = Item()
+
+        class Canvas(object):
+            pass
+
+        canvas = Canvas()
+        canvas.scene = scene
+
+        g.set_valve_state('A', True)
+        g.set_canvas_states(canvas, 'A')
+        self.assertTrue(scene.items['laser_A'].state)
+        self.assertTrue(scene.items['A_B'].state)
+        self.assertFalse(scene.items['B_spectrometer'].state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from pychron.extraction_line.poll_scheduler import AdaptivePollScheduler
+from pychron.hardware.actuators import parse_state_word
+from pychron.hardware.core.checksum_helper import computeCRC
+
+
+class AdaptivePollSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AdaptivePollScheduler(min_period=1, max_period=8, backoff=2)
+
+    def test_unknown_due(self):
+        self.assertEqual(self.scheduler.due(['A', 'B'], now=0), ['A', 'B'])
+
+    def test_backoff(self):
+        s = self.scheduler
+        s.update('A', False, now=0)
+        self.assertEqual(s.period('A'), 1)
+        for p in (2, 4, 8, 8):
+            s.update('A', False, now=0)
+            self.assertEqual(s.period('A'), p)
+
+        self.assertEqual(s.due(['A'], now=7), [])
+        self.assertEqual(s.due(['A'], now=8), ['A'])
+
+    def test_change_resets_period(self):
+        s = self.scheduler
+        for i in range(4):
+            s.update('A', False, now=0)
+        s.update('A', True, now=10)
+        self.assertEqual(s.period('A'), 1)
+        self.assertEqual(s.due(['A'], now=11), ['A'])
+
+    def test_reset(self):
+        s = self.scheduler
+        s.update('A', False, now=0)
+        s.update('B', False, now=0)
+        s.reset('A')
+        self.assertEqual(s.due(['A', 'B'], now=0.5), ['A'])
+        s.reset()
+        self.assertEqual(s.due(['A', 'B'], now=0.5), ['A', 'B'])
+
+
+class StateWordTestCase(unittest.TestCase):
+    def test_parse(self):
+        data = 'A1,B0,CC1'
+        d = parse_state_word('{}{}'.format(data, computeCRC(data)))
+        self.assertEqual(d, {'A': True, 'B': False, 'CC': True})
+
+    def test_bad_checksum(self):
+        self.assertIsNone(parse_state_word('A1,B0XXXX'))
+
+    def test_empty(self):
+        self.assertIsNone(parse_state_word(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -112,6 +112,10 @@ class Globals(object):
 
     laser_version = 1
 
+    lazy_plugins = False
+    profile_startup = False
+    instrument_runs = True
+
     def build(self, ip):
 
         for attr, func in [('use_ipc', to_bool),
@@ -159,7 +163,10 @@ class Globals(object):
                            ('entry_irradiation_import_from_file_debug', to_bool),
                            ('client_only_locking', to_bool),
                            ('cert_file', str),
-                           ('laser_version', int)]:
+                           ('laser_version', int),
+                           ('lazy_plugins', to_bool),
+                           ('profile_startup', to_bool),
+                           ('instrument_runs', to_bool)]:
             a = ip.get_global(attr)
             if a is not None:
                 setattr(globalv, attr, func(a))
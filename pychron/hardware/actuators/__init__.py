@@ -29,3 +29,29 @@ def get_valve_name(obj):
     else:
         name = obj.name.split('-')[1]
     return name
+
+
+def parse_state_word(word):
+    """
+        parse a checksummed state word e.g. A1,B0,C1<crc>
+
+        return a dict of name: bool or None if the word is invalid
+    """
+    from pychron.hardware.core.checksum_helper import computeCRC
+
+    if not word:
+        return
+
+    word = word.strip()
+    data, checksum = word[:-4], word[-4:]
+    if computeCRC(data) != checksum:
+        return
+
+    d = {}
+    for packet in data.split(','):
+        if packet:
+            try:
+                d[packet[:-1]] = bool(int(packet[-1:]))
+            except ValueError:
+                return
+    return d
@@ -1,6 +1,7 @@
 
 from __future__ import absolute_import
 from .gp_actuator import GPActuator
+from pychron.hardware.actuators import get_valve_name
 
 
 class DummyGPActuator(GPActuator):
@@ -20,6 +21,12 @@ class DummyGPActuator(GPActuator):
     def get_channel_state(self, ch, *args, **kw):
         return self._states.get(ch, False)
 
+    def get_channel_states(self, objs, *args, **kw):
+        return {get_valve_name(o): self.get_channel_state(o) for o in objs}
+
+    def get_indicator_states(self, objs, *args, **kw):
+        return self.get_channel_states(objs)
+
     def get_state_checksum(self, *args, **kw):
         return 0
 
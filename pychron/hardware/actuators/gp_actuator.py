@@ -40,6 +40,22 @@ class GPActuator(CoreDevice):
     def get_indicator_state(self, obj, *args, **kw):
         return self.get_channel_state(obj, **kw)
 
+    def get_indicator_states(self, objs, *args, **kw):
+        """
+            return a dict of valve name: indicator state for ``objs`` using a single command.
+
+            return None if this actuator cannot read many states at once
+        """
+        return None
+
+    def get_channel_states(self, objs, *args, **kw):
+        """
+            return a dict of valve name: channel state for ``objs`` using a single command.
+
+            return None if this actuator cannot read many states at once
+        """
+        return None
+
     def get_channel_state(self, *args, **kw):
         """
         """
@@ -20,7 +20,7 @@ import time
 
 # ========== local library imports =============
 from .gp_actuator import GPActuator
-from pychron.hardware.actuators import get_valve_name
+from pychron.hardware.actuators import get_valve_name, parse_state_word
 from pychron.core.communication_helper import trim, trim_bool
 
 
@@ -63,6 +63,20 @@ class PychronGPActuator(GPActuator):
         cmd = 'GetIndicatorState {}'.format(get_valve_name(obj))
         return self.ask(cmd, verbose=verbose)
 
+    def get_indicator_states(self, objs, verbose=False):
+        """
+            Query the hardware for many indicator states in one round trip
+        """
+        cmd = 'GetIndicatorStates {}'.format(','.join(get_valve_name(o) for o in objs))
+        return parse_state_word(self.ask(cmd, verbose=verbose))
+
+    def get_channel_states(self, objs, verbose=False):
+        """
+            Query the hardware for many channel states in one round trip
+        """
+        cmd = 'GetChannelStates {}'.format(','.join(get_valve_name(o) for o in objs))
+        return parse_state_word(self.ask(cmd, verbose=verbose))
+
     @trim_bool
     def get_channel_state(self, obj, verbose=True):
         """
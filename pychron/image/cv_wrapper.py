@@ -28,7 +28,7 @@ try:
         rectangle, imread, findContours, drawContours, arcLength, \
         approxPolyDP, contourArea, isContourConvex, boundingRect, GaussianBlur, \
         addWeighted, \
-        circle, moments, minAreaRect, minEnclosingCircle, convexHull
+        circle, moments, minAreaRect, minEnclosingCircle, convexHull, resize as cv_resize
 
     from cv2 import RETR_EXTERNAL, CHAIN_APPROX_NONE, LINE_AA
     # from cv2 import ConvertImage, fromarray, LoadImage, Flip, \
@@ -85,6 +85,10 @@ def grayspace(src):
     return dst
 
 
+def resize(src, w, h):
+    return cv_resize(asarray(src), (int(w), int(h)))
+
+
 #
 #
 # def resize(src, w, h, dst=None):
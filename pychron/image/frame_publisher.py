@@ -0,0 +1,209 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import json
+import time
+from io import BytesIO
+
+import zmq
+from PIL import Image
+from numpy import array, asarray, abs as nabs, uint8, int16
+
+# ============= local library imports  ==========================
+
+FRAME_TOPIC = b'frame'
+PREVIEW_TOPIC = b'preview'
+
+KEY = 'key'
+TILES = 'tiles'
+
+
+def encode_jpeg(frame, quality=75):
+    buf = BytesIO()
+    Image.fromarray(asarray(frame, dtype=uint8)).save(buf, 'JPEG', quality=quality)
+    return buf.getvalue()
+
+
+def decode_jpeg(buf):
+    img = Image.open(BytesIO(buf))
+    return array(img.convert('RGB'))
+
+
+def changed_tiles(frame, previous, tile_size=64, threshold=8):
+    """
+        return a list of (x, y, w, h) tiles where the maximum absolute pixel difference between
+        ``frame`` and ``previous`` exceeds ``threshold``
+    """
+    h, w = frame.shape[:2]
+    diff = nabs(frame.astype(int16) - previous.astype(int16))
+    if diff.ndim == 3:
+        diff = diff.max(axis=2)
+
+    tiles = []
+    for y in range(0, h, tile_size):
+        for x in range(0, w, tile_size):
+            if diff[y:y + tile_size, x:x + tile_size].max() > threshold:
+                tiles.append((x, y, min(tile_size, w - x), min(tile_size, h - y)))
+    return tiles
+
+
+class FramePublisher(object):
+    """
+        capture and encode frames once and fan the encoded buffers out to any number of
+        subscribers on a zmq PUB socket.
+
+        messages are multipart [topic, header, payload...]. the header is json and contains
+        a sequence number, the frame shape and, for ``tiles`` messages, the regions that changed.
+
+        slow subscribers drop messages at the socket's high water mark instead of blocking
+        the capture loop
+    """
+
+    def __init__(self, get_frame, sock, fps=10, quality=75,
+                 preview_scale=0, preview_quality=50,
+                 use_changed_regions=False, tile_size=64, threshold=8, keyframe_interval=50):
+        self.get_frame = get_frame
+        self.sock = sock
+        self.fps = fps
+        self.quality = quality
+        self.preview_scale = preview_scale
+        self.preview_quality = preview_quality
+        self.use_changed_regions = use_changed_regions
+        self.tile_size = tile_size
+        self.threshold = threshold
+        self.keyframe_interval = keyframe_interval
+
+        self.seq = 0
+        self.nencoded = 0
+        self.nunchanged = 0
+        self.encode_time = 0
+
+        self._previous = None
+        self._since_key = 0
+
+    def run(self, stop):
+        period = 1 / float(self.fps)
+        while not stop.is_set():
+            st = time.time()
+            self.publish_once()
+            time.sleep(max(0, period - (time.time() - st)))
+
+    def publish_once(self):
+        frame = self.get_frame()
+        if frame is None:
+            return
+
+        frame = asarray(frame, dtype=uint8)
+        st = time.time()
+
+        previous = self._previous
+        if not self.use_changed_regions or previous is None or previous.shape != frame.shape \
+                or self._since_key >= self.keyframe_interval:
+            self._send(FRAME_TOPIC, KEY, frame, [encode_jpeg(frame, self.quality)])
+            self._since_key = 0
+        else:
+            tiles = changed_tiles(frame, previous, self.tile_size, self.threshold)
+            if not tiles:
+                self.nunchanged += 1
+                return
+
+            bufs = [encode_jpeg(frame[y:y + h, x:x + w], self.quality) for x, y, w, h in tiles]
+            self._send(FRAME_TOPIC, TILES, frame, bufs, tiles=tiles)
+            self._since_key += 1
+
+        if self.preview_scale > 1:
+            s = self.preview_scale
+            preview = frame[::s, ::s]
+            self.sock.send_multipart([PREVIEW_TOPIC,
+                                      self._header(KEY, preview),
+                                      encode_jpeg(preview, self.preview_quality)])
+
+        self._previous = frame
+        self.nencoded += 1
+        self.encode_time += time.time() - st
+
+    def stats(self):
+        return {'seq': self.seq,
+                'encoded': self.nencoded,
+                'unchanged': self.nunchanged,
+                'encode_time': self.encode_time}
+
+    # private
+    def _send(self, topic, kind, frame, bufs, **kw):
+        self.seq += 1
+        self.sock.send_multipart([topic, self._header(kind, frame, **kw)] + bufs)
+
+    def _header(self, kind, frame, **kw):
+        h = {'kind': kind, 'seq': self.seq, 'timestamp': time.time(), 'shape': frame.shape}
+        h.update(kw)
+        return json.dumps(h).encode('utf-8')
+
+
+class FrameSubscriber(object):
+    """
+        receive frames from a FramePublisher.
+
+        ``get_frame`` drains all pending messages and returns the most recent frame. changed regions
+        are painted onto the last keyframe. if a message was missed, tiles are ignored until the
+        next keyframe
+    """
+
+    def __init__(self, host='localhost', port=1084, topic=FRAME_TOPIC, context=None, url=None):
+        context = context or zmq.Context.instance()
+        self._sock = context.socket(zmq.SUB)
+        self._sock.setsockopt(zmq.RCVHWM, 4)
+        self._sock.setsockopt(zmq.SUBSCRIBE, topic)
+        self._sock.connect(url or 'tcp://{}:{}'.format(host, port))
+
+        self._poller = zmq.Poller()
+        self._poller.register(self._sock, zmq.POLLIN)
+        self._frame = None
+        self._seq = None
+
+    def get_frame(self, timeout=100):
+        if dict(self._poller.poll(timeout)).get(self._sock) == zmq.POLLIN:
+            while 1:
+                try:
+                    msg = self._sock.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                self._handle(msg)
+
+        return self._frame
+
+    def close(self):
+        self._sock.close(linger=0)
+
+    def _handle(self, msg):
+        topic, header, bufs = msg[0], json.loads(msg[1].decode('utf-8')), msg[2:]
+        seq = header['seq']
+        if header['kind'] == KEY:
+            self._frame = decode_jpeg(bufs[0])
+        elif self._frame is not None and self._seq is not None and seq == self._seq + 1:
+            frame = self._frame.copy()
+            for (x, y, w, h), buf in zip(header['tiles'], bufs):
+                frame[y:y + h, x:x + w] = decode_jpeg(buf)
+            self._frame = frame
+        else:
+            # missed a message. wait for the next keyframe
+            self._seq = None
+            return
+
+        self._seq = seq
+
+# ============= EOF =============================================
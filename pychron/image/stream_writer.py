@@ -0,0 +1,258 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import shutil
+import subprocess
+import time
+from queue import Queue, Full, Empty
+from threading import Thread, Lock
+
+from numpy import uint8, uint16, clip, dstack
+
+
+# ============= local library imports  ==========================
+
+
+def to_rgb8(frame):
+    """
+        convert a frame to a contiguous 8bit RGB array suitable for a rawvideo pipe
+    """
+    if frame.dtype == uint16:
+        # assume its a pylon mono12 frame
+        frame = frame / 4095 * 255
+
+    if frame.dtype != uint8:
+        frame = clip(frame, 0, 255).astype(uint8)
+
+    if frame.ndim == 2:
+        frame = dstack((frame, frame, frame))
+    elif frame.shape[2] == 4:
+        frame = frame[:, :, :3]
+
+    return frame.copy(order='C')
+
+
+def find_ffmpeg(ffmpeg=None):
+    if ffmpeg and os.path.isfile(ffmpeg):
+        return ffmpeg
+
+    return shutil.which('ffmpeg') or '/usr/local/bin/ffmpeg'
+
+
+class StreamingVideoWriter(object):
+    """
+        push raw frames through a bounded queue into a single encoder process.
+
+        ``put`` blocks for at most ``put_timeout`` seconds when the queue is full (back-pressure)
+        and then drops the frame. ``close`` drains the queue and waits for the encoder so the output
+        file is complete as soon as it returns.
+
+        the encoder is started lazily with the size of the first frame. ``command`` can be used to
+        replace the default ffmpeg command. it is called with (width, height) and must return an argument
+        list for a process that reads rgb24 frames from stdin
+    """
+
+    def __init__(self, path, fps, ffmpeg=None, maxsize=64, put_timeout=0.05, command=None):
+        self.path = path
+        self.fps = fps
+        self.ffmpeg = ffmpeg
+        self.put_timeout = put_timeout
+        self.command = command
+
+        self.nframes = 0
+        self.nwritten = 0
+        self.ndropped = 0
+        self.max_depth = 0
+        self.frame_size = None
+        self.error = None
+
+        self._queue = Queue(maxsize=maxsize)
+        self._lock = Lock()
+        self._process = None
+        self._consumer = None
+        self._closed = False
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def put(self, frame):
+        """
+            queue a frame for encoding. return False if the frame was dropped
+        """
+        if frame is None or self._closed:
+            return False
+
+        with self._lock:
+            self.nframes += 1
+            if self.error:
+                self.ndropped += 1
+                return False
+
+            h, w = frame.shape[:2]
+            if self.frame_size is None:
+                self._start(w, h)
+                if self.error:
+                    self.ndropped += 1
+                    return False
+            elif self.frame_size != (w, h):
+                self.ndropped += 1
+                return False
+
+        try:
+            self._queue.put(frame, timeout=self.put_timeout)
+        except Full:
+            with self._lock:
+                self.ndropped += 1
+            return False
+
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    def close(self, timeout=None):
+        """
+            flush the queue, stop the encoder and return the frame accounting
+        """
+        self._closed = True
+        if self._consumer is not None:
+            self._put_sentinel(timeout)
+            self._consumer.join(timeout)
+            if self._consumer.is_alive():
+                # the encoder stopped reading. kill it so the consumer is not left blocked writing to it
+                self._process.kill()
+                self._consumer.join()
+                self.error = 'encoder did not finish within {}s'.format(timeout)
+
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+            except (OSError, ValueError):
+                pass
+
+            try:
+                self._process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.error = 'encoder did not finish within {}s'.format(timeout)
+                self._process.kill()
+                self._process.wait()
+
+        return self.stats()
+
+    def stats(self):
+        return {'frames': self.nframes,
+                'written': self.nwritten,
+                'dropped': self.ndropped,
+                'max_queue_depth': self.max_depth,
+                'error': self.error}
+
+    # private
+    def _put_sentinel(self, timeout):
+        """
+            queue the end of stream marker. give up if the consumer exits or ``timeout`` elapses while the
+            queue is full
+        """
+        st = time.time()
+        while self._consumer.is_alive():
+            try:
+                self._queue.put(None, timeout=0.1)
+                return
+            except Full:
+                if timeout is not None and time.time() - st > timeout:
+                    return
+
+    def _start(self, w, h):
+        self.frame_size = (w, h)
+        if self.command:
+            args = self.command(w, h)
+        else:
+            args = self._ffmpeg_command(w, h)
+
+        try:
+            self._process = subprocess.Popen(args, stdin=subprocess.PIPE,
+                                             stdout=subprocess.DEVNULL,
+                                             stderr=subprocess.DEVNULL)
+        except OSError as e:
+            self.error = str(e)
+            return
+
+        self._consumer = Thread(target=self._consume, name='StreamingVideoWriter')
+        self._consumer.daemon = True
+        self._consumer.start()
+
+    def _ffmpeg_command(self, w, h):
+        return [find_ffmpeg(self.ffmpeg), '-y',
+                '-f', 'rawvideo',
+                '-pix_fmt', 'rgb24',
+                '-s', '{}x{}'.format(w, h),
+                '-r', str(self.fps),
+                '-i', '-',
+                '-an',
+                self.path]
+
+    def _consume(self):
+        stdin = self._process.stdin
+        while 1:
+            try:
+                frame = self._queue.get(timeout=1)
+            except Empty:
+                if self._process.poll() is not None:
+                    self.error = 'encoder exited with code {}'.format(self._process.returncode)
+                    break
+                continue
+
+            if frame is None:
+                break
+
+            try:
+                stdin.write(to_rgb8(frame).data)
+                self.nwritten += 1
+            except (OSError, ValueError) as e:
+                self.error = str(e)
+                with self._lock:
+                    self.ndropped += 1
+                break
+
+        # account for anything left behind if the encoder failed
+        while 1:
+            try:
+                frame = self._queue.get_nowait()
+            except Empty:
+                break
+            if frame is not None:
+                with self._lock:
+                    self.ndropped += 1
+
+
+def stream_record(writer, frame_getter, fps, stop, max_duration=None):
+    """
+        grab frames from ``frame_getter`` at ``fps`` and push them into ``writer`` until ``stop`` is set
+    """
+    fps_1 = 1 / float(fps)
+    start = time.time()
+    while not stop.is_set():
+        st = time.time()
+        if max_duration and st - start > max_duration:
+            break
+
+        writer.put(frame_getter())
+        time.sleep(max(0, fps_1 - (time.time() - st)))
+
+    return writer.close()
+
+# ============= EOF =============================================
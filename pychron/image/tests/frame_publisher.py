@@ -0,0 +1,107 @@
+import time
+import unittest
+
+import zmq
+from numpy import zeros, uint8
+
+from pychron.image.frame_publisher import FramePublisher, FrameSubscriber, changed_tiles, PREVIEW_TOPIC
+
+
+class Frames(object):
+    def __init__(self):
+        self.frame = zeros((128, 192, 3), dtype=uint8)
+        self.ncalls = 0
+
+    def __call__(self):
+        self.ncalls += 1
+        return self.frame
+
+
+class ChangedTilesTestCase(unittest.TestCase):
+    def test_unchanged(self):
+        a = zeros((128, 192, 3), dtype=uint8)
+        self.assertEqual(changed_tiles(a, a.copy()), [])
+
+    def test_changed(self):
+        a = zeros((128, 192, 3), dtype=uint8)
+        b = a.copy()
+        b[70, 130] = 255
+        self.assertEqual(changed_tiles(b, a, tile_size=64), [(128, 64, 64, 64)])
+
+    def test_edge_tile(self):
+        a = zeros((100, 100), dtype=uint8)
+        b = a.copy()
+        b[99, 99] = 255
+        self.assertEqual(changed_tiles(b, a, tile_size=64), [(64, 64, 36, 36)])
+
+
+class FramePublisherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.ctx = zmq.Context()
+        self.pub = self.ctx.socket(zmq.PUB)
+        self.pub.bind('inproc://frames')
+        self.frames = Frames()
+
+    def tearDown(self):
+        self.pub.close(linger=0)
+        self.ctx.term()
+
+    def _subscriber(self, **kw):
+        sub = FrameSubscriber(context=self.ctx, url='inproc://frames', **kw)
+        # allow the subscription to propagate
+        time.sleep(0.1)
+        return sub
+
+    def _get(self, sub):
+        for i in range(20):
+            f = sub.get_frame(50)
+            if f is not None:
+                return f
+
+    def test_fan_out_encodes_once(self):
+        subs = [self._subscriber() for i in range(3)]
+        p = FramePublisher(self.frames, self.pub)
+        p.publish_once()
+
+        for s in subs:
+            self.assertEqual(self._get(s).shape, (128, 192, 3))
+            s.close()
+
+        self.assertEqual(self.frames.ncalls, 1)
+        self.assertEqual(p.nencoded, 1)
+
+    def test_changed_regions(self):
+        sub = self._subscriber()
+        p = FramePublisher(self.frames, self.pub, use_changed_regions=True)
+        p.publish_once()
+        self._get(sub)
+
+        # unchanged frames are not encoded or sent
+        p.publish_once()
+        self.assertEqual(p.nunchanged, 1)
+        self.assertEqual(p.seq, 1)
+
+        f = self.frames.frame.copy()
+        f[0:10, 0:10] = 200
+        self.frames.frame = f
+        p.publish_once()
+        self.assertEqual(p.seq, 2)
+
+        for i in range(20):
+            frame = sub.get_frame(50)
+            if frame[5, 5, 0] > 150:
+                break
+        self.assertGreater(frame[5, 5, 0], 150)
+        self.assertLess(frame[100, 100, 0], 50)
+        sub.close()
+
+    def test_preview(self):
+        sub = self._subscriber(topic=PREVIEW_TOPIC)
+        p = FramePublisher(self.frames, self.pub, preview_scale=4)
+        p.publish_once()
+        self.assertEqual(self._get(sub).shape, (32, 48, 3))
+        sub.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+from numpy import zeros, uint8
+
+from pychron.globals import globalv
+from pychron.image.stream_writer import StreamingVideoWriter
+from pychron.image.video import Video
+
+# stand-in encoder that copies the raw frames on stdin to the output file
+COPY = 'import sys, shutil; shutil.copyfileobj(sys.stdin.buffer, open(sys.argv[1], "wb"))'
+SLOW_COPY = 'import sys, time; time.sleep(1); open(sys.argv[1], "wb").write(sys.stdin.buffer.read())'
+STALLED = 'import time; time.sleep(30)'
+
+
+def copy_command(path, script=COPY):
+    def command(w, h):
+        return [sys.executable, '-c', script, path]
+
+    return command
+
+
+class StreamingVideoWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'video.raw')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_write(self):
+        w = StreamingVideoWriter(self.path, 10, command=copy_command(self.path))
+        for i in range(5):
+            w.put(zeros((4, 6, 3), dtype=uint8) + i)
+
+        stats = w.close()
+        self.assertEqual(stats['written'], 5)
+        self.assertEqual(stats['dropped'], 0)
+        self.assertEqual(os.path.getsize(self.path), 5 * 4 * 6 * 3)
+
+    def test_gray_frame(self):
+        w = StreamingVideoWriter(self.path, 10, command=copy_command(self.path))
+        w.put(zeros((4, 6), dtype=uint8))
+        w.close()
+        self.assertEqual(os.path.getsize(self.path), 4 * 6 * 3)
+
+    def test_size_change_dropped(self):
+        w = StreamingVideoWriter(self.path, 10, command=copy_command(self.path))
+        w.put(zeros((4, 6, 3), dtype=uint8))
+        self.assertFalse(w.put(zeros((5, 6, 3), dtype=uint8)))
+        stats = w.close()
+        self.assertEqual(stats['frames'], 2)
+        self.assertEqual(stats['written'], 1)
+        self.assertEqual(stats['dropped'], 1)
+
+    def test_back_pressure(self):
+        w = StreamingVideoWriter(self.path, 10, maxsize=2, put_timeout=0,
+                                 command=copy_command(self.path, SLOW_COPY))
+        # frames large enough to fill the pipe buffer so the consumer blocks
+        for i in range(20):
+            w.put(zeros((512, 512, 3), dtype=uint8))
+
+        stats = w.close()
+        self.assertGreater(stats['dropped'], 0)
+        self.assertEqual(stats['written'] + stats['dropped'], 20)
+        self.assertEqual(os.path.getsize(self.path), stats['written'] * 512 * 512 * 3)
+
+    def test_stalled_encoder(self):
+        w = StreamingVideoWriter(self.path, 10, maxsize=2, put_timeout=0,
+                                 command=copy_command(self.path, STALLED))
+        for i in range(10):
+            w.put(zeros((512, 512, 3), dtype=uint8))
+
+        st = time.time()
+        stats = w.close(timeout=0.5)
+        self.assertLess(time.time() - st, 5)
+        self.assertTrue(stats['error'])
+        self.assertEqual(stats['written'] + stats['dropped'], 10)
+
+    def test_missing_encoder(self):
+        w = StreamingVideoWriter(self.path, 10, command=lambda w, h: [os.path.join(self.root, 'noencoder')])
+        self.assertFalse(w.put(zeros((4, 6, 3), dtype=uint8)))
+        self.assertFalse(w.put(zeros((4, 6, 3), dtype=uint8)))
+        stats = w.close()
+        self.assertEqual(stats['dropped'], 2)
+        self.assertTrue(stats['error'])
+
+
+class CopyVideo(Video):
+    def _new_stream_writer(self, path):
+        return StreamingVideoWriter(path, self.fps, command=copy_command(path))
+
+
+class VideoStreamRecordTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self._video_test = globalv.video_test, globalv.video_test_path
+        globalv.video_test = True
+        globalv.video_test_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'no_connection.jpg')
+
+    def tearDown(self):
+        globalv.video_test, globalv.video_test_path = self._video_test
+        shutil.rmtree(self.root)
+
+    def test_stream_record(self):
+        path = os.path.join(self.root, 'video.raw')
+        v = CopyVideo(fps=20, recording_mode='stream', max_recording_duration=1)
+        v.open()
+        h, w = v.get_frame().shape[:2]
+
+        v.start_recording(path)
+        time.sleep(0.5)
+        self.assertTrue(v.stop_recording(wait=True))
+
+        self.assertGreater(v.recorded_frames, 0)
+        self.assertEqual(os.path.getsize(path), v.recorded_frames * w * h * 3)
+        self.assertEqual(os.listdir(self.root), ['video.raw'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -31,9 +31,12 @@ from traits.api import Any, Bool, Float, List, Str, Int, Enum
 
 from .cv_wrapper import get_capture_device
 from pychron.core.helpers.filetools import add_extension
+from pychron.core.helpers.logger_setup import new_logger
 from pychron.globals import globalv
 from pychron.image.image import Image
 
+logger = new_logger('Video')
+
 
 def convert_to_video(path, fps, name_filter='snapshot%03d.jpg',
                      ffmpeg=None,
@@ -107,6 +110,10 @@ class Video(Image):
     output_pic_mode = Enum('jpg', 'tif')
     ffmpeg_path = Str
     fps = Int
+    recording_mode = Enum('images', 'stream')
+    recording_queue_size = Int(64)
+    dropped_frames = Int
+    recorded_frames = Int
     identifier = 0
     max_recording_duration = Float
 
@@ -141,6 +148,8 @@ class Video(Image):
                     self.ffmpeg_path = vid.get('ffmpeg_path', '')
                     self.fps = vid.get('fps')
                     self.max_recording_duration = vid.get('max_recording_duration', 30)
+                    self.recording_mode = vid.get('recording_mode', 'images')
+                    self.recording_queue_size = vid.get('recording_queue_size', 64)
 
                 if hasattr(self.cap, 'load_configuration'):
                     self.cap.load_configuration(cfg)
@@ -220,17 +229,26 @@ class Video(Image):
         if self.cap is not None:
             self._recording = True
 
-            t = Thread(target=self._ffmpeg_record, args=(path, self._stop_recording_event, renderer))
+            if self.recording_mode == 'stream' and renderer is None:
+                target = self._stream_record
+                args = (path, self._stop_recording_event)
+            else:
+                target = self._ffmpeg_record
+                args = (path, self._stop_recording_event, renderer)
+
+            t = Thread(target=target, args=args)
             t.start()
 
     def stop_recording(self, wait=False):
         """
         """
+        if wait:
+            self._save_ok_event = Event()
+
         if self._stop_recording_event is not None:
             self._stop_recording_event.set()
         self._recording = False
         if wait:
-            self._save_ok_event = Event()
             return self._ready_to_save()
 
     def record_frame(self, path, crop=None, **kw):
@@ -300,6 +318,33 @@ class Video(Image):
         if self._save_ok_event:
             self._save_ok_event.set()
 
+    def _stream_record(self, path, stop):
+        """
+            push frames through a bounded queue directly into a single encoder process.
+            no intermediate images are written and the video is complete when recording stops
+
+        """
+        from pychron.image.stream_writer import stream_record
+
+        writer = self._new_stream_writer(path)
+        stats = stream_record(writer, self.get_cached_frame, self.fps, stop,
+                              max_duration=self.max_recording_duration * 60)
+
+        self.recorded_frames = stats['written']
+        self.dropped_frames = stats['dropped']
+        if stats['error']:
+            logger.warning('stream record failed. {}'.format(stats['error']))
+
+        if self._save_ok_event:
+            self._save_ok_event.set()
+
+    def _new_stream_writer(self, path):
+        from pychron.image.stream_writer import StreamingVideoWriter
+
+        return StreamingVideoWriter(path, self.fps,
+                                    ffmpeg=self.ffmpeg_path,
+                                    maxsize=self.recording_queue_size)
+
     def _get_balser_pylon_device(self, identifier):
         from .basler_pylon_camera import BaslerPylonCamera
         cam = BaslerPylonCamera(identifier)
@@ -16,11 +16,10 @@
 
 # ============= enthought library imports =======================
 from __future__ import absolute_import
-from traits.api import Instance, Button, Property, Bool, Int
+from traits.api import Instance, Button, Property, Bool, Int, Enum, Float
 from traitsui.api import View, Item, ButtonEditor
 # ============= standard library imports ========================
 from threading import Thread, Event
-import time
 from numpy import array
 # ============= local library imports  ==========================
 from pychron.image.video import Video
@@ -33,6 +32,14 @@ class VideoServer(Loggable):
     quality = Int(75)
     _started = False
     use_color = True
+
+    mode = Enum('request_reply', 'publish')
+    publish_fps = Float(10)
+    preview_scale = Int(0)
+    use_changed_regions = Bool(False)
+    tile_size = Int(64)
+    keyframe_interval = Int(50)
+    publisher = None
     start_button = Button
     start_label = Property(depends_on='_started')
     _started = Bool(False)
@@ -75,14 +82,22 @@ class VideoServer(Loggable):
         self.info('video broadcast thread started')
 
         context = zmq.Context()
-#         sock = context.socket(zmq.PUB)
-        sock = context.socket(zmq.REP)
-        sock.bind('tcp://*:{}'.format(self.port))
+        if self.mode == 'publish':
+            sock = context.socket(zmq.PUB)
+            # keep at most a couple of frames queued for each subscriber. slow subscribers drop stale frames
+            sock.setsockopt(zmq.SNDHWM, 2)
+            sock.bind('tcp://*:{}'.format(self.port))
+            self.publish(sock)
+        else:
+            sock = context.socket(zmq.REP)
+            sock.bind('tcp://*:{}'.format(self.port))
 
-        poll = zmq.Poller()
-        poll.register(sock, zmq.POLLIN)
+            poll = zmq.Poller()
+            poll.register(sock, zmq.POLLIN)
 
-        self.request_reply(sock, poll)
+            self.request_reply(sock, poll)
+
+        sock.close(linger=0)
 #        if use_color:
 #            kw = dict(swap_rb=True)
 #            depth = 3
@@ -122,25 +137,23 @@ class VideoServer(Loggable):
                 sock.send(buf)
 
 
-    def publisher(self, sock):
-        stop = self._stop_signal
-        video = self.video
-        use_color = self.use_color
-        fps = 10
-        from . import Image
-        from cStringIO import StringIO
-        while not stop.isSet():
-
-            f = video.get_frame(gray=False)
-#            new_frame.clear()
-            im = Image.fromarray(array(f))
-            s = StringIO()
-            im.save(s, 'JPEG')
-
-            sock.send(str(fps))
-            sock.send(s.getvalue())
+    def publish(self, sock):
+        """
+            capture and encode each frame once in this thread and fan it out to all subscribers
+        """
+        from pychron.image.frame_publisher import FramePublisher
 
-            time.sleep(1.0 / fps)
+        video = self.video
+        pub = FramePublisher(lambda: video.get_frame(gray=False), sock,
+                             fps=self.publish_fps,
+                             quality=self.quality,
+                             preview_scale=self.preview_scale,
+                             use_changed_regions=self.use_changed_regions,
+                             tile_size=self.tile_size,
+                             keyframe_interval=self.keyframe_interval)
+        self.publisher = pub
+        pub.run(self._stop_signal)
+        self.info('video publisher stopped. {}'.format(pub.stats()))
 
 # class VideoServer2(Loggable):
 #    video = Instance(Video)
@@ -19,8 +19,8 @@ from __future__ import absolute_import
 from traits.api import HasTraits, File, Str, Int
 # ============= standard library imports ========================
 import zmq
-from cStringIO import StringIO
-from . import Image as PILImage
+from io import BytesIO
+from PIL import Image as PILImage
 import os
 from numpy import asarray, array
 
@@ -57,6 +57,7 @@ class VideoSource(HasTraits):
     _sock = None
     poller = None
     _cached_image = None
+    _subscriber = None
 
     def __init__(self, *args, **kw):
         super(VideoSource, self).__init__(*args, **kw)
@@ -74,7 +75,11 @@ class VideoSource(HasTraits):
 
     def set_url(self, url):
         islocal, r = parse_url(url)
-        if islocal:
+        if url.startswith('pub://'):
+            from pychron.image.frame_publisher import FrameSubscriber
+            self.host, self.port = r
+            self._subscriber = FrameSubscriber(self.host, self.port)
+        elif islocal:
             self.image_path = r
         else:
             self.host, self.port = r
@@ -101,7 +106,12 @@ class VideoSource(HasTraits):
 
 
     def get_image_data(self, size=None):
-        if self._sock is None:
+        if self._subscriber is not None:
+            img = self._subscriber.get_frame()
+            if img is not None:
+                self._cached_image = img
+            img = self._cached_image
+        elif self._sock is None:
             img = self._get_image_data()
         else:
             img = self._get_video_data()
@@ -153,7 +163,7 @@ class VideoSource(HasTraits):
         if self._connected:
             resp = self._get_reply('IMAGE')
             if resp:
-                buf = StringIO(resp)
+                buf = BytesIO(resp)
                 buf.seek(0)
                 img = PILImage.open(buf)
                 img = img.convert('RGB')
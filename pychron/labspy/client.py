@@ -21,13 +21,16 @@ from datetime import datetime
 from threading import Thread, Lock
 
 import yaml
+from sqlalchemy.exc import OperationalError, DisconnectionError
 # ============= enthought library imports =======================
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Instance, Bool, Int
+from traits.api import Instance, Bool, Int, Float
 
 from pychron.core.helpers.logger_setup import logging_setup
+from pychron.dashboard.timeseries_store import TimeSeriesStore, summarize
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.labspy.database_adapter import LabspyDatabaseAdapter
+from pychron.labspy.uploader import BufferedUploader, UploadDataError
 from pychron.loggable import Loggable
 from pychron.paths import paths
 from pychron.pychron_constants import SCRIPT_NAMES, NULL_STR
@@ -64,10 +67,29 @@ def auto_reset_connect(func):
     return wrapper
 
 
+SUMMARY_STATS = ('min', 'mean', 'max')
+
+
 class NotificationTrigger(object):
+    """
+        params:
+            device, tag, cmp, units, addresses, subject
+            period: optional. test a statistic of the values recorded over the last ``period`` seconds
+                instead of the current value
+            stat: optional. one of min, mean, max. default=mean
+    """
+
     def __init__(self, params):
         self._params = params
 
+    @property
+    def period(self):
+        return self._params.get('period')
+
+    @property
+    def stat(self):
+        return self._params.get('stat', 'mean')
+
     def test(self, dev, tag, val, unit):
         mdev = self._params['device']
         mtag = self._params['tag']
@@ -101,8 +123,14 @@ class LabspyClient(Loggable):
     use_connection_status = Bool
     connection_status_period = Int
 
+    upload_batch_size = Int(50)
+    upload_flush_period = Float(2)
+    upload_retry_period = Float(30)
+
     _timer = None
     session_lock = None
+    _stores = None
+    _uploader = None
 
     def __init__(self, bind=True, *args, **kw):
         super(LabspyClient, self).__init__(*args, **kw)
@@ -110,6 +138,7 @@ class LabspyClient(Loggable):
             self.bind_preferences()
             # self.start()
         self.session_lock = Lock()
+        self._stores = {}
 
     def bind_preferences(self):
         self.db.bind_preferences()
@@ -146,6 +175,44 @@ class LabspyClient(Loggable):
     def get_latest_lab_pneumatics(self):
         return self.db.get_latest_lab_pneumatics()
 
+    def get_process_history(self, dev, name, start=None, end=None, max_points=2000):
+        """
+            return the samples of process value ``name`` recorded locally by the dashboard device ``dev``
+        """
+        return self._get_store(dev).query(name, start, end, max_points=max_points)
+
+    def get_process_summary(self, dev, name, start=None, end=None):
+        """
+            return (min, mean, max, n) of a locally recorded process value. uses the rollups so long periods are
+            summarized without reading every sample
+        """
+        return summarize(self.get_process_history(dev, name, start, end))
+
+    def stop(self):
+        """
+            upload the queued measurements. anything that cannot be uploaded is spooled and replayed at the next
+            start
+        """
+        if self._uploader:
+            self._uploader.stop()
+
+    def upload_stats(self):
+        """
+            return the queue depth, spool depth and upload counts of the measurement uploader
+        """
+        return self.uploader.stats()
+
+    @property
+    def uploader(self):
+        if self._uploader is None:
+            self._uploader = BufferedUploader(self._write_batch,
+                                              os.path.join(paths.labspy_dir, 'upload_spool.jsonl'),
+                                              os.path.join(paths.labspy_dir, 'upload_rejected.jsonl'),
+                                              batch_size=self.upload_batch_size,
+                                              flush_period=self.upload_flush_period,
+                                              retry_period=self.upload_retry_period)
+        return self._uploader
+
     def _connection_status(self, verbose=False):
 
         # if verbose:
@@ -201,7 +268,6 @@ class LabspyClient(Loggable):
         hid = self._generate_hid_from_exp(exp)
         exp = self.db.get_experiment(hid)
 
-    @auto_connect
     def update_connection(self, ts, devname, com, addr, status, verbose=False):
         if verbose:
             self.debug(
@@ -216,10 +282,8 @@ class LabspyClient(Loggable):
         except ValueError:
             pass
 
-        self.db.set_connection(ts,
-                               appname.strip(),
-                               user.strip(),
-                               devname, com, addr, status)
+        self.uploader.put('connection', time.mktime(ts.timetuple()), appname.strip(), user.strip(),
+                          devname, com, addr, bool(status))
 
     @auto_connect
     def update_status(self, **kw):
@@ -272,19 +336,17 @@ class LabspyClient(Loggable):
 
                 self.db.add_measurement('{}Monitor'.format(ms), '{}{}'.format(ms, name), v, units)
 
-    @auto_connect
     def add_measurement(self, dev, tag, val, unit):
+        """
+            queue a measurement for upload. returns immediately. see ``BufferedUploader``
+        """
         val = float(val)
         self.debug(
             'adding measurement dev={} process={} value={} ({})'.format(dev,
                                                                         tag,
                                                                         val,
                                                                         unit))
-        try:
-            self.db.add_measurement(dev, tag, val, unit)
-            self._check_notifications(dev, tag, val, unit)
-        except BaseException as e:
-            self.debug('failed adding measurement. {}'.format(e))
+        self.uploader.put('measurement', dev, tag, val, unit, time.time())
 
     def connect(self):
         self.warning('not connected to db {}'.format(self.db.public_url))
@@ -297,6 +359,47 @@ class LabspyClient(Loggable):
             return [NotificationTrigger(i) for i in yaml.load(rfile)]
 
     # private
+    def _write_batch(self, items):
+        """
+            insert a batch of queued items in one transaction. called by the uploader thread. raises if the
+            database is not available so the batch is spooled. raises ``UploadDataError`` if the database rejected
+            the batch
+        """
+        db = self.db
+        with self.session_lock:
+            if not db.connected:
+                self.connect()
+            if not db.connected:
+                raise ConnectionError('not connected to {}'.format(db.public_url))
+
+            autocommit, reraise = db.autocommit, db.reraise
+            db.autocommit, db.reraise = True, True
+            try:
+                with db.session_ctx(use_parent_session=False) as sess:
+                    for kind, args in items:
+                        if kind == 'measurement':
+                            dev, tag, val, unit, ts = args
+                            db.add_measurement(dev, tag, val, unit, pub_date=datetime.fromtimestamp(ts))
+                        elif kind == 'connection':
+                            ts, appname, user, devname, com, addr, status = args
+                            db.set_connection(datetime.fromtimestamp(ts), appname, user, devname, com, addr,
+                                              status)
+                    sess.commit()
+            except (OperationalError, DisconnectionError):
+                db.reset_connection()
+                raise
+            except Exception as e:
+                raise UploadDataError(e)
+            finally:
+                db.autocommit, db.reraise = autocommit, reraise
+
+        for kind, args in items:
+            if kind == 'measurement':
+                try:
+                    self._check_notifications(*args[:4])
+                except BaseException as e:
+                    self.debug('failed checking notifications. {}'.format(e))
+
     def _get_configuration(self):
         """
         eg;
@@ -324,6 +427,26 @@ class LabspyClient(Loggable):
 
         return config
 
+    def _get_store(self, dev):
+        store = self._stores.get(dev)
+        if store is None:
+            store = self._stores[dev] = TimeSeriesStore(os.path.join(paths.device_scan_dir, dev))
+        return store
+
+    def _get_trigger_value(self, nt, dev, tag):
+        """
+            return the ``stat`` of the values of ``tag`` recorded by the dashboard over the trigger's period
+        """
+        end = time.time()
+        try:
+            summary = self.get_process_summary(dev, tag, end - nt.period, end)
+        except BaseException as e:
+            self.debug('failed reading recorded values for {} {}. {}'.format(dev, tag, e))
+            return
+
+        if summary:
+            return summary[SUMMARY_STATS.index(nt.stat)]
+
     def _check_notifications(self, dev, tag, val, unit):
         if not os.path.isfile(paths.notification_triggers):
             self.debug('no notification trigger file available. {}'.format(
@@ -332,10 +455,16 @@ class LabspyClient(Loggable):
 
         ns = []
         for nt in self.notification_triggers:
-            self.debug('testing {} {} {} {}'.format(dev, tag, val, unit))
-            if nt.test(dev, tag, val, unit):
+            v = val
+            if nt.period:
+                v = self._get_trigger_value(nt, dev, tag)
+                if v is None:
+                    continue
+
+            self.debug('testing {} {} {} {}'.format(dev, tag, v, unit))
+            if nt.test(dev, tag, v, unit):
                 self.debug('notification triggered')
-                ns.append(nt.notify(val, unit))
+                ns.append(nt.notify(v, unit))
         self.debug('notifications: {}'.format(ns))
         if ns:
             emailer = self.application.get_service(
@@ -65,7 +65,7 @@ class LabspyDatabaseAdapter(DatabaseAdapter):
             conn = self.get_connection(appname, devname)
         except SQLAlchemyError as e:
             self.warning('Error getting connection {}.{} exception: {}'.format(appname, devname, e))
-            return
+            raise
 
         add = False
         if conn is None:
@@ -97,12 +97,14 @@ class LabspyDatabaseAdapter(DatabaseAdapter):
         dev = Device(name=dev)
         return self._add_item(dev)
 
-    def add_measurement(self, dev, name, value, unit):
+    def add_measurement(self, dev, name, value, unit, pub_date=None):
         pinfo = self.get_process_info(dev, name)
         # if not pinfo:
         #     pinfo = self.add_process_info(dev, name, unit)
         if pinfo:
             measurement = Measurement(value=value)
+            if pub_date is not None:
+                measurement.pub_date = pub_date
             measurement.process = pinfo
             return self._add_item(measurement)
         else:
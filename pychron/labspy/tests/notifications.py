@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pychron.dashboard.timeseries_store import TimeSeriesStore
+from pychron.labspy.client import LabspyClient, NotificationTrigger
+from pychron.paths import paths
+
+
+class NotificationTriggerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self._device_scan_dir = paths.device_scan_dir
+        paths.device_scan_dir = self.root
+
+        store = TimeSeriesStore(os.path.join(self.root, 'Environmental'))
+        now = time.time()
+        for i, v in enumerate((20, 22, 30)):
+            store.append('temperature', v, now - 100 + i)
+        store.close()
+
+        self.client = LabspyClient(bind=False)
+
+    def tearDown(self):
+        paths.device_scan_dir = self._device_scan_dir
+        shutil.rmtree(self.root)
+
+    def _trigger(self, **kw):
+        params = dict(device='Environmental', tag='temperature', cmp='x>25', units='C')
+        params.update(kw)
+        return NotificationTrigger(params)
+
+    def test_process_summary(self):
+        vmin, vmean, vmax, n = self.client.get_process_summary('Environmental', 'temperature')
+        self.assertEqual((vmin, vmax, n), (20, 30, 3))
+        self.assertAlmostEqual(vmean, 24)
+
+    def test_period_mean(self):
+        nt = self._trigger(period=600)
+        v = self.client._get_trigger_value(nt, 'Environmental', 'temperature')
+        self.assertAlmostEqual(v, 24)
+        self.assertFalse(nt.test('Environmental', 'temperature', v, 'C'))
+
+    def test_period_max(self):
+        nt = self._trigger(period=600, stat='max')
+        v = self.client._get_trigger_value(nt, 'Environmental', 'temperature')
+        self.assertEqual(v, 30)
+        self.assertTrue(nt.test('Environmental', 'temperature', v, 'C'))
+
+    def test_period_no_samples(self):
+        nt = self._trigger(period=600)
+        self.assertIsNone(self.client._get_trigger_value(nt, 'Environmental', 'humidity'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.labspy.uploader import BufferedUploader, UploadDataError
+
+
+class BufferedUploaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.spool = os.path.join(self.root, 'spool.jsonl')
+        self.batches = []
+        self.fail = False
+        self.bad = ()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, items):
+        if self.fail:
+            raise ConnectionError('offline')
+        if any(args[0] in self.bad for kind, args in items):
+            raise UploadDataError('bad value')
+        self.batches.append(items)
+
+    def _uploader(self, **kw):
+        return BufferedUploader(self._write, self.spool, flush_period=0.05, **kw)
+
+    def _written(self):
+        return [args[0] for b in self.batches for kind, args in b]
+
+    def test_upload(self):
+        up = self._uploader()
+        for i in range(3):
+            up.put('measurement', i)
+        up.stop()
+
+        self.assertEqual(self._written(), [0, 1, 2])
+        self.assertEqual(up.stats()['uploaded'], 3)
+        self.assertFalse(os.path.isfile(self.spool))
+
+    def test_batch_size(self):
+        up = self._uploader(batch_size=2)
+        for i in range(5):
+            up.put('measurement', i)
+        up.stop()
+
+        self.assertEqual(self._written(), [0, 1, 2, 3, 4])
+        self.assertTrue(all(len(b) <= 2 for b in self.batches))
+
+    def test_spool_and_replay(self):
+        self.fail = True
+        up = self._uploader()
+        for i in range(3):
+            up.put('measurement', i)
+        up.stop()
+
+        st = up.stats()
+        self.assertEqual(st['spool_depth'], 3)
+        self.assertEqual(st['failed_batches'], 1)
+        self.assertEqual(self.batches, [])
+
+        # restart with the database available
+        self.fail = False
+        up = self._uploader()
+        self.assertEqual(up.stats()['spool_depth'], 3)
+        up.put('measurement', 3)
+        up.stop()
+
+        self.assertEqual(self._written(), [0, 1, 2, 3])
+        st = up.stats()
+        self.assertEqual(st['spool_depth'], 0)
+        self.assertEqual(st['replayed'], 4)
+        self.assertFalse(os.path.isfile(self.spool))
+
+    def test_retry_period(self):
+        self.fail = True
+        up = self._uploader(retry_period=60)
+        up.put('measurement', 0)
+        up.stop()
+
+        # the database is not tried again until the retry period has passed
+        self.fail = False
+        up.put('measurement', 1)
+        up.stop()
+        self.assertEqual(self.batches, [])
+        self.assertEqual(up.stats()['spool_depth'], 2)
+
+        up.flush()
+        self.assertEqual(self._written(), [0, 1])
+
+    def test_invalid_spool_line(self):
+        with open(self.spool, 'w') as wfile:
+            wfile.write('["measurement", [0]]\n["measurem\n')
+
+        up = self._uploader()
+        up.flush()
+        self.assertEqual(self._written(), [0])
+
+        st = up.stats()
+        self.assertEqual(st['replayed'], 1)
+        self.assertEqual(st['uploaded'], 1)
+        self.assertEqual(st['rejected'], 1)
+        self.assertTrue(os.path.isfile(up.dead_letter_path))
+
+    def test_rejected(self):
+        self.bad = (1, 3)
+        up = self._uploader()
+        for i in range(5):
+            up.put('measurement', i)
+        up.stop()
+
+        # only the rejected items are dead lettered and the database is not treated as unavailable
+        self.assertEqual(self._written(), [0, 2, 4])
+        st = up.stats()
+        self.assertEqual(st['uploaded'], 3)
+        self.assertEqual(st['rejected'], 2)
+        self.assertEqual(st['failed_batches'], 0)
+        self.assertEqual(st['spool_depth'], 0)
+
+        with open(up.dead_letter_path, 'r') as rfile:
+            self.assertEqual([json.loads(line)['args'] for line in rfile], [[1], [3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
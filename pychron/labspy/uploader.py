@@ -0,0 +1,287 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import json
+import logging
+import os
+import time
+from queue import Queue, Empty
+from threading import Thread, Lock
+
+# ============= local library imports  ==========================
+
+_STOP = object()
+
+logger = logging.getLogger('LabspyUploader')
+
+
+class UploadDataError(Exception):
+    """
+        raised by ``write`` when the database rejected the data itself, e.g. an integrity or data error.
+        retrying will not help so the items are moved to the dead letter file
+    """
+
+
+class BufferedUploader(object):
+    """
+        upload items to labspy from a background thread.
+
+        ``put`` only queues the item so the caller never waits on the database. the upload thread collects
+        items until ``batch_size`` items are queued or ``flush_period`` seconds have passed and hands the batch
+        to ``write``. ``write`` should insert the whole batch in one session and raise if it fails.
+
+        a batch that fails is appended to the spool file and the database is not tried again for
+        ``retry_period`` seconds. while the spool is not empty new batches are appended to it as well so that
+        the spool is replayed in the original order once the database is reachable.
+
+        a batch rejected with ``UploadDataError`` is written again one item at a time and only the rejected
+        items are appended to the dead letter file
+    """
+
+    def __init__(self, write, spool_path, dead_letter_path=None, batch_size=50, flush_period=2, retry_period=30):
+        self.write = write
+        self.spool_path = spool_path
+        if dead_letter_path is None:
+            dead_letter_path = '{}.rejected'.format(spool_path)
+        self.dead_letter_path = dead_letter_path
+        self.batch_size = batch_size
+        self.flush_period = flush_period
+        self.retry_period = retry_period
+
+        self.nuploaded = 0
+        self.nspooled = 0
+        self.nreplayed = 0
+        self.nrejected = 0
+        self.nfailed_batches = 0
+        self.last_error = None
+        self.last_flush = None
+
+        self._queue = Queue()
+        self._thread = None
+        self._lock = Lock()
+        self._next_retry = 0
+        self._spool_depth = self._count_spool()
+
+    def put(self, kind, *args):
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name='LabspyUploader')
+                self._thread.daemon = True
+                self._thread.start()
+
+        self._queue.put((kind, args))
+
+    def stop(self, timeout=10):
+        """
+            upload or spool the queued items and stop the upload thread
+        """
+        with self._lock:
+            t, self._thread = self._thread, None
+
+        if t is not None:
+            self._queue.put(_STOP)
+            t.join(timeout)
+
+    def flush(self):
+        """
+            upload the queued items and replay the spool on the caller's thread. used when the upload thread
+            is not running
+        """
+        items = []
+        while 1:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+            if item is not _STOP:
+                items.append(item)
+
+        self._next_retry = 0
+        self._flush(items)
+
+    def stats(self):
+        return {'queue_depth': self._queue.qsize(),
+                'spool_depth': self._spool_depth,
+                'uploaded': self.nuploaded,
+                'spooled': self.nspooled,
+                'replayed': self.nreplayed,
+                'rejected': self.nrejected,
+                'failed_batches': self.nfailed_batches,
+                'last_error': self.last_error,
+                'last_flush': self.last_flush}
+
+    # private
+    def _run(self):
+        alive = True
+        while alive:
+            items, alive = self._collect()
+            try:
+                self._flush(items)
+            except BaseException as e:
+                logger.warning('upload failed unexpectedly. {}'.format(e))
+
+    def _collect(self):
+        items = []
+        deadline = None
+        while len(items) < self.batch_size:
+            timeout = self.flush_period if deadline is None else max(0, deadline - time.time())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except Empty:
+                # return empty batches too so the spool is retried while nothing is being measured
+                break
+
+            if item is _STOP:
+                return items, False
+
+            items.append(item)
+            if deadline is None:
+                deadline = time.time() + self.flush_period
+
+        return items, True
+
+    def _flush(self, items):
+        if self._spool_depth:
+            if items:
+                self._spool(items)
+            self._replay()
+        elif items:
+            if time.time() < self._next_retry:
+                self._spool(items)
+            else:
+                _, rest = self._write(items)
+                if rest:
+                    self._spool(rest)
+
+        self.last_flush = time.time()
+
+    def _write(self, items):
+        """
+            return the number of items uploaded and the items still to be uploaded. the items are not empty only if
+            the database is not available
+        """
+        try:
+            self.write(items)
+        except UploadDataError as e:
+            self.last_error = str(e)
+            if len(items) == 1:
+                self._dead_letter(items, e)
+                return 0, []
+
+            # find the bad items
+            n = 0
+            for i, item in enumerate(items):
+                ni, rest = self._write([item])
+                if rest:
+                    return n, items[i:]
+                n += ni
+            return n, []
+
+        except BaseException as e:
+            self.nfailed_batches += 1
+            self.last_error = str(e)
+            self._next_retry = time.time() + self.retry_period
+            logger.warning('upload failed. spooling to {}. {}'.format(self.spool_path, e))
+            return 0, items
+
+        self.nuploaded += len(items)
+        return len(items), []
+
+    def _replay(self):
+        if time.time() < self._next_retry:
+            return
+
+        with open(self.spool_path, 'r') as rfile:
+            lines = [line for line in rfile if line.strip()]
+
+        bs = self.batch_size
+        for i in range(0, len(lines), bs):
+            items = []
+            for line in lines[i:i + bs]:
+                item = self._decode(line)
+                if item:
+                    items.append(item)
+                else:
+                    self._dead_letter_line(line)
+
+            n, rest = self._write(items) if items else (0, [])
+            self.nreplayed += n
+            if rest:
+                self._rewrite_spool([self._encode(item) for item in rest] + lines[i + bs:])
+                return
+
+        os.remove(self.spool_path)
+        self._spool_depth = 0
+
+    def _spool(self, items):
+        d = os.path.dirname(self.spool_path)
+        if d and not os.path.isdir(d):
+            os.makedirs(d)
+
+        self._append(self.spool_path, [self._encode(item) for item in items])
+        self.nspooled += len(items)
+        self._spool_depth += len(items)
+
+    def _dead_letter(self, items, err):
+        logger.warning('upload rejected. moving {} items to {}. {}'.format(len(items), self.dead_letter_path, err))
+        self._append(self.dead_letter_path, ['{}\n'.format(json.dumps({'kind': kind,
+                                                                       'args': list(args),
+                                                                       'error': str(err)}))
+                                             for kind, args in items])
+        self.nrejected += len(items)
+
+    def _dead_letter_line(self, line):
+        # partial line left by an interrupted write
+        logger.warning('invalid spool line "{}". moving to {}'.format(line.strip(), self.dead_letter_path))
+        self._append(self.dead_letter_path, ['{}\n'.format(json.dumps({'line': line.strip(),
+                                                                       'error': 'invalid spool line'}))])
+        self.nrejected += 1
+
+    def _append(self, p, lines):
+        d = os.path.dirname(p)
+        if d and not os.path.isdir(d):
+            os.makedirs(d)
+
+        with open(p, 'a') as wfile:
+            wfile.writelines(lines)
+
+    def _rewrite_spool(self, lines):
+        tmp = '{}.tmp'.format(self.spool_path)
+        with open(tmp, 'w') as wfile:
+            wfile.writelines(lines)
+        os.replace(tmp, self.spool_path)
+        self._spool_depth = len(lines)
+
+    def _encode(self, item):
+        kind, args = item
+        return '{}\n'.format(json.dumps([kind, list(args)]))
+
+    def _decode(self, line):
+        try:
+            kind, args = json.loads(line)
+        except (ValueError, TypeError):
+            return
+        return kind, tuple(args)
+
+    def _count_spool(self):
+        if os.path.isfile(self.spool_path):
+            with open(self.spool_path, 'r') as rfile:
+                return sum(1 for line in rfile if line.strip())
+        return 0
+
+# ============= EOF =============================================
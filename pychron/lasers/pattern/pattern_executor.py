@@ -30,6 +30,7 @@ from pychron.core.ui.thread import Thread, sleep
 from pychron.envisage.view_util import open_view
 from pychron.hardware.motion_controller import PositionError, TargetPositionError
 from pychron.lasers.pattern.patternable import Patternable
+from pychron.mv.lum_peak_pipeline import PeakRenderer
 from pychron.paths import paths
 from pychron.pychron_constants import NULL_STR
 
@@ -347,33 +348,17 @@ class PatternExecutor(Patternable):
         # imgplot, imgplot2, imgplot3 = pattern.setup_execution_graph()
         # imgplot, imgplot2 = pattern.setup_execution_graph()
         imgplot, imgplot2 = pattern.setup_execution_graph(nplots=2)
-        cx, cy = pattern.cx, pattern.cy
 
         sm = lm.stage_manager
-
-        linear_move = controller.linear_move
-        in_motion = controller.in_motion
-        find_lum_peak = sm.find_lum_peak
         pxpermm = sm.pxpermm
 
         set_data = imgplot.data.set_data
         set_data2 = imgplot2.data.set_data
         # set_data3 = imgplot3.data.set_data
 
-        duration = pattern.duration
-        sat_threshold = pattern.saturation_threshold
-        total_duration = pattern.total_duration
-        min_distance = pattern.min_distance
-        aggressiveness = pattern.aggressiveness
         update_period = pattern.update_period / 1000.
-        move_threshold = pattern.move_threshold
         blur = pattern.blur
-        px, py = cx, cy
-        ncx, ncy = cx, cy
 
-        point_gen = None
-        cnt = 0
-        # peak = None
         oimg = sm.get_preprocessed_src()
         pos_img = zeros_like(oimg, dtype='int16')
         per_img = zeros_like(oimg, dtype='int16')
@@ -385,43 +370,59 @@ class PatternExecutor(Patternable):
         per_img[perimeter_circle] = 50
         set_data('imagedata', gray2rgb(per_img.astype(uint8)))
 
+        # peaks are found on every camera frame by the pipeline thread. the display is updated separately
+        # at most every update_period
+        renderer = PeakRenderer()
+
+        def display(src, peak):
+            set_data2('imagedata', renderer.render(src, peak))
+
+        pipeline = sm.make_lum_peak_pipeline(blur=blur, display=display, display_period=update_period)
+        pipeline.start()
+        try:
+            self._dragonfly_iterations(st, pattern, pipeline, controller, pxpermm, set_data, pos_img, per_img,
+                                       color)
+        finally:
+            pipeline.stop()
+            self.debug('dragonfly frames={} processed={}'.format(pipeline.nframes, pipeline.nprocessed))
+
+        self.debug('dragonfly complete')
+        controller.block()
+
+    def _dragonfly_iterations(self, st, pattern, pipeline, controller, pxpermm, set_data, pos_img, per_img, color):
+        cx, cy = pattern.cx, pattern.cy
+
+        linear_move = controller.linear_move
+        in_motion = controller.in_motion
+
+        duration = pattern.duration
+        sat_threshold = pattern.saturation_threshold
+        total_duration = pattern.total_duration
+        aggressiveness = pattern.aggressiveness
+        update_period = pattern.update_period / 1000.
+        move_threshold = pattern.move_threshold
+        px, py = cx, cy
+        ncx, ncy = cx, cy
+        img_h, img_w = pos_img.shape
+
+        point_gen = None
+        cnt = 0
         while time.time() - st < total_duration:
             if not self._alive:
                 break
 
-            sats = []
-            pts = []
             ist = time.time()
             npt = None
             self.debug('starting iteration={}, in_motion={}'.format(cnt, in_motion()))
+            pipeline.clear()
             while time.time() - ist < duration or in_motion():
-                args = find_lum_peak(min_distance, blur)
-
-                if args is None:
-                    sleep(update_period/5)
-                    continue
-
+                if not self._alive:
+                    break
                 sleep(update_period)
 
-                pt, peakcol, peakrow, peak_img, sat, src = args
-
-                sats.append(sat)
-                # if peak is None:
-                #     peak = peak_img
-                # else:
-                #     peak = ((peak.astype('int16') - 2) + peak_img).clip(0, 255)
-
-                # img = gray2rgb(peak).astype(uint8)
-                src = gray2rgb(src).astype(uint8)
-                if pt:
-                    pts.append(pt)
-                    c = circle(peakrow, peakcol, 2)
-                    # img[c] = (255, 0, 0)
-                    src[c] = (255, 0, 0)
-
-                # set_data('imagedata', src)
-                set_data2('imagedata', src)
-                # set_data('imagedata', img)
+            peaks = pipeline.drain()
+            sats = [p.saturation for p in peaks]
+            pts = [p.pt for p in peaks]
 
             self.debug('iteration {} finished, npts={}'.format(cnt, len(pts)))
 
@@ -531,9 +532,6 @@ class PatternExecutor(Patternable):
 
             cnt += 1
 
-        self.debug('dragonfly complete')
-        controller.block()
-
     def _hill_climber(self, st, controller, pattern):
         g = pattern.execution_graph
         imgplot, cp = pattern.setup_execution_graph()
@@ -37,6 +37,7 @@ from pychron.lasers.points.points_programmer import PointsProgrammer
 from pychron.managers.motion_controller_managers.motion_controller_manager \
     import MotionControllerManager
 from pychron.paths import paths
+from pychron.stage.route_optimizer import optimize_route
 from pychron.stage.stage_manager import BaseStageManager
 
 
@@ -350,8 +351,41 @@ class StageManager(BaseStageManager):
             smap = self.stage_map
 
             xx, yy = smap.map_to_uncalibration((x, y), ca.center, ca.rotation)
-            return next((hole for hole in smap.sample_holes
-                         if abs(hole.x - xx) < tol and abs(hole.y - yy) < tol), None)
+            return smap.get_nearest_hole(xx, yy, tol)
+
+    def get_hole_route(self, keys):
+        """
+            return the hole ``keys`` ordered to minimize the stage travel time from the current position using
+            the x and y axes velocity and acceleration. the holes are ordered by distance if the axes velocities
+            are not available
+        """
+        holes, invalid = [], []
+        for k in keys:
+            pos = self.get_hole_xy(k) if self.get_hole(k) is not None else None
+            if pos is None:
+                invalid.append(k)
+            else:
+                holes.append((k, pos))
+
+        sc = self.stage_controller
+        start = sc.x, sc.y
+        if sc.xy_swapped():
+            start = start[1], start[0]
+
+        axes = sc.axes
+        try:
+            velocity = axes['x'].velocity, axes['y'].velocity
+            acceleration = axes['x'].acceleration, axes['y'].acceleration
+        except KeyError:
+            velocity, acceleration = None, None
+
+        if velocity is None or not all(velocity):
+            velocity, acceleration = None, None
+        elif not all(acceleration):
+            acceleration = None
+
+        order = optimize_route([p for k, p in holes], velocity=velocity, acceleration=acceleration, start=start)
+        return [holes[i][0] for i in order] + invalid
 
     def get_hole_xy(self, key):
         pos = self.stage_map.get_hole_pos(key)
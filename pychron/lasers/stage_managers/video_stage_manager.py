@@ -432,6 +432,25 @@ class VideoStageManager(StageManager):
                                     blur=blur,
                                     min_distance=min_distance, **kw)
 
+    def make_lum_peak_pipeline(self, blur=1, **kw):
+        """
+            return a LumPeakPipeline that processes every new video frame cropped and masked like
+            ``find_lum_peak``
+        """
+        from pychron.mv.lum_peak_pipeline import LumPeakPipeline
+
+        ld = self.lumen_detector
+        ld.pxpermm = self.pxpermm
+        cropdim = self.stage_map.g_dimension * 2.5
+
+        def crop(frame):
+            offx, offy = self.canvas.get_screen_offset()
+            return ld.crop(frame, cropdim, cropdim, offx, offy, verbose=False)
+
+        return LumPeakPipeline(self.video.get_cached_frame, crop=crop,
+                               mask_radius=ld.mask_radius * self.pxpermm,
+                               blur=blur, **kw)
+
     def get_brightness(self, **kw):
         ld = self.lumen_detector
         src = self._get_preprocessed_src()
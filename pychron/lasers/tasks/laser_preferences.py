@@ -65,6 +65,9 @@ class FusionsLaserPreferences(LaserPreferences):
     autocenter_search_step = Int
     autocenter_search_n = Int
     autocenter_search_width = Int
+    autocenter_search_strategy = Enum('linear', 'coarse_to_fine')
+    autocenter_search_pyramid_levels = Int(1)
+    autocenter_search_workers = Int(4)
 
     render_with_markup = Bool(False)
     crosshairs_offsetx = Float(0)
@@ -162,6 +165,12 @@ class FusionsLaserPreferencesPane(PreferencesPane):
                                     VGroup(Item('autocenter_search_step', label='Step'),
                                            Item('autocenter_search_n', label='N'),
                                            Item('autocenter_search_width', label='Width'),
+                                           Item('autocenter_search_strategy', label='Strategy'),
+                                           Item('autocenter_search_pyramid_levels', label='Pyramid Levels',
+                                                tooltip='Number of times the image is halved for the coarse pass',
+                                                enabled_when='autocenter_search_strategy=="coarse_to_fine"'),
+                                           Item('autocenter_search_workers', label='Workers',
+                                                enabled_when='autocenter_search_strategy=="coarse_to_fine"'),
 
                                            Item('autocenter_use_adaptive_threshold', label='Use Adaptive Threshold'),
                                            Item('autocenter_blocksize', label='Block Size',
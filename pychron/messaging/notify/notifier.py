@@ -89,6 +89,11 @@ class Notifier(Broadcaster):
                         elif req in self._handlers:
                             func = self._handlers[req]
                             sock.send(func())
+                        else:
+                            # requests with arguments e.g. "history <tag> <start> <end> <max_points>"
+                            name, _, args = req.partition(' ')
+                            if args and name in self._handlers:
+                                sock.send(self._handlers[name](args))
                 except zmq.ZMQBaseError:
                     pass
 
@@ -17,13 +17,18 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
+import time
+from collections import deque
+
 from apptools.preferences.preference_binding import bind_preference
-from traits.api import Float, Button, Bool, Any, Instance, Event, Int
+from traits.api import Float, Button, Bool, Any, Instance, Event, Int, Enum
 from traitsui.api import View, Item, HGroup, RangeEditor
 from math import ceil
 from pychron.image.standalone_image import FrameImage
 from pychron.mv.machine_vision_manager import MachineVisionManager, view_image
 
+MAX_TIMINGS = 500
+
 
 class AutoCenterManager(MachineVisionManager):
     canvas = Any
@@ -46,6 +51,12 @@ class AutoCenterManager(MachineVisionManager):
     search_width = Int
     blocksize = Int
     blocksize_step = Int
+    search_strategy = Enum('linear', 'coarse_to_fine')
+    search_pyramid_levels = Int(1)
+    search_workers = Int(4)
+
+    # one entry per autocenter. used to compare search strategies
+    timings = Instance(deque)
 
     display_image = Instance(FrameImage, ())
 
@@ -59,6 +70,9 @@ class AutoCenterManager(MachineVisionManager):
         bind_preference(self, 'search_width', '{}.autocenter_search_width'.format(pref_id))
         bind_preference(self, 'blocksize', '{}.autocenter_blocksize'.format(pref_id))
         bind_preference(self, 'blocksize_step', '{}.autocenter_blocksize_step'.format(pref_id))
+        bind_preference(self, 'search_strategy', '{}.autocenter_search_strategy'.format(pref_id))
+        bind_preference(self, 'search_pyramid_levels', '{}.autocenter_search_pyramid_levels'.format(pref_id))
+        bind_preference(self, 'search_workers', '{}.autocenter_search_workers'.format(pref_id))
 
     def calculate_new_center(self, cx, cy, offx, offy, dim=1.0, shape='circle'):
         frame = self.new_image_frame()
@@ -79,8 +93,14 @@ class AutoCenterManager(MachineVisionManager):
                       width=self.search_width,
                       blocksize=self.blocksize,
                       blocksize_step=self.blocksize_step,
-                      use_adaptive_threshold=self.use_adaptive_threshold)
+                      use_adaptive_threshold=self.use_adaptive_threshold,
+                      strategy=self.search_strategy,
+                      pyramid_levels=self.search_pyramid_levels,
+                      workers=self.search_workers)
+
+        st = time.time()
         dx, dy = loc.find(im, frame, dim=dim, preprocess=preprop, search=search)
+        self._record_timing(loc, time.time() - st)
 
         if dx is None and dy is None:
             return
@@ -93,9 +113,21 @@ class AutoCenterManager(MachineVisionManager):
             return cx + mdx, cy + mdy
 
     # private
+    def _record_timing(self, loc, duration):
+        timing = {'timestamp': time.time(), 'total': duration}
+        if loc.last_search_timing:
+            timing.update(loc.last_search_timing)
+
+        self.info('autocenter strategy={} total={:0.3f}s'.format(timing.get('strategy', self.search_strategy),
+                                                                  duration))
+        self.timings.append(timing)
+
     def _get_locator(self, *args, **kw):
         raise NotImplementedError
 
+    def _timings_default(self):
+        return deque(maxlen=MAX_TIMINGS)
+
     # handlers
     def _configure_button_fired(self):
         w = h = self.crop_size * self.pxpermm
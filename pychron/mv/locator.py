@@ -21,6 +21,7 @@ from traits.api import Float
 
 from numpy import array, histogram, argmax, zeros, asarray, ones_like, \
     nonzero, max, arange, argsort, invert, median, mean, zeros_like
+from concurrent.futures import ThreadPoolExecutor
 from operator import attrgetter
 from skimage.morphology import watershed
 from skimage.draw import polygon, circle, circle_perimeter, circle_perimeter_aa
@@ -65,6 +66,10 @@ class Locator(Loggable):
     step_signal = None
     pixel_depth = 255
 
+    search_strategy = 'linear'
+    search_workers = 4
+    last_search_timing = None
+
     def wait(self):
         if self.step_signal:
             self.step_signal.wait()
@@ -159,63 +164,186 @@ class Locator(Loggable):
         if inverted:
             src = invert(src)
 
+        w = search.get('width', 10)
         start = search.get('start')
         if start is None:
-            w = search.get('width', 10)
             start = int(mean(src[src > 0])) - search.get('start_offset_scalar', 3) * w
 
         step = search.get('step', 2)
         n = search.get('n', 20)
+        windows = self._get_threshold_windows(start, step, n, w, inverted)
 
-        blocksize_step = search.get('blocksize_step', 5)
-        seg = RegionSegmenter(use_adaptive_threshold=search.get('use_adaptive_threshold', False),
-                              blocksize=search.get('blocksize', 20))
         fa = self._get_filter_target_area(shape, dim)
-        phigh, plow = None, None
 
+        strategy = search.get('strategy', self.search_strategy)
+        st = time.time()
+        if strategy == 'coarse_to_fine':
+            targets, nevaluated = self._coarse_to_fine_search(image, frame, src, dim, windows, fa, search,
+                                                              filter_targets, convexity_filter, set_image)
+        else:
+            targets, nevaluated = self._linear_search(image, frame, src, dim, windows, fa, search,
+                                                      filter_targets, convexity_filter, set_image)
+
+        self._record_search_timing(strategy, time.time() - st, nevaluated, len(windows), bool(targets))
+        return targets
+
+    # ===============================================================================
+    # search
+    # ===============================================================================
+    def _get_threshold_windows(self, start, step, n, width, inverted=False):
+        """
+            return the ordered list of (low, high) threshold windows to try.
+
+            windows widen by ``width`` every ``n`` steps. a repeated window ends the current sweep
+        """
+        windows = []
+        phigh, plow = None, None
         for j in range(n):
-            ww = w * (j + 1)
-            print('start', start, ww)
+            ww = width * (j + 1)
             for i in range(n):
-
                 low = max((0, start + i * step - ww))
                 high = max((1, min((255, start + i * step + ww))))
                 if inverted:
-                    low = 255-low
-                    high = 255-high
-
-                seg.threshold_low = low
-                seg.threshold_high = high
+                    low = 255 - low
+                    high = 255 - high
 
-                if seg.threshold_low == plow and seg.threshold_high == phigh:
+                if low == plow and high == phigh:
                     break
 
-                plow = seg.threshold_low
-                phigh = seg.threshold_high
+                plow, phigh = low, high
+                windows.append((low, high))
+        return windows
+
+    def _linear_search(self, image, frame, src, dim, windows, fa, search,
+                       filter_targets, convexity_filter, set_image):
+        """
+            try each threshold window in order. the display image is updated on every attempt
+        """
+        blocksize = search.get('blocksize', 20)
+        blocksize_step = search.get('blocksize_step', 5)
+        adaptive = search.get('use_adaptive_threshold', False)
+
+        for i, window in enumerate(windows):
+            nf, targets = self._segment_window(src, window, blocksize + i * blocksize_step, adaptive)
+            if set_image and image is not None:
+                image.set_frame(nf)
 
-                nsrc = seg.segment(src)
-                seg.blocksize += blocksize_step
+            targets = self._accept_targets(image, frame, dim, targets, fa, filter_targets, convexity_filter)
+            if targets:
+                return targets, i + 1
 
-                nf = colorspace(nsrc)
+        return None, len(windows)
 
-                # draw contours
-                targets = self._find_polygon_targets(nsrc, frame=nf)
-                if set_image and image is not None:
-                    image.set_frame(nf)
+    def _coarse_to_fine_search(self, image, frame, src, dim, windows, fa, search,
+                               filter_targets, convexity_filter, set_image):
+        """
+            1. screen every ``coarse_stride`` window on a downsampled copy of ``src``
+            2. refine around the first coarse hit at full resolution
 
-                if targets:
+            candidates are evaluated concurrently, one batch of ``workers`` windows at a time, and the
+            search stops after the first batch that contains an acceptable window. results are taken in
+            window order so the outcome does not depend on thread scheduling.
+        """
+        blocksize = search.get('blocksize', 20)
+        blocksize_step = search.get('blocksize_step', 5)
+        adaptive = search.get('use_adaptive_threshold', False)
+        stride = max((1, search.get('coarse_stride', 4)))
+        levels = search.get('pyramid_levels', 1)
+        workers = max((1, search.get('workers', self.search_workers)))
+
+        scale = 2 ** levels
+        lsrc = src[::scale, ::scale]
+        mi, ma = fa[0] / scale ** 2, fa[1] / scale ** 2
+
+        def coarse_test(idx):
+            nf, targets = self._segment_window(lsrc, windows[idx],
+                                               int((blocksize + idx * blocksize_step) / scale),
+                                               adaptive)
+            return self._screen_targets(lsrc, targets, mi, ma, filter_targets, convexity_filter, scale)
+
+        def fine_test(idx):
+            nf, targets = self._segment_window(src, windows[idx], blocksize + idx * blocksize_step, adaptive)
+            targets = self._accept_targets(image, frame, dim, targets, fa, filter_targets, convexity_filter)
+            return nf, targets
+
+        nevaluated = 0
+        nwindows = len(windows)
+        coarse = list(range(0, nwindows, stride))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for bi in range(0, len(coarse), workers):
+                batch = coarse[bi:bi + workers]
+                nevaluated += len(batch)
+                hits = [idx for idx, hit in zip(batch, executor.map(coarse_test, batch)) if hit]
+                for hit in hits:
+                    refine = list(range(max((0, hit - stride + 1)), min((nwindows, hit + stride))))
+                    for ri in range(0, len(refine), workers):
+                        rbatch = refine[ri:ri + workers]
+                        nevaluated += len(rbatch)
+                        for nf, targets in executor.map(fine_test, rbatch):
+                            if targets:
+                                if set_image and image is not None:
+                                    image.set_frame(nf)
+                                return targets, nevaluated
+
+        # the downsampled image can hide small or faint targets. try every window like the linear search
+        self.debug('coarse search failed. falling back to linear search')
+        targets, n = self._linear_search(image, frame, src, dim, windows, fa, search,
+                                         filter_targets, convexity_filter, set_image)
+        return targets, nevaluated + n
+
+    def _segment_window(self, src, window, blocksize, use_adaptive_threshold):
+        """
+            segment ``src`` using the threshold ``window`` and find the polygon targets
+
+            return the colorized segmented frame and the unfiltered targets
+        """
+        seg = RegionSegmenter(use_adaptive_threshold=use_adaptive_threshold,
+                              blocksize=max((1, blocksize)))
+        seg.threshold_low, seg.threshold_high = window
 
-                    # filter targets
-                    if filter_targets:
-                        targets = self._filter_targets(image, frame, dim, targets, fa)
-                    elif convexity_filter:
-                        # for t in targets:
-                        #     print t.convexity, t.area, t.min_enclose_area, t.perimeter_convexity
-                        targets = [t for t in targets if t.perimeter_convexity > convexity_filter]
+        nsrc = seg.segment(src)
+        nf = colorspace(nsrc)
 
-                if targets:
-                    return sorted(targets, key=attrgetter('area'), reverse=True)
-                    # time.sleep(0.5)
+        # draw contours
+        targets = self._find_polygon_targets(nsrc, frame=nf)
+        return nf, targets
+
+    def _accept_targets(self, image, frame, dim, targets, fa, filter_targets, convexity_filter):
+        if targets:
+            # filter targets
+            if filter_targets:
+                targets = self._filter_targets(image, frame, dim, targets, fa)
+            elif convexity_filter:
+                targets = [t for t in targets if t.perimeter_convexity > convexity_filter]
+
+        if targets:
+            return sorted(targets, key=attrgetter('area'), reverse=True)
+
+    def _screen_targets(self, src, targets, mi, ma, filter_targets, convexity_filter, scale=1):
+        """
+            cheap acceptance test used on downsampled images. ``src`` is downsampled by ``scale``
+
+            convexity is not required when filtering because the full resolution pass
+            can still split a concave target using watershed segmentation
+        """
+        if not targets:
+            return False
+
+        if filter_targets:
+            tol = 0.75 / scale
+            return any(ma > t.area > mi and self._near_center(t.centroid, src, tol=tol) for t in targets)
+        elif convexity_filter:
+            return any(t.perimeter_convexity > convexity_filter for t in targets)
+        return True
+
+    def _record_search_timing(self, strategy, duration, nevaluated, nwindows, found):
+        self.last_search_timing = {'strategy': strategy,
+                                   'duration': duration,
+                                   'nevaluated': nevaluated,
+                                   'nwindows': nwindows,
+                                   'found': found}
+        self.debug('{} search evaluated {}/{} windows in {:0.3f}s. found={}'.format(strategy, nevaluated,
+                                                                                  nwindows, duration, found))
 
     def _mask(self, src, radius=None):
 
@@ -0,0 +1,353 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import logging
+import time
+from threading import Thread, Lock, Event
+
+from numpy import empty, arange, ogrid, multiply, add, subtract, maximum, copyto, count_nonzero, unravel_index, \
+    greater, float64, uint8, pi
+from scipy.ndimage import gaussian_filter
+
+# ============= local library imports  ==========================
+
+# same weights as skimage.color.rgb2gray
+LUM_WEIGHTS = (0.2125, 0.7154, 0.0721)
+
+logger = logging.getLogger('LumPeakPipeline')
+
+
+class LumPeak(object):
+    """
+        result of processing one frame.
+
+        ``pt`` is the luminosity weighted centroid relative to the center of the frame in pixels and the
+        saturation. (cx, cy) is the centroid and (peak_row, peak_col) the brightest pixel of the blurred frame.
+        ``saturation`` and ``density`` are the mean luminance of the target as a fraction of the pixel depth and
+        in pixel values. ``area`` is the number of target pixels
+    """
+    __slots__ = ('timestamp', 'pt', 'cx', 'cy', 'peak_row', 'peak_col', 'saturation', 'density', 'area')
+
+    def __init__(self, timestamp, pt, cx, cy, peak_row, peak_col, saturation, density, area):
+        self.timestamp = timestamp
+        self.pt = pt
+        self.cx = cx
+        self.cy = cy
+        self.peak_row = peak_row
+        self.peak_col = peak_col
+        self.saturation = saturation
+        self.density = density
+        self.area = area
+
+
+class LumPeakKernel(object):
+    """
+        compute the luminosity peak, centroid and saturation of frames of one shape.
+
+        all intermediate images are preallocated so processing a frame does not allocate any full frame arrays.
+        pixels outside a circle of ``mask_radius`` pixels are ignored.
+
+        the target is the pixels of the blurred frame brighter than ``centroid_threshold`` times the peak. a
+        target is detected if the peak is at least ``min_contrast`` times the mean luminance, the target has
+        ``min_target_area`` pixels and the target pixels are not spread more than ``max_spread`` times a disk
+        of the same area. the centroid and saturation are computed from the target pixels
+    """
+
+    def __init__(self, shape, mask_radius=None, blur=1, centroid_threshold=0.5, pixel_depth=255,
+                 min_contrast=2, min_target_area=3, max_spread=4):
+        h, w = shape[:2]
+        self.shape = (h, w)
+        self.blur = blur
+        self.centroid_threshold = centroid_threshold
+        self.pixel_depth = pixel_depth
+        self.min_contrast = min_contrast
+        self.min_target_area = min_target_area
+        self.max_spread = max_spread
+
+        self._lum = empty((h, w), dtype=float64)
+        self._tmp = empty((h, w), dtype=float64)
+        self._blurred = empty((h, w), dtype=float64)
+        self._target = empty((h, w), dtype=bool)
+        self._rows = arange(h, dtype=float64)
+        self._cols = arange(w, dtype=float64)
+
+        yy, xx = ogrid[:h, :w]
+        if mask_radius:
+            mask = (yy - h / 2.) ** 2 + (xx - w / 2.) ** 2 <= mask_radius ** 2
+        else:
+            mask = (yy >= 0) & (xx >= 0)
+
+        self._mask = mask.astype(float64)
+        self.mask_area = max(1, int(mask.sum()))
+
+    def process(self, frame, timestamp=None):
+        """
+            return a LumPeak or None if no target was detected in the masked frame
+        """
+        lum = self._luminance(frame)
+        multiply(lum, self._mask, out=lum)
+
+        total = lum.sum()
+        if total <= 0:
+            return
+
+        b = self._blurred
+        if self.blur:
+            gaussian_filter(lum, self.blur, output=b)
+            multiply(b, self._mask, out=b)
+        else:
+            copyto(b, lum)
+
+        idx = b.argmax()
+        peak = b.flat[idx]
+        peak_row, peak_col = unravel_index(idx, b.shape)
+        if peak < self.min_contrast * total / self.mask_area:
+            return
+
+        thr = peak * self.centroid_threshold
+        target = self._target
+        greater(b, thr, out=target)
+        area = self._target_area(target)
+        if not area:
+            return
+
+        # mean luminance of the target. like the target area denominator of LumenDetector.find_lum_peak
+        tmp = self._tmp
+        multiply(lum, target, out=tmp)
+        ilum = tmp.sum()
+        saturation = ilum / (area * self.pixel_depth)
+        density = ilum / area
+
+        subtract(b, thr, out=b)
+        maximum(b, 0, out=b)
+        wtotal = b.sum()
+        if wtotal > 0:
+            cy = b.sum(axis=1).dot(self._rows) / wtotal
+            cx = b.sum(axis=0).dot(self._cols) / wtotal
+        else:
+            cy, cx = float(peak_row), float(peak_col)
+
+        h, w = self.shape
+        pt = cx - w / 2., cy - h / 2., saturation
+        return LumPeak(timestamp, pt, cx, cy, int(peak_row), int(peak_col), saturation, density, area)
+
+    def _target_area(self, target):
+        """
+            return the number of target pixels or 0 if the target is too small or too spread out. noise gives
+            target pixels scattered over the frame
+        """
+        area = count_nonzero(target)
+        if area < self.min_target_area:
+            return 0
+
+        rs = target.sum(axis=1)
+        cs = target.sum(axis=0)
+        rows, cols = self._rows, self._cols
+        var = (rs.dot(rows ** 2) - rs.dot(rows) ** 2 / area + cs.dot(cols ** 2) - cs.dot(cols) ** 2 / area) / area
+
+        # the mean squared distance from the center of a disk is area/(2 pi)
+        if 2 * pi * var > self.max_spread * area:
+            return 0
+        return area
+
+    def _luminance(self, frame):
+        lum = self._lum
+        if frame.ndim == 2:
+            copyto(lum, frame)
+        else:
+            wr, wg, wb = LUM_WEIGHTS
+            tmp = self._tmp
+            multiply(frame[..., 0], wr, out=lum)
+            multiply(frame[..., 1], wg, out=tmp)
+            add(lum, tmp, out=lum)
+            multiply(frame[..., 2], wb, out=tmp)
+            add(lum, tmp, out=lum)
+        return lum
+
+
+class PeakRenderer(object):
+    """
+        draw the peak marker into one of two preallocated rgb buffers. alternating the buffers lets the gui
+        draw one while the next is rendered
+    """
+
+    def __init__(self, radius=2, color=(255, 0, 0)):
+        self.radius = radius
+        self.color = color
+        self._buffers = None
+        self._idx = 0
+
+        r = radius
+        yy, xx = ogrid[-r:r + 1, -r:r + 1]
+        dy, dx = (yy ** 2 + xx ** 2 <= r ** 2).nonzero()
+        self._dy, self._dx = dy - r, dx - r
+
+    def render(self, frame, peak=None):
+        h, w = frame.shape[:2]
+        if self._buffers is None or self._buffers[0].shape[:2] != (h, w):
+            self._buffers = [empty((h, w, 3), dtype=uint8) for _ in range(2)]
+
+        self._idx = (self._idx + 1) % 2
+        out = self._buffers[self._idx]
+        if frame.ndim == 2:
+            copyto(out, frame[..., None], casting='unsafe')
+        else:
+            copyto(out, frame[..., :3], casting='unsafe')
+
+        if peak is not None:
+            rows = self._dy + peak.peak_row
+            cols = self._dx + peak.peak_col
+            ok = (rows >= 0) & (rows < h) & (cols >= 0) & (cols < w)
+            out[rows[ok], cols[ok]] = self.color
+        return out
+
+
+class LumPeakPipeline(object):
+    """
+        process every new camera frame on a dedicated thread.
+
+        ``get_frame`` returns the latest frame. a frame is processed once, when ``get_frame`` returns a new
+        object. ``crop`` is applied to the frame before processing.
+
+        the results are collected until ``drain`` is called. ``display(frame, peak)`` is called from a separate
+        thread at most every ``display_period`` seconds with the latest frame so rendering never delays
+        the peak detection
+    """
+
+    def __init__(self, get_frame, crop=None, mask_radius=None, blur=1, centroid_threshold=0.5,
+                 pixel_depth=255, display=None, display_period=0.1, poll_period=0.002):
+        self.get_frame = get_frame
+        self.crop = crop
+        self.mask_radius = mask_radius
+        self.blur = blur
+        self.centroid_threshold = centroid_threshold
+        self.pixel_depth = pixel_depth
+        self.display = display
+        self.display_period = display_period
+        self.poll_period = poll_period
+
+        self.nframes = 0
+        self.nprocessed = 0
+
+        self._kernel = None
+        self._results = []
+        self._latest = None
+        self._lock = Lock()
+        self._new_result = Event()
+        self._stop = Event()
+        self._threads = []
+
+    def start(self):
+        self._stop.clear()
+        self._threads = [Thread(target=self._run, name='LumPeakPipeline')]
+        if self.display:
+            self._threads.append(Thread(target=self._run_display, name='LumPeakDisplay'))
+
+        for t in self._threads:
+            t.daemon = True
+            t.start()
+
+    def stop(self, timeout=1):
+        self._stop.set()
+        self._new_result.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    def clear(self):
+        with self._lock:
+            self._results = []
+
+    def drain(self):
+        """
+            return the results collected since the last ``clear`` or ``drain``
+        """
+        with self._lock:
+            rs, self._results = self._results, []
+        return rs
+
+    def latest(self):
+        """
+            return the (frame, peak) of the last processed frame
+        """
+        return self._latest
+
+    def wait(self, timeout=None):
+        """
+            wait for the next processed frame. return its (frame, peak) or None after ``timeout``
+        """
+        self._new_result.clear()
+        if self._new_result.wait(timeout):
+            return self._latest
+
+    def process(self, frame, timestamp=None):
+        """
+            process one frame on the calling thread
+        """
+        if self.crop:
+            frame = self.crop(frame)
+
+        k = self._kernel
+        if k is None or k.shape != frame.shape[:2]:
+            k = LumPeakKernel(frame.shape, mask_radius=self.mask_radius, blur=self.blur,
+                              centroid_threshold=self.centroid_threshold, pixel_depth=self.pixel_depth)
+            self._kernel = k
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        peak = k.process(frame, timestamp)
+        with self._lock:
+            self.nprocessed += 1
+            if peak is not None:
+                self._results.append(peak)
+            self._latest = frame, peak
+
+        self._new_result.set()
+        return peak
+
+    # private
+    def _run(self):
+        last = None
+        while not self._stop.is_set():
+            frame = self.get_frame()
+            if frame is None or frame is last:
+                self._stop.wait(self.poll_period)
+                continue
+
+            last = frame
+            self.nframes += 1
+            try:
+                self.process(frame)
+            except BaseException as e:
+                logger.warning('failed processing frame. {}'.format(e))
+
+    def _run_display(self):
+        shown = None
+        while not self._stop.wait(self.display_period):
+            latest = self._latest
+            if latest is None or latest is shown:
+                continue
+
+            shown = latest
+            try:
+                self.display(*latest)
+            except BaseException as e:
+                logger.warning('failed displaying frame. {}'.format(e))
+
+# ============= EOF =============================================
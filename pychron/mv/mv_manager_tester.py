@@ -39,6 +39,7 @@ from pychron.mv.lumen_detector import LumenDetector
 
 class TestAutocenter(HasTraits):
     test1_button = Button('Test1')
+    compare_button = Button('Compare Strategies')
     display_image = Instance(FrameImage)
 
     def init(self):
@@ -77,6 +78,25 @@ class TestAutocenter(HasTraits):
         t.start()
         self.t = t
 
+    def _compare_strategies(self):
+        """
+            autocenter the stored test image with each search strategy and report the timings
+        """
+
+        def func():
+            m = self.manager
+            for strategy in ('linear', 'coarse_to_fine'):
+                m.search_strategy = strategy
+                m.calculate_new_center(0, 0, 0, 0, dim=1.5)
+
+            for ti in m.timings:
+                print('{strategy:<16s} total={total:0.3f} search={duration:0.3f} '
+                      'evaluated={nevaluated}/{nwindows} found={found}'.format(**ti))
+
+        t = Thread(target=func)
+        t.start()
+        self.t = t
+
     def _set_test_image(self):
         from pychron.globals import globalv
         # p = '/Users/ross/Sandbox/test_target.jpg'
@@ -93,12 +113,17 @@ class TestAutocenter(HasTraits):
         self._set_test_image()
         self._test1()
 
+    def _compare_button_fired(self):
+        self._set_test_image()
+        self._compare_strategies()
+
 
 if __name__ == '__main__':
     logging_setup('mv', use_archiver=False, use_file=False)
     t = TestAutocenter()
     t.init()
     t.configure_traits(view=View(UItem('test1_button'),
+                                 UItem('compare_button'),
                                  UItem('object.display_image.source_frame',
                                        width=254, height=254,
                                        editor=ImageEditor(refresh='object.display_image.refresh_needed')),
@@ -0,0 +1,74 @@
+import unittest
+
+from numpy import zeros, uint8
+
+from pychron.mv.locator import Locator
+
+
+class FakeTarget(object):
+    def __init__(self, area, centroid):
+        self.area = area
+        self.centroid = centroid
+        self.perimeter_convexity = 1
+
+
+class WindowLocator(Locator):
+    """
+        a target is only found at full resolution and only with window ``hit``
+    """
+    hit = 7
+
+    def __init__(self, shape, *args, **kw):
+        super(WindowLocator, self).__init__(*args, **kw)
+        self.shape = shape
+        self.windows = []
+
+    def _segment_window(self, src, window, blocksize, use_adaptive_threshold):
+        self.windows.append(window)
+        targets = []
+        if src.shape == self.shape:
+            h, w = self.shape
+            targets = [FakeTarget(100, (w / 2, h / 2))]
+        return src, targets
+
+    def _accept_targets(self, image, frame, dim, targets, fa, filter_targets, convexity_filter):
+        if targets and self.windows[-1] == (self.hit, self.hit + 1):
+            return targets
+
+
+class LocatorSearchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.src = zeros((80, 80), dtype=uint8)
+        self.windows = [(i, i + 1) for i in range(20)]
+
+    def test_coarse_fallback(self):
+        loc = WindowLocator(self.src.shape, pxpermm=10)
+        targets, n = loc._coarse_to_fine_search(None, self.src, self.src, 5, self.windows, (50, 200),
+                                                {'coarse_stride': 4, 'workers': 2},
+                                                True, False, False)
+        self.assertTrue(targets)
+        self.assertEqual(loc.windows[-1], (7, 8))
+
+        # every coarse window plus the linear search up to the hit
+        self.assertEqual(n, 5 + 8)
+
+    def test_linear(self):
+        loc = WindowLocator(self.src.shape, pxpermm=10)
+        targets, n = loc._linear_search(None, self.src, self.src, 5, self.windows, (50, 200), {},
+                                        True, False, False)
+        self.assertTrue(targets)
+        self.assertEqual(n, 8)
+
+    def test_screen_tolerance(self):
+        loc = Locator(pxpermm=10)
+        # 80x80 downsampled by 2. the tolerance is 0.75mm, 7.5px at full resolution, 3.75px downsampled
+        lsrc = zeros((40, 40), dtype=uint8)
+        self.assertTrue(loc._screen_targets(lsrc, [FakeTarget(100, (23, 20))], 50, 200, True, False, scale=2))
+        self.assertFalse(loc._screen_targets(lsrc, [FakeTarget(100, (25, 20))], 50, 200, True, False, scale=2))
+
+        # full resolution
+        self.assertTrue(loc._screen_targets(lsrc, [FakeTarget(100, (25, 20))], 50, 200, True, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
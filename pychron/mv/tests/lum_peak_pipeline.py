@@ -0,0 +1,148 @@
+import time
+import unittest
+
+from numpy import zeros, ogrid, exp, uint8, dstack
+from numpy.random import RandomState
+
+from pychron.mv.lum_peak_pipeline import LumPeakKernel, LumPeakPipeline, PeakRenderer
+
+
+def spot(shape=(60, 80), cx=50, cy=20, sigma=3, amp=200):
+    h, w = shape
+    yy, xx = ogrid[:h, :w]
+    img = amp * exp(-((xx - cx) ** 2 + (yy - cy) ** 2) / (2 * sigma ** 2))
+    return img.astype(uint8)
+
+
+class LumPeakKernelTestCase(unittest.TestCase):
+    def test_peak(self):
+        k = LumPeakKernel((60, 80), blur=1)
+        p = k.process(spot())
+        self.assertEqual((p.peak_row, p.peak_col), (20, 50))
+        self.assertAlmostEqual(p.cx, 50, 1)
+        self.assertAlmostEqual(p.cy, 20, 1)
+        self.assertAlmostEqual(p.pt[0], 10, 1)
+        self.assertAlmostEqual(p.pt[1], -10, 1)
+
+    def test_saturation(self):
+        # the saturation is relative to the target area not the frame
+        img = zeros((20, 20), dtype=uint8)
+        img[5:10, 5:10] = 255
+        p = LumPeakKernel(img.shape, blur=0).process(img)
+        self.assertEqual(p.area, 25)
+        self.assertAlmostEqual(p.saturation, 1)
+        self.assertAlmostEqual(p.density, 255)
+        self.assertEqual(p.pt[2], p.saturation)
+
+        img[5:10, 5:10] = 153
+        img[7, 7] = 255
+        p = LumPeakKernel(img.shape, blur=0).process(img)
+        self.assertAlmostEqual(p.saturation, (24 * 153 + 255) / (25 * 255.))
+
+    def test_no_target(self):
+        k = LumPeakKernel((60, 80))
+        rs = RandomState(3)
+        for amp in (20, 255):
+            self.assertIsNone(k.process(rs.randint(0, amp, (60, 80)).astype(uint8)))
+
+        img = spot()
+        img += rs.randint(0, 20, img.shape).astype(uint8)
+        self.assertIsNotNone(k.process(img))
+
+        # uniform
+        self.assertIsNone(k.process(zeros((60, 80), dtype=uint8) + 100))
+
+    def test_mask(self):
+        # the spot is outside the mask
+        k = LumPeakKernel((60, 80), mask_radius=10)
+        self.assertIsNone(k.process(spot(cx=70, cy=5)))
+
+        img = spot(cx=42, cy=30)
+        img[20, 50] = 255
+        p = k.process(img)
+        self.assertEqual((p.peak_row, p.peak_col), (30, 42))
+
+    def test_rgb(self):
+        img = spot()
+        k = LumPeakKernel(img.shape)
+        gp = k.process(img)
+        cp = k.process(dstack((img, img, img)))
+        self.assertAlmostEqual(gp.cx, cp.cx, 6)
+        self.assertAlmostEqual(gp.cy, cp.cy, 6)
+        self.assertAlmostEqual(gp.saturation, cp.saturation, 6)
+
+    def test_dark(self):
+        self.assertIsNone(LumPeakKernel((10, 10)).process(zeros((10, 10), dtype=uint8)))
+
+    def test_renderer(self):
+        img = spot()
+        p = LumPeakKernel(img.shape).process(img)
+        r = PeakRenderer(radius=2)
+        a = r.render(img, p)
+        self.assertEqual(a.shape, (60, 80, 3))
+        self.assertListEqual(a[20, 50].tolist(), [255, 0, 0])
+        self.assertListEqual(a[0, 0].tolist(), [0, 0, 0])
+
+        # double buffered
+        b = r.render(img)
+        self.assertIsNot(a, b)
+        self.assertListEqual(b[20, 50].tolist(), [img[20, 50]] * 3)
+
+
+class LumPeakPipelineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.frames = [spot(cx=x) for x in range(30, 60, 5)]
+        self.frame = None
+        self.displayed = []
+
+    def _get_frame(self):
+        return self.frame
+
+    def _display(self, frame, peak):
+        self.displayed.append(peak)
+
+    def test_each_frame_once(self):
+        p = LumPeakPipeline(self._get_frame, display=self._display, display_period=0.05)
+        p.start()
+        try:
+            for f in self.frames:
+                self.frame = f
+                st = time.time()
+                while p.latest() is None or p.latest()[0] is not f:
+                    if time.time() - st > 2:
+                        break
+                    time.sleep(0.005)
+
+            time.sleep(0.1)
+        finally:
+            p.stop()
+
+        peaks = p.drain()
+        self.assertEqual(p.nframes, len(self.frames))
+        self.assertListEqual([pk.peak_col for pk in peaks], list(range(30, 60, 5)))
+        self.assertListEqual(p.drain(), [])
+        self.assertTrue(self.displayed)
+        self.assertLessEqual(len(self.displayed), len(self.frames))
+
+    def test_crop_clear(self):
+        p = LumPeakPipeline(self._get_frame, crop=lambda f: f[10:30, 40:60])
+        pk = p.process(spot())
+        self.assertEqual((pk.peak_row, pk.peak_col), (10, 10))
+        p.clear()
+        self.assertListEqual(p.drain(), [])
+
+    def test_wait(self):
+        p = LumPeakPipeline(self._get_frame)
+        p.start()
+        try:
+            self.assertIsNone(p.wait(0.05))
+            self.frame = self.frames[0]
+            frame, peak = p.wait(1)
+            self.assertIs(frame, self.frames[0])
+            self.assertEqual(peak.peak_col, 30)
+        finally:
+            p.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -257,11 +257,14 @@ class Paths(object):
     # display_formatting_options = None
     plotter_options = None
     task_extensions_file = None
+    plugin_manifest = None
+    startup_profile = None
     simple_ui_file = None
     edit_ui_defaults = None
 
     duration_tracker = None
     duration_tracker_frequencies = None
+    duration_tracker_db = None
     experiment_launch_history = None
     notification_triggers = None
     furnace_firmware = None
@@ -472,11 +475,14 @@ class Paths(object):
 
         self.plotter_options = join(self.plotter_options_dir, 'plotter_options.p')
         self.task_extensions_file = join(self.appdata_dir, 'task_extensions.yaml')
+        self.plugin_manifest = join(self.appdata_dir, 'plugin_manifest.json')
+        self.startup_profile = join(self.log_dir, 'startup_profile.txt')
         self.simple_ui_file = join(self.appdata_dir, 'simple_ui.yaml')
         self.edit_ui_defaults = join(self.appdata_dir, 'edit_ui.yaml')
 
         self.duration_tracker = join(self.appdata_dir, 'duration_tracker.txt')
         self.duration_tracker_frequencies = join(self.appdata_dir, 'duration_tracker_frequencies.txt')
+        self.duration_tracker_db = join(self.appdata_dir, 'duration_tracker.sqlite3')
         self.experiment_launch_history = join(self.appdata_dir, 'experiment_launch_history.txt')
         self.notification_triggers = join(self.setup_dir, 'notification_triggers.yaml')
 
@@ -40,6 +40,16 @@ class TableSeparator(HasTraits):
         return ''
 
 
+def quick_record_id(item):
+    """
+        the record id of ``item``. quick-look analyses are marked because they do not include the ic factors
+    """
+    r = item.record_id
+    if getattr(item, 'quick', False):
+        r = '{} (Quick)'.format(r)
+    return r
+
+
 def swidth(v=60):
     return Int(v)
 
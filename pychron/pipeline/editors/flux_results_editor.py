@@ -115,6 +115,16 @@ MONITOR_COLUMNS = [
 
 MONITOR_EDITOR = TableEditor(columns=MONITOR_COLUMNS, sortable=False, reorderable=False)
 
+MODEL_COMPARISON_COLUMNS = [
+    column(klass=CheckboxColumn, name='active', label='Active', width=30),
+    column(name='kind', label='Model'),
+    column(name='loo_rms', label='LOO RMS', format_func=sciformat),
+    column(name='press', label='PRESS', format_func=sciformat),
+    column(name='sef', label='SE Fit', format_func=sciformat)]
+
+MODEL_COMPARISON_EDITOR = TableEditor(columns=MODEL_COMPARISON_COLUMNS, sortable=False, reorderable=False,
+                                      editable=False)
+
 
 class FluxPosition(HasTraits):
     hole_id = Int
@@ -345,6 +355,8 @@ class FluxResultsEditor(BaseFluxVisualizationEditor, SelectionFigure):
                              show_border=True, label='Unknowns'),
                       label='Tables')
 
+        mgrp = VGroup(UItem('model_comparison', editor=MODEL_COMPARISON_EDITOR), label='Models')
+
         ggrp = UItem('graph', style='custom')
         tgrp = HGroup(UItem('recalculate_button'),
                       Item('min_j', format_str='%0.4e',
@@ -367,7 +379,7 @@ class FluxResultsEditor(BaseFluxVisualizationEditor, SelectionFigure):
                       icon_button_editor('save_all_button', 'dialog-ok-apply-5',
                                          tooltip='Toggle "save" for all positions'))
 
-        v = View(VGroup(tgrp, Tabbed(ggrp, pgrp)))
+        v = View(VGroup(tgrp, Tabbed(ggrp, pgrp, mgrp)))
         return v
 
 
@@ -16,7 +16,7 @@
 from operator import itemgetter
 
 from numpy import linspace, meshgrid, arctan2, sin, cos, vstack, array, zeros, diff, argwhere
-from traits.api import Instance, Int, Str, Float, Property, List, on_trait_change
+from traits.api import HasTraits, Instance, Int, Str, Float, Bool, Property, List, on_trait_change
 from traitsui.api import View, UItem, VGroup, HGroup, TableEditor, Tabbed
 from traitsui.table_column import ObjectColumn
 from uncertainties import nominal_value, std_dev
@@ -26,6 +26,7 @@ from pychron.core.geometry.affine import AffineTransform
 from pychron.core.helpers.formatting import floatfmt
 from pychron.core.regression.flux_regressor import BowlFluxRegressor, PlaneFluxRegressor, MatchingFluxRegressor, \
     BracketingFluxRegressor
+from pychron.core.regression.flux_surface import FluxSurface
 from pychron.core.regression.mean_regressor import WeightedMeanRegressor
 from pychron.core.regression.ols_regressor import OLSRegressor
 from pychron.core.stats.monte_carlo import FluxEstimator
@@ -104,6 +105,14 @@ def add_axes_tools(g, p):
     g.add_axis_tool(p, p.y_axis)
 
 
+class FluxModelComparison(HasTraits):
+    kind = Str
+    loo_rms = Float
+    press = Float
+    sef = Float
+    active = Bool
+
+
 class BaseFluxVisualizationEditor(BaseTraitsEditor):
     graph = Instance('pychron.graph.graph.Graph')
     levels = 10
@@ -124,6 +133,7 @@ class BaseFluxVisualizationEditor(BaseTraitsEditor):
     monitor_positions = List
     unknown_positions = List
     rotation = Float(auto_set=False, enter_set=True)
+    model_comparison = List
 
     _regressor = None
     _analyses = List
@@ -147,6 +157,7 @@ class BaseFluxVisualizationEditor(BaseTraitsEditor):
             # print(x)
         except ValueError as e:
             self.debug('no monitor positions to fit, {}'.format(e))
+            self.model_comparison = []
             return
 
         # print(x)
@@ -164,9 +175,17 @@ class BaseFluxVisualizationEditor(BaseTraitsEditor):
             msg = 'Not enough monitor positions. At least 3 required. Currently only {} active'.format(n)
             self.debug(msg)
             self.information_dialog(msg)
+            self.model_comparison = []
             return
 
         options = self.plotter_options
+        if options.model_kind in (LEAST_SQUARES_1D, WEIGHTED_MEAN_1D):
+            # the Plane and Bowl surfaces are not comparable to a 1D model
+            surface = None
+            self.model_comparison = []
+        else:
+            surface = self._fit_surfaces(x, y, z, ze)
+
         ipositions = self.unknown_positions + self.monitor_positions
 
         if options.model_kind == LEAST_SQUARES_1D:
@@ -195,8 +214,11 @@ class BaseFluxVisualizationEditor(BaseTraitsEditor):
                     p.position_jerr = pe
                     p.dev = (oj - j) / j * 100
         else:
-            js = reg.predict(pts)
-            jes = reg.predict_error(pts)
+            if surface and options.model_kind in surface.fits:
+                js, jes = surface.predict(pts, error_calc=options.predicted_j_error_type)[options.model_kind]
+            else:
+                js = reg.predict(pts)
+                jes = reg.predict_error(pts)
 
             for j, je, p in zip(js, jes, ipositions):
                 p.j = float(j)
@@ -259,6 +281,23 @@ class BaseFluxVisualizationEditor(BaseTraitsEditor):
         reg.calculate()
         return reg
 
+    def _fit_surfaces(self, x, y, z, ze):
+        """
+            fit the Plane and Bowl models together and compare their leave-one-out errors
+        """
+        po = self.plotter_options
+        try:
+            surface = FluxSurface(vstack((x, y)).T, z, ze, use_weighted_fit=po.use_weighted_fit).fit()
+        except ValueError as e:
+            self.debug('failed fitting flux surfaces. {}'.format(e))
+            self.model_comparison = []
+            return
+
+        self.model_comparison = [FluxModelComparison(kind=kind, loo_rms=loo_rms, press=press, sef=sef,
+                                                     active=kind == po.model_kind)
+                                 for kind, loo_rms, press, sef in surface.compare()]
+        return surface
+
     def _model_flux(self, reg, r):
 
         n = reg.n * 10
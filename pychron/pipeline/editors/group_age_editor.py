@@ -23,7 +23,7 @@ from traitsui.menu import Action
 from pychron.column_sorter_mixin import ColumnSorterMixin
 from pychron.core.helpers.iterfuncs import groupby_group_id
 from pychron.core.ui.tabular_editor import myTabularEditor
-from pychron.pipeline.editors.base_adapter import BaseAdapter
+from pychron.pipeline.editors.base_adapter import BaseAdapter, quick_record_id
 from pychron.pipeline.editors.base_table_editor import BaseTableEditor
 from pychron.pipeline.subgrouping import compress_groups, make_interpreted_age_groups, make_interpreted_age_group
 from pychron.processing.analyses.preferred import get_preferred_grp
@@ -82,12 +82,16 @@ class AnalysesAdapter(SubGroupAdapter):
     ]
 
     subgroup_text = Property
+    record_id_text = Property
     record_id_width = Int(60)
     subgroup_width = Int(100)
 
     def _get_tag_text(self):
         return self.item.tag
 
+    def _get_record_id_text(self):
+        return quick_record_id(self.item)
+
     def _get_subgroup_text(self):
         return self._get_subgroup_attr('name')
 
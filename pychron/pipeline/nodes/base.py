@@ -17,12 +17,14 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
+from pyface.message_dialog import warning
 from traits.api import Bool, Any, List, Str
 
 # ============= standard library imports ========================
 # ============= local library imports  ==========================
 from pychron.column_sorter_mixin import ColumnSorterMixin
 from pychron.core.helpers.traitsui_shortcuts import okcancel_view
+from pychron.dvc import AnalysisNotAnvailableError
 
 
 class BaseNode(ColumnSorterMixin):
@@ -81,6 +83,28 @@ class BaseNode(ColumnSorterMixin):
     def _pre_run_hook(self, state):
         pass
 
+    def _load_full(self, state):
+        """
+            read the repository files of the quick-look analyses in ``state``. analyses that are not in their
+            repository are removed from ``state``
+        """
+        missing = []
+        for attr in ('unknowns', 'references'):
+            ans = []
+            for ai in getattr(state, attr):
+                try:
+                    ai.load_full()
+                    ans.append(ai)
+                except AnalysisNotAnvailableError:
+                    missing.append(ai.record_id)
+
+            if len(ans) != len(getattr(state, attr)):
+                setattr(state, attr, ans)
+
+        if missing:
+            warning(None, 'Could not load {} from their repositories. They were removed '
+                          'from the pipeline'.format(', '.join(missing)))
+
     def pre_run(self, state, configure=True):
         self._pre_run_hook(state)
 
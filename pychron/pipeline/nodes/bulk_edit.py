@@ -86,6 +86,9 @@ class BulkEditNode(BaseDVCNode):
     options_klass = BulkOptions
     name = 'Bulk Edit'
 
+    def _pre_run_hook(self, state):
+        self._load_full(state)
+
     def pre_run(self, state, configure=True):
         if state.unknowns:
             dets = list({iso.detector for ai in state.unknowns for iso in ai.itervalues()})
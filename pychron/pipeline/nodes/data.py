@@ -295,6 +295,7 @@ class BaseAutoUnknownNode(UnknownNode):
     engine = None
     single_shot = False
     verbose = Bool
+    quick_look = Bool
 
     _cached_unknowns = None
     _unks_ids = None
@@ -327,6 +328,9 @@ class BaseAutoUnknownNode(UnknownNode):
                                                       cols=len(self.available_analysis_types))),
                           Item('post_analysis_delay', label='Post Analysis Found Delay',
                                tooltip='Time (min) to delay before next "check for new analyses"'),
+                          Item('quick_look', label='Quick Look',
+                               tooltip='Make the analyses from the intensities stored in the database '
+                                       'instead of the repositories'),
                           Item('verbose'))
         return v
 
@@ -345,6 +349,11 @@ class BaseAutoUnknownNode(UnknownNode):
     def _post_run_hook(self, engine, state):
         pass
 
+    def _make_analyses(self, records):
+        if self.quick_look:
+            return self.dvc.make_quick_analyses(records)
+        return self.dvc.make_analyses(records)
+
     def _finish_load_hook(self):
         if globalv.auto_pipeline_debug:
             self.mass_spectrometer = 'jan'
@@ -381,7 +390,7 @@ class BaseAutoUnknownNode(UnknownNode):
 
             if not self._cached_unknowns:
                 updated = True
-                ans = self.dvc.make_analyses(records)
+                ans = self._make_analyses(records)
             else:
                 ans = []
                 ais = []
@@ -398,11 +407,11 @@ class BaseAutoUnknownNode(UnknownNode):
                     # sleeping X seconds is a potential work around but a little dumb.
                     # better solution is to save to database after repository is updated
                     try:
-                        ans.extend(self.dvc.make_analyses(ais))
+                        ans.extend(self._make_analyses(ais))
                     except BaseException:
                         time.sleep(10)
                         try:
-                            ans.extend(self.dvc.make_analyses(ais))
+                            ans.extend(self._make_analyses(ais))
                         except BaseException:
                             pass
 
@@ -47,6 +47,7 @@ class FigureNode(SortableNode):
     plotter_options_manager_klass = Any
     plotter_options_manager = Any
     no_analyses_warning = Bool(False)
+    quick_look = Bool(False)
     # editors = List
     auto_set_items = True
     use_plotting = True
@@ -62,6 +63,14 @@ class FigureNode(SortableNode):
             print('figure not refresh needed')
             e.refresh_needed = True
 
+    def _pre_run_hook(self, state):
+        if not self.quick_look:
+            self._load_full(state)
+
+    def _to_template(self, d):
+        if self.quick_look:
+            d['quick_look'] = True
+
     def run(self, state):
         self.plotter_options = self.plotter_options_manager.selected_options
         po = self.plotter_options
@@ -46,6 +46,10 @@ class FitNode(FigureNode):
     _keys = List
 
     # has_save_node = False
+    def _pre_run_hook(self, state):
+        # fits are saved to the repositories so always edit the full analyses
+        self._load_full(state)
+
     def _set_additional_options(self, state):
         pass
 
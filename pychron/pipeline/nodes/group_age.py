@@ -14,6 +14,7 @@
 # limitations under the License.
 # ===============================================================================
 from apptools.preferences.preference_binding import bind_preference
+from traits.api import Bool
 
 from pychron.core.helpers.iterfuncs import groupby_group_id
 from pychron.pipeline.editors.group_age_editor import SubGroupAgeEditor
@@ -28,6 +29,15 @@ class GroupAgeNode(BaseDVCNode):
     configurable = False
     editor = None
     editor_klass = SubGroupAgeEditor
+    quick_look = Bool(False)
+
+    def _pre_run_hook(self, state):
+        if not self.quick_look:
+            self._load_full(state)
+
+    def _to_template(self, d):
+        if self.quick_look:
+            d['quick_look'] = True
 
     def run(self, state):
         unknowns = list(a for a in state.unknowns if a.analysis_type == 'unknown')
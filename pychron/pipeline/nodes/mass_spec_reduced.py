@@ -82,6 +82,9 @@ class MassSpecReducedNode(BaseMassSpecNode):
                           title='Configure Mass Spec Reduced')
         return v
 
+    def _pre_run_hook(self, state):
+        self._load_full(state)
+
     def run(self, state):
         if self.recaller.connect():
 
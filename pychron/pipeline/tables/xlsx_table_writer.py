@@ -54,6 +54,19 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         self._workbook = xlsxwriter.Workbook(add_extension(path, '.xlsx'), {'nan_inf_to_errors': True})
 
     def build(self, groups, path=None, options=None):
+        path = self.write(groups, path, options)
+
+        view = self._options.auto_view
+        if not view:
+            view = confirm(None, 'Table saved to {}\n\nView Table?'.format(path)) == YES
+
+        if view:
+            view_file(path, application='Excel')
+
+    def write(self, groups, path=None, options=None):
+        """
+            write the workbook without asking to view it. returns the path of the table
+        """
         if options is None:
             options = XLSXAnalysisTableWriterOptions()
 
@@ -103,13 +116,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
                 self._make_summary_sheet(unknowns)
 
         self._workbook.close()
-
-        view = self._options.auto_view
-        if not view:
-            view = confirm(None, 'Table saved to {}\n\nView Table?'.format(path)) == YES
-
-        if view:
-            view_file(path, application='Excel')
+        return path
 
     # private
     def _get_detectors(self, grps):
@@ -35,6 +35,7 @@ from pychron.core.ui.table_configurer import TableConfigurer
 from pychron.core.ui.tabular_editor import myTabularEditor
 from pychron.envisage.browser.view import PaneBrowserView
 from pychron.envisage.icon_button_editor import icon_button_editor
+from pychron.pipeline.editors.base_adapter import quick_record_id
 from pychron.pipeline.engine import Pipeline, PipelineGroup, NodeGroup
 from pychron.pipeline.nodes import FindReferencesNode
 from pychron.pipeline.nodes.base import BaseNode
@@ -335,6 +336,7 @@ class PipelinePane(TraitsDockPane):
 class BaseAnalysesAdapter(TabularAdapter, ConfigurableMixin):
     font = 'arial 10'
     rundate_text = Property
+    record_id_text = Property
     record_id_width = Int(80)
     tag_width = Int(50)
     sample_width = Int(80)
@@ -346,6 +348,9 @@ class BaseAnalysesAdapter(TabularAdapter, ConfigurableMixin):
             r = ''
         return r
 
+    def _get_record_id_text(self):
+        return quick_record_id(self.item)
+
     def get_bg_color(self, obj, trait, row, column=0):
         if self.item.tag == 'invalid':
             c = '#C9C5C5'
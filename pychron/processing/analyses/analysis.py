@@ -435,6 +435,7 @@ class Analysis(ArArAge, IdeogramPlotable):
     # meta
     has_raw_data = False
     has_changes = False
+    quick = False
 
     recall_event = Event
     tag_event = Event
@@ -461,6 +462,12 @@ class Analysis(ArArAge, IdeogramPlotable):
     def extraction_type(self, v):
         self._extraction_type = v
 
+    def load_full(self):
+        """
+            load the values a quick-look analysis skipped. nothing to do for a full analysis
+        """
+        pass
+
     def get_baseline_corrected_signal_dict(self):
         get = lambda iso: iso.get_baseline_corrected_value()
         return self._get_isotope_dict(get)
@@ -0,0 +1,122 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    process wide caches for pyscripts.
+
+    compiled code objects are keyed by the hash of the script text. dry run (syntax test) results are keyed
+    by the script class, text hash and context and are dropped when any file the dry run read (gosubs,
+    interpolation files) is modified
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+
+# ============= local library imports  ==========================
+
+MAX_SIZE = 512
+
+_lock = Lock()
+_code = OrderedDict()
+_dry_runs = OrderedDict()
+_stats = {'code_hits': 0, 'code_misses': 0, 'dry_run_hits': 0, 'dry_run_misses': 0}
+
+
+def text_hash(text):
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    return hashlib.sha1(text).hexdigest()
+
+
+def file_stamp(p):
+    try:
+        return os.path.getmtime(p)
+    except OSError:
+        return None
+
+
+def compile_script(text, filename='<string>'):
+    """
+        return the compiled code for ``text``. raises the same exceptions as ``compile``
+    """
+    key = (text_hash(text), filename)
+    with _lock:
+        code = _code.get(key)
+        if code is not None:
+            _code.move_to_end(key)
+            _stats['code_hits'] += 1
+            return code
+
+    code = compile(text, filename, 'exec')
+    with _lock:
+        _stats['code_misses'] += 1
+        _put(_code, key, code)
+    return code
+
+
+def get_dry_run(key):
+    """
+        return (estimated_duration, error) for ``key`` or None
+    """
+    with _lock:
+        entry = _dry_runs.get(key)
+
+    if entry is not None:
+        duration, error, dependencies = entry
+        if all(file_stamp(p) == stamp for p, stamp in dependencies):
+            with _lock:
+                _stats['dry_run_hits'] += 1
+            return duration, error
+
+        with _lock:
+            _dry_runs.pop(key, None)
+
+    with _lock:
+        _stats['dry_run_misses'] += 1
+
+
+def set_dry_run(key, duration, error, dependencies):
+    dependencies = [(p, file_stamp(p)) for p in set(dependencies)]
+    with _lock:
+        _put(_dry_runs, key, (duration, error, dependencies))
+
+
+def clear():
+    with _lock:
+        _code.clear()
+        _dry_runs.clear()
+        for k in _stats:
+            _stats[k] = 0
+
+
+def cache_stats():
+    with _lock:
+        d = dict(_stats)
+        d['ncode'] = len(_code)
+        d['ndry_runs'] = len(_dry_runs)
+    return d
+
+
+def _put(cache, key, value):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_SIZE:
+        cache.popitem(last=False)
+
+# ============= EOF =============================================
@@ -33,6 +33,7 @@ from traits.api import Str, Any, Bool, Property, Int, Dict
 from pychron.globals import globalv
 from pychron.loggable import Loggable
 from pychron.paths import paths
+from pychron.pyscripts.code_cache import compile_script, get_dry_run, set_dry_run, text_hash
 from pychron.pyscripts.error import PyscriptError, IntervalError, GosubError, \
     KlassError, MainError
 
@@ -210,6 +211,7 @@ class PyScript(Loggable):
     interpolation_path = Str
 
     _interpolation_context = None
+    _dependencies = None
 
     def is_aborted(self):
         return self._aborted
@@ -292,8 +294,23 @@ class PyScript(Loggable):
         if not self.syntax_checked:
             self.setup_context()
 
+            key = self._dry_run_key(argv)
+            cached = get_dry_run(key)
+            if cached is not None:
+                self.debug('using cached syntax check')
+                self._estimated_duration, r = cached
+                self.syntax_checked = True
+                self._syntax_error = r is not None
+                if r is not None:
+                    raise PyscriptError(self.filename, r)
+                return
+
             self.debug('testing...')
             self._estimated_duration = 0
+            self._dependencies = []
+            if self.interpolation_path:
+                self._dependencies.append(self.interpolation_path)
+
             self.syntax_checked = True
             self.testing_syntax = True
             self._syntax_error = True
@@ -304,6 +321,7 @@ class PyScript(Loggable):
                 ee = PyscriptError(self.filename, r)
                 print('invalid pyscript', self.text)
                 print('error', r)
+                set_dry_run(key, 0, r, self._dependencies)
                 raise ee
 
             elif not self._interval_stack.empty():
@@ -312,6 +330,7 @@ class PyScript(Loggable):
             else:
                 self.console_info('syntax checking passed')
                 self._syntax_error = False
+                set_dry_run(key, self._estimated_duration, None, self._dependencies)
 
             self.testing_syntax = False
 
@@ -343,7 +362,7 @@ class PyScript(Loggable):
         else:
 
             try:
-                code = compile(snippet, '<string>', 'exec')
+                code = compile_script(snippet)
             except BaseException as e:
                 self.debug(traceback.format_exc())
                 return e
@@ -526,6 +545,7 @@ class PyScript(Loggable):
             root = self.root
 
         root, name = self._find_root(root, name)
+        self._add_dependency(os.path.join(root, name))
 
         if klass is None:
             klass = self.__class__
@@ -908,6 +928,23 @@ class PyScript(Loggable):
 
         return d
 
+    def _add_dependency(self, p):
+        if self._dependencies is not None:
+            self._dependencies.append(p)
+
+        if self.parent_script:
+            self.parent_script._add_dependency(p)
+
+    def _dry_run_key(self, argv):
+        """
+            the result of a dry run depends on the script text, the context and the interpolation file
+        """
+        ctx = self._ctx or {}
+        ctx = sorted(((k, v) for k, v in ctx.items() if k != 'ex'), key=lambda x: x[0])
+        variables = [(v, getattr(self, v, None)) for v in self.get_variables()]
+        return (self.__class__.__name__, text_hash(self.text or ''),
+                repr(ctx), repr(variables), repr(argv), self.interpolation_path)
+
     def _tracer(self, frame, event, arg):
         if event == 'line':
             print(frame.f_code.co_filename, frame.f_lineno)
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import time
+import unittest
+
+from pychron.pyscripts import code_cache
+from pychron.pyscripts.pyscript import PyScript
+
+TEXT = '''
+def main():
+    begin_interval(2)
+    complete_interval()
+'''
+
+
+def make_script(text=TEXT, **ctx):
+    s = PyScript()
+    s.text = text
+    s.bootstrap(load=False)
+    s.setup_context(**ctx)
+    return s
+
+
+class CompileScriptTestCase(unittest.TestCase):
+    def setUp(self):
+        code_cache.clear()
+
+    def test_cached(self):
+        a = code_cache.compile_script(TEXT)
+        b = code_cache.compile_script(TEXT)
+        self.assertIs(a, b)
+        self.assertEqual(code_cache.cache_stats()['code_hits'], 1)
+
+    def test_syntax_error(self):
+        self.assertRaises(SyntaxError, code_cache.compile_script, 'def main(:')
+
+
+class DryRunCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        code_cache.clear()
+
+    def test_estimated_duration(self):
+        s = make_script()
+        s.test()
+        self.assertEqual(s.get_estimated_duration(), 2)
+
+        s = make_script()
+        s.test()
+        self.assertEqual(s.get_estimated_duration(), 2)
+        self.assertEqual(code_cache.cache_stats()['dry_run_hits'], 1)
+
+    def test_context_key(self):
+        make_script(duration=1).test()
+        make_script(duration=2).test()
+        self.assertEqual(code_cache.cache_stats()['dry_run_hits'], 0)
+
+    def test_cached_error(self):
+        code_cache.set_dry_run('a', 0, 'error', [])
+        self.assertEqual(code_cache.get_dry_run('a'), (0, 'error'))
+
+    def test_dependency_modified(self):
+        fd, p = tempfile.mkstemp(suffix='.py')
+        os.close(fd)
+        try:
+            code_cache.set_dry_run('a', 2, None, [p])
+            self.assertEqual(code_cache.get_dry_run('a'), (2, None))
+
+            t = time.time() + 10
+            os.utime(p, (t, t))
+            self.assertIsNone(code_cache.get_dry_run('a'))
+        finally:
+            os.remove(p)
+
+
+if __name__ == '__main__':
+    unittest.main()
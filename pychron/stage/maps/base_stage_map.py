@@ -19,12 +19,14 @@ from __future__ import absolute_import
 
 import os
 
-from traits.api import HasTraits, Str, CFloat, Float, Property, List, Enum
+from traits.api import HasTraits, Str, CFloat, Float, Property, List, Enum, on_trait_change
 
 from pychron.core.geometry.affine import transform_point, \
     itransform_point
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.loggable import Loggable
+from pychron.stage.maps.hole_index import HoleIndex
+from pychron.stage.route_optimizer import optimize_route
 
 
 class SampleHole(HasTraits):
@@ -72,6 +74,8 @@ class BaseStageMap(Loggable):
     # should always be N,E,S,W,center
     calibration_holes = None
 
+    _hole_index = None
+
     def __init__(self, *args, **kw):
         super(BaseStageMap, self).__init__(*args, **kw)
         self.load()
@@ -195,15 +199,49 @@ class BaseStageMap(Loggable):
 
         return transform_point(pos, cpos, rot, scale)
 
+    @property
+    def hole_index(self):
+        if self._hole_index is None:
+            self._hole_index = HoleIndex(self.sample_holes)
+        return self._hole_index
+
     def get_hole(self, key):
-        return next((h for h in self.sample_holes if h.id == str(key)), None)
+        return self.hole_index.get(key)
 
     def get_hole_pos(self, key):
         """
             hole ids are str so convert key to str
         """
-        return next(((h.x, h.y)
-                     for h in self.sample_holes if h.id == str(key)), None)
+        h = self.hole_index.get(key)
+        if h is not None:
+            return h.x, h.y
+
+    def get_nearest_hole(self, x, y, tol=None):
+        """
+            return the hole closest to the uncalibrated position x,y. if ``tol`` is not None the hole's x and y
+            must be within ``tol`` of x,y
+        """
+        return self.hole_index.nearest(x, y, tol)
+
+    def get_holes_within(self, x, y, r):
+        return self.hole_index.within(x, y, r)
+
+    def get_route(self, keys, start=None, velocity=1., acceleration=None):
+        """
+            return ``keys`` ordered to minimize the travel time between the holes. invalid holes are
+            appended in their original order
+        """
+        holes, invalid = [], []
+        for k in keys:
+            h = self.get_hole(k)
+            if h is None:
+                invalid.append(k)
+            else:
+                holes.append((k, h))
+
+        order = optimize_route([(h.x, h.y) for k, h in holes],
+                               velocity=velocity, acceleration=acceleration, start=start)
+        return [holes[i][0] for i in order] + invalid
 
     def check_valid_hole(self, key, autocenter_only=False, **kw):
         if autocenter_only and not key:
@@ -299,6 +337,10 @@ Check that the file is UTF-8 and Unix (LF) linefeed'''.format(self.name,
         return cpos, rot, scale
 
     # handlers
+    @on_trait_change('sample_holes[], sample_holes:[x, y, id]')
+    def _reset_hole_index(self):
+        self._hole_index = None
+
     def _g_dimension_changed(self):
         for h in self.sample_holes:
             h.dimension = self.g_dimension
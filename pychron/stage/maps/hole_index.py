@@ -0,0 +1,70 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import array, inf, isinf
+from scipy.spatial import cKDTree
+
+
+# ============= local library imports  ==========================
+
+
+class HoleIndex(object):
+    """
+        kd-tree of the nominal hole positions of a stage map and a dict of the holes by id
+    """
+
+    def __init__(self, holes):
+        self.holes = list(holes)
+        self.ids = {h.id: h for h in self.holes}
+        self.tree = None
+        if self.holes:
+            self.tree = cKDTree(array([(h.x, h.y) for h in self.holes]))
+
+    def get(self, key):
+        return self.ids.get(str(key))
+
+    def nearest(self, x, y, tol=None):
+        """
+            return the hole closest to x,y. if ``tol`` is not None only a hole whose x and y are both within
+            ``tol`` of x,y is returned
+        """
+        if self.tree is None:
+            return
+
+        if tol is None:
+            d, i = self.tree.query((x, y))
+        else:
+            # chebyshev distance i.e. a square of half width tol
+            d, i = self.tree.query((x, y), p=inf, distance_upper_bound=tol)
+            if isinf(d) or d >= tol:
+                return
+
+        return self.holes[i]
+
+    def within(self, x, y, r):
+        """
+            return the holes within ``r`` of x,y ordered by distance
+        """
+        if self.tree is None:
+            return []
+
+        idxs = self.tree.query_ball_point((x, y), r)
+        holes = [self.holes[i] for i in idxs]
+        return sorted(holes, key=lambda h: (h.x - x) ** 2 + (h.y - y) ** 2)
+
+# ============= EOF =============================================
@@ -0,0 +1,160 @@
+# ===============================================================================
+# Copyright 2026 Jake Ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+    order stage positions to minimize the total travel time.
+
+    the x and y axes move simultaneously so the time of a move is the time of the slower axis. each axis follows
+    a trapezoidal velocity profile, or a triangular profile if the move is too short to reach ``velocity``.
+    a ``velocity`` of None uses the distance between positions instead of the time
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+from numpy import absolute, arange, array, asarray, hypot, inf, maximum, sqrt, where, zeros
+
+
+# ============= local library imports  ==========================
+
+
+def move_time(d, velocity=1., acceleration=None):
+    """
+        time to move a distance ``d`` starting and ending at rest
+    """
+    d = absolute(asarray(d, dtype=float))
+    if not acceleration:
+        return d / velocity
+
+    # distance spent accelerating and decelerating
+    ramp = velocity ** 2 / acceleration
+    short = d < ramp
+    return where(short, 2 * sqrt(d / acceleration), d / velocity + velocity / acceleration)
+
+
+def _axis_params(v):
+    if isinstance(v, (tuple, list)):
+        return v
+    return v, v
+
+
+def travel_times(points, velocity=1., acceleration=None, start=None):
+    """
+        return the matrix of move times between ``points``. if ``start`` is given also return the move times
+        from ``start`` to each point
+    """
+    pts = asarray(points, dtype=float).reshape(-1, 2)
+    xs, ys = pts[:, 0], pts[:, 1]
+    if velocity is None:
+        m = hypot(xs[:, None] - xs[None, :], ys[:, None] - ys[None, :])
+        return m, None if start is None else hypot(xs - start[0], ys - start[1])
+
+    vx, vy = _axis_params(velocity)
+    ax, ay = _axis_params(acceleration)
+
+    m = maximum(move_time(xs[:, None] - xs[None, :], vx, ax),
+                move_time(ys[:, None] - ys[None, :], vy, ay))
+    if start is None:
+        return m, None
+
+    sx, sy = start
+    s = maximum(move_time(xs - sx, vx, ax), move_time(ys - sy, vy, ay))
+    return m, s
+
+
+def route_time(points, order=None, velocity=1., acceleration=None, start=None):
+    """
+        total travel time visiting ``points`` in ``order``
+    """
+    if order is None:
+        order = list(range(len(points)))
+    if not len(order):
+        return 0
+
+    m, s = travel_times(points, velocity, acceleration, start)
+    order = asarray(order)
+    t = m[order[:-1], order[1:]].sum()
+    if s is not None:
+        t += s[order[0]]
+    return float(t)
+
+
+def optimize_route(points, velocity=1., acceleration=None, start=None, max_passes=50):
+    """
+        return the indices of ``points`` in the order that minimizes the travel time. the route starts at
+        ``start``, if given, and does not return.
+
+        the route is built with nearest neighbour and improved with 2-opt until no reversal of a segment
+        shortens it or ``max_passes`` passes were made.
+
+        ``velocity`` and ``acceleration`` are scalars or (x, y) tuples. without ``acceleration`` the travel
+        time is proportional to the distance of the slower axis. without ``velocity`` the route minimizes the
+        distance
+    """
+    n = len(points)
+    if not n:
+        return []
+    if n < 3 and start is None:
+        return list(range(n))
+
+    m, s = travel_times(points, velocity, acceleration, start)
+
+    # node n is the start and node n+1 is a free end. moves to the free end cost nothing
+    d = zeros((n + 2, n + 2))
+    d[:n, :n] = m
+    if s is not None:
+        d[n, :n] = s
+        d[:n, n] = s
+
+    route = [n] + _nearest_neighbour(m, s) + [n + 1]
+    return _two_opt(array(route), d, max_passes)[1:-1].tolist()
+
+
+def _nearest_neighbour(m, s):
+    n = len(m)
+    visited = zeros(n, dtype=bool)
+    cur = int(s.argmin()) if s is not None else 0
+
+    route = [cur]
+    visited[cur] = True
+    for _ in range(n - 1):
+        row = where(visited, inf, m[cur])
+        cur = int(row.argmin())
+        visited[cur] = True
+        route.append(cur)
+    return route
+
+
+def _two_opt(route, d, max_passes):
+    n = len(route) - 2
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, n):
+            js = arange(i + 1, n + 1)
+            a, b = route[i - 1], route[i]
+            c, e = route[js], route[js + 1]
+            delta = d[a, c] + d[b, e] - d[a, b] - d[c, e]
+
+            k = delta.argmin()
+            if delta[k] < -1e-9:
+                j = js[k]
+                route[i:j + 1] = route[i:j + 1][::-1].copy()
+                improved = True
+
+        if not improved:
+            break
+
+    return route
+
+# ============= EOF =============================================
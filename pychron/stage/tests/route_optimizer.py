@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from pychron.stage.route_optimizer import move_time, optimize_route, route_time
+
+
+class RouteOptimizerTestCase(unittest.TestCase):
+    def test_move_time_trapezoid(self):
+        # 1s accelerating, 1s decelerating, 2s at speed
+        self.assertAlmostEqual(move_time(3, velocity=1, acceleration=1), 4)
+
+    def test_move_time_triangle(self):
+        self.assertAlmostEqual(move_time(0.5, velocity=1, acceleration=2), 1)
+
+    def test_move_time_no_acceleration(self):
+        self.assertAlmostEqual(move_time(-3, velocity=2), 1.5)
+
+    def test_line(self):
+        pts = [(x, 0) for x in (5, 1, 3, 0, 4, 2)]
+        order = optimize_route(pts, start=(0, 0))
+        self.assertListEqual([pts[i][0] for i in order], [0, 1, 2, 3, 4, 5])
+
+    def test_axes(self):
+        pts = [(x, y) for y in range(2) for x in range(4)]
+
+        # y is slow so the route finishes a row before moving to the next
+        order = optimize_route(pts, velocity=(10, 1), start=(0, 0))
+        ys = [pts[i][1] for i in order]
+        self.assertEqual(sum(a != b for a, b in zip(ys, ys[1:])), 1)
+
+        # x is slow so the route finishes a column before moving to the next
+        order = optimize_route(pts, velocity=(1, 10), start=(0, 0))
+        xs = [pts[i][0] for i in order]
+        self.assertEqual(sum(a != b for a, b in zip(xs, xs[1:])), 3)
+
+    def test_distance(self):
+        pts = [(3, 0), (2, 2.9)]
+        self.assertAlmostEqual(route_time(pts, [0], velocity=None, start=(0, 0)), 3)
+        self.assertAlmostEqual(route_time(pts, [1], velocity=None, start=(0, 0)), 12.41 ** 0.5)
+
+        # (2, 2.9) is nearer by time of the slower axis but further by distance
+        self.assertListEqual(optimize_route(pts, start=(0, 0)), [1, 0])
+        self.assertListEqual(optimize_route(pts, velocity=None, start=(0, 0)), [0, 1])
+
+    def test_grid(self):
+        rand = random.Random(4)
+        pts = [(x, y) for x in range(15) for y in range(15)]
+        rand.shuffle(pts)
+
+        kw = dict(velocity=2, acceleration=4, start=(0, 0))
+        order = optimize_route(pts, **kw)
+        self.assertListEqual(sorted(order), list(range(len(pts))))
+
+        t = route_time(pts, order, **kw)
+        self.assertLess(t, route_time(pts, **kw) / 3)
+        # every move is to a neighbouring hole at best
+        self.assertLess(t, 1.2 * (len(pts) - 1) * move_time(1, 2, 4))
+
+    def test_small(self):
+        self.assertListEqual(optimize_route([]), [])
+        self.assertListEqual(optimize_route([(1, 1)], start=(0, 0)), [0])
+        self.assertListEqual(optimize_route([(5, 5), (1, 1)], start=(0, 0)), [1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -144,6 +144,32 @@ class StageMapTestCase(unittest.TestCase):
         hs = [hi.id for hi in holes[:6]]
         self.assertListEqual(['3', '10', '20', '32', '46', '61'], hs)
 
+    def test_nearest_hole(self):
+        h = self.sm.get_nearest_hole(0.3, 15.6)
+        self.assertEqual(h.id, '3')
+
+    def test_nearest_hole_tol(self):
+        self.assertEqual(self.sm.get_nearest_hole(-2.3, 16.2, tol=0.5).id, '2')
+        self.assertIsNone(self.sm.get_nearest_hole(1, 15.9512, tol=0.5))
+
+    def test_holes_within(self):
+        x, y, r = 0.1, 15.9512, 2.1
+        hs = [hi.id for hi in self.sm.get_holes_within(x, y, r)]
+        self.assertListEqual(['3', '4'], hs[:2])
+
+        ds = sorted((((hi.x - x) ** 2 + (hi.y - y) ** 2) ** 0.5, hi.id) for hi in self.sm.sample_holes)
+        self.assertListEqual([hid for d, hid in ds if d <= r], hs)
+
+    def test_hole_index_reset(self):
+        h = self.sm.get_hole('3')
+        h.x = 100
+        self.assertEqual(self.sm.get_nearest_hole(99, 15.9512).id, '3')
+        self.assertTupleEqual(self.sm.get_hole_pos('3'), (100, 15.9512))
+
+    def test_route(self):
+        route = self.sm.get_route(['5', '1', '4', 'foo', '2', '3'], start=(-4, 16))
+        self.assertListEqual(['1', '2', '3', '4', '5', 'foo'], route)
+
 
 class TransformTestCase(unittest.TestCase):
     def test_itransform_point_ntran_nrot(self):
@@ -19,6 +19,9 @@ def suite():
     # Canvas
     from pychron.canvas.canvas2D.tests.calibration_item import CalibrationObjectTestCase
 
+    # Classifier
+    from pychron.classifier.tests.base_classifier import BaseClassifierTestCase, IsotopeClassifierTestCase
+
     # Core
     from pychron.core.tests.spell_correct import SpellCorrectTestCase
     from pychron.core.tests.filtering_tests import FilteringTestCase
@@ -28,7 +31,28 @@ def suite():
     from pychron.core.xml.tests.xml_parser import XMLParserTestCase
     from pychron.core.regression.tests.regression import OLSRegressionTest, MeanRegressionTest, \
         FilterOLSRegressionTest, OLSRegressionTest2, TruncateRegressionTest, ExpoRegressionTest, ExpoRegressionTest2
+    from pychron.core.regression.tests.interpolation import InterpolationRegressorTestCase
+    from pychron.core.regression.tests.flux_surface import FluxSurfaceTestCase
     from pychron.core.tests.alpha_tests import AlphaTestCase
+    from pychron.core.tests.benchmark import BenchmarkRunnerTestCase
+    from pychron.core.tests.spans import SpanRecorderTestCase
+    from pychron.core.tests.fuzzyfinder import FuzzyIndexTestCase
+
+    # Dashboard
+    from pychron.dashboard.tests.poll_scheduler import DeadlineSchedulerTestCase
+    from pychron.dashboard.tests.timeseries_store import TimeSeriesStoreTestCase
+
+    # DVC
+    from pychron.dvc.tests.bulk_transfer import BulkTransferTestCase
+    from pychron.dvc.tests.iso_db_transfer import IsoDBBulkExportTestCase
+    from pychron.dvc.tests.find_references import FindReferencesTestCase
+    from pychron.dvc.tests.orm_loading import ORMLoadingTestCase
+    from pychron.dvc.tests.quick_analysis import QuickAnalysisTestCase
+    from pychron.dvc.tests.search_index import SearchIndexTestCase
+
+    # Envisage
+    from pychron.envisage.tests.startup_profiler import StartupProfilerTestCase, PluginManifestTestCase
+    from pychron.envisage.tests.lazy_plugin import LazyActionTestCase
 
     # DataMapper
     from pychron.data_mapper.tests.usgs_vsc_file_source import USGSVSCFileSourceUnittest, \
@@ -36,6 +60,10 @@ def suite():
     from pychron.data_mapper.tests.nu_file_source import NuFileSourceUnittest
     from pychron.data_mapper.tests.nmgrl_legacy_source import NMGRLLegacySourceUnittest
 
+    # Image
+    from pychron.image.tests.stream_writer import StreamingVideoWriterTestCase, VideoStreamRecordTestCase
+    from pychron.image.tests.frame_publisher import ChangedTilesTestCase, FramePublisherTestCase
+
     # Experiment
     from pychron.experiment.tests.repository_identifier import ExperimentIdentifierTestCase
     from pychron.experiment.tests.peak_hop_parse import PeakHopYamlCase1
@@ -43,6 +71,7 @@ def suite():
     from pychron.experiment.tests.backup import BackupTestCase
     from pychron.experiment.tests.peak_hop_parse import PeakHopTxtCase
     from pychron.experiment.tests.duration_tracker import DurationTrackerTestCase
+    from pychron.experiment.tests.run_preparer import RunPreparerTestCase
     from pychron.experiment.tests.frequency_test import FrequencyTestCase, FrequencyTemplateTestCase
     from pychron.experiment.tests.position_regex_test import XYTestCase
     from pychron.experiment.tests.renumber_aliquot_test import RenumberAliquotTestCase
@@ -50,9 +79,21 @@ def suite():
     from pychron.experiment.tests.identifier import IdentifierTestCase
     from pychron.experiment.tests.comment_template import CommentTemplaterTestCase
 
+    # ExtractionLine
+    from pychron.extraction_line.tests.extraction_line_graph import ExtractionLineGraphTestCase
+    from pychron.extraction_line.tests.poll_scheduler import AdaptivePollSchedulerTestCase, StateWordTestCase
+
     # ExternalPipette
     from pychron.external_pipette.tests.external_pipette import ExternalPipetteTestCase
 
+    # Labspy
+    from pychron.labspy.tests.uploader import BufferedUploaderTestCase
+    from pychron.labspy.tests.notifications import NotificationTriggerTestCase
+
+    # MV
+    from pychron.mv.tests.lum_peak_pipeline import LumPeakKernelTestCase, LumPeakPipelineTestCase
+    from pychron.mv.tests.locator import LocatorSearchTestCase
+
     # Processing
     from pychron.processing.tests.plateau import PlateauTestCase
     from pychron.processing.tests.ratio import RatioTestCase
@@ -61,12 +102,14 @@ def suite():
     # Pyscripts
     from pychron.pyscripts.tests.extraction_script import WaitForTestCase
     from pychron.pyscripts.tests.measurement_pyscript import InterpolationTestCase, DocstrContextTestCase
+    from pychron.pyscripts.tests.code_cache import CompileScriptTestCase, DryRunCacheTestCase
 
     # Spectrometer
     from pychron.spectrometer.tests.mftable import MFTableTestCase, DiscreteMFTableTestCase
     from pychron.spectrometer.tests.integration_time import IntegrationTimeTestCase
 
     from pychron.stage.tests.stage_map import StageMapTestCase, TransformTestCase
+    from pychron.stage.tests.route_optimizer import RouteOptimizerTestCase
 
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
@@ -75,8 +118,15 @@ def suite():
         # Canvas
         CalibrationObjectTestCase,
 
+        # Classifier
+        BaseClassifierTestCase,
+        IsotopeClassifierTestCase,
+
         # Core
         AlphaTestCase,
+        BenchmarkRunnerTestCase,
+        SpanRecorderTestCase,
+        FuzzyIndexTestCase,
         SpellCorrectTestCase,
         FilteringTestCase,
         MultiPeakDetectionTestCase,
@@ -91,6 +141,25 @@ def suite():
         FilterOLSRegressionTest,
         OLSRegressionTest2,
         TruncateRegressionTest,
+        InterpolationRegressorTestCase,
+        FluxSurfaceTestCase,
+
+        # Dashboard
+        DeadlineSchedulerTestCase,
+        TimeSeriesStoreTestCase,
+
+        # DVC
+        BulkTransferTestCase,
+        IsoDBBulkExportTestCase,
+        FindReferencesTestCase,
+        ORMLoadingTestCase,
+        QuickAnalysisTestCase,
+        SearchIndexTestCase,
+
+        # Envisage
+        StartupProfilerTestCase,
+        LazyActionTestCase,
+        PluginManifestTestCase,
 
         # DataMapper
         USGSVSCFileSourceUnittest,
@@ -98,6 +167,12 @@ def suite():
         NuFileSourceUnittest,
         NMGRLLegacySourceUnittest,
 
+        # Image
+        StreamingVideoWriterTestCase,
+        VideoStreamRecordTestCase,
+        ChangedTilesTestCase,
+        FramePublisherTestCase,
+
         # Experiment
         ExperimentIdentifierTestCase,
         PeakHopYamlCase1,
@@ -105,6 +180,7 @@ def suite():
         BackupTestCase,
         PeakHopTxtCase,
         DurationTrackerTestCase,
+        RunPreparerTestCase,
         FrequencyTestCase,
         FrequencyTemplateTestCase,
         XYTestCase,
@@ -114,9 +190,23 @@ def suite():
         IdentifierTestCase,
         CommentTemplaterTestCase,
 
+        # ExtractionLine
+        ExtractionLineGraphTestCase,
+        AdaptivePollSchedulerTestCase,
+        StateWordTestCase,
+
         # ExternalPipette
         ExternalPipetteTestCase,
 
+        # Labspy
+        BufferedUploaderTestCase,
+        NotificationTriggerTestCase,
+
+        # MV
+        LumPeakKernelTestCase,
+        LumPeakPipelineTestCase,
+        LocatorSearchTestCase,
+
         # Processing
         PlateauTestCase,
         RatioTestCase,
@@ -126,6 +216,8 @@ def suite():
         WaitForTestCase,
         InterpolationTestCase,
         DocstrContextTestCase,
+        CompileScriptTestCase,
+        DryRunCacheTestCase,
 
         # Spectrometer
         MFTableTestCase,
@@ -133,7 +225,7 @@ def suite():
         IntegrationTimeTestCase,
 
         # Stage
-        StageMapTestCase, TransformTestCase)
+        StageMapTestCase, TransformTestCase, RouteOptimizerTestCase)
 
     for t in tests:
         suite.addTest(loader.loadTestsFromTestCase(t))
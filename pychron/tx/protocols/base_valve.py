@@ -52,6 +52,8 @@ class BaseValveProtocol(ServiceProtocol):
                     ('Close', '_close'),
                     ('GetIndicatorState', '_get_indicator_state'),
                     ('GetValveState', '_get_valve_state'),
+                    ('GetIndicatorStates', '_get_indicator_states'),
+                    ('GetChannelStates', '_get_channel_states'),
                     ('GetStateChecksum', '_get_state_checksum'),
                     ('GetValveStates', '_get_valve_states'),
                     ('GetValveLockStates', '_get_valve_lock_states'),
@@ -76,6 +78,32 @@ class BaseValveProtocol(ServiceProtocol):
             result = InvalidValveErrorCode(data)
         return result
 
+    def _get_indicator_states(self, data):
+        """
+        Get the indicator states of many valves in one command. e.g. A,B,C::
+
+            # 0 == close
+            # 1 == open
+            A0,B1,C0
+
+        :return: valve state str with checksum
+        """
+        if isinstance(data, dict):
+            data = data['value']
+
+        return self._manager.get_indicator_states(data.split(','))
+
+    def _get_channel_states(self, data):
+        """
+        Get the hardware states of many valves in one command. e.g. A,B,C
+
+        :return: valve state str with checksum
+        """
+        if isinstance(data, dict):
+            data = data['value']
+
+        return self._manager.get_hardware_states(data.split(','))
+
     def _open(self, data):
         """
         Open a valve. Valve name e.g. A